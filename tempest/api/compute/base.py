@@ -16,7 +16,9 @@
 import time
 
 from tempest import clients
+from tempest.common import teardown
 from tempest.common.utils import data_utils
+from tempest.common import waiters
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -76,52 +78,81 @@ class BaseComputeTest(tempest.test.BaseTestCase):
                     raise exceptions.InvalidConfiguration(msg)
         return multi_user
 
+    @classmethod
+    def _delete_server(cls, server):
+        # Errors are ignored, the servers may already be deleted
+        try:
+            cls.servers_client.delete_server(server['id'])
+        except Exception:
+            pass
+
+    @classmethod
+    def _wait_for_servers_deleted(cls, servers):
+        # Errors are logged, the rest of the teardown has to run
+        server_ids = [server['id'] for server in servers]
+        if not server_ids:
+            return
+        try:
+            waiters.wait_for_servers_status(cls.servers_client, server_ids,
+                                            waiters.DELETED,
+                                            raise_on_error=False)
+        except Exception:
+            LOG.exception('Servers not deleted: %s' % ', '.join(server_ids))
+
     @classmethod
     def clear_servers(cls):
-        for server in cls.servers:
-            try:
-                cls.servers_client.delete_server(server['id'])
-            except Exception:
-                pass
+        # Errors are ignored, the servers may already be deleted
+        server_ids = [server['id'] for server in cls.servers]
+        cls.servers_client.fanout(cls.servers_client.delete_server,
+                                  server_ids, return_exceptions=True)
+        cls._wait_for_servers_deleted(cls.servers)
 
-        for server in cls.servers:
-            try:
-                cls.servers_client.wait_for_server_termination(server['id'])
-            except Exception:
-                pass
+    @classmethod
+    def _delete_image(cls, image_id):
+        try:
+            cls.images_client.delete_image(image_id)
+        except exceptions.NotFound:
+            # The image may have already been deleted which is OK.
+            pass
+        except Exception:
+            LOG.exception('Exception raised deleting image %s' % image_id)
+            pass
 
     @classmethod
     def clear_images(cls):
         for image_id in cls.images:
-            try:
-                cls.images_client.delete_image(image_id)
-            except exceptions.NotFound:
-                # The image may have already been deleted which is OK.
-                pass
-            except Exception:
-                LOG.exception('Exception raised deleting image %s' % image_id)
-                pass
+            cls._delete_image(image_id)
+
+    @classmethod
+    def _delete_security_group(cls, sg):
+        try:
+            resp, body =\
+                cls.security_groups_client.delete_security_group(sg['id'])
+        except exceptions.NotFound:
+            # The security group may have already been deleted which is OK.
+            pass
+        except Exception as exc:
+            LOG.info('Exception raised deleting security group %s',
+                     sg['id'])
+            LOG.exception(exc)
+            pass
 
     @classmethod
     def clear_security_groups(cls):
         for sg in cls.security_groups:
-            try:
-                resp, body =\
-                    cls.security_groups_client.delete_security_group(sg['id'])
-            except exceptions.NotFound:
-                # The security group may have already been deleted which is OK.
-                pass
-            except Exception as exc:
-                LOG.info('Exception raised deleting security group %s',
-                         sg['id'])
-                LOG.exception(exc)
-                pass
+            cls._delete_security_group(sg)
 
     @classmethod
     def tearDownClass(cls):
-        cls.clear_images()
-        cls.clear_servers()
-        cls.clear_security_groups()
+        # The images and the servers are deleted concurrently, the security
+        # groups once the servers using them are gone
+        cleanup = teardown.Teardown()
+        cleanup.add('images', cls.images, cls._delete_image)
+        cleanup.add('servers', cls.servers, cls._delete_server,
+                    wait=cls._wait_for_servers_deleted)
+        cleanup.add('security_groups', cls.security_groups,
+                    cls._delete_security_group, depends_on=('servers',))
+        cleanup.run()
         cls.clear_isolated_creds()
         super(BaseComputeTest, cls).tearDownClass()
 
@@ -16,6 +16,7 @@
 import netaddr
 
 from tempest import clients
+from tempest.common import teardown
 from tempest.common.utils import data_utils
 from tempest import config
 from tempest import exceptions
@@ -83,53 +84,54 @@ class BaseNetworkTest(tempest.test.BaseTestCase):
         cls.metering_labels = []
         cls.metering_label_rules = []
 
+    @classmethod
+    def _delete_router(cls, router):
+        resp, body = cls.client.list_router_interfaces(router['id'])
+        interfaces = body['ports']
+        for i in interfaces:
+            cls.client.remove_router_interface_with_subnet_id(
+                router['id'], i['fixed_ips'][0]['subnet_id'])
+        cls.client.delete_router(router['id'])
+
     @classmethod
     def tearDownClass(cls):
-        # Clean up ike policies
-        for ikepolicy in cls.ikepolicies:
-            cls.client.delete_ikepolicy(ikepolicy['id'])
-        # Clean up vpn services
-        for vpnservice in cls.vpnservices:
-            cls.client.delete_vpnservice(vpnservice['id'])
-        # Clean up floating IPs
-        for floating_ip in cls.floating_ips:
-            cls.client.delete_floating_ip(floating_ip['id'])
-        # Clean up routers
-        for router in cls.routers:
-            resp, body = cls.client.list_router_interfaces(router['id'])
-            interfaces = body['ports']
-            for i in interfaces:
-                cls.client.remove_router_interface_with_subnet_id(
-                    router['id'], i['fixed_ips'][0]['subnet_id'])
-            cls.client.delete_router(router['id'])
-        # Clean up health monitors
-        for health_monitor in cls.health_monitors:
-            cls.client.delete_health_monitor(health_monitor['id'])
-        # Clean up members
-        for member in cls.members:
-            cls.client.delete_member(member['id'])
-        # Clean up vips
-        for vip in cls.vips:
-            cls.client.delete_vip(vip['id'])
-        # Clean up pools
-        for pool in cls.pools:
-            cls.client.delete_pool(pool['id'])
-        # Clean up metering label rules
-        for metering_label_rule in cls.metering_label_rules:
-            cls.admin_client.delete_metering_label_rule(
-                metering_label_rule['id'])
-        # Clean up metering labels
-        for metering_label in cls.metering_labels:
-            cls.admin_client.delete_metering_label(metering_label['id'])
-        # Clean up ports
-        for port in cls.ports:
-            cls.client.delete_port(port['id'])
-        # Clean up subnets
-        for subnet in cls.subnets:
-            cls.client.delete_subnet(subnet['id'])
-        # Clean up networks
-        for network in cls.networks:
-            cls.client.delete_network(network['id'])
+        # The resources of a kind are deleted once the resources of the
+        # kinds they depend on are, independent resources concurrently
+        cleanup = teardown.Teardown()
+        cleanup.add('ikepolicies', cls.ikepolicies,
+                    lambda r: cls.client.delete_ikepolicy(r['id']))
+        cleanup.add('vpnservices', cls.vpnservices,
+                    lambda r: cls.client.delete_vpnservice(r['id']))
+        cleanup.add('floating_ips', cls.floating_ips,
+                    lambda r: cls.client.delete_floating_ip(r['id']))
+        cleanup.add('routers', cls.routers, cls._delete_router,
+                    depends_on=('vpnservices', 'floating_ips'))
+        cleanup.add('health_monitors', cls.health_monitors,
+                    lambda r: cls.client.delete_health_monitor(r['id']))
+        cleanup.add('members', cls.members,
+                    lambda r: cls.client.delete_member(r['id']))
+        cleanup.add('vips', cls.vips,
+                    lambda r: cls.client.delete_vip(r['id']))
+        cleanup.add('pools', cls.pools,
+                    lambda r: cls.client.delete_pool(r['id']),
+                    depends_on=('health_monitors', 'members', 'vips'))
+        cleanup.add('metering_label_rules', cls.metering_label_rules,
+                    lambda r: cls.admin_client.delete_metering_label_rule(
+                        r['id']))
+        cleanup.add('metering_labels', cls.metering_labels,
+                    lambda r: cls.admin_client.delete_metering_label(r['id']),
+                    depends_on=('metering_label_rules',))
+        cleanup.add('ports', cls.ports,
+                    lambda r: cls.client.delete_port(r['id']),
+                    depends_on=('floating_ips', 'routers', 'vips'))
+        cleanup.add('subnets', cls.subnets,
+                    lambda r: cls.client.delete_subnet(r['id']),
+                    depends_on=('vpnservices', 'routers', 'vips', 'pools',
+                                'ports'))
+        cleanup.add('networks', cls.networks,
+                    lambda r: cls.client.delete_network(r['id']),
+                    depends_on=('ports', 'subnets'))
+        cleanup.run()
         cls.clear_isolated_creds()
         super(BaseNetworkTest, cls).tearDownClass()
 
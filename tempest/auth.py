@@ -15,7 +15,11 @@
 
 import copy
 import exceptions
+import hashlib
+import json
+import os
 import re
+import time
 import urlparse
 
 from datetime import datetime
@@ -25,11 +29,15 @@ from tempest.services.identity.v3.json import identity_client as json_v3id
 from tempest.services.identity.v3.xml import identity_client as xml_v3id
 from tempest.services.identity.xml import identity_client as xml_id
 
+from tempest.openstack.common import lockutils
 from tempest.openstack.common import log as logging
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
+# Catalog index key matching any region or interface
+_ANY = object()
+
 
 class AuthProvider(object):
     """
@@ -52,9 +60,12 @@ class AuthProvider(object):
         self.interface = interface
         if self.client_type == 'tempest' and self.interface is None:
             self.interface = 'json'
+        self._base_urls = {}
         self.cache = None
         self.alt_auth_data = None
         self.alt_part = None
+        # Number of times the auth data were renewed because they expired
+        self.refresh_count = 0
 
     def __str__(self):
         return "Creds :{creds}, client type: {client_type}, interface: " \
@@ -80,9 +91,26 @@ class AuthProvider(object):
         """
         return isinstance(credentials, dict)
 
+    @property
+    def cache(self):
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        # Anything derived from the auth data is stale when they change
+        self._cache = value
+        self._catalog = None
+        self._refresh_at = None
+        self._base_urls.clear()
+
     @property
     def auth_data(self):
-        if self.cache is None or self.is_expired(self.cache):
+        if self.cache is None:
+            self.cache = self._get_auth()
+        elif self.is_expired(self.cache):
+            self.refresh_count += 1
+            LOG.debug("Refreshing expired auth data of %s (refresh #%d)" %
+                      (self.credentials.get('username'), self.refresh_count))
             self.cache = self._get_auth()
         return self.cache
 
@@ -162,12 +190,117 @@ class AuthProvider(object):
         raise NotImplementedError
 
 
+class TokenCache(object):
+    """
+    Cache of the auth data shared by the auth providers of a process
+
+    Auth data are keyed by auth version and credentials. When a lock path
+    is set they are also stored in files in that directory, so that all
+    the test workers using it share them.
+    """
+
+    def __init__(self, lock_path=None, expiry_margin=0):
+        """
+        :param lock_path: directory of the file-backed store, if any
+        :param expiry_margin: seconds before their expiry after which auth
+                              data are not handed out anymore
+        """
+        self.lock_path = lock_path
+        self.expiry_margin = expiry_margin
+        self._auth_data = {}
+
+    def _is_valid(self, auth_data, get_expiry):
+        if auth_data is None:
+            return False
+        return get_expiry(auth_data) - self.expiry_margin > time.time()
+
+    def _lock(self, key):
+        return lockutils.lock('token-' + key, 'tempest-',
+                              external=self.lock_path is not None,
+                              lock_path=self.lock_path)
+
+    def _path(self, key):
+        return os.path.join(self.lock_path, 'token-%s.json' % key)
+
+    def _load(self, key):
+        try:
+            with open(self._path(key)) as f:
+                token, auth_data = json.load(f)
+        except (IOError, ValueError):
+            return None
+        return token, auth_data
+
+    def _store(self, key, auth_data):
+        # Tokens are secrets, only the owner can read them
+        fd = os.open(self._path(key), os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(auth_data, f)
+
+    def get_auth(self, key, get_auth, get_expiry):
+        """
+        Returns valid cached auth data for key, or the ones obtained
+        through get_auth if there are none.
+
+        :param key: the cache key of the credentials
+        :param get_auth: callable returning new auth data
+        :param get_expiry: callable returning the expiry timestamp of
+                           auth data
+        """
+        with self._lock(key):
+            auth_data = self._auth_data.get(key)
+            if not self._is_valid(auth_data, get_expiry) and self.lock_path:
+                auth_data = self._load(key)
+            if not self._is_valid(auth_data, get_expiry):
+                auth_data = get_auth()
+                if self.lock_path:
+                    self._store(key, auth_data)
+            self._auth_data[key] = auth_data
+            return auth_data
+
+    def invalidate(self, key, auth_data):
+        """
+        Drops the cached auth data for key, if they are still auth_data
+        """
+        with self._lock(key):
+            cached = self._auth_data.get(key)
+            if cached is None or cached[0] != auth_data[0]:
+                return
+            del self._auth_data[key]
+            if self.lock_path:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+
+
+_token_cache = None
+
+
+def get_token_cache():
+    """
+    Returns the token cache of the process
+    """
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(
+            lock_path=CONF.identity.token_cache_dir,
+            expiry_margin=CONF.identity.token_cache_expiry_margin)
+    return _token_cache
+
+
 class KeystoneAuthProvider(AuthProvider):
 
     def __init__(self, credentials, client_type='tempest', interface=None):
         super(KeystoneAuthProvider, self).__init__(credentials, client_type,
                                                    interface)
         self.auth_client = self._auth_client()
+        # Auth data are refreshed this many seconds before they expire
+        self.refresh_window = CONF.identity.token_refresh_window
+        if CONF.identity.token_cache:
+            self.token_cache = get_token_cache()
+        else:
+            self.token_cache = None
 
     def _decorate_request(self, filters, method, url, headers=None, body=None,
                           auth_data=None):
@@ -184,9 +317,10 @@ class KeystoneAuthProvider(AuthProvider):
         else:
             # Join base URL and url, and remove multiple contiguous slashes
             _url = "/".join([base_url, url])
-            parts = [x for x in urlparse.urlparse(_url)]
-            parts[2] = re.sub("/{2,}", "/", parts[2])
-            _url = urlparse.urlunparse(parts)
+            if '//' in _url.partition('://')[2]:
+                parts = [x for x in urlparse.urlparse(_url)]
+                parts[2] = re.sub("/{2,}", "/", parts[2])
+                _url = urlparse.urlunparse(parts)
         # no change to method or body
         return _url, _headers, body
 
@@ -196,7 +330,28 @@ class KeystoneAuthProvider(AuthProvider):
     def _auth_params(self):
         raise NotImplementedError
 
+    def token_cache_key(self):
+        """
+        Returns the key of the auth data in the token cache
+        """
+        key = [self.__class__.__name__, self.interface,
+               self.auth_client.auth_url, sorted(self.credentials.items())]
+        return hashlib.sha1(json.dumps(key)).hexdigest()
+
+    def clear_auth(self):
+        if self.token_cache is not None and self.cache is not None:
+            # The token was found invalid, do not hand it out anymore
+            self.token_cache.invalidate(self.token_cache_key(), self.cache)
+        super(KeystoneAuthProvider, self).clear_auth()
+
     def _get_auth(self):
+        if self.token_cache is not None:
+            return self.token_cache.get_auth(self.token_cache_key(),
+                                             self._fetch_auth,
+                                             self._get_refresh_time)
+        return self._fetch_auth()
+
+    def _fetch_auth(self):
         # Bypasses the cache
         if self.client_type == 'tempest':
             auth_func = getattr(self.auth_client, 'get_token')
@@ -211,6 +366,79 @@ class KeystoneAuthProvider(AuthProvider):
     def get_token(self):
         return self.auth_data[0]
 
+    def get_tenant_id(self):
+        """
+        Returns the id of the tenant the token is scoped to, if any
+        """
+        raise NotImplementedError
+
+    def get_expiry(self, auth_data):
+        """
+        Returns the expiry datetime of auth_data
+        """
+        raise NotImplementedError
+
+    def _get_refresh_time(self, auth_data):
+        """
+        Returns the timestamp after which auth_data must be refreshed
+        """
+        # The expiry of the cached auth data is parsed only once
+        if auth_data is self.cache and self._refresh_at is not None:
+            return self._refresh_at
+        expiry = self.get_expiry(auth_data)
+        refresh_at = time.mktime(expiry.timetuple()) - self.refresh_window
+        if auth_data is self.cache:
+            self._refresh_at = refresh_at
+        return refresh_at
+
+    def is_expired(self, auth_data):
+        return self._get_refresh_time(auth_data) <= time.time()
+
+    def _index_catalog(self, auth_data):
+        """
+        Returns the endpoints of the catalog indexed by service type,
+        region and interface
+        """
+        raise NotImplementedError
+
+    def _get_catalog(self, auth_data):
+        # The catalog of the cached auth data is indexed only once per token
+        if auth_data is not self.cache:
+            return self._index_catalog(auth_data[1])
+        if self._catalog is None:
+            self._catalog = self._index_catalog(auth_data[1])
+        return self._catalog
+
+    def base_url(self, filters, auth_data=None):
+        """
+        Filters can be:
+        - service: compute, image, etc
+        - region: the service region
+        - endpoint_type: adminURL, publicURL, internalURL
+        - api_version: replace catalog version with this
+        - skip_path: take just the base URL
+        """
+        if auth_data is None:
+            auth_data = self.auth_data
+        if auth_data is not self.cache:
+            # Alternative auth data are not memoized
+            return self._base_url(filters, auth_data)
+        key = (filters.get('service'), filters.get('region'),
+               filters.get('endpoint_type'), filters.get('api_version'),
+               filters.get('skip_path'))
+        try:
+            return self._base_urls[key]
+        except KeyError:
+            _base_url = self._base_url(filters, auth_data)
+            self._base_urls[key] = _base_url
+            return _base_url
+
+    def _base_url(self, filters, auth_data):
+        """
+        Extracts the base_url from auth_data based on provided filters
+        """
+        raise NotImplementedError
+
 
 class KeystoneV2AuthProvider(KeystoneAuthProvider):
 
@@ -245,18 +473,20 @@ class KeystoneV2AuthProvider(KeystoneAuthProvider):
         else:
             raise NotImplementedError
 
-    def base_url(self, filters, auth_data=None):
-        """
-        Filters can be:
-        - service: compute, image, etc
-        - region: the service region
-        - endpoint_type: adminURL, publicURL, internalURL
-        - api_version: replace catalog version with this
-        - skip_path: take just the base URL
-        """
-        if auth_data is None:
-            auth_data = self.auth_data
-        token, _auth_data = auth_data
+    def _index_catalog(self, auth_data):
+        catalog = {}
+        for service in auth_data['serviceCatalog']:
+            # Only the first service of each type is used
+            if (service['type'], _ANY) in catalog:
+                continue
+            for ep in service['endpoints']:
+                # The last endpoint of a region wins, the first one is the
+                # default
+                catalog[(service['type'], ep.get('region'))] = ep
+                catalog.setdefault((service['type'], _ANY), ep)
+        return catalog
+
+    def _base_url(self, filters, auth_data):
         service = filters.get('service')
         region = filters.get('region')
         endpoint_type = filters.get('endpoint_type', 'publicURL')
@@ -265,15 +495,12 @@ class KeystoneV2AuthProvider(KeystoneAuthProvider):
             raise exceptions.EndpointNotFound("No service provided")
 
         _base_url = None
-        for ep in _auth_data['serviceCatalog']:
-            if ep["type"] == service:
-                for _ep in ep['endpoints']:
-                    if region is not None and _ep['region'] == region:
-                        _base_url = _ep.get(endpoint_type)
-                if not _base_url:
-                    # No region matching, use the first
-                    _base_url = ep['endpoints'][0].get(endpoint_type)
-                break
+        catalog = self._get_catalog(auth_data)
+        if region is not None:
+            _base_url = catalog.get((service, region), {}).get(endpoint_type)
+        if not _base_url:
+            # No region matching, use the first
+            _base_url = catalog.get((service, _ANY), {}).get(endpoint_type)
         if _base_url is None:
             raise exceptions.EndpointNotFound(service)
 
@@ -289,11 +516,14 @@ class KeystoneV2AuthProvider(KeystoneAuthProvider):
 
         return _base_url
 
-    def is_expired(self, auth_data):
+    def get_tenant_id(self):
+        _, access = self.auth_data
+        return access['token'].get('tenant', {}).get('id')
+
+    def get_expiry(self, auth_data):
         _, access = auth_data
-        expiry = datetime.strptime(access['token']['expires'],
-                                   self.EXPIRY_DATE_FORMAT)
-        return expiry <= datetime.now()
+        return datetime.strptime(access['token']['expires'],
+                                 self.EXPIRY_DATE_FORMAT)
 
 
 class KeystoneV3AuthProvider(KeystoneAuthProvider):
@@ -330,18 +560,21 @@ class KeystoneV3AuthProvider(KeystoneAuthProvider):
         else:
             raise NotImplementedError
 
-    def base_url(self, filters, auth_data=None):
-        """
-        Filters can be:
-        - service: compute, image, etc
-        - region: the service region
-        - endpoint_type: adminURL, publicURL, internalURL
-        - api_version: replace catalog version with this
-        - skip_path: take just the base URL
-        """
-        if auth_data is None:
-            auth_data = self.auth_data
-        token, _auth_data = auth_data
+    def _index_catalog(self, auth_data):
+        catalog = {}
+        for service in auth_data['catalog']:
+            # Only the first service of each type is used
+            if (service['type'], _ANY, _ANY) in catalog:
+                continue
+            for ep in service['endpoints']:
+                # The first endpoint of each key wins
+                for region in (ep.get('region'), _ANY):
+                    for interface in (ep.get('interface'), _ANY):
+                        catalog.setdefault(
+                            (service['type'], region, interface), ep)
+        return catalog
+
+    def _base_url(self, filters, auth_data):
         service = filters.get('service')
         region = filters.get('region')
         endpoint_type = filters.get('endpoint_type', 'public')
@@ -351,29 +584,21 @@ class KeystoneV3AuthProvider(KeystoneAuthProvider):
 
         if 'URL' in endpoint_type:
             endpoint_type = endpoint_type.replace('URL', '')
-        _base_url = None
-        catalog = _auth_data['catalog']
-        # Select entries with matching service type
-        service_catalog = [ep for ep in catalog if ep['type'] == service]
-        if len(service_catalog) > 0:
-            service_catalog = service_catalog[0]['endpoints']
-        else:
+        catalog = self._get_catalog(auth_data)
+        if (service, _ANY, _ANY) not in catalog:
             # No matching service
             raise exceptions.EndpointNotFound(service)
-        # Filter by endpoint type (interface)
-        filtered_catalog = [ep for ep in service_catalog if
-                            ep['interface'] == endpoint_type]
-        if len(filtered_catalog) == 0:
-            # No matching type, keep all and try matching by region at least
-            filtered_catalog = service_catalog
-        # Filter by region
-        filtered_catalog = [ep for ep in filtered_catalog if
-                            ep['region'] == region]
-        if len(filtered_catalog) == 0:
+        # Match the endpoint type (interface), if any endpoint has it
+        interface = endpoint_type
+        if (service, _ANY, interface) not in catalog:
+            # No matching type, try matching by region at least
+            interface = _ANY
+        # Match the region, there should be only one match
+        ep = catalog.get((service, region, interface))
+        if ep is None:
             # No matching region, take the first endpoint
-            filtered_catalog = [service_catalog[0]]
-        # There should be only one match. If not take the first.
-        _base_url = filtered_catalog[0].get('url', None)
+            ep = catalog[(service, _ANY, _ANY)]
+        _base_url = ep.get('url', None)
         if _base_url is None:
                 raise exceptions.EndpointNotFound(service)
 
@@ -389,8 +614,11 @@ class KeystoneV3AuthProvider(KeystoneAuthProvider):
 
         return _base_url
 
-    def is_expired(self, auth_data):
+    def get_tenant_id(self):
+        _, access = self.auth_data
+        return access.get('project', {}).get('id')
+
+    def get_expiry(self, auth_data):
         _, access = auth_data
-        expiry = datetime.strptime(access['expires_at'],
-                                   self.EXPIRY_DATE_FORMAT)
-        return expiry <= datetime.now()
+        return datetime.strptime(access['expires_at'],
+                                 self.EXPIRY_DATE_FORMAT)
@@ -14,170 +14,175 @@
 #    under the License.
 
 # Default client libs
-import cinderclient.client
-import glanceclient
-import heatclient.client
-import keystoneclient.exceptions
-import keystoneclient.v2_0.client
-import neutronclient.v2_0.client
-import novaclient.client
-import swiftclient
-
 from tempest.common.rest_client import NegativeRestClient
 from tempest import config
 from tempest import exceptions
 from tempest import manager
+from tempest.openstack.common import importutils
 from tempest.openstack.common import log as logging
-from tempest.services.baremetal.v1.client_json import BaremetalClientJSON
-from tempest.services import botoclients
-from tempest.services.compute.json.aggregates_client import \
-    AggregatesClientJSON
-from tempest.services.compute.json.availability_zone_client import \
-    AvailabilityZoneClientJSON
-from tempest.services.compute.json.certificates_client import \
-    CertificatesClientJSON
-from tempest.services.compute.json.extensions_client import \
-    ExtensionsClientJSON
-from tempest.services.compute.json.fixed_ips_client import FixedIPsClientJSON
-from tempest.services.compute.json.flavors_client import FlavorsClientJSON
-from tempest.services.compute.json.floating_ips_client import \
-    FloatingIPsClientJSON
-from tempest.services.compute.json.hosts_client import HostsClientJSON
-from tempest.services.compute.json.hypervisor_client import \
-    HypervisorClientJSON
-from tempest.services.compute.json.images_client import ImagesClientJSON
-from tempest.services.compute.json.instance_usage_audit_log_client import \
-    InstanceUsagesAuditLogClientJSON
-from tempest.services.compute.json.interfaces_client import \
-    InterfacesClientJSON
-from tempest.services.compute.json.keypairs_client import KeyPairsClientJSON
-from tempest.services.compute.json.limits_client import LimitsClientJSON
-from tempest.services.compute.json.quotas_client import QuotasClientJSON
-from tempest.services.compute.json.security_groups_client import \
-    SecurityGroupsClientJSON
-from tempest.services.compute.json.servers_client import ServersClientJSON
-from tempest.services.compute.json.services_client import ServicesClientJSON
-from tempest.services.compute.json.tenant_usages_client import \
-    TenantUsagesClientJSON
-from tempest.services.compute.json.volumes_extensions_client import \
-    VolumesExtensionsClientJSON
-from tempest.services.compute.v3.json.aggregates_client import \
-    AggregatesV3ClientJSON
-from tempest.services.compute.v3.json.availability_zone_client import \
-    AvailabilityZoneV3ClientJSON
-from tempest.services.compute.v3.json.certificates_client import \
-    CertificatesV3ClientJSON
-from tempest.services.compute.v3.json.extensions_client import \
-    ExtensionsV3ClientJSON
-from tempest.services.compute.v3.json.flavors_client import FlavorsV3ClientJSON
-from tempest.services.compute.v3.json.hosts_client import HostsV3ClientJSON
-from tempest.services.compute.v3.json.hypervisor_client import \
-    HypervisorV3ClientJSON
-from tempest.services.compute.v3.json.interfaces_client import \
-    InterfacesV3ClientJSON
-from tempest.services.compute.v3.json.keypairs_client import \
-    KeyPairsV3ClientJSON
-from tempest.services.compute.v3.json.quotas_client import \
-    QuotasV3ClientJSON
-from tempest.services.compute.v3.json.servers_client import \
-    ServersV3ClientJSON
-from tempest.services.compute.v3.json.services_client import \
-    ServicesV3ClientJSON
-from tempest.services.compute.v3.json.version_client import \
-    VersionV3ClientJSON
-from tempest.services.compute.xml.aggregates_client import AggregatesClientXML
-from tempest.services.compute.xml.availability_zone_client import \
-    AvailabilityZoneClientXML
-from tempest.services.compute.xml.certificates_client import \
-    CertificatesClientXML
-from tempest.services.compute.xml.extensions_client import ExtensionsClientXML
-from tempest.services.compute.xml.fixed_ips_client import FixedIPsClientXML
-from tempest.services.compute.xml.flavors_client import FlavorsClientXML
-from tempest.services.compute.xml.floating_ips_client import \
-    FloatingIPsClientXML
-from tempest.services.compute.xml.hosts_client import HostsClientXML
-from tempest.services.compute.xml.hypervisor_client import HypervisorClientXML
-from tempest.services.compute.xml.images_client import ImagesClientXML
-from tempest.services.compute.xml.instance_usage_audit_log_client import \
-    InstanceUsagesAuditLogClientXML
-from tempest.services.compute.xml.interfaces_client import \
-    InterfacesClientXML
-from tempest.services.compute.xml.keypairs_client import KeyPairsClientXML
-from tempest.services.compute.xml.limits_client import LimitsClientXML
-from tempest.services.compute.xml.quotas_client import QuotasClientXML
-from tempest.services.compute.xml.security_groups_client \
-    import SecurityGroupsClientXML
-from tempest.services.compute.xml.servers_client import ServersClientXML
-from tempest.services.compute.xml.services_client import ServicesClientXML
-from tempest.services.compute.xml.tenant_usages_client import \
-    TenantUsagesClientXML
-from tempest.services.compute.xml.volumes_extensions_client import \
-    VolumesExtensionsClientXML
-from tempest.services.data_processing.v1_1.client import DataProcessingClient
-from tempest.services.identity.json.identity_client import IdentityClientJSON
-from tempest.services.identity.json.identity_client import TokenClientJSON
-from tempest.services.identity.v3.json.credentials_client import \
-    CredentialsClientJSON
-from tempest.services.identity.v3.json.endpoints_client import \
-    EndPointClientJSON
-from tempest.services.identity.v3.json.identity_client import \
-    IdentityV3ClientJSON
-from tempest.services.identity.v3.json.identity_client import V3TokenClientJSON
-from tempest.services.identity.v3.json.policy_client import PolicyClientJSON
-from tempest.services.identity.v3.json.service_client import \
-    ServiceClientJSON
-from tempest.services.identity.v3.xml.credentials_client import \
-    CredentialsClientXML
-from tempest.services.identity.v3.xml.endpoints_client import EndPointClientXML
-from tempest.services.identity.v3.xml.identity_client import \
-    IdentityV3ClientXML
-from tempest.services.identity.v3.xml.identity_client import V3TokenClientXML
-from tempest.services.identity.v3.xml.policy_client import PolicyClientXML
-from tempest.services.identity.v3.xml.service_client import \
-    ServiceClientXML
-from tempest.services.identity.xml.identity_client import IdentityClientXML
-from tempest.services.identity.xml.identity_client import TokenClientXML
-from tempest.services.image.v1.json.image_client import ImageClientJSON
-from tempest.services.image.v2.json.image_client import ImageClientV2JSON
-from tempest.services.network.json.network_client import NetworkClientJSON
-from tempest.services.network.xml.network_client import NetworkClientXML
-from tempest.services.object_storage.account_client import AccountClient
-from tempest.services.object_storage.account_client import \
-    AccountClientCustomizedHeader
-from tempest.services.object_storage.container_client import ContainerClient
-from tempest.services.object_storage.object_client import ObjectClient
-from tempest.services.object_storage.object_client import \
-    ObjectClientCustomizedHeader
-from tempest.services.orchestration.json.orchestration_client import \
-    OrchestrationClient
-from tempest.services.telemetry.json.telemetry_client import \
-    TelemetryClientJSON
-from tempest.services.telemetry.xml.telemetry_client import \
-    TelemetryClientXML
-from tempest.services.volume.json.admin.volume_hosts_client import \
-    VolumeHostsClientJSON
-from tempest.services.volume.json.admin.volume_types_client import \
-    VolumeTypesClientJSON
-from tempest.services.volume.json.backups_client import BackupsClientJSON
-from tempest.services.volume.json.extensions_client import \
-    ExtensionsClientJSON as VolumeExtensionClientJSON
-from tempest.services.volume.json.snapshots_client import SnapshotsClientJSON
-from tempest.services.volume.json.volumes_client import VolumesClientJSON
-from tempest.services.volume.v2.json.volumes_client import VolumesV2ClientJSON
-from tempest.services.volume.v2.xml.volumes_client import VolumesV2ClientXML
-from tempest.services.volume.xml.admin.volume_hosts_client import \
-    VolumeHostsClientXML
-from tempest.services.volume.xml.admin.volume_types_client import \
-    VolumeTypesClientXML
-from tempest.services.volume.xml.backups_client import BackupsClientXML
-from tempest.services.volume.xml.extensions_client import \
-    ExtensionsClientXML as VolumeExtensionClientXML
-from tempest.services.volume.xml.snapshots_client import SnapshotsClientXML
-from tempest.services.volume.xml.volumes_client import VolumesClientXML
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
+# The service clients are imported on first use, so that importing this
+# module (and tempest.test) does not load every service client module.
+# Paths are relative to SERVICES_PACKAGE.
+SERVICES_PACKAGE = 'tempest.services.'
+
+XML_CLIENTS = {
+    'aggregates_client': 'compute.xml.aggregates_client.AggregatesClientXML',
+    'availability_zone_client': (
+        'compute.xml.availability_zone_client.AvailabilityZoneClientXML'),
+    'backups_client': 'volume.xml.backups_client.BackupsClientXML',
+    'certificates_client': (
+        'compute.xml.certificates_client.CertificatesClientXML'),
+    'credentials_client': (
+        'identity.v3.xml.credentials_client.CredentialsClientXML'),
+    'endpoints_client': 'identity.v3.xml.endpoints_client.EndPointClientXML',
+    'extensions_client': 'compute.xml.extensions_client.ExtensionsClientXML',
+    'fixed_ips_client': 'compute.xml.fixed_ips_client.FixedIPsClientXML',
+    'flavors_client': 'compute.xml.flavors_client.FlavorsClientXML',
+    'floating_ips_client': (
+        'compute.xml.floating_ips_client.FloatingIPsClientXML'),
+    'hosts_client': 'compute.xml.hosts_client.HostsClientXML',
+    'hypervisor_client': 'compute.xml.hypervisor_client.HypervisorClientXML',
+    'identity_client': 'identity.xml.identity_client.IdentityClientXML',
+    'identity_v3_client': (
+        'identity.v3.xml.identity_client.IdentityV3ClientXML'),
+    'images_client': 'compute.xml.images_client.ImagesClientXML',
+    'instance_usages_audit_log_client': (
+        'compute.xml.instance_usage_audit_log_client.'
+        'InstanceUsagesAuditLogClientXML'),
+    'interfaces_client': 'compute.xml.interfaces_client.InterfacesClientXML',
+    'keypairs_client': 'compute.xml.keypairs_client.KeyPairsClientXML',
+    'limits_client': 'compute.xml.limits_client.LimitsClientXML',
+    'network_client': 'network.xml.network_client.NetworkClientXML',
+    'policy_client': 'identity.v3.xml.policy_client.PolicyClientXML',
+    'quotas_client': 'compute.xml.quotas_client.QuotasClientXML',
+    'security_groups_client': (
+        'compute.xml.security_groups_client.SecurityGroupsClientXML'),
+    'servers_client': 'compute.xml.servers_client.ServersClientXML',
+    'service_client': 'identity.v3.xml.service_client.ServiceClientXML',
+    'services_client': 'compute.xml.services_client.ServicesClientXML',
+    'snapshots_client': 'volume.xml.snapshots_client.SnapshotsClientXML',
+    'telemetry_client': 'telemetry.xml.telemetry_client.TelemetryClientXML',
+    'tenant_usages_client': (
+        'compute.xml.tenant_usages_client.TenantUsagesClientXML'),
+    'volume_hosts_client': (
+        'volume.xml.admin.volume_hosts_client.VolumeHostsClientXML'),
+    'volume_types_client': (
+        'volume.xml.admin.volume_types_client.VolumeTypesClientXML'),
+    'volumes_client': 'volume.xml.volumes_client.VolumesClientXML',
+    'volumes_extension_client': (
+        'volume.xml.extensions_client.ExtensionsClientXML'),
+    'volumes_extensions_client': (
+        'compute.xml.volumes_extensions_client.VolumesExtensionsClientXML'),
+    'volumes_v2_client': 'volume.v2.xml.volumes_client.VolumesV2ClientXML',
+}
+
+JSON_CLIENTS = {
+    'aggregates_client': 'compute.json.aggregates_client.AggregatesClientJSON',
+    'aggregates_v3_client': (
+        'compute.v3.json.aggregates_client.AggregatesV3ClientJSON'),
+    'availability_zone_client': (
+        'compute.json.availability_zone_client.AvailabilityZoneClientJSON'),
+    'availability_zone_v3_client': (
+        'compute.v3.json.availability_zone_client.'
+        'AvailabilityZoneV3ClientJSON'),
+    'backups_client': 'volume.json.backups_client.BackupsClientJSON',
+    'baremetal_client': 'baremetal.v1.client_json.BaremetalClientJSON',
+    'certificates_client': (
+        'compute.json.certificates_client.CertificatesClientJSON'),
+    'certificates_v3_client': (
+        'compute.v3.json.certificates_client.CertificatesV3ClientJSON'),
+    'credentials_client': (
+        'identity.v3.json.credentials_client.CredentialsClientJSON'),
+    'endpoints_client': 'identity.v3.json.endpoints_client.EndPointClientJSON',
+    'extensions_client': 'compute.json.extensions_client.ExtensionsClientJSON',
+    'extensions_v3_client': (
+        'compute.v3.json.extensions_client.ExtensionsV3ClientJSON'),
+    'fixed_ips_client': 'compute.json.fixed_ips_client.FixedIPsClientJSON',
+    'flavors_client': 'compute.json.flavors_client.FlavorsClientJSON',
+    'flavors_v3_client': 'compute.v3.json.flavors_client.FlavorsV3ClientJSON',
+    'floating_ips_client': (
+        'compute.json.floating_ips_client.FloatingIPsClientJSON'),
+    'hosts_client': 'compute.json.hosts_client.HostsClientJSON',
+    'hosts_v3_client': 'compute.v3.json.hosts_client.HostsV3ClientJSON',
+    'hypervisor_client': 'compute.json.hypervisor_client.HypervisorClientJSON',
+    'hypervisor_v3_client': (
+        'compute.v3.json.hypervisor_client.HypervisorV3ClientJSON'),
+    'identity_client': 'identity.json.identity_client.IdentityClientJSON',
+    'identity_v3_client': (
+        'identity.v3.json.identity_client.IdentityV3ClientJSON'),
+    'images_client': 'compute.json.images_client.ImagesClientJSON',
+    'instance_usages_audit_log_client': (
+        'compute.json.instance_usage_audit_log_client.'
+        'InstanceUsagesAuditLogClientJSON'),
+    'interfaces_client': 'compute.json.interfaces_client.InterfacesClientJSON',
+    'interfaces_v3_client': (
+        'compute.v3.json.interfaces_client.InterfacesV3ClientJSON'),
+    'keypairs_client': 'compute.json.keypairs_client.KeyPairsClientJSON',
+    'keypairs_v3_client': (
+        'compute.v3.json.keypairs_client.KeyPairsV3ClientJSON'),
+    'limits_client': 'compute.json.limits_client.LimitsClientJSON',
+    'network_client': 'network.json.network_client.NetworkClientJSON',
+    'policy_client': 'identity.v3.json.policy_client.PolicyClientJSON',
+    'quotas_client': 'compute.json.quotas_client.QuotasClientJSON',
+    'quotas_v3_client': 'compute.v3.json.quotas_client.QuotasV3ClientJSON',
+    'security_groups_client': (
+        'compute.json.security_groups_client.SecurityGroupsClientJSON'),
+    'servers_client': 'compute.json.servers_client.ServersClientJSON',
+    'servers_v3_client': 'compute.v3.json.servers_client.ServersV3ClientJSON',
+    'service_client': 'identity.v3.json.service_client.ServiceClientJSON',
+    'services_client': 'compute.json.services_client.ServicesClientJSON',
+    'services_v3_client': (
+        'compute.v3.json.services_client.ServicesV3ClientJSON'),
+    'snapshots_client': 'volume.json.snapshots_client.SnapshotsClientJSON',
+    'telemetry_client': 'telemetry.json.telemetry_client.TelemetryClientJSON',
+    'tenant_usages_client': (
+        'compute.json.tenant_usages_client.TenantUsagesClientJSON'),
+    'version_v3_client': 'compute.v3.json.version_client.VersionV3ClientJSON',
+    'volume_hosts_client': (
+        'volume.json.admin.volume_hosts_client.VolumeHostsClientJSON'),
+    'volume_types_client': (
+        'volume.json.admin.volume_types_client.VolumeTypesClientJSON'),
+    'volumes_client': 'volume.json.volumes_client.VolumesClientJSON',
+    'volumes_extension_client': (
+        'volume.json.extensions_client.ExtensionsClientJSON'),
+    'volumes_extensions_client': (
+        'compute.json.volumes_extensions_client.VolumesExtensionsClientJSON'),
+    'volumes_v2_client': 'volume.v2.json.volumes_client.VolumesV2ClientJSON',
+}
+
+COMMON_CLIENTS = {
+    'account_client': 'object_storage.account_client.AccountClient',
+    'container_client': 'object_storage.container_client.ContainerClient',
+    'custom_account_client': (
+        'object_storage.account_client.AccountClientCustomizedHeader'),
+    'custom_object_client': (
+        'object_storage.object_client.ObjectClientCustomizedHeader'),
+    'data_processing_client': (
+        'data_processing.v1_1.client.DataProcessingClient'),
+    'image_client': 'image.v1.json.image_client.ImageClientJSON',
+    'image_client_v2': 'image.v2.json.image_client.ImageClientV2JSON',
+    'object_client': 'object_storage.object_client.ObjectClient',
+    'orchestration_client': (
+        'orchestration.json.orchestration_client.OrchestrationClient'),
+}
+
+
+EC2_CLIENTS = {
+    'ec2api_client': 'botoclients.APIClientEC2',
+    's3_client': 'botoclients.ObjectClientS3',
+}
+
+TOKEN_CLIENTS = {
+    'xml': ('identity.xml.identity_client.TokenClientXML',
+            'identity.v3.xml.identity_client.V3TokenClientXML'),
+    'json': ('identity.json.identity_client.TokenClientJSON',
+             'identity.v3.json.identity_client.V3TokenClientJSON'),
+}
+
 
 class Manager(manager.Manager):
 
@@ -195,6 +200,9 @@ class Manager(manager.Manager):
         :param username: Override of the username
         :param password: Override of the password
         :param tenant_name: Override of the tenant name
+
+        The service clients are built on first access, so that a test class
+        only pays for the clients it actually uses.
         """
         self.interface = interface
         self.client_type = 'tempest'
@@ -203,144 +211,29 @@ class Manager(manager.Manager):
             username=username, password=password, tenant_name=tenant_name)
 
         if self.interface == 'xml':
-            self.certificates_client = CertificatesClientXML(
-                self.auth_provider)
-            self.servers_client = ServersClientXML(self.auth_provider)
-            self.limits_client = LimitsClientXML(self.auth_provider)
-            self.images_client = ImagesClientXML(self.auth_provider)
-            self.keypairs_client = KeyPairsClientXML(self.auth_provider)
-            self.quotas_client = QuotasClientXML(self.auth_provider)
-            self.flavors_client = FlavorsClientXML(self.auth_provider)
-            self.extensions_client = ExtensionsClientXML(self.auth_provider)
-            self.volumes_extensions_client = VolumesExtensionsClientXML(
-                self.auth_provider)
-            self.floating_ips_client = FloatingIPsClientXML(
-                self.auth_provider)
-            self.backups_client = BackupsClientXML(self.auth_provider)
-            self.snapshots_client = SnapshotsClientXML(self.auth_provider)
-            self.volumes_client = VolumesClientXML(self.auth_provider)
-            self.volumes_v2_client = VolumesV2ClientXML(self.auth_provider)
-            self.volume_types_client = VolumeTypesClientXML(
-                self.auth_provider)
-            self.identity_client = IdentityClientXML(self.auth_provider)
-            self.identity_v3_client = IdentityV3ClientXML(
-                self.auth_provider)
-            self.security_groups_client = SecurityGroupsClientXML(
-                self.auth_provider)
-            self.interfaces_client = InterfacesClientXML(self.auth_provider)
-            self.endpoints_client = EndPointClientXML(self.auth_provider)
-            self.fixed_ips_client = FixedIPsClientXML(self.auth_provider)
-            self.availability_zone_client = AvailabilityZoneClientXML(
-                self.auth_provider)
-            self.service_client = ServiceClientXML(self.auth_provider)
-            self.aggregates_client = AggregatesClientXML(self.auth_provider)
-            self.services_client = ServicesClientXML(self.auth_provider)
-            self.tenant_usages_client = TenantUsagesClientXML(
-                self.auth_provider)
-            self.policy_client = PolicyClientXML(self.auth_provider)
-            self.hosts_client = HostsClientXML(self.auth_provider)
-            self.hypervisor_client = HypervisorClientXML(self.auth_provider)
-            self.network_client = NetworkClientXML(self.auth_provider)
-            self.credentials_client = CredentialsClientXML(
-                self.auth_provider)
-            self.instance_usages_audit_log_client = \
-                InstanceUsagesAuditLogClientXML(self.auth_provider)
-            self.volume_hosts_client = VolumeHostsClientXML(
-                self.auth_provider)
-            self.volumes_extension_client = VolumeExtensionClientXML(
-                self.auth_provider)
-            if CONF.service_available.ceilometer:
-                self.telemetry_client = TelemetryClientXML(
-                    self.auth_provider)
-            self.token_client = TokenClientXML()
-            self.token_v3_client = V3TokenClientXML()
-
+            clients = XML_CLIENTS
         elif self.interface == 'json':
-            self.certificates_client = CertificatesClientJSON(
-                self.auth_provider)
-            self.certificates_v3_client = CertificatesV3ClientJSON(
-                self.auth_provider)
-            self.baremetal_client = BaremetalClientJSON(self.auth_provider)
-            self.servers_client = ServersClientJSON(self.auth_provider)
-            self.servers_v3_client = ServersV3ClientJSON(self.auth_provider)
-            self.limits_client = LimitsClientJSON(self.auth_provider)
-            self.images_client = ImagesClientJSON(self.auth_provider)
-            self.keypairs_v3_client = KeyPairsV3ClientJSON(
-                self.auth_provider)
-            self.keypairs_client = KeyPairsClientJSON(self.auth_provider)
-            self.keypairs_v3_client = KeyPairsV3ClientJSON(
-                self.auth_provider)
-            self.quotas_client = QuotasClientJSON(self.auth_provider)
-            self.quotas_v3_client = QuotasV3ClientJSON(self.auth_provider)
-            self.flavors_client = FlavorsClientJSON(self.auth_provider)
-            self.flavors_v3_client = FlavorsV3ClientJSON(self.auth_provider)
-            self.extensions_v3_client = ExtensionsV3ClientJSON(
-                self.auth_provider)
-            self.extensions_client = ExtensionsClientJSON(
-                self.auth_provider)
-            self.volumes_extensions_client = VolumesExtensionsClientJSON(
-                self.auth_provider)
-            self.floating_ips_client = FloatingIPsClientJSON(
-                self.auth_provider)
-            self.backups_client = BackupsClientJSON(self.auth_provider)
-            self.snapshots_client = SnapshotsClientJSON(self.auth_provider)
-            self.volumes_client = VolumesClientJSON(self.auth_provider)
-            self.volumes_v2_client = VolumesV2ClientJSON(self.auth_provider)
-            self.volume_types_client = VolumeTypesClientJSON(
-                self.auth_provider)
-            self.identity_client = IdentityClientJSON(self.auth_provider)
-            self.identity_v3_client = IdentityV3ClientJSON(
-                self.auth_provider)
-            self.security_groups_client = SecurityGroupsClientJSON(
-                self.auth_provider)
-            self.interfaces_v3_client = InterfacesV3ClientJSON(
-                self.auth_provider)
-            self.interfaces_client = InterfacesClientJSON(
-                self.auth_provider)
-            self.endpoints_client = EndPointClientJSON(self.auth_provider)
-            self.fixed_ips_client = FixedIPsClientJSON(self.auth_provider)
-            self.availability_zone_v3_client = AvailabilityZoneV3ClientJSON(
-                self.auth_provider)
-            self.availability_zone_client = AvailabilityZoneClientJSON(
-                self.auth_provider)
-            self.services_v3_client = ServicesV3ClientJSON(
-                self.auth_provider)
-            self.service_client = ServiceClientJSON(self.auth_provider)
-            self.aggregates_v3_client = AggregatesV3ClientJSON(
-                self.auth_provider)
-            self.aggregates_client = AggregatesClientJSON(
-                self.auth_provider)
-            self.services_client = ServicesClientJSON(self.auth_provider)
-            self.tenant_usages_client = TenantUsagesClientJSON(
-                self.auth_provider)
-            self.version_v3_client = VersionV3ClientJSON(self.auth_provider)
-            self.policy_client = PolicyClientJSON(self.auth_provider)
-            self.hosts_client = HostsClientJSON(self.auth_provider)
-            self.hypervisor_v3_client = HypervisorV3ClientJSON(
-                self.auth_provider)
-            self.hypervisor_client = HypervisorClientJSON(
-                self.auth_provider)
-            self.network_client = NetworkClientJSON(self.auth_provider)
-            self.credentials_client = CredentialsClientJSON(
-                self.auth_provider)
-            self.instance_usages_audit_log_client = \
-                InstanceUsagesAuditLogClientJSON(self.auth_provider)
-            self.volume_hosts_client = VolumeHostsClientJSON(
-                self.auth_provider)
-            self.volumes_extension_client = VolumeExtensionClientJSON(
-                self.auth_provider)
-            self.hosts_v3_client = HostsV3ClientJSON(self.auth_provider)
-            if CONF.service_available.ceilometer:
-                self.telemetry_client = TelemetryClientJSON(
-                    self.auth_provider)
-            self.token_client = TokenClientJSON()
-            self.token_v3_client = V3TokenClientJSON()
-            self.negative_client = NegativeRestClient(self.auth_provider)
-            self.negative_client.service = service
-
+            clients = JSON_CLIENTS
+            self._set_client_factory('negative_client',
+                                     self._get_negative_client, service)
         else:
             msg = "Unsupported interface type `%s'" % interface
             raise exceptions.InvalidConfiguration(msg)
+        clients = dict(clients, **COMMON_CLIENTS)
+        if not CONF.service_available.ceilometer:
+            del clients['telemetry_client']
+        if not CONF.service_available.glance:
+            del clients['image_client']
+            del clients['image_client_v2']
+        for name, path in clients.items():
+            self._set_client_factory(name, importutils.import_object,
+                                     SERVICES_PACKAGE + path,
+                                     self.auth_provider)
+        token_client, token_v3_client = TOKEN_CLIENTS[self.interface]
+        self._set_client_factory('token_client', importutils.import_object,
+                                 SERVICES_PACKAGE + token_client)
+        self._set_client_factory('token_v3_client', importutils.import_object,
+                                 SERVICES_PACKAGE + token_v3_client)
 
         # TODO(andreaf) EC2 client still do their auth, v2 only
         ec2_client_args = (self.credentials.get('username'),
@@ -348,23 +241,15 @@ class Manager(manager.Manager):
                            CONF.identity.uri,
                            self.credentials.get('tenant_name'))
 
-        # common clients
-        self.account_client = AccountClient(self.auth_provider)
-        if CONF.service_available.glance:
-            self.image_client = ImageClientJSON(self.auth_provider)
-            self.image_client_v2 = ImageClientV2JSON(self.auth_provider)
-        self.container_client = ContainerClient(self.auth_provider)
-        self.object_client = ObjectClient(self.auth_provider)
-        self.orchestration_client = OrchestrationClient(
-            self.auth_provider)
-        self.ec2api_client = botoclients.APIClientEC2(*ec2_client_args)
-        self.s3_client = botoclients.ObjectClientS3(*ec2_client_args)
-        self.custom_object_client = ObjectClientCustomizedHeader(
-            self.auth_provider)
-        self.custom_account_client = \
-            AccountClientCustomizedHeader(self.auth_provider)
-        self.data_processing_client = DataProcessingClient(
-            self.auth_provider)
+        for name, path in EC2_CLIENTS.items():
+            self._set_client_factory(name, importutils.import_object,
+                                     SERVICES_PACKAGE + path,
+                                     *ec2_client_args)
+
+    def _get_negative_client(self, service):
+        negative_client = NegativeRestClient(self.auth_provider)
+        negative_client.service = service
+        return negative_client
 
 
 class AltManager(Manager):
@@ -435,6 +320,9 @@ class OfficialClientManager(manager.Manager):
     """
     Manager that provides access to the official python clients for
     calling various OpenStack APIs.
+
+    The official client libraries are imported when the client is first
+    accessed: most test runs do not need them.
     """
 
     NOVACLIENT_VERSION = '2'
@@ -449,27 +337,25 @@ class OfficialClientManager(manager.Manager):
         # super cares for credentials validation
         super(OfficialClientManager, self).__init__(
             username=username, password=password, tenant_name=tenant_name)
-        self.compute_client = self._get_compute_client(username,
-                                                       password,
-                                                       tenant_name)
-        self.identity_client = self._get_identity_client(username,
-                                                         password,
-                                                         tenant_name)
-        self.image_client = self._get_image_client()
-        self.network_client = self._get_network_client()
-        self.volume_client = self._get_volume_client(username,
-                                                     password,
-                                                     tenant_name)
-        self.object_storage_client = self._get_object_storage_client(
-            username,
-            password,
-            tenant_name)
-        self.orchestration_client = self._get_orchestration_client(
-            username,
-            password,
-            tenant_name)
+        credentials = (username, password, tenant_name)
+        self._set_client_factory('compute_client', self._get_compute_client,
+                                 *credentials)
+        self._set_client_factory('identity_client',
+                                 self._get_identity_client, *credentials)
+        self._set_client_factory('image_client', self._get_image_client)
+        self._set_client_factory('network_client', self._get_network_client)
+        self._set_client_factory('volume_client', self._get_volume_client,
+                                 *credentials)
+        self._set_client_factory('object_storage_client',
+                                 self._get_object_storage_client,
+                                 *credentials)
+        self._set_client_factory('orchestration_client',
+                                 self._get_orchestration_client,
+                                 *credentials)
 
     def _get_compute_client(self, username, password, tenant_name):
+        import novaclient.client
+
         # Novaclient will not execute operations for anyone but the
         # identified user, so a new client needs to be created for
         # each user that operations need to be performed for.
@@ -494,6 +380,8 @@ class OfficialClientManager(manager.Manager):
                                         http_log_debug=True)
 
     def _get_image_client(self):
+        import glanceclient
+
         token = self.identity_client.auth_token
         region = CONF.identity.region
         endpoint_type = CONF.image.endpoint_type
@@ -505,6 +393,8 @@ class OfficialClientManager(manager.Manager):
                                    insecure=dscv)
 
     def _get_volume_client(self, username, password, tenant_name):
+        import cinderclient.client
+
         auth_url = CONF.identity.uri
         region = CONF.identity.region
         endpoint_type = CONF.volume.endpoint_type
@@ -518,6 +408,9 @@ class OfficialClientManager(manager.Manager):
                                           http_log_debug=True)
 
     def _get_object_storage_client(self, username, password, tenant_name):
+        import keystoneclient.exceptions
+        import swiftclient
+
         auth_url = CONF.identity.uri
         # add current tenant to swift operator role group.
         keystone_admin = self._get_identity_client(
@@ -547,6 +440,9 @@ class OfficialClientManager(manager.Manager):
 
     def _get_orchestration_client(self, username=None, password=None,
                                   tenant_name=None):
+        import heatclient.client
+        import keystoneclient.exceptions
+
         if not username:
             username = CONF.identity.admin_username
         if not password:
@@ -577,6 +473,8 @@ class OfficialClientManager(manager.Manager):
                                             password=password)
 
     def _get_identity_client(self, username, password, tenant_name):
+        import keystoneclient.v2_0.client
+
         # This identity client is not intended to check the security
         # of the identity service, so use admin credentials by default.
         self._validate_credentials(username, password, tenant_name)
@@ -591,6 +489,8 @@ class OfficialClientManager(manager.Manager):
                                                  insecure=dscv)
 
     def _get_network_client(self):
+        import neutronclient.v2_0.client
+
         # The intended configuration is for the network client to have
         # admin privileges and indicate for whom resources are being
         # created via a 'tenant_id' parameter.  This will often be
@@ -0,0 +1,348 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Record and replay of the HTTP requests of the service clients.
+
+With the [service-clients] cassette_mode set to record, the request and
+response pairs sent by the HTTP objects of the REST clients and by the
+glance HTTP client are written to a cassette file per test in
+cassette_dir. The requests sent by the fixtures of a test class go to the
+cassette of the class.
+
+With cassette_mode set to replay, the same requests are answered from the
+cassettes without any network access, like the fake HTTP objects of the
+unit tests do. A request is answered by the first response recorded for
+the same method and URL which was not replayed yet, or else for the same
+method and URL template, so that the requests holding ids or query values
+which differ from the recording still find their response.
+
+The tokens of the recorded token responses are replaced by a placeholder,
+so that no live token is written to the cassettes. The replayed tokens
+expire in the far future, since the expiry they were recorded with has
+passed.
+
+Selecting the cassette of a test does not load the configuration: the
+cassette_mode is only read when the first request is sent. A cassette is
+dropped once another one is in use, except the cassette of a test class
+while one of its tests runs.
+"""
+
+import base64
+import json
+import os
+import re
+import threading
+
+from tempest.common import latency
+from tempest import config
+from tempest import exceptions
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+RECORD = 'record'
+REPLAY = 'replay'
+DEFAULT_CASSETTE = 'default'
+
+# Characters of the test ids which are not kept in the cassette file names
+_FILE_NAME_RE = re.compile('[^A-Za-z0-9_.-]')
+
+# Token recorded in place of the issued ones
+REDACTED_TOKEN = 'redacted-token'
+# Expiry of the replayed tokens, in the formats of the v2 and v3 APIs
+REPLAYED_TOKEN_EXPIRY = '2100-01-01T00:00:00Z'
+REPLAYED_TOKEN_EXPIRY_V3 = '2100-01-01T00:00:00.000000Z'
+
+_lock = threading.Lock()
+_cassettes = {}
+_current = None
+# Name of the cassette the next requests go to
+_name = DEFAULT_CASSETTE
+
+
+class Cassette(object):
+    """The recorded interactions of a test, in the order they happened."""
+
+    def __init__(self, name, path, interactions=None):
+        self.name = name
+        self.path = path
+        self.interactions = interactions or []
+        self._played = [False] * len(self.interactions)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, name, path):
+        interactions = []
+        if os.path.exists(path):
+            with open(path) as f:
+                interactions = json.load(f)
+        return cls(name, path, interactions)
+
+    def save(self):
+        with self._lock:
+            if not self.interactions:
+                return
+            with open(self.path, 'w') as f:
+                json.dump(self.interactions, f, separators=(',', ':'))
+
+    def record(self, method, url, status, headers, body):
+        interaction = {'method': method.upper(), 'url': url,
+                       'status': int(status), 'headers': headers}
+        if body:
+            try:
+                interaction['body'] = body.decode('utf-8')
+            except UnicodeError:
+                interaction['body_b64'] = base64.b64encode(body).decode(
+                    'ascii')
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def _find(self, match):
+        for index, interaction in enumerate(self.interactions):
+            if not self._played[index] and match(interaction):
+                self._played[index] = True
+                return interaction
+
+    def play(self, method, url):
+        """
+        Returns the (status, headers, body) recorded for the request.
+        """
+        method = method.upper()
+        template = latency.url_template(url)
+        with self._lock:
+            interaction = (
+                self._find(lambda i: (i['method'] == method and
+                                      i['url'] == url)) or
+                self._find(lambda i: (i['method'] == method and
+                                      latency.url_template(i['url']) ==
+                                      template)))
+        if interaction is None:
+            raise exceptions.UnrecordedRequest(method=method, url=url,
+                                               cassette=self.path)
+        if 'body_b64' in interaction:
+            body = base64.b64decode(interaction['body_b64'])
+        else:
+            body = interaction.get('body', '').encode('utf-8')
+        return interaction['status'], interaction['headers'], body
+
+
+def mode():
+    """Returns RECORD, REPLAY or None when the cassettes are not used."""
+    cassette_mode = CONF.service_clients.cassette_mode
+    if cassette_mode in (RECORD, REPLAY):
+        return cassette_mode
+    return None
+
+
+def _path(name):
+    cassette_dir = CONF.service_clients.cassette_dir
+    if not cassette_dir:
+        raise exceptions.InvalidConfiguration(
+            "cassette_dir is required with the cassette_mode %s" % mode())
+    if not os.path.isdir(cassette_dir):
+        os.makedirs(cassette_dir)
+    return os.path.join(cassette_dir,
+                        _FILE_NAME_RE.sub('_', name) + '.json')
+
+
+def use(name):
+    """
+    Makes the cassette of the test or of the test class name the one the
+    next requests are recorded to, or replayed from. The cassette is only
+    loaded by the first of them.
+    """
+    global _current, _name
+    with _lock:
+        previous, _name = _name, name
+        if previous == name:
+            return
+        if _current is not None:
+            # A cassette is only in use once a request was recorded or
+            # replayed, the configuration is loaded by then
+            if mode() == RECORD:
+                _current.save()
+            _current = None
+        # The cassette of a test class is used again once its test is over
+        if not name.startswith(previous + '.'):
+            _cassettes.pop(previous, None)
+
+
+def current_name():
+    """Returns the name of the cassette in use, None before the first."""
+    if _current is None:
+        return None
+    return _current.name
+
+
+def current():
+    global _current
+    with _lock:
+        if _current is None:
+            if _name not in _cassettes:
+                if mode() == REPLAY:
+                    _cassettes[_name] = Cassette.load(_name, _path(_name))
+                else:
+                    _cassettes[_name] = Cassette(_name, _path(_name))
+            _current = _cassettes[_name]
+        return _current
+
+
+def save():
+    """Writes the cassette in use, when recording."""
+    if _current is not None and mode() == RECORD:
+        _current.save()
+
+
+def _is_token_request(method, url):
+    return method.upper() == 'POST' and url.split('?')[0].endswith('tokens')
+
+
+def _rewrite_json(headers, body, rewrite):
+    """
+    Returns the headers and the body of a JSON response with the body
+    rewritten by rewrite(data), which returns whether it changed it.
+    """
+    try:
+        data = json.loads(body)
+    except (TypeError, ValueError):
+        return headers, body
+    if not isinstance(data, dict) or not rewrite(data):
+        return headers, body
+    headers = dict((name, value) for name, value in headers.items()
+                   if name.lower() != 'content-length')
+    return headers, json.dumps(data).encode('utf-8')
+
+
+def _redact_token(headers, body):
+    """
+    Returns the headers and body of a token response with the token
+    replaced by REDACTED_TOKEN, for the v2 and the v3 APIs.
+    """
+    headers = dict((name, REDACTED_TOKEN
+                    if name.lower() == 'x-subject-token' else value)
+                   for name, value in headers.items())
+
+    def redact(data):
+        token = data.get('access', {}).get('token')
+        if not isinstance(token, dict) or 'id' not in token:
+            return False
+        token['id'] = REDACTED_TOKEN
+        return True
+
+    return _rewrite_json(headers, body, redact)
+
+
+def _unexpire_token(headers, body):
+    """
+    Returns the headers and body of a recorded token response with the
+    token expiring in the far future, so that the auth providers do not
+    request a new token, which was not recorded, before every request.
+    """
+    def unexpire(data):
+        token = data.get('access', {}).get('token')
+        if isinstance(token, dict) and 'expires' in token:
+            token['expires'] = REPLAYED_TOKEN_EXPIRY
+        elif isinstance(data.get('token'), dict) and (
+                'expires_at' in data['token']):
+            data['token']['expires_at'] = REPLAYED_TOKEN_EXPIRY_V3
+        else:
+            return False
+        return True
+
+    return _rewrite_json(headers, body, unexpire)
+
+
+def record(method, url, status, headers, body):
+    if _is_token_request(method, url):
+        headers, body = _redact_token(headers, body)
+    current().record(method, url, status, headers, body)
+
+
+def play(method, url):
+    LOG.debug("Replaying %s %s from %s" % (method, url, current().path))
+    status, headers, body = current().play(method, url)
+    if _is_token_request(method, url):
+        headers, body = _unexpire_token(headers, body)
+    return status, headers, body
+
+
+def httplib2_request(send, uri, method='GET', body=None, **kwargs):
+    """
+    Sends the request with send, an httplib2.Http.request like callable,
+    and records it, or replays it without calling send.
+    """
+    # Imported here since httplib2 is only used by the callers of this
+    # function and this module is imported by glance_http
+    import httplib2
+
+    cassette_mode = mode()
+    if cassette_mode == REPLAY:
+        status, headers, content = play(method, uri)
+        headers = dict(headers, status=str(status))
+        return httplib2.Response(headers), content
+    resp, content = send(uri, method, body=body, **kwargs)
+    if cassette_mode == RECORD:
+        headers = dict(resp)
+        headers.pop('status', None)
+        record(method, uri, resp.status, headers, content)
+    return resp, content
+
+
+class ReplayedResponse(object):
+    """httplib.HTTPResponse like response replayed from a cassette."""
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.reason = ''
+        self._headers = headers
+        self._body = body
+        self._offset = 0
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name.lower(), default)
+
+    def getheaders(self):
+        return list(self._headers.items())
+
+    def read(self, amt=None):
+        if amt is None:
+            end = len(self._body)
+        else:
+            end = min(self._offset + amt, len(self._body))
+        data = self._body[self._offset:end]
+        self._offset = end
+        return data
+
+    def close(self):
+        pass
+
+
+def replay_response(method, url):
+    """Returns the ReplayedResponse recorded for the request."""
+    return ReplayedResponse(*play(method, url))
+
+
+def record_response(method, url, response):
+    """
+    Reads the whole body of the httplib response and records it, returns
+    a ReplayedResponse to be read in place of the response.
+    """
+    body = response.read()
+    headers = dict((name.lower(), value)
+                   for name, value in response.getheaders())
+    record(method, url, response.status, headers, body)
+    return ReplayedResponse(response.status, headers, body)
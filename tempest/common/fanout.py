@@ -0,0 +1,124 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Run batches of independent service client calls concurrently.
+
+The calls are run by a bounded set of worker threads. Requests sent by
+the RestClient to a service are additionally capped by the
+[service-clients] max_concurrent_requests option, whatever the number of
+threads using the clients, so that a fan-out does not trip the rate
+limiting of the service.
+"""
+
+import contextlib
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+_service_semaphores = {}
+_service_semaphores_lock = threading.Lock()
+
+
+def _get_service_semaphore(service):
+    with _service_semaphores_lock:
+        if service not in _service_semaphores:
+            limits = CONF.service_clients.max_concurrent_requests or {}
+            limit = limits.get(service)
+            _service_semaphores[service] = (
+                threading.BoundedSemaphore(int(limit)) if limit else None)
+        return _service_semaphores[service]
+
+
+@contextlib.contextmanager
+def service_slot(service):
+    """
+    Holds one of the concurrent request slots of the service, if the
+    service is capped, for the duration of the block.
+    """
+    semaphore = _get_service_semaphore(service)
+    if semaphore is None:
+        yield
+        return
+    with semaphore:
+        yield
+
+
+def run(calls, max_workers=None, return_exceptions=False):
+    """
+    Runs the calls concurrently and returns their results, in the order of
+    the calls.
+
+    :param calls: iterable of callables taking no argument
+    :param max_workers: maximum number of concurrent calls, defaults to
+                        the [service-clients] fanout_workers option
+    :param return_exceptions: if True, the exception raised by a call is
+                              returned in place of its result. Otherwise
+                              the exception of the first failed call is
+                              re-raised once all the calls are complete.
+    """
+    calls = list(calls)
+    if max_workers is None:
+        max_workers = CONF.service_clients.fanout_workers
+    results = [None] * len(calls)
+    errors = [None] * len(calls)
+
+    def call(index):
+        try:
+            results[index] = calls[index]()
+        except Exception:
+            errors[index] = sys.exc_info()
+
+    if max_workers <= 1 or len(calls) <= 1:
+        for index in range(len(calls)):
+            call(index)
+    else:
+        pending = queue.Queue()
+        for index in range(len(calls)):
+            pending.put(index)
+
+        def worker():
+            while True:
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    return
+                call(index)
+
+        threads = [threading.Thread(target=worker)
+                   for _ in range(min(max_workers, len(calls)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    failed = [exc_info for exc_info in errors if exc_info is not None]
+    if failed:
+        LOG.debug("%d of %d fan-out calls failed" % (len(failed), len(calls)))
+        if not return_exceptions:
+            six.reraise(*failed[0])
+        for index, exc_info in enumerate(errors):
+            if exc_info is not None:
+                results[index] = exc_info[1]
+    return results
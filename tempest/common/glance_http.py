@@ -16,14 +16,13 @@
 # Originally copied from python-glanceclient
 
 import copy
-import hashlib
 import httplib
-import json
+import logging as std_logging
 import posixpath
-import re
 import socket
 import StringIO
 import struct
+import time
 import urlparse
 
 
@@ -34,13 +33,16 @@ if not hasattr(urlparse, 'parse_qsl'):
 
 import OpenSSL
 
+from tempest.common import cassette
+from tempest.common import http
+from tempest.common import json_codec
+from tempest.common import latency
 from tempest import exceptions as exc
 from tempest.openstack.common import log as logging
 
 LOG = logging.getLogger(__name__)
 USER_AGENT = 'tempest'
 CHUNKSIZE = 1024 * 64  # 64kB
-TOKEN_CHARS_RE = re.compile('^[-A-Za-z0-9+/=]*$')
 
 
 class HTTPClient(object):
@@ -103,6 +105,10 @@ class HTTPClient(object):
 
         self._log_request(method, url, kwargs['headers'])
 
+        start = time.time()
+        if cassette.mode() == cassette.REPLAY:
+            resp = cassette.replay_response(method, url)
+            return resp, self._read_body(resp, method, url, start)
         conn = self.get_connection()
 
         try:
@@ -132,6 +138,11 @@ class HTTPClient(object):
                        {'endpoint': self.endpoint, 'e': e})
             raise exc.TimeoutException(message)
 
+        if cassette.mode() == cassette.RECORD:
+            resp = cassette.record_response(method, url, resp)
+        return resp, self._read_body(resp, method, url, start)
+
+    def _read_body(self, resp, method, url, start):
         body_iter = ResponseBodyIterator(resp)
 
         # Read body into string if it isn't obviously image data
@@ -141,46 +152,38 @@ class HTTPClient(object):
             self._log_response(resp, None)
         else:
             self._log_response(resp, body_iter)
-
-        return resp, body_iter
+        if latency.enabled():
+            latency.record(self.filters.get('service'), method, url,
+                           resp.status, time.time() - start)
+        return body_iter
 
     def _log_request(self, method, url, headers):
-        LOG.info('Request: ' + method + ' ' + url)
-        if headers:
-            headers_out = headers
-            if 'X-Auth-Token' in headers and headers['X-Auth-Token']:
-                token = headers['X-Auth-Token']
-                if len(token) > 64 and TOKEN_CHARS_RE.match(token):
-                    headers_out = headers.copy()
-                    headers_out['X-Auth-Token'] = "<Token omitted>"
-                LOG.info('Request Headers: ' + str(headers_out))
+        LOG.info('Request: %s %s', method, url)
+        if headers and LOG.isEnabledFor(std_logging.INFO):
+            LOG.info('Request Headers: %s', http.safe_headers(headers))
 
     def _log_response(self, resp, body):
-        status = str(resp.status)
-        LOG.info("Response Status: " + status)
+        LOG.info("Response Status: %s", resp.status)
+        if not LOG.isEnabledFor(std_logging.INFO):
+            return
         if resp.getheaders():
-            LOG.info('Response Headers: ' + str(resp.getheaders()))
-        if body:
-            str_body = str(body)
-            length = len(body)
-            LOG.info('Response Body: ' + str_body[:2048])
-            if length >= 2048:
-                self.LOG.debug("Large body (%d) md5 summary: %s", length,
-                               hashlib.md5(str_body).hexdigest())
+            LOG.info('Response Headers: %s', resp.getheaders())
+        if body is not None:
+            LOG.debug('Response Body: <streamed>')
 
     def json_request(self, method, url, **kwargs):
         kwargs.setdefault('headers', {})
         kwargs['headers'].setdefault('Content-Type', 'application/json')
 
         if 'body' in kwargs:
-            kwargs['body'] = json.dumps(kwargs['body'])
+            kwargs['body'] = json_codec.dumps(kwargs['body'])
 
         resp, body_iter = self._http_request(url, method, **kwargs)
 
         if 'application/json' in resp.getheader('content-type', None):
             body = ''.join([chunk for chunk in body_iter])
             try:
-                body = json.loads(body)
+                body = json_codec.loads(body)
             except ValueError:
                 LOG.error('Could not decode response body as JSON')
         else:
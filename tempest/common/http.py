@@ -14,12 +14,349 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import hashlib
+import logging as std_logging
+import re
+import socket
+import ssl
+import threading
+import time
+
 import httplib2
+import six
+from six.moves import http_client
+from six.moves.urllib import parse as urlparse
+
+from tempest.common import cassette
+from tempest.openstack.common import log as logging
+
+LOG = logging.getLogger(__name__)
+
+# Errors raised when a kept-alive connection was closed by the server (or a
+# load balancer in front of it) while it was sitting idle in the pool.
+STALE_CONNECTION_ERRORS = (http_client.BadStatusLine,
+                           http_client.CannotSendRequest,
+                           http_client.ResponseNotReady,
+                           socket.error)
+
+# Methods sent again after any of the STALE_CONNECTION_ERRORS. The others
+# may have been acted on by the server, they are only sent again when the
+# request was not sent or not answered at all, see _not_received.
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+CHUNK_SIZE = 1024 * 64
+
+TOKEN_CHARS_RE = re.compile('^[-A-Za-z0-9+/=]*$')
+
+
+def log_body(log, title, body, limit):
+    """
+    Logs at most limit characters of the body at debug level, followed by
+    the length and the md5 of larger bodies. Nothing is formatted, copied
+    or hashed when the debug level is disabled.
+    """
+    if not body or limit <= 0 or not log.isEnabledFor(std_logging.DEBUG):
+        return
+    if not isinstance(body, (six.string_types, six.binary_type)):
+        body = str(body)
+    log.debug('%s: %s', title, body[:limit])
+    if len(body) > limit:
+        # Hashed by chunks, a text body is never encoded whole
+        md5 = hashlib.md5()
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            if isinstance(chunk, six.text_type):
+                chunk = chunk.encode('utf-8')
+            md5.update(chunk)
+        log.debug("Large body (%d) md5 summary: %s", len(body),
+                  md5.hexdigest())
+
+
+def safe_headers(headers):
+    """Returns the headers with the auth token omitted, for logging."""
+    token = headers.get('X-Auth-Token')
+    if token and len(token) > 64 and TOKEN_CHARS_RE.match(token):
+        headers = dict(headers, **{'X-Auth-Token': '<Token omitted>'})
+    return headers
 
 
 class ClosingHttp(httplib2.Http):
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        super(ClosingHttp, self).__init__(*args, **kwargs)
+
+    # httplib2 keeps the connection of the request in this dict, keep one
+    # per thread so that concurrent requests do not share a connection.
+    @property
+    def connections(self):
+        if not hasattr(self._local, 'connections'):
+            self._local.connections = {}
+        return self._local.connections
+
+    @connections.setter
+    def connections(self, value):
+        self._local.connections = value
+
     def request(self, *args, **kwargs):
         original_headers = kwargs.get('headers', {})
         new_headers = dict(original_headers, connection='close')
         new_kwargs = dict(kwargs, headers=new_headers)
-        return super(ClosingHttp, self).request(*args, **new_kwargs)
+        return cassette.httplib2_request(
+            super(ClosingHttp, self).request, *args, **new_kwargs)
+
+
+class PooledHttp(object):
+    """
+    Thread-safe pool of keep-alive HTTP connections
+
+    Connections are pooled per (scheme, host, port). Each pooled entry is an
+    httplib2.Http object which is handed out to a single request at a time,
+    so concurrent requests to the same endpoint use separate connections.
+    The object exposes the same request() interface as httplib2.Http so it
+    can be used as the http_obj of a RestClient.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=30, stale_retries=1,
+                 **http_kwargs):
+        """
+        :param maxsize: maximum number of idle connections kept per host
+        :param idle_timeout: seconds after which an idle connection is closed
+        :param stale_retries: how many times a request failing on a reused
+                              connection is retried on a new connection
+        :param http_kwargs: passed as-is to httplib2.Http
+        """
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.stale_retries = stale_retries
+        self.http_kwargs = http_kwargs
+        self._pools = collections.defaultdict(collections.deque)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def pool_key(uri):
+        parts = urlparse.urlsplit(uri)
+        scheme = parts.scheme.lower()
+        port = parts.port or DEFAULT_PORTS.get(scheme)
+        return scheme, parts.hostname, port
+
+    @staticmethod
+    def _not_received(exc):
+        # Nothing was sent, or the connection was closed before any byte
+        # of the response
+        if isinstance(exc, http_client.CannotSendRequest):
+            return True
+        return (isinstance(exc, http_client.BadStatusLine) and
+                exc.line in ('', "''"))
+
+    def _can_resend(self, method, exc):
+        return (method.upper() in IDEMPOTENT_METHODS or
+                self._not_received(exc))
+
+    @staticmethod
+    def _close(http_obj):
+        for conn in http_obj.connections.values():
+            conn.close()
+        http_obj.connections.clear()
+
+    def _acquire(self, key):
+        """Returns a tuple (http_obj, reused)."""
+        expired = []
+        now = time.time()
+        with self._lock:
+            pool = self._pools[key]
+            # Entries are appended on release, so the oldest are on the left
+            while pool and now - pool[0][1] > self.idle_timeout:
+                expired.append(pool.popleft()[0])
+            entry = pool.pop() if pool else None
+        for http_obj in expired:
+            self._close(http_obj)
+        if entry is not None:
+            return entry[0], True
+        return httplib2.Http(**self.http_kwargs), False
+
+    def _release(self, key, http_obj):
+        with self._lock:
+            pool = self._pools[key]
+            if len(pool) < self.maxsize:
+                pool.append((http_obj, time.time()))
+                return
+        self._close(http_obj)
+
+    def size(self, uri=None):
+        """Number of idle connections, for one endpoint or overall."""
+        with self._lock:
+            if uri is not None:
+                return len(self._pools.get(self.pool_key(uri), ()))
+            return sum(len(pool) for pool in self._pools.values())
+
+    def clear(self):
+        """Closes all the idle connections."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            for http_obj, _ in pool:
+                self._close(http_obj)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        return cassette.httplib2_request(self._request, uri, method,
+                                         body=body, headers=headers, **kwargs)
+
+    def _request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        key = self.pool_key(uri)
+        # A streamed body cannot be sent twice
+        can_retry = body is None or isinstance(body, six.string_types)
+        retry = 0
+        while True:
+            http_obj, reused = self._acquire(key)
+            try:
+                resp, content = http_obj.request(uri, method, body=body,
+                                                 headers=headers, **kwargs)
+            except STALE_CONNECTION_ERRORS as e:
+                self._close(http_obj)
+                if (not (reused and can_retry and
+                         self._can_resend(method, e)) or
+                        retry >= self.stale_retries):
+                    raise
+                retry += 1
+                LOG.debug("Stale pooled connection to %s://%s:%s (%s), "
+                          "retrying on a new connection" % (key + (e,)))
+                continue
+            except Exception:
+                # The connection may be in any state, it is not reused
+                self._close(http_obj)
+                raise
+            if resp.get('connection', '').lower() == 'close':
+                self._close(http_obj)
+            else:
+                self._release(key, http_obj)
+            return resp, content
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pooled_http(maxsize=10, idle_timeout=30, stale_retries=1,
+                    **http_kwargs):
+    """
+    Returns the process-wide PooledHttp for the given settings, so that all
+    the clients created with the same settings share their connections.
+    """
+    key = (maxsize, idle_timeout, stale_retries,
+           tuple(sorted(http_kwargs.items())))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = PooledHttp(maxsize=maxsize,
+                                     idle_timeout=idle_timeout,
+                                     stale_retries=stale_retries,
+                                     **http_kwargs)
+        return _pools[key]
+
+
+class ResponseBodyStream(object):
+    """
+    File-like and iterable body of a streamed response
+
+    The data is read from the connection at most chunk_size bytes at a time
+    when iterating, and the md5 and the length of the data read so far are
+    kept up to date, so that the body never needs to be held in memory.
+    The connection is closed once the body is exhausted or closed, then the
+    callables in on_close are called with the stream.
+    """
+
+    def __init__(self, response, connection=None, chunk_size=CHUNK_SIZE):
+        self.response = response
+        self.connection = connection
+        self.chunk_size = chunk_size
+        self.length = 0
+        self.closed = False
+        self.on_close = []
+        self._md5 = hashlib.md5()
+
+    @property
+    def md5(self):
+        return self._md5.hexdigest()
+
+    def read(self, size=-1):
+        if self.closed:
+            return b''
+        if size is None or size < 0:
+            return b''.join(self)
+        data = self.response.read(size)
+        if data:
+            self.length += len(data)
+            self._md5.update(data)
+        else:
+            self.close()
+        return data
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.response.close()
+        if self.connection is not None:
+            self.connection.close()
+        for callback in self.on_close:
+            callback(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def open_stream(uri, method="GET", body=None, headers=None,
+                chunk_size=CHUNK_SIZE, timeout=None,
+                disable_ssl_certificate_validation=False):
+    """
+    Sends a request on a new connection without reading the response body
+
+    Returns a tuple (httplib2.Response, ResponseBodyStream), the caller is
+    responsible for consuming or closing the stream.
+    """
+    if cassette.mode() == cassette.REPLAY:
+        response = cassette.replay_response(method, uri)
+        headers = dict(response.getheaders(), status=str(response.status))
+        return (httplib2.Response(headers),
+                ResponseBodyStream(response, chunk_size=chunk_size))
+    parts = urlparse.urlsplit(uri)
+    if parts.scheme.lower() == 'https':
+        kwargs = {}
+        if (disable_ssl_certificate_validation and
+                hasattr(ssl, '_create_unverified_context')):
+            kwargs['context'] = ssl._create_unverified_context()
+        connection = http_client.HTTPSConnection(parts.hostname, parts.port,
+                                                 timeout=timeout, **kwargs)
+    else:
+        connection = http_client.HTTPConnection(parts.hostname, parts.port,
+                                                timeout=timeout)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    try:
+        connection.request(method, path, body, headers or {})
+        response = connection.getresponse()
+    except Exception:
+        connection.close()
+        raise
+    if cassette.mode() == cassette.RECORD:
+        # The body is read now to be recorded, the stream replays it
+        replayed = cassette.record_response(method, uri, response)
+        connection.close()
+        return (httplib2.Response(response),
+                ResponseBodyStream(replayed, chunk_size=chunk_size))
+    return (httplib2.Response(response),
+            ResponseBodyStream(response, connection, chunk_size))
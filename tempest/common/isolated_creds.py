@@ -14,10 +14,8 @@
 
 import netaddr
 
-import keystoneclient.v2_0.client as keystoneclient
-import neutronclient.v2_0.client as neutronclient
-
 from tempest import clients
+from tempest.common import journal
 from tempest.common.utils import data_utils
 from tempest import config
 from tempest import exceptions
@@ -43,6 +41,10 @@ class IsolatedCreds(object):
             self._get_admin_clients())
 
     def _get_official_admin_clients(self):
+        # Only the official clients need these libraries
+        import keystoneclient.v2_0.client as keystoneclient
+        import neutronclient.v2_0.client as neutronclient
+
         username = CONF.identity.admin_username
         password = CONF.identity.admin_password
         tenant_name = CONF.identity.admin_tenant_name
@@ -75,6 +77,26 @@ class IsolatedCreds(object):
             admin_clients = self._get_official_admin_clients()
         return admin_clients
 
+    def _journal(self, service, resource_type, resource_id, path,
+                 tenant_id=None):
+        # The tempest clients journal the resources they create themselves
+        if self.tempest_client:
+            return
+        if service == CONF.identity.catalog_type:
+            filters = dict(service=service, endpoint_type='adminURL',
+                           region=CONF.identity.region)
+        else:
+            region, endpoint_type = CONF.service_index.get(
+                service, (CONF.identity.region, 'publicURL'))
+            filters = dict(service=service, endpoint_type=endpoint_type,
+                           region=region)
+        journal.record(service, resource_type, resource_id, path,
+                       tenant=tenant_id, filters=filters)
+
+    def _unjournal(self, service, resource_id):
+        if not self.tempest_client:
+            journal.close(service, resource_id)
+
     def _create_tenant(self, name, description):
         if self.tempest_client:
             resp, tenant = self.identity_admin_client.create_tenant(
@@ -83,6 +105,8 @@ class IsolatedCreds(object):
             tenant = self.identity_admin_client.tenants.create(
                 name,
                 description=description)
+            self._journal(CONF.identity.catalog_type, 'tenants', tenant.id,
+                          'tenants/%s' % tenant.id, tenant.id)
         return tenant
 
     def _get_tenant_by_name(self, name):
@@ -108,6 +132,8 @@ class IsolatedCreds(object):
             user = self.identity_admin_client.users.create(username, password,
                                                            email,
                                                            tenant_id=tenant.id)
+            self._journal(CONF.identity.catalog_type, 'users', user.id,
+                          'users/%s' % user.id, tenant.id)
         return user
 
     def _get_user(self, tenant, username):
@@ -138,12 +164,14 @@ class IsolatedCreds(object):
             self.identity_admin_client.delete_user(user)
         else:
             self.identity_admin_client.users.delete(user)
+            self._unjournal(CONF.identity.catalog_type, user)
 
     def _delete_tenant(self, tenant):
         if self.tempest_client:
             self.identity_admin_client.delete_tenant(tenant)
         else:
             self.identity_admin_client.tenants.delete(tenant)
+            self._unjournal(CONF.identity.catalog_type, tenant)
 
     def _create_creds(self, suffix="", admin=False):
         """Create random credentials under the following schema.
@@ -250,6 +278,10 @@ class IsolatedCreds(object):
         else:
             body = {'network': {'tenant_id': tenant_id, 'name': name}}
             resp_body = self.network_admin_client.create_network(body)
+            self._journal(CONF.network.catalog_type, 'networks',
+                          resp_body['network']['id'],
+                          'v2.0/networks/%s' % resp_body['network']['id'],
+                          tenant_id)
         return resp_body['network']
 
     def _create_subnet(self, subnet_name, tenant_id, network_id):
@@ -289,6 +321,9 @@ class IsolatedCreds(object):
             e = exceptions.BuildErrorException()
             e.message = 'Available CIDR for subnet creation could not be found'
             raise e
+        self._journal(CONF.network.catalog_type, 'subnets',
+                      resp_body['subnet']['id'],
+                      'v2.0/subnets/%s' % resp_body['subnet']['id'], tenant_id)
         return resp_body['subnet']
 
     def _create_router(self, router_name, tenant_id):
@@ -304,6 +339,10 @@ class IsolatedCreds(object):
                                'external_gateway_info': external_net_id,
                                'admin_state_up': True}}
             resp_body = self.network_admin_client.create_router(body)
+            self._journal(CONF.network.catalog_type, 'routers',
+                          resp_body['router']['id'],
+                          'v2.0/routers/%s' % resp_body['router']['id'],
+                          tenant_id)
         return resp_body['router']
 
     def _add_router_interface(self, router_id, subnet_id):
@@ -420,6 +459,7 @@ class IsolatedCreds(object):
         net_client = self.network_admin_client
         try:
             net_client.delete_router(router_id)
+            self._unjournal(CONF.network.catalog_type, router_id)
         except exceptions.NotFound:
             LOG.warn('router with name: %s not found for delete' %
                      router_name)
@@ -429,6 +469,7 @@ class IsolatedCreds(object):
         net_client = self.network_admin_client
         try:
             net_client.delete_subnet(subnet_id)
+            self._unjournal(CONF.network.catalog_type, subnet_id)
         except exceptions.NotFound:
             LOG.warn('subnet with name: %s not found for delete' %
                      subnet_name)
@@ -438,6 +479,7 @@ class IsolatedCreds(object):
         net_client = self.network_admin_client
         try:
             net_client.delete_network(network_id)
+            self._unjournal(CONF.network.catalog_type, network_id)
         except exceptions.NotFound:
             LOG.warn('network with name: %s not found for delete' %
                      network_name)
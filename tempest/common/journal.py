@@ -0,0 +1,175 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Journal of the resources created by the tests.
+
+When [service-clients] resource_journal is set, the JSON service clients
+append an entry to this SQLite database for each resource they create,
+with its type, id, tenant id, the test creating it and the time, and
+close the entry when they delete the resource. The type of a resource is
+the collection it was created in, the last segment of the URL of the
+POST, e.g. servers or floatingips. The isolated credentials of the
+official clients are journaled the same way.
+
+The database is in WAL mode and every entry is committed as it is
+written, so that the entries of a worker killed by a timeout are not
+lost and the test workers can append concurrently. The resources a run
+leaked are the open entries, which tools/sweep_resources.py deletes, see
+tempest.common.sweeper.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    service TEXT NOT NULL,
+    filters TEXT,
+    resource_type TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    tenant TEXT,
+    test TEXT,
+    pid INTEGER,
+    created REAL NOT NULL,
+    closed REAL
+);
+CREATE INDEX IF NOT EXISTS open_resources
+    ON resources (service, resource_id) WHERE closed IS NULL;
+"""
+
+# Columns of the entries returned by open_entries
+COLUMNS = ('id', 'service', 'filters', 'resource_type', 'resource_id',
+           'path', 'tenant', 'test', 'pid', 'created')
+
+_lock = threading.Lock()
+_connection = None
+_pid = None
+_test = None
+
+
+def enabled():
+    return bool(CONF.service_clients.resource_journal)
+
+
+def start_test(test_id):
+    """Makes test_id the owner of the resources created from now on."""
+    global _test
+    _test = test_id
+
+
+def connect(path):
+    """Opens the journal at path, creating it if needed."""
+    connection = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                 check_same_thread=False)
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _get_connection():
+    # The connections are not shared with the processes forked after they
+    # were opened, e.g. by the stress framework
+    global _connection, _pid
+    if _connection is None or _pid != os.getpid():
+        _connection = connect(CONF.service_clients.resource_journal)
+        _pid = os.getpid()
+    return _connection
+
+
+def record(service, resource_type, resource_id, path, tenant=None,
+           filters=None):
+    """
+    Records the creation of a resource, deleted with DELETE path on the
+    endpoint of service selected by the client filters.
+    """
+    if not enabled():
+        return
+    with _lock:
+        _get_connection().execute(
+            'INSERT INTO resources (service, filters, resource_type, '
+            'resource_id, path, tenant, test, pid, created) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (service, json.dumps(filters, sort_keys=True), resource_type,
+             resource_id, path, tenant, _test, os.getpid(), time.time()))
+
+
+def close(service, resource_id):
+    """Records the deletion of a resource."""
+    if not enabled():
+        return
+    with _lock:
+        _get_connection().execute(
+            'UPDATE resources SET closed = ? '
+            'WHERE service = ? AND resource_id = ? AND closed IS NULL',
+            (time.time(), service, resource_id))
+
+
+def open_entries(connection):
+    """Returns the entries of the resources not deleted, as dicts."""
+    cursor = connection.execute(
+        'SELECT %s FROM resources WHERE closed IS NULL ORDER BY id' %
+        ', '.join(COLUMNS))
+    entries = []
+    for row in cursor.fetchall():
+        entry = dict(zip(COLUMNS, row))
+        entry['filters'] = json.loads(entry['filters'] or 'null')
+        entries.append(entry)
+    return entries
+
+
+def close_entry(connection, entry_id):
+    connection.execute('UPDATE resources SET closed = ? WHERE id = ?',
+                       (time.time(), entry_id))
+
+
+def journal_response(client, method, url, resp, resp_body):
+    """
+    Records the resource created by a successful POST of client, or
+    closes the entry of the resource deleted by a DELETE, even when it was
+    not found.
+    """
+    method = method.upper()
+    path = url.split('?')[0].rstrip('/')
+    if method == 'DELETE':
+        if resp.status < 300 or resp.status == 404:
+            close(client.service, path.rsplit('/', 1)[-1])
+        return
+    if method != 'POST' or not 200 <= resp.status < 300 or not resp_body:
+        return
+    try:
+        # Decoded once for the journal and the client
+        body = client._decode_resp(resp, resp_body)
+    except (ValueError, AttributeError):
+        return
+    if not isinstance(body, dict) or not body.get('id'):
+        return
+    # The resources created by an admin for another tenant hold its id
+    tenant_id = (body.get('tenant_id') or body.get('project_id') or
+                 client.auth_provider.get_tenant_id())
+    record(client.service, path.rsplit('/', 1)[-1], str(body['id']),
+           '%s/%s' % (path, body['id']), tenant=tenant_id,
+           filters=client.filters)
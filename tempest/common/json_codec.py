@@ -0,0 +1,79 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+JSON encoding and decoding of the service client bodies.
+
+The implementation is chosen by the [service-clients] json_codec option
+the first time a body is encoded or decoded, the standard json module by
+default. The faster modules are opt-in, since they encode some bodies
+differently, e.g. ujson escapes the slashes and rounds the floats. With
+'auto' the fastest installed module among ujson and simplejson is used,
+falling back to json. All of them raise a ValueError on invalid
+documents.
+"""
+
+import json
+
+from tempest import config
+from tempest import exceptions
+from tempest.openstack.common import importutils
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+# By order of preference for 'auto'
+CODECS = ('ujson', 'simplejson', 'json')
+
+_codec = None
+
+
+def get_codec():
+    """Returns the module used to encode and decode JSON."""
+    global _codec
+    if _codec is None:
+        name = CONF.service_clients.json_codec
+        if name == 'auto':
+            for candidate in CODECS:
+                _codec = importutils.try_import(candidate)
+                if _codec is not None:
+                    break
+        elif name in CODECS:
+            _codec = importutils.try_import(name)
+            if _codec is None:
+                raise exceptions.InvalidConfiguration(
+                    "JSON codec %s is not installed" % name)
+        else:
+            raise exceptions.InvalidConfiguration(
+                "Unknown JSON codec %s" % name)
+        LOG.debug("Using the %s JSON codec" % _codec.__name__)
+    return _codec
+
+
+def loads(data):
+    return get_codec().loads(data)
+
+
+def dumps(obj):
+    codec = get_codec()
+    if codec is json:
+        return json.dumps(obj)
+    try:
+        return codec.dumps(obj)
+    except (TypeError, OverflowError):
+        # Let the reference implementation accept or reject what the
+        # faster ones can not encode
+        return json.dumps(obj)
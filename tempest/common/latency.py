@@ -0,0 +1,250 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Latency histograms of the requests sent by the service clients.
+
+When [service-clients] latency_stats is enabled, the REST clients record
+the wall time of every request by (service, method, URL template, status),
+where the template is the URL path with the UUIDs and hexadecimal ids
+replaced by a placeholder. Each test run by tempest.test.BaseTestCase
+gets a summary of its requests attached as a 'latency' detail.
+
+When latency_report_dir is also set, every test worker writes its
+histograms to that directory when it exits, and merges the histograms of
+all the workers of the run into report.json with the p50, p90 and p99
+latencies of each request template. The workers of a run are the
+processes of the process group of the test runner, e.g. the workers of
+testr run --parallel, so the files left by the previous runs are not
+merged.
+"""
+
+import collections
+import glob
+import json
+import math
+import os
+import re
+import threading
+
+from six.moves.urllib import parse as urlparse
+
+from tempest import config
+from tempest.openstack.common import lockutils
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+ID_PLACEHOLDER = '{id}'
+ID_RE = re.compile('^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+                   '[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{32})$')
+REPORT_FILE = 'report.json'
+# By process group of the run and pid of the worker
+WORKER_FILE = 'latency-%d-%d.json'
+
+# Buckets grow geometrically, so a percentile is accurate within 5%
+BUCKET_GROWTH = 1.05
+MIN_LATENCY_MS = 0.01
+
+
+def url_template(url):
+    """
+    Returns the path of the URL with the ids replaced by a placeholder,
+    followed by the sorted names of the query parameters.
+    """
+    parts = urlparse.urlsplit(url)
+    segments = [ID_PLACEHOLDER if ID_RE.match(segment) else segment
+                for segment in parts.path.split('/')]
+    template = '/'.join(segments)
+    if parts.query:
+        names = sorted(set(name for name, _ in urlparse.parse_qsl(
+            parts.query, keep_blank_values=True)))
+        template += '?' + '&'.join(names)
+    return template
+
+
+class Histogram(object):
+    """Mergeable histogram of latencies, in milliseconds."""
+
+    def __init__(self):
+        self.buckets = collections.defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(value):
+        value = max(value, MIN_LATENCY_MS)
+        return int(math.floor(math.log(value / MIN_LATENCY_MS) /
+                              math.log(BUCKET_GROWTH)))
+
+    def record(self, value):
+        self.buckets[self._bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Upper bound of the bucket holding the percentile."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100.0)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.max,
+                           MIN_LATENCY_MS * BUCKET_GROWTH ** (bucket + 1))
+        return self.max
+
+    def summary(self):
+        return {'count': self.count,
+                'mean': round(self.total / self.count, 3)
+                if self.count else 0.0,
+                'p50': round(self.percentile(50), 3),
+                'p90': round(self.percentile(90), 3),
+                'p99': round(self.percentile(99), 3),
+                'max': round(self.max, 3)}
+
+    def to_dict(self):
+        return {'buckets': dict((str(bucket), count) for bucket, count
+                                in self.buckets.items()),
+                'count': self.count,
+                'total': self.total,
+                'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        for bucket, count in data['buckets'].items():
+            histogram.buckets[int(bucket)] = count
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.max = data['max']
+        return histogram
+
+
+class LatencyRecorder(object):
+    """Thread-safe set of histograms, by request key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = collections.defaultdict(Histogram)
+
+    @staticmethod
+    def key(service, method, url, status):
+        return '%s %s %s %s' % (service, method.upper(), url_template(url),
+                                status)
+
+    def record(self, key, elapsed_ms):
+        with self._lock:
+            self.histograms[key].record(elapsed_ms)
+
+    def merge(self, histograms):
+        with self._lock:
+            for key, histogram in histograms.items():
+                self.histograms[key].merge(histogram)
+
+    def reset(self):
+        with self._lock:
+            histograms = self.histograms
+            self.histograms = collections.defaultdict(Histogram)
+        return histograms
+
+
+_run_recorder = LatencyRecorder()
+_test_recorder = LatencyRecorder()
+
+
+def enabled():
+    return CONF.service_clients.latency_stats
+
+
+def record(service, method, url, status, elapsed):
+    """Records a request which took elapsed seconds."""
+    key = LatencyRecorder.key(service, method, url, status)
+    elapsed_ms = elapsed * 1000.0
+    _run_recorder.record(key, elapsed_ms)
+    _test_recorder.record(key, elapsed_ms)
+
+
+def recorded():
+    """Whether any request was recorded by this process."""
+    return bool(_run_recorder.histograms)
+
+
+def start_test():
+    _test_recorder.reset()
+
+
+def stop_test():
+    """
+    Returns the compact summary of the requests made since start_test(),
+    one line per request key.
+    """
+    histograms = _test_recorder.reset()
+    lines = []
+    for key in sorted(histograms):
+        histogram = histograms[key]
+        lines.append('%s count=%d total=%.1fms max=%.1fms' % (
+            key, histogram.count, histogram.total, histogram.max))
+    return '\n'.join(lines)
+
+
+def report(histograms):
+    return {'requests': dict((key, histogram.summary()) for key, histogram
+                             in histograms.items())}
+
+
+def _load(path):
+    with open(path) as f:
+        return dict((key, Histogram.from_dict(data))
+                    for key, data in json.load(f).items())
+
+
+def write_report(report_dir):
+    """
+    Writes the histograms of this process to report_dir, then merges the
+    histograms of all the workers of the run which wrote theirs into the
+    report.
+    """
+    histograms = _run_recorder.histograms
+    if not histograms:
+        return
+    if not os.path.isdir(report_dir):
+        os.makedirs(report_dir)
+    run = os.getpgrp()
+    worker_file = os.path.join(report_dir, WORKER_FILE % (run, os.getpid()))
+    with lockutils.lock('latency-report', 'tempest-', external=True,
+                        lock_path=report_dir):
+        with open(worker_file, 'w') as f:
+            json.dump(dict((key, histogram.to_dict()) for key, histogram
+                           in histograms.items()), f)
+        merged = LatencyRecorder()
+        for path in glob.glob(os.path.join(report_dir,
+                                           'latency-%d-*.json' % run)):
+            merged.merge(_load(path))
+        with open(os.path.join(report_dir, REPORT_FILE), 'w') as f:
+            json.dump(report(merged.histograms), f, indent=2,
+                      sort_keys=True)
+    LOG.debug("Latency report updated in %s" % report_dir)
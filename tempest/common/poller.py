@@ -0,0 +1,339 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Registry of the outstanding waits of the process, polled by one thread.
+
+A wait is a check, a callable returning PENDING until the awaited
+resource is ready, then the result of the wait, or raising if the
+resource failed. A check returning PendingUntil(when) is polled again no
+later than when, e.g. at the end of a fixed wait. submit registers a
+wait and returns its Future, so that a test can start waiting for a
+server, a volume and a floating IP, then collect the three results: the
+waits overlap instead of running one after the other.
+
+A single poller thread runs the checks when they are due, following the
+poll profile of their type of resource (see tempest.common.polling). The
+due checks of a service run one after the other in a single thread, so
+that the waits do not add to the concurrent requests sent to the
+service, while the checks of different services run concurrently. The
+checks are not combined: each one sends its own requests. A wait failing
+to complete within its timeout fails with the exception returned by its
+timeout_error callable.
+
+With the [service-clients] central_poller disabled, the default, submit
+runs the wait in the calling thread and returns a completed Future.
+
+The threads blocked on a Future wake up every WAKEUP_INTERVAL seconds:
+on Python 2.7 a wait on an Event without a timeout cannot be interrupted
+by a signal, which would keep the test timeouts and Ctrl-C from stopping
+a hung wait before its own timeout.
+"""
+
+import heapq
+import os
+import sys
+import threading
+import time
+
+import six
+
+from tempest.common import fanout
+from tempest.common import polling
+from tempest import config
+from tempest import exceptions
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+# Returned by the checks of the waits which are not complete
+PENDING = object()
+# Seconds between two wake-ups of the threads blocked on a Future
+WAKEUP_INTERVAL = 0.5
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+class PendingUntil(object):
+    """Returned by a check which is not complete, due again by when."""
+
+    def __init__(self, when):
+        self.when = when
+
+
+def _pending(result):
+    return result is PENDING or isinstance(result, PendingUntil)
+
+
+class Future(object):
+    """The result of a wait, available once it is complete."""
+
+    def __init__(self, description=None):
+        self.description = description
+        self._event = threading.Event()
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        return self._event.is_set()
+
+    def _complete(self, result=None, exc_info=None):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._result = result
+            self._exc_info = exc_info
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def set_result(self, result):
+        self._complete(result=result)
+
+    def set_exception(self, exc_info):
+        """Fails the wait with the exc_info tuple of sys.exc_info()."""
+        self._complete(exc_info=exc_info)
+
+    def add_done_callback(self, callback):
+        """Calls callback(future) once the wait is complete."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _wait(self, timeout):
+        """Returns whether the wait completed within timeout seconds."""
+        deadline = None if timeout is None else time.time() + timeout
+        while not self._event.is_set():
+            interval = WAKEUP_INTERVAL
+            if deadline is not None:
+                interval = min(interval, deadline - time.time())
+                if interval <= 0:
+                    return False
+            self._event.wait(interval)
+        return True
+
+    def exception(self, timeout=None):
+        if not self._wait(timeout):
+            raise exceptions.TimeoutException(
+                "%s is not complete" % self.description)
+        return self._exc_info and self._exc_info[1]
+
+    def result(self, timeout=None):
+        """
+        Returns the result of the wait, or raises its exception, blocking
+        until it is complete or timeout seconds elapsed.
+        """
+        self.exception(timeout)
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._result
+
+
+class _Wait(object):
+
+    def __init__(self, check, future, deadline, intervals, service,
+                 timeout_error):
+        self.check = check
+        self.future = future
+        self.deadline = deadline
+        self.intervals = intervals
+        self.service = service
+        self.timeout_error = timeout_error
+        self.next_poll = time.time()
+
+    def schedule(self, now, until=None):
+        """
+        Returns False once the deadline of the wait elapsed. The next poll
+        is due after the next interval, or at until if it comes earlier.
+        """
+        remaining = self.deadline - now
+        if remaining <= 0:
+            return False
+        self.next_poll = now + min(next(self.intervals), remaining)
+        if until is not None:
+            self.next_poll = max(min(self.next_poll, until), now)
+        return True
+
+    def time_out(self):
+        try:
+            raise self.timeout_error()
+        except Exception:
+            self.future.set_exception(sys.exc_info())
+
+
+def _run_check(check):
+    """Returns (result, exc_info) of the check."""
+    try:
+        return check(), None
+    except Exception:
+        return None, sys.exc_info()
+
+
+class Poller(object):
+    """Polls the outstanding waits of the process from one thread."""
+
+    def __init__(self):
+        self._queue = []
+        self._counter = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, wait):
+        with self._condition:
+            self._counter += 1
+            heapq.heappush(self._queue,
+                           (wait.next_poll, self._counter, wait))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run,
+                                                name='tempest-poller')
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+    def outstanding(self):
+        with self._condition:
+            return len(self._queue)
+
+    def _due(self):
+        """Blocks until waits are due, then pops them."""
+        with self._condition:
+            while True:
+                now = time.time()
+                if self._queue and self._queue[0][0] <= now:
+                    break
+                timeout = self._queue[0][0] - now if self._queue else None
+                self._condition.wait(timeout)
+            due = []
+            while self._queue and self._queue[0][0] <= now:
+                due.append(heapq.heappop(self._queue)[2])
+            return due
+
+    def _reschedule(self, waits):
+        with self._condition:
+            for wait in waits:
+                self._counter += 1
+                heapq.heappush(self._queue,
+                               (wait.next_poll, self._counter, wait))
+
+    @staticmethod
+    def _run_checks(waits):
+        """Runs the checks of the due waits of a service, in turn."""
+        return dict((wait, _run_check(wait.check)) for wait in waits)
+
+    def _run(self):
+        while True:
+            due = self._due()
+            by_service = {}
+            for wait in due:
+                by_service.setdefault(wait.service, []).append(wait)
+            calls = [lambda waits=waits: self._run_checks(waits)
+                     for waits in by_service.values()]
+            try:
+                results = {}
+                for service_results in fanout.run(calls):
+                    results.update(service_results)
+            except Exception:
+                # Not expected, the errors of the checks are caught
+                LOG.exception("Polling the waits failed")
+                results = {}
+            pending = []
+            now = time.time()
+            for wait in due:
+                result, exc_info = results.get(wait, (PENDING, None))
+                if exc_info is not None:
+                    wait.future.set_exception(exc_info)
+                elif not _pending(result):
+                    wait.future.set_result(result)
+                elif wait.schedule(now, getattr(result, 'when', None)):
+                    pending.append(wait)
+                else:
+                    wait.time_out()
+            self._reschedule(pending)
+
+
+def get_poller():
+    """Returns the poller of the process."""
+    global _poller
+    with _poller_lock:
+        # A forked process, e.g. a stress test worker, has its own poller
+        if _poller is None or _poller[0] != os.getpid():
+            _poller = (os.getpid(), Poller())
+        return _poller[1]
+
+
+def _wait_here(wait):
+    while True:
+        result, exc_info = _run_check(wait.check)
+        if exc_info is not None:
+            wait.future.set_exception(exc_info)
+            return
+        if not _pending(result):
+            wait.future.set_result(result)
+            return
+        now = time.time()
+        if not wait.schedule(now, getattr(result, 'when', None)):
+            wait.time_out()
+            return
+        time.sleep(wait.next_poll - now)
+
+
+def submit(check, timeout, interval, resource_type=polling.DEFAULT,
+           service=None, timeout_error=None, description=None):
+    """
+    Registers a wait and returns its Future.
+
+    :param check: callable returning PENDING or a PendingUntil until the
+                  wait is complete, then its result, or raising its error
+    :param timeout: seconds before the wait fails with timeout_error()
+    :param interval: build_interval of the wait, see polling.get_profile
+    :param service: service polled by the check, the checks of a service
+                    run in turn
+    :param timeout_error: callable returning the exception of a timeout,
+                          a TimeoutException by default
+    """
+    description = description or getattr(check, '__name__', 'wait')
+    if timeout_error is None:
+        def timeout_error():
+            return exceptions.TimeoutException(
+                "%s did not complete within the required time (%s s)" %
+                (description, timeout))
+    future = Future(description)
+    wait = _Wait(check, future, time.time() + timeout,
+                 polling.get_profile(resource_type, interval).intervals(),
+                 service, timeout_error)
+    if CONF.service_clients.central_poller:
+        get_poller().submit(wait)
+    else:
+        _wait_here(wait)
+    return future
+
+
+def wait_all(futures, timeout=None):
+    """
+    Waits for all the futures and returns their results, in order. The
+    exception of the first failed future, in order, is raised once all
+    are complete.
+    """
+    futures = list(futures)
+    for future in futures:
+        future.exception(timeout)
+    return [future.result() for future in futures]
@@ -0,0 +1,125 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Adaptive intervals between the polls of the waiters.
+
+The waiters used to sleep their build_interval between two polls, so a
+transition taking a fraction of a second was noticed a whole interval
+later, while a transition taking minutes was polled every interval. The
+waiters now poll poll_fast_polls times every poll_initial_interval
+seconds, then back off exponentially by poll_backoff up to the maximum
+interval, which is twice their build_interval unless poll_max_interval is
+set. Every interval is randomized by poll_jitter so that concurrent
+waiters spread their polls.
+
+The [service-clients] poll_profiles override the initial and maximum
+intervals of a type of resource, e.g. stack:2:30 for the stacks. With
+adaptive_polling disabled the waiters sleep build_interval between polls.
+"""
+
+import random
+import time
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+# Types of the resources waited for, used as keys of the poll_profiles
+DEFAULT = 'default'
+SERVER = 'server'
+IMAGE = 'image'
+VOLUME = 'volume'
+SNAPSHOT = 'snapshot'
+BACKUP = 'backup'
+STACK = 'stack'
+INTERFACE = 'interface'
+DELETION = 'deletion'
+
+
+class PollProfile(object):
+    """The intervals between the polls of a waiter."""
+
+    def __init__(self, initial_interval, max_interval, fast_polls=0,
+                 backoff=1.0, jitter=0.0):
+        self.initial_interval = initial_interval
+        self.max_interval = max(max_interval, initial_interval)
+        self.fast_polls = fast_polls
+        self.backoff = backoff
+        self.jitter = jitter
+
+    def intervals(self):
+        """Yields the seconds to sleep before each poll but the first."""
+        interval = self.initial_interval
+        polls = 0
+        while True:
+            if self.jitter:
+                yield interval * (1 + self.jitter * (2 * random.random() - 1))
+            else:
+                yield interval
+            polls += 1
+            if polls >= self.fast_polls:
+                interval = min(interval * self.backoff, self.max_interval)
+
+
+def get_profile(resource_type, interval):
+    """
+    Returns the PollProfile of a waiter of the resource type, whose
+    build_interval is interval.
+    """
+    conf = CONF.service_clients
+    if not conf.adaptive_polling:
+        return PollProfile(interval, interval)
+    initial = conf.poll_initial_interval
+    maximum = conf.poll_max_interval or 2 * interval
+    profile = (conf.poll_profiles or {}).get(resource_type)
+    if profile:
+        values = profile.split(':')
+        initial = float(values[0])
+        if len(values) > 1 and values[1]:
+            maximum = float(values[1])
+    return PollProfile(initial, maximum, fast_polls=conf.poll_fast_polls,
+                       backoff=conf.poll_backoff, jitter=conf.poll_jitter)
+
+
+def poll(resource_type, timeout, interval):
+    """
+    Iterates once per poll until timeout seconds elapsed, sleeping the
+    intervals of the profile of the resource type in between. The first
+    poll happens right away and the last one once the timeout elapsed, so
+    a waiter returning from the loop when its resource is ready only has
+    to fail after it:
+
+        for _ in polling.poll(polling.VOLUME, timeout, interval):
+            if is_ready():
+                return
+        raise exceptions.TimeoutException()
+
+    :param interval: the build_interval of the waiter
+    """
+    deadline = time.time() + timeout
+    intervals = get_profile(resource_type, interval).intervals()
+    polls = 0
+    while True:
+        polls += 1
+        yield polls
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            LOG.debug("Gave up waiting for a %s after %d polls" %
+                      (resource_type, polls))
+            return
+        time.sleep(min(next(intervals), remaining))
@@ -0,0 +1,191 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Cache of the responses of the GET requests of the REST clients.
+
+Only the URLs matching one of the [service-clients] response_cache_patterns
+are cached, which should be resources that do not change during a run,
+like flavors, images or the image schemas. A successful response is
+served from the cache for response_cache_ttl seconds. After that, if it
+had an ETag or a Last-Modified header, it is revalidated with a
+conditional request, otherwise it is fetched again. The least recently
+used responses are evicted beyond response_cache_size responses.
+
+The responses are cached by URL, Accept header and token, so that a
+response is never served to another user. Any other request to a cached
+URL, or to a URL which is a prefix of it or has it as a prefix, evicts it:
+updating or deleting a resource invalidates its cached representation and
+the cached listings of its collection.
+"""
+
+import collections
+import re
+import threading
+import time
+
+import httplib2
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class CachedResponse(object):
+
+    def __init__(self, resp, body, now):
+        self.resp = dict(resp)
+        self.body = body
+        self.stored = now
+        self.etag = resp.get('etag')
+        self.last_modified = resp.get('last-modified')
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def response(self, from_cache=True):
+        resp = httplib2.Response(self.resp)
+        resp.fromcache = from_cache
+        return resp, self.body
+
+
+class ResponseCache(object):
+    """Thread-safe LRU cache of the GET responses of matching URLs."""
+
+    def __init__(self, patterns=(), ttl=300.0, maxsize=256):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._responses = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def enabled(self):
+        return bool(self.patterns) and self.maxsize > 0
+
+    def cacheable(self, url):
+        return any(pattern.search(url) for pattern in self.patterns)
+
+    @staticmethod
+    def key(url, headers):
+        headers = headers or {}
+        return url, headers.get('Accept'), headers.get('X-Auth-Token')
+
+    def _get(self, key):
+        with self._lock:
+            cached = self._responses.pop(key, None)
+            if cached is not None:
+                # Most recently used last
+                self._responses[key] = cached
+            return cached
+
+    def _put(self, key, cached):
+        with self._lock:
+            self._responses.pop(key, None)
+            self._responses[key] = cached
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+                self.evictions += 1
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def request(self, send, url, method='GET', headers=None, body=None):
+        """
+        Sends the request with send, an httplib2.Http.request like callable,
+        unless its response is cached and fresh. The responses served from
+        the cache have their fromcache attribute set.
+        """
+        if method.upper() != 'GET':
+            self.invalidate(url)
+            return send(url, method, headers=headers, body=body)
+        if not self.cacheable(url):
+            return send(url, method, headers=headers, body=body)
+        key = self.key(url, headers)
+        cached = self._get(key)
+        now = time.time()
+        if cached is not None and now - cached.stored < self.ttl:
+            self._count('hits')
+            return cached.response()
+        if cached is not None and (cached.etag or cached.last_modified):
+            conditional = dict(headers or {}, **cached.conditional_headers())
+            resp, resp_body = send(url, method, headers=conditional,
+                                   body=body)
+            if resp.status == 304:
+                self._count('revalidations')
+                cached.stored = now
+                if resp.get('etag'):
+                    cached.etag = cached.resp['etag'] = resp['etag']
+                return cached.response(from_cache=False)
+        else:
+            resp, resp_body = send(url, method, headers=headers, body=body)
+        self._count('misses')
+        if resp.status == 200:
+            self._put(key, CachedResponse(resp, resp_body, now))
+        else:
+            with self._lock:
+                self._responses.pop(key, None)
+        return resp, resp_body
+
+    def invalidate(self, url):
+        """Evicts the responses of the URLs related to url."""
+        path = url.split('?', 1)[0].rstrip('/')
+        with self._lock:
+            for key in list(self._responses):
+                cached_path = key[0].split('?', 1)[0].rstrip('/')
+                if cached_path.startswith(path) or path.startswith(
+                        cached_path):
+                    del self._responses[key]
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+
+    def summary(self):
+        return ('hits=%d misses=%d revalidations=%d evictions=%d size=%d' %
+                (self.hits, self.misses, self.revalidations, self.evictions,
+                 len(self._responses)))
+
+
+def get_cache():
+    """Returns the response cache of the process, built from the config."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            conf = CONF.service_clients
+            _cache = ResponseCache(conf.response_cache_patterns or (),
+                                   ttl=conf.response_cache_ttl,
+                                   maxsize=conf.response_cache_size)
+        return _cache
+
+
+def used():
+    """Whether any response was looked up in the cache."""
+    return _cache is not None and _cache.enabled() and bool(
+        _cache.hits or _cache.misses or _cache.revalidations)
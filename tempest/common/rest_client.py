@@ -15,32 +15,62 @@
 #    under the License.
 
 import collections
-import hashlib
-import json
+import functools
+import logging as std_logging
 from lxml import etree
-import re
 import time
 
+from tempest.common import fanout
 from tempest.common import http
+from tempest.common import journal
+from tempest.common import json_codec
+from tempest.common import latency
+from tempest.common import polling
+from tempest.common import response_cache
+from tempest.common import retry
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
+from tempest.services.compute.xml.common import parse_array
 from tempest.services.compute.xml.common import xml_to_json
 
 CONF = config.CONF
 
 # redrive rate limited calls at most twice
 MAX_RECURSION_DEPTH = 2
-TOKEN_CHARS_RE = re.compile('^[-A-Za-z0-9+/=]*$')
 
 # All the successful HTTP status codes from RFC 2616
 HTTP_SUCCESS = (200, 201, 202, 203, 204, 205, 206)
 
 
+class FiltersAttribute(object):
+    """
+    Client attribute used to build the filters: setting it resets the
+    filters cached by the client.
+    """
+
+    def __init__(self, name):
+        self.key = '_%s_value' % name.lstrip('_')
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        return client.__dict__.get(self.key)
+
+    def __set__(self, client, value):
+        client.__dict__[self.key] = value
+        client._filters = None
+
+
 class RestClient(object):
 
     TYPE = "json"
 
+    service = FiltersAttribute('service')
+    endpoint_url = FiltersAttribute('endpoint_url')
+    api_version = FiltersAttribute('api_version')
+    _skip_path = FiltersAttribute('_skip_path')
+
     # This is used by _parse_resp method
     # Redefine it for purposes of your xml service client
     # List should contain top-xml_tag-names of data, which is like list/array
@@ -57,6 +87,7 @@ class RestClient(object):
 
     def __init__(self, auth_provider):
         self.auth_provider = auth_provider
+        self._filters = None
 
         self.endpoint_url = None
         self.service = None
@@ -74,8 +105,16 @@ class RestClient(object):
                                        'retry-after', 'server',
                                        'vary', 'www-authenticate'))
         dscv = CONF.identity.disable_ssl_certificate_validation
-        self.http_obj = http.ClosingHttp(
-            disable_ssl_certificate_validation=dscv)
+        if CONF.service_clients.connection_pooling:
+            # All the clients share the keep-alive connections of the pool
+            self.http_obj = http.get_pooled_http(
+                maxsize=CONF.service_clients.pool_maxsize,
+                idle_timeout=CONF.service_clients.pool_idle_timeout,
+                stale_retries=CONF.service_clients.pool_stale_retries,
+                disable_ssl_certificate_validation=dscv)
+        else:
+            self.http_obj = http.ClosingHttp(
+                disable_ssl_certificate_validation=dscv)
 
     def _get_type(self):
         return self.TYPE
@@ -99,20 +138,20 @@ class RestClient(object):
                              str(self.token)[0:STRING_LIMIT],
                              str(self.get_headers())[0:STRING_LIMIT])
 
+    def _get_service_config(self, service):
+        """
+        Returns the (region, endpoint_type) configured for a service
+        """
+        try:
+            return CONF.service_index[service]
+        except KeyError:
+            return CONF.identity.region, None
+
     def _get_region(self, service):
         """
         Returns the region for a specific service
         """
-        service_region = None
-        for cfgname in dir(CONF._config):
-            # Find all config.FOO.catalog_type and assume FOO is a service.
-            cfg = getattr(CONF, cfgname)
-            catalog_type = getattr(cfg, 'catalog_type', None)
-            if catalog_type == service:
-                service_region = getattr(cfg, 'region', None)
-        if not service_region:
-            service_region = CONF.identity.region
-        return service_region
+        return self._get_service_config(service)[0]
 
     def _get_endpoint_type(self, service):
         """
@@ -121,20 +160,7 @@ class RestClient(object):
         # If the client requests a specific endpoint type, then be it
         if self.endpoint_url:
             return self.endpoint_url
-        endpoint_type = None
-        for cfgname in dir(CONF._config):
-            # Find all config.FOO.catalog_type and assume FOO is a service.
-            cfg = getattr(CONF, cfgname)
-            catalog_type = getattr(cfg, 'catalog_type', None)
-            if catalog_type == service:
-                endpoint_type = getattr(cfg, 'endpoint_type', 'publicURL')
-                break
-        # Special case for compute v3 service which hasn't its own
-        # configuration group
-        else:
-            if service == CONF.compute.catalog_v3_type:
-                endpoint_type = CONF.compute.endpoint_type
-        return endpoint_type
+        return self._get_service_config(service)[1]
 
     @property
     def user(self):
@@ -158,16 +184,20 @@ class RestClient(object):
 
     @property
     def filters(self):
-        _filters = dict(
-            service=self.service,
-            endpoint_type=self._get_endpoint_type(self.service),
-            region=self._get_region(self.service)
-        )
-        if self.api_version is not None:
-            _filters['api_version'] = self.api_version
-        if self._skip_path:
-            _filters['skip_path'] = self._skip_path
-        return _filters
+        # The filters are cached, they are reset whenever one of the
+        # attributes they are built from is changed
+        if self._filters is None:
+            _filters = dict(
+                service=self.service,
+                endpoint_type=self._get_endpoint_type(self.service),
+                region=self._get_region(self.service)
+            )
+            if self.api_version is not None:
+                _filters['api_version'] = self.api_version
+            if self._skip_path:
+                _filters['skip_path'] = self._skip_path
+            self._filters = _filters
+        return self._filters
 
     def skip_path(self):
         """
@@ -198,7 +228,15 @@ class RestClient(object):
     def post(self, url, body, headers=None):
         return self.request('POST', url, headers, body)
 
-    def get(self, url, headers=None):
+    def get(self, url, headers=None, stream=False):
+        """
+        With stream=True the response body is an http.ResponseBodyStream,
+        read from the connection on demand, which the caller must consume
+        or close.
+        """
+        if stream:
+            # Not passed otherwise, some clients override request()
+            return self.request('GET', url, headers, stream=True)
         return self.request('GET', url, headers)
 
     def delete(self, url, headers=None, body=None):
@@ -223,47 +261,43 @@ class RestClient(object):
         return resp, versions
 
     def _log_request(self, method, req_url, headers, body):
-        self.LOG.info('Request: ' + method + ' ' + req_url)
+        self.LOG.info('Request: %s %s', method, req_url)
+        if not self.LOG.isEnabledFor(std_logging.DEBUG):
+            return
         if headers:
-            print_headers = headers
-            if 'X-Auth-Token' in headers and headers['X-Auth-Token']:
-                token = headers['X-Auth-Token']
-                if len(token) > 64 and TOKEN_CHARS_RE.match(token):
-                    print_headers = headers.copy()
-                    print_headers['X-Auth-Token'] = "<Token omitted>"
-            self.LOG.debug('Request Headers: ' + str(print_headers))
-        if body:
-            str_body = str(body)
-            length = len(str_body)
-            self.LOG.debug('Request Body: ' + str_body[:2048])
-            if length >= 2048:
-                self.LOG.debug("Large body (%d) md5 summary: %s", length,
-                               hashlib.md5(str_body).hexdigest())
+            self.LOG.debug('Request Headers: %s', http.safe_headers(headers))
+        http.log_body(self.LOG, 'Request Body', body,
+                      CONF.service_clients.log_body_limit)
 
     def _log_response(self, resp, resp_body):
-        status = resp['status']
-        self.LOG.info("Response Status: " + status)
-        headers = resp.copy()
-        del headers['status']
-        if headers.get('x-compute-request-id'):
-            self.LOG.info("Nova/Cinder request id: %s" %
-                          headers.pop('x-compute-request-id'))
-        elif headers.get('x-openstack-request-id'):
-            self.LOG.info("OpenStack request id %s" %
-                          headers.pop('x-openstack-request-id'))
-        if len(headers):
-            self.LOG.debug('Response Headers: ' + str(headers))
-        if resp_body:
-            str_body = str(resp_body)
-            length = len(str_body)
-            self.LOG.debug('Response Body: ' + str_body[:2048])
-            if length >= 2048:
-                self.LOG.debug("Large body (%d) md5 summary: %s", length,
-                               hashlib.md5(str_body).hexdigest())
+        self.LOG.info("Response Status: %s", resp['status'])
+        request_id = None
+        if resp.get('x-compute-request-id'):
+            request_id = 'x-compute-request-id'
+            self.LOG.info("Nova/Cinder request id: %s", resp[request_id])
+        elif resp.get('x-openstack-request-id'):
+            request_id = 'x-openstack-request-id'
+            self.LOG.info("OpenStack request id %s", resp[request_id])
+        if not self.LOG.isEnabledFor(std_logging.DEBUG):
+            return
+        headers = dict((key, value) for key, value in resp.items()
+                       if key not in ('status', request_id))
+        if headers:
+            self.LOG.debug('Response Headers: %s', headers)
+        if isinstance(resp_body, http.ResponseBodyStream):
+            self.LOG.debug('Response Body: <streamed>')
+            resp_body.on_close.append(self._log_response_stream)
+        else:
+            http.log_body(self.LOG, 'Response Body', resp_body,
+                          CONF.service_clients.log_body_limit)
+
+    def _log_response_stream(self, stream):
+        self.LOG.debug("Streamed body (%d) md5 summary: %s", stream.length,
+                       stream.md5)
 
     def _parse_resp(self, body):
         if self._get_type() is "json":
-            body = json.loads(body)
+            body = json_codec.loads(body)
 
             # We assume, that if the first value of the deserialized body's
             # item set is a dict or a list, that we just return the first value
@@ -297,14 +331,22 @@ class RestClient(object):
                 return dictionary
             if any(s in element.tag for s in self.list_tags):
                 # Parse list-like xmls (users, roles, etc)
-                array = []
-                for child in element.getchildren():
-                    array.append(xml_to_json(child))
-                return array
+                return parse_array(element)
 
             # Parse one-item-like xmls (user, role, etc)
             return xml_to_json(element)
 
+    def _decode_resp(self, resp, resp_body):
+        """
+        Returns _parse_resp(resp_body), decoding the body at most once per
+        response: the result is cached on the response.
+        """
+        decoded = getattr(resp, 'decoded_body', None)
+        if decoded is None or decoded[0] is not resp_body:
+            decoded = (resp_body, self._parse_resp(resp_body))
+            resp.decoded_body = decoded
+        return decoded[1]
+
     def response_checker(self, method, url, headers, body, resp, resp_body):
         if (resp.status in set((204, 205, 304)) or resp.status < 200 or
                 method.upper() == 'HEAD') and resp_body:
@@ -333,15 +375,38 @@ class RestClient(object):
         if not resp_body and resp.status >= 400:
             self.LOG.warning("status >= 400 response with empty body")
 
-    def _request(self, method, url, headers=None, body=None):
+    def _request(self, method, url, headers=None, body=None, stream=False):
         """A simple HTTP request interface."""
         # Authenticate the request with the auth provider
         req_url, req_headers, req_body = self.auth_provider.auth_request(
             method, url, headers, body, self.filters)
         self._log_request(method, req_url, req_headers, req_body)
         # Do the actual request
-        resp, resp_body = self.http_obj.request(
-            req_url, method, headers=req_headers, body=req_body)
+        start = time.time()
+        if stream:
+            resp, resp_body = http.open_stream(
+                req_url, method, headers=req_headers, body=req_body,
+                chunk_size=CONF.service_clients.stream_chunk_size,
+                disable_ssl_certificate_validation=(
+                    CONF.identity.disable_ssl_certificate_validation))
+            # Only successful responses with an entity are streamed, the
+            # others are small and checked as usual
+            if (resp.status not in HTTP_SUCCESS or
+                    resp.status in (204, 205) or method.upper() == 'HEAD'):
+                resp_body = resp_body.read()
+        else:
+            cache = response_cache.get_cache()
+            if cache.enabled():
+                resp, resp_body = cache.request(
+                    self.http_obj.request, req_url, method,
+                    headers=req_headers, body=req_body)
+            else:
+                resp, resp_body = self.http_obj.request(
+                    req_url, method, headers=req_headers, body=req_body)
+        # The responses served from the cache did not reach the service
+        if latency.enabled() and not getattr(resp, 'fromcache', False):
+            latency.record(self.service, method, req_url, resp.status,
+                           time.time() - start)
         self._log_response(resp, resp_body)
         # Verify HTTP response codes
         self.response_checker(method, url, req_headers, req_body, resp,
@@ -349,31 +414,94 @@ class RestClient(object):
 
         return resp, resp_body
 
-    def request(self, method, url, headers=None, body=None):
-        retry = 0
+    def request(self, method, url, headers=None, body=None, stream=False):
+        overlimit_retries = 0
 
         if headers is None:
             # NOTE(vponomaryov): if some client do not need headers,
             # it should explicitly pass empty dict
             headers = self.get_headers()
 
-        resp, resp_body = self._request(method, url,
-                                        headers=headers, body=body)
+        resp, resp_body = self._retry_request(method, url, headers, body,
+                                              stream)
 
         while (resp.status == 413 and
                'retry-after' in resp and
                 not self.is_absolute_limit(
-                    resp, self._parse_resp(resp_body)) and
-                retry < MAX_RECURSION_DEPTH):
-            retry += 1
+                    resp, self._decode_resp(resp, resp_body)) and
+                overlimit_retries < MAX_RECURSION_DEPTH):
+            overlimit_retries += 1
             delay = int(resp['retry-after'])
             time.sleep(delay)
-            resp, resp_body = self._request(method, url,
-                                            headers=headers, body=body)
+            resp, resp_body = self._retry_request(method, url, headers, body,
+                                                  stream)
+        if journal.enabled() and not stream and self._get_type() == "json":
+            journal.journal_response(self, method, url, resp, resp_body)
         self._error_checker(method, url, headers, body,
                             resp, resp_body)
         return resp, resp_body
 
+    def _retry_request(self, method, url, headers, body, stream):
+        """
+        Sends the request, and sends it again while it fails transiently
+        and the retry policy of the service allows it.
+        """
+        policy = retry.get_policy(self.service)
+        attempt = 0
+        while True:
+            try:
+                with fanout.service_slot(self.service):
+                    resp, resp_body = self._request(method, url,
+                                                    headers=headers,
+                                                    body=body, stream=stream)
+            except retry.CONNECTION_ERRORS as e:
+                delay = self._retry_delay(policy, method, url, body, attempt,
+                                          error=e)
+                if delay is None:
+                    raise
+            else:
+                if resp.status not in policy.statuses:
+                    return resp, resp_body
+                delay = self._retry_delay(policy, method, url, body, attempt,
+                                          status=resp.status)
+                if delay is None:
+                    return resp, resp_body
+            time.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(self, policy, method, url, body, attempt, status=None,
+                     error=None):
+        """
+        Returns the delay before the retry of a failed request, or None if
+        it is not retried.
+        """
+        if not policy.retriable(method, body, status):
+            return None
+        if attempt >= policy.attempts:
+            retry.record_exhausted(self.service)
+            return None
+        if not policy.spend_budget():
+            self.LOG.warning("The retry budget of the %s service is spent, "
+                             "%s %s is not retried", self.service, method, url)
+            return None
+        delay = policy.delay(attempt)
+        retry.record(self.service, delay)
+        self.LOG.info("%s %s failed (%s), retrying in %.1fs (%d/%d)",
+                      method, url, error or status, delay, attempt + 1,
+                      policy.attempts)
+        return delay
+
+    def fanout(self, func, items, return_exceptions=False):
+        """
+        Calls func on each item concurrently, e.g.
+        servers_client.fanout(servers_client.delete_server, server_ids),
+        and returns the results in the order of the items. Errors are the
+        usual exceptions raised by _error_checker, see fanout.run for how
+        they are returned.
+        """
+        return fanout.run([functools.partial(func, item) for item in items],
+                          return_exceptions=return_exceptions)
+
     def _error_checker(self, method, url,
                        headers, body, resp, resp_body):
 
@@ -419,17 +547,17 @@ class RestClient(object):
 
         if resp.status == 400:
             if parse_resp:
-                resp_body = self._parse_resp(resp_body)
+                resp_body = self._decode_resp(resp, resp_body)
             raise exceptions.BadRequest(resp_body)
 
         if resp.status == 409:
             if parse_resp:
-                resp_body = self._parse_resp(resp_body)
+                resp_body = self._decode_resp(resp, resp_body)
             raise exceptions.Conflict(resp_body)
 
         if resp.status == 413:
             if parse_resp:
-                resp_body = self._parse_resp(resp_body)
+                resp_body = self._decode_resp(resp, resp_body)
             if self.is_absolute_limit(resp, resp_body):
                 raise exceptions.OverLimit(resp_body)
             else:
@@ -437,14 +565,14 @@ class RestClient(object):
 
         if resp.status == 422:
             if parse_resp:
-                resp_body = self._parse_resp(resp_body)
+                resp_body = self._decode_resp(resp, resp_body)
             raise exceptions.UnprocessableEntity(resp_body)
 
         if resp.status in (500, 501):
             message = resp_body
             if parse_resp:
                 try:
-                    resp_body = self._parse_resp(resp_body)
+                    resp_body = self._decode_resp(resp, resp_body)
                 except ValueError:
                     # If response body is a non-json string message.
                     # Use resp_body as is and raise InvalidResponseBody
@@ -468,7 +596,7 @@ class RestClient(object):
 
         if resp.status >= 400:
             if parse_resp:
-                resp_body = self._parse_resp(resp_body)
+                resp_body = self._decode_resp(resp, resp_body)
             raise exceptions.RestClientException(str(resp.status))
 
     def is_absolute_limit(self, resp, resp_body):
@@ -485,13 +613,11 @@ class RestClient(object):
 
     def wait_for_resource_deletion(self, id):
         """Waits for a resource to be deleted."""
-        start_time = int(time.time())
-        while True:
+        for _ in polling.poll(polling.DELETION, self.build_timeout,
+                              self.build_interval):
             if self.is_resource_deleted(id):
                 return
-            if int(time.time()) - start_time >= self.build_timeout:
-                raise exceptions.TimeoutException
-            time.sleep(self.build_interval)
+        raise exceptions.TimeoutException
 
     def is_resource_deleted(self, id):
         """
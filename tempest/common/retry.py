@@ -0,0 +1,182 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Retries of the requests sent by the REST clients which failed transiently.
+
+A request failing with a connection error, or with one of the
+[service-clients] retry_statuses, is retried up to retry_attempts times,
+or the retry_service_attempts of its service. Only the requests of the
+retry_methods are retried, which are the idempotent GET, HEAD and DELETE
+by default.
+
+The delay before a retry grows exponentially from retry_backoff up to
+retry_backoff_max, and part of it is randomized so that the concurrent
+test workers do not retry in lockstep. Every service has a budget of
+retries per process: once it is spent a failing service fails the requests
+right away instead of slowing every test down.
+
+The number of retries and the time spent backing off are counted by
+service, for the whole run and for the current test.
+"""
+
+import collections
+import random
+import socket
+import threading
+
+import six
+from six.moves import http_client
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+# Errors of a request which did not get a response from the service
+CONNECTION_ERRORS = (http_client.HTTPException, socket.error)
+
+_policies = {}
+_policies_lock = threading.Lock()
+
+
+class RetryPolicy(object):
+    """When and after which delay the requests of a service are retried."""
+
+    def __init__(self, service, attempts=0, statuses=(), methods=(),
+                 backoff=1.0, backoff_max=30.0, jitter=0.5, budget=0):
+        self.service = service
+        self.attempts = attempts
+        self.statuses = frozenset(int(status) for status in statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        # None stands for an unlimited budget
+        self.budget = budget or None
+        self._lock = threading.Lock()
+
+    def retriable(self, method, body=None, status=None):
+        """
+        Whether a request which failed with the status, or without any
+        response when the status is None, may be retried.
+        """
+        if not self.attempts or method.upper() not in self.methods:
+            return False
+        # A streamed body can not be sent twice
+        if body is not None and not isinstance(body, six.string_types):
+            return False
+        return status is None or status in self.statuses
+
+    def delay(self, attempt):
+        """Returns the delay in seconds before the retry number attempt."""
+        delay = min(self.backoff * 2 ** attempt, self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
+
+    def spend_budget(self):
+        """Takes one retry from the budget, returns False if it is spent."""
+        with self._lock:
+            if self.budget is None:
+                return True
+            if self.budget <= 0:
+                return False
+            self.budget -= 1
+            return True
+
+
+def get_policy(service):
+    """Returns the retry policy of the service, built from the config."""
+    with _policies_lock:
+        if service not in _policies:
+            conf = CONF.service_clients
+            attempts = (conf.retry_service_attempts or {}).get(
+                service, conf.retry_attempts)
+            _policies[service] = RetryPolicy(
+                service, attempts=int(attempts),
+                statuses=conf.retry_statuses, methods=conf.retry_methods,
+                backoff=conf.retry_backoff,
+                backoff_max=conf.retry_backoff_max, jitter=conf.retry_jitter,
+                budget=conf.retry_budget)
+        return _policies[service]
+
+
+class RetryStats(object):
+    """Thread-safe counts of the retries and of the delays, by service."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = collections.defaultdict(int)
+        self.backoff = collections.defaultdict(float)
+        self.exhausted = collections.defaultdict(int)
+
+    def record(self, service, delay):
+        with self._lock:
+            self.retries[service] += 1
+            self.backoff[service] += delay
+
+    def record_exhausted(self, service):
+        with self._lock:
+            self.exhausted[service] += 1
+
+    def reset(self):
+        """Clears the counts, returns them as a new RetryStats."""
+        stats = RetryStats()
+        with self._lock:
+            stats.retries, self.retries = self.retries, stats.retries
+            stats.backoff, self.backoff = self.backoff, stats.backoff
+            stats.exhausted, self.exhausted = self.exhausted, stats.exhausted
+        return stats
+
+    def summary(self):
+        lines = []
+        for service in sorted(set(self.retries) | set(self.exhausted)):
+            lines.append('%s retries=%d backoff=%.1fs exhausted=%d' % (
+                service, self.retries[service], self.backoff[service],
+                self.exhausted[service]))
+        return '\n'.join(lines)
+
+
+_run_stats = RetryStats()
+_test_stats = RetryStats()
+
+
+def record(service, delay):
+    """Records a retry of a request of the service after delay seconds."""
+    _run_stats.record(service, delay)
+    _test_stats.record(service, delay)
+
+
+def record_exhausted(service):
+    """Records a request which failed after all its retries."""
+    _run_stats.record_exhausted(service)
+    _test_stats.record_exhausted(service)
+
+
+def stats():
+    """Returns the counts of the whole run, by service."""
+    return _run_stats
+
+
+def start_test():
+    _test_stats.reset()
+
+
+def stop_test():
+    """
+    Returns the summary of the retries since start_test(), one line per
+    service, or an empty string if there was none.
+    """
+    return _test_stats.reset().summary()
@@ -0,0 +1,214 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Deletion of the resources leaked by the tests, from the resource journal.
+
+Only the resources of the open entries of the journal are deleted, by id
+with the admin credentials: nothing is listed across the tenants, so
+sweeping is fast on a large cloud and never touches the resources of
+other users. The resources are deleted concurrently along the
+dependencies between their types, see tempest.common.teardown. The
+servers, volumes, snapshots, backups and stacks are deleted
+asynchronously: all the resources of such a type are waited for before
+the resources depending on them are deleted, each polled by id since the
+resources of other tenants can only be listed with all_tenants. The
+entries are closed once their resource is deleted or not found.
+
+The entries of the test workers still running on this host are skipped.
+"""
+
+import errno
+import os
+import threading
+
+from tempest.common import journal
+from tempest.common import polling
+from tempest.common import rest_client
+from tempest.common import teardown
+from tempest import exceptions
+from tempest.openstack.common import log as logging
+
+LOG = logging.getLogger(__name__)
+
+# Types of resources, the collections of their URLs, by deletion order,
+# with the types deleted before them
+DEPENDENCIES = (
+    ('os-volume_attachments', ()),
+    ('stacks', ()),
+    ('servers', ('os-volume_attachments', 'stacks')),
+    ('images', ()),
+    ('backups', ()),
+    ('snapshots', ('backups',)),
+    ('volumes', ('servers', 'backups', 'snapshots')),
+    ('os-floating-ips', ('servers',)),
+    ('floatingips', ('servers',)),
+    ('ipsec-site-connections', ()),
+    ('vpnservices', ('ipsec-site-connections',)),
+    ('ikepolicies', ('ipsec-site-connections',)),
+    ('ipsecpolicies', ('ipsec-site-connections',)),
+    ('members', ()),
+    ('health_monitors', ()),
+    ('vips', ()),
+    ('pools', ('members', 'health_monitors', 'vips')),
+    ('metering-label-rules', ()),
+    ('metering-labels', ('metering-label-rules',)),
+    ('routers', ('floatingips', 'vpnservices')),
+    ('ports', ('servers', 'floatingips', 'routers', 'vips')),
+    ('subnets', ('ports', 'routers', 'vpnservices', 'vips', 'pools')),
+    ('networks', ('servers', 'ports', 'subnets')),
+    ('os-security-group-rules', ()),
+    ('os-security-groups', ('servers', 'os-security-group-rules')),
+    ('security-group-rules', ()),
+    ('security-groups', ('servers', 'ports', 'security-group-rules')),
+)
+# Types deleted last, once the resources of their tenants are
+IDENTITY_TYPES = ('users', 'tenants', 'projects')
+# Types deleted asynchronously, waited for before their dependents
+ASYNC_TYPES = {'servers': polling.SERVER, 'volumes': polling.VOLUME,
+               'snapshots': polling.SNAPSHOT, 'backups': polling.BACKUP,
+               'stacks': polling.STACK}
+
+
+class _SweepClient(rest_client.RestClient):
+    """Client sending the requests to the endpoint of a journal entry."""
+
+    def __init__(self, auth_provider, filters):
+        super(_SweepClient, self).__init__(auth_provider)
+        self.service = filters['service']
+        self._entry_filters = filters
+
+    @property
+    def filters(self):
+        return self._entry_filters
+
+
+def _alive(pid):
+    if pid is None or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except OSError as exc:
+        return exc.errno == errno.EPERM
+    return True
+
+
+class Sweeper(object):
+
+    def __init__(self, connection, auth_provider, max_workers=None):
+        self.connection = connection
+        self.auth_provider = auth_provider
+        self.max_workers = max_workers
+        self.clients = {}
+        self.lock = threading.Lock()
+        self.deleted = []
+        self.failed = []
+
+    def _client(self, entry):
+        key = repr(sorted(entry['filters'].items()))
+        with self.lock:
+            if key not in self.clients:
+                self.clients[key] = _SweepClient(self.auth_provider,
+                                                 entry['filters'])
+            return self.clients[key]
+
+    def _close(self, entry):
+        with self.lock:
+            journal.close_entry(self.connection, entry['id'])
+            self.deleted.append(entry)
+
+    def _remove_router_interfaces(self, client, entry):
+        # The ports of the router, not a listing across the tenants
+        resp, body = client.get('v2.0/ports?device_id=%s' %
+                                entry['resource_id'])
+        for port in client._parse_resp(body):
+            if port['device_owner'] != 'network:router_interface':
+                continue
+            client.put('%s/remove_router_interface' % entry['path'],
+                       '{"port_id": "%s"}' % port['id'])
+
+    def delete(self, entry):
+        client = self._client(entry)
+        try:
+            if entry['resource_type'] == 'routers':
+                self._remove_router_interfaces(client, entry)
+            client.delete(entry['path'])
+        except exceptions.NotFound:
+            pass
+        except Exception as exc:
+            # The resources depending on this one are still tried
+            LOG.warning("Failed to delete %s %s: %s" %
+                        (entry['resource_type'], entry['resource_id'], exc))
+            with self.lock:
+                self.failed.append(entry)
+            return
+        if entry['resource_type'] not in ASYNC_TYPES:
+            self._close(entry)
+
+    def wait(self, entries):
+        """Waits for the deletion of the entries of an asynchronous type."""
+        entries = [entry for entry in entries if entry not in self.failed]
+        if not entries:
+            return
+        client = self._client(entries[0])
+        for _ in polling.poll(ASYNC_TYPES[entries[0]['resource_type']],
+                              client.build_timeout, client.build_interval):
+            remaining = []
+            for entry in entries:
+                try:
+                    self._client(entry).get(entry['path'])
+                    remaining.append(entry)
+                except exceptions.NotFound:
+                    self._close(entry)
+            entries = remaining
+            if not entries:
+                return
+        for entry in entries:
+            LOG.warning("%s %s not deleted" %
+                        (entry['resource_type'], entry['resource_id']))
+            with self.lock:
+                self.failed.append(entry)
+
+    def sweep(self, include_running=False):
+        """Deletes the resources of the open entries of the journal."""
+        entries = journal.open_entries(self.connection)
+        if not include_running:
+            running = [entry for entry in entries if _alive(entry['pid'])]
+            if running:
+                LOG.info("Skipping %d resources of running workers" %
+                         len(running))
+            entries = [entry for entry in entries
+                       if entry not in running]
+        by_type = {}
+        for entry in entries:
+            by_type.setdefault(entry['resource_type'], []).append(entry)
+        cleanup = teardown.Teardown(max_workers=self.max_workers)
+        for resource_type, depends_on in DEPENDENCIES:
+            self._add(cleanup, resource_type, by_type, depends_on)
+        known = set(cleanup.kinds) | set(IDENTITY_TYPES)
+        for resource_type in sorted(set(by_type) - known):
+            self._add(cleanup, resource_type, by_type)
+        # The resources of the tenants go before the tenants and users
+        others = tuple(cleanup.kinds)
+        self._add(cleanup, 'users', by_type, others)
+        self._add(cleanup, 'tenants', by_type, others + ('users',))
+        self._add(cleanup, 'projects', by_type, others + ('users',))
+        cleanup.run()
+        return self.deleted, self.failed
+
+    def _add(self, cleanup, resource_type, by_type, depends_on=()):
+        wait = self.wait if resource_type in ASYNC_TYPES else None
+        cleanup.add(resource_type, by_type.get(resource_type, []),
+                    self.delete, depends_on=depends_on, wait=wait)
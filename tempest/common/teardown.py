@@ -0,0 +1,178 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Concurrent deletion of the resources of a test class along their
+dependencies.
+
+The resources are added by kind, e.g. the routers, with the function
+deleting one of them and the kinds which must be deleted first, e.g. the
+floating IPs for the routers. A kind can also have a function waiting for
+the deletion of all its resources at once, called once they are all
+deleted, before the kinds depending on it are deleted.
+
+The deletions of the kinds whose dependencies are deleted run
+concurrently, by at most [service-clients] fanout_workers threads. The
+first deletion raising an exception stops the teardown: the deletions not
+started yet are skipped and the exception is raised once the running ones
+complete, as the sequential teardown did. The delete functions have to
+handle the errors which should not stop the teardown.
+"""
+
+import collections
+import sys
+import threading
+
+import six
+
+from tempest import config
+from tempest.openstack.common import log as logging
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+_Kind = collections.namedtuple('_Kind', ['name', 'resources', 'delete',
+                                         'depends_on', 'wait'])
+
+
+class Teardown(object):
+    """The dependency graph of the kinds of resources to delete."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.kinds = collections.OrderedDict()
+
+    def add(self, name, resources, delete, depends_on=(), wait=None):
+        """
+        Adds a kind of resources.
+
+        :param resources: the resources to delete
+        :param delete: callable deleting one resource
+        :param depends_on: names of the kinds to delete first
+        :param wait: callable waiting for the deletion of the resources,
+                     called with all of them once they are deleted
+        """
+        for dependency in depends_on:
+            if dependency not in self.kinds:
+                raise ValueError("%s depends on %s, which is unknown or "
+                                 "added after it" % (name, dependency))
+        self.kinds[name] = _Kind(name, list(resources), delete,
+                                 tuple(depends_on), wait)
+
+    def run(self):
+        _Run(self).run()
+
+
+class _Run(object):
+
+    def __init__(self, teardown):
+        self.kinds = teardown.kinds
+        self.max_workers = teardown.max_workers
+        if self.max_workers is None:
+            self.max_workers = CONF.service_clients.fanout_workers
+        self.condition = threading.Condition()
+        # (kind, resource) to delete, or (kind, None) to wait for a kind
+        self.ready = collections.deque()
+        self.remaining = dict((name, len(kind.resources))
+                              for name, kind in self.kinds.items())
+        self.blocking = dict((name, set(kind.depends_on))
+                             for name, kind in self.kinds.items())
+        self.pending_kinds = set(self.kinds)
+        self.scheduled = set()
+        self.running = 0
+        self.error = None
+
+    def _schedule(self, name):
+        if name in self.scheduled:
+            return
+        self.scheduled.add(name)
+        kind = self.kinds[name]
+        if kind.resources:
+            self.ready.extend((kind, resource) for resource in kind.resources)
+        elif kind.wait is not None:
+            self.ready.append((kind, None))
+        else:
+            self._kind_done(name)
+
+    def _kind_done(self, name):
+        LOG.debug("Teardown of the %s complete" % name)
+        self.pending_kinds.discard(name)
+        for other, blocking in self.blocking.items():
+            if name in blocking:
+                blocking.discard(name)
+                if not blocking:
+                    self._schedule(other)
+
+    def _task_done(self, kind, resource):
+        if resource is None:
+            self._kind_done(kind.name)
+            return
+        self.remaining[kind.name] -= 1
+        if not self.remaining[kind.name]:
+            if kind.wait is not None:
+                self.ready.append((kind, None))
+            else:
+                self._kind_done(kind.name)
+
+    def _worker(self):
+        while True:
+            with self.condition:
+                while not self.ready and self.running and self.error is None:
+                    self.condition.wait()
+                if self.error is not None or not self.ready:
+                    self.condition.notify_all()
+                    return
+                kind, resource = self.ready.popleft()
+                self.running += 1
+            try:
+                if resource is None:
+                    kind.wait(kind.resources)
+                else:
+                    kind.delete(resource)
+            except Exception:
+                exc_info = sys.exc_info()
+                with self.condition:
+                    if self.error is None:
+                        self.error = exc_info
+                    self.running -= 1
+                    self.condition.notify_all()
+                continue
+            with self.condition:
+                self.running -= 1
+                self._task_done(kind, resource)
+                self.condition.notify_all()
+
+    def run(self):
+        with self.condition:
+            for name, blocking in self.blocking.items():
+                if not blocking:
+                    self._schedule(name)
+        total = sum(len(kind.resources) for kind in self.kinds.values())
+        workers = max(1, min(self.max_workers, total))
+        if workers == 1:
+            self._worker()
+        else:
+            threads = [threading.Thread(target=self._worker)
+                       for _ in range(workers)]
+            for thread in threads:
+                thread.daemon = True
+                thread.start()
+            for thread in threads:
+                thread.join()
+        if self.error is not None:
+            six.reraise(*self.error)
+        if self.pending_kinds:
+            LOG.warning("Teardown of %s not complete" %
+                        ', '.join(sorted(self.pending_kinds)))
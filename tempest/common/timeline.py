@@ -0,0 +1,293 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Timeline of the status transitions of the resources waited for.
+
+When [service-clients] timeline_dir is set, the waiters record a row each
+time they find a server, volume, image, snapshot or stack in a new status
+or task state, with the creation time of the resource and, for the
+servers, their flavor and image. The waiters returning a Future also
+record a row when the wait completes, with its duration and outcome.
+
+Every test worker appends its rows to a dataset file of timeline_dir, as
+JSON lines or CSV depending on timeline_format, and merges the datasets
+of all the workers of the run into timeline-report.json when it exits.
+The workers of a run are the processes of the process group of the test
+runner, e.g. the workers of testr run --parallel, so the datasets left by
+the previous runs are not merged. The report has the p50, p90 and p99
+of:
+
+- the boot time of the servers, from their creation to ACTIVE, by flavor
+  and by image,
+- the time from the creation of the resources of each type to each of
+  their status,
+- the duration of the waits by type of resource and status waited for,
+  the waits of the volumes for in-use being the volume attach latency.
+
+Comparing the reports of two runs shows the performance regressions of
+the cloud, see tools/timeline_report.py.
+"""
+
+import calendar
+import csv
+import glob
+import json
+import math
+import os
+import threading
+import time
+
+from tempest import config
+from tempest.openstack.common import lockutils
+from tempest.openstack.common import log as logging
+from tempest.openstack.common import timeutils
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+JSON_LINES = 'jsonl'
+CSV = 'csv'
+REPORT_FILE = 'timeline-report.json'
+# By process group of the run, pid of the worker and format
+WORKER_FILE = 'timeline-%d-%d.%s'
+
+TRANSITION = 'transition'
+WAIT = 'wait'
+FIELDS = ('time', 'kind', 'test', 'resource_type', 'resource_id', 'status',
+          'task_state', 'created', 'flavor', 'image', 'target', 'duration',
+          'outcome')
+# Keys of the creation time of the resources of the different services
+CREATED_KEYS = ('created', 'created_at', 'creation_time')
+
+_lock = threading.Lock()
+_file = None
+_writer = None
+_test = None
+# Last (status, task_state) recorded by resource
+_states = {}
+
+
+def enabled():
+    return bool(CONF.service_clients.timeline_dir)
+
+
+def recorded():
+    """Whether any row was recorded by this process."""
+    return _file is not None
+
+
+def start_test(test_id):
+    """Makes test_id the test of the rows recorded from now on."""
+    global _test
+    _test = test_id
+
+
+def _epoch(value):
+    """Returns the seconds since the epoch of an ISO 8601 time, or None."""
+    if not value:
+        return None
+    try:
+        parsed = timeutils.parse_isotime(value)
+    except ValueError:
+        return None
+    return (calendar.timegm(parsed.utctimetuple()) +
+            parsed.microsecond / 1000000.0)
+
+
+def _reference_id(value):
+    """The id of the flavor or image of a server."""
+    if isinstance(value, dict):
+        return value.get('id')
+    return value or None
+
+
+def _write(row):
+    global _file, _writer
+    row = dict((field, row.get(field)) for field in FIELDS)
+    with _lock:
+        if _file is None:
+            timeline_dir = CONF.service_clients.timeline_dir
+            if not os.path.isdir(timeline_dir):
+                os.makedirs(timeline_dir)
+            timeline_format = CONF.service_clients.timeline_format
+            path = os.path.join(timeline_dir, WORKER_FILE % (
+                os.getpgrp(), os.getpid(), timeline_format))
+            _file = open(path, 'a')
+            if timeline_format == CSV:
+                _writer = csv.DictWriter(_file, FIELDS)
+                # Once per file, a pid may be reused during a run
+                if not os.path.getsize(path):
+                    _writer.writerow(dict(zip(FIELDS, FIELDS)))
+        if _writer is not None:
+            _writer.writerow(row)
+        else:
+            _file.write(json.dumps(row, sort_keys=True) + '\n')
+        _file.flush()
+
+
+def record_status(resource_type, resource_id, status, task_state=None,
+                  resource=None):
+    """
+    Records the status of a resource, if it changed since it was last
+    recorded. resource is the representation of the resource returned by
+    the service, if any, holding its creation time, flavor and image.
+    """
+    if not enabled():
+        return
+    key = (resource_type, resource_id)
+    state = (status, None if task_state is None else str(task_state))
+    with _lock:
+        if _states.get(key) == state:
+            return
+        _states[key] = state
+    row = {'time': time.time(), 'kind': TRANSITION, 'test': _test,
+           'resource_type': resource_type, 'resource_id': resource_id,
+           'status': status, 'task_state': state[1]}
+    if resource:
+        for created_key in CREATED_KEYS:
+            if resource.get(created_key):
+                row['created'] = _epoch(resource[created_key])
+                break
+        row['flavor'] = _reference_id(resource.get('flavor'))
+        row['image'] = _reference_id(resource.get('image'))
+    _write(row)
+
+
+def track_wait(future, resource_type, resource_id, target):
+    """Records the duration and outcome of the wait of the future."""
+    if not enabled():
+        return future
+    start = time.time()
+    test = _test
+
+    def done(future):
+        error = future.exception()
+        _write({'time': time.time(), 'kind': WAIT, 'test': test,
+                'resource_type': resource_type, 'resource_id': resource_id,
+                'target': target, 'duration': time.time() - start,
+                'outcome': type(error).__name__ if error else 'ok'})
+
+    future.add_done_callback(done)
+    return future
+
+
+def _run_of(path):
+    return os.path.basename(path).split('-')[1]
+
+
+def dataset_paths(timeline_dir, run=None):
+    """
+    Returns the dataset files of the workers of a run in timeline_dir, by
+    default of the run which wrote last.
+    """
+    paths = []
+    for timeline_format in (CSV, JSON_LINES):
+        paths += glob.glob(os.path.join(timeline_dir,
+                                        'timeline-*-*.%s' % timeline_format))
+    if run is None:
+        if not paths:
+            return []
+        run = _run_of(max(paths, key=os.path.getmtime))
+    return [path for path in paths if _run_of(path) == str(run)]
+
+
+def load(paths):
+    """Returns the rows of the dataset files."""
+    rows = []
+    for path in paths:
+        with open(path) as f:
+            if path.endswith('.' + CSV):
+                for row in csv.DictReader(f):
+                    row = dict((field, value if value != '' else None)
+                               for field, value in row.items())
+                    for field in ('time', 'created', 'duration'):
+                        if row[field] is not None:
+                            row[field] = float(row[field])
+                    rows.append(row)
+            else:
+                rows.extend(json.loads(line) for line in f if line.strip())
+    return rows
+
+
+def percentile(values, percent):
+    """Nearest rank percentile of the sorted values."""
+    rank = int(math.ceil(len(values) * percent / 100.0))
+    return values[max(rank, 1) - 1]
+
+
+def summary(values):
+    values = sorted(values)
+    return {'count': len(values),
+            'p50': round(percentile(values, 50), 3),
+            'p90': round(percentile(values, 90), 3),
+            'p99': round(percentile(values, 99), 3),
+            'max': round(values[-1], 3)}
+
+
+def report(rows):
+    """Returns the aggregates of the rows of a run."""
+    first_seen = {}
+    for row in sorted(rows, key=lambda row: row['time']):
+        if row['kind'] != TRANSITION or row['created'] is None:
+            continue
+        key = (row['resource_type'], row['resource_id'], row['status'])
+        if key not in first_seen:
+            first_seen[key] = row
+    times = {}
+    boot_times = {'flavor': {}, 'image': {}}
+    for (resource_type, _, status), row in first_seen.items():
+        elapsed = row['time'] - row['created']
+        times.setdefault(resource_type, {}).setdefault(
+            status, []).append(elapsed)
+        if resource_type == 'server' and status == 'ACTIVE':
+            for reference in ('flavor', 'image'):
+                boot_times[reference].setdefault(
+                    row[reference] or 'none', []).append(elapsed)
+    waits = {}
+    for row in rows:
+        if row['kind'] == WAIT and row['outcome'] == 'ok':
+            waits.setdefault('%s %s' % (row['resource_type'], row['target']),
+                             []).append(row['duration'])
+
+    def summaries(values_by_key):
+        return dict((key, summary(values))
+                    for key, values in values_by_key.items())
+
+    return {'boot_time': dict((reference, summaries(values))
+                              for reference, values in boot_times.items()),
+            'time_to_status': dict((resource_type, summaries(values))
+                                   for resource_type, values
+                                   in times.items()),
+            'waits': summaries(waits),
+            'volume_attach': summary(waits['volume in-use'])
+            if 'volume in-use' in waits else None}
+
+
+def write_report(timeline_dir):
+    """
+    Merges the datasets of all the workers of the run which wrote to
+    timeline_dir into its report.
+    """
+    with _lock:
+        if _file is None:
+            return
+        _file.flush()
+    with lockutils.lock('timeline-report', 'tempest-', external=True,
+                        lock_path=timeline_dir):
+        paths = dataset_paths(timeline_dir, run=os.getpgrp())
+        with open(os.path.join(timeline_dir, REPORT_FILE), 'w') as f:
+            json.dump(report(load(paths)), f, indent=2, sort_keys=True)
+    LOG.debug("Timeline report updated in %s" % timeline_dir)
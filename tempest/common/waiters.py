@@ -11,8 +11,15 @@
 #    under the License.
 
 
+import calendar
+import email.utils
+import socket
+import threading
 import time
 
+from tempest.common import poller
+from tempest.common import polling
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -20,103 +27,426 @@ from tempest.openstack.common import log as logging
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
+# Status of the resources waited for by wait_for_resources_status which
+# are deleted
+DELETED = 'DELETED'
 
-# NOTE(afazekas): This function needs to know a token and a subject.
-def wait_for_server_status(client, server_id, status, ready_wait=True,
-                           extra_timeout=0, raise_on_error=True):
-    """Waits for a server to reach a given status."""
 
-    def _get_task_state(body):
-        if client.service == CONF.compute.catalog_v3_type:
-            task_state = body.get("os-extended-status:task_state", None)
-        else:
-            task_state = body.get('OS-EXT-STS:task_state', None)
-        return task_state
+# Power states of nova in which a server of the status is ready
+_READY_POWER_STATES = {
+    'ACTIVE': 1,
+    'PAUSED': 3,
+    'SHUTOFF': 4,
+    'SUSPENDED': 7,
+}
+
+_ready_probe_stats = {'servers': 0, 'probed': 0, 'saved': 0.0}
+_ready_probe_lock = threading.Lock()
+
+
+def _get_extended_status(client, body, name):
+    if client.service == CONF.compute.catalog_v3_type:
+        return body.get('os-extended-status:%s' % name, None)
+    return body.get('OS-EXT-STS:%s' % name, None)
+
+
+def _last_action_finished(client, server_id):
+    """
+    Whether all the events of the last action on the server finished, True
+    when the instance actions extension is not available.
+    """
+    try:
+        resp, actions = client.list_instance_actions(server_id)
+        if not actions:
+            return True
+        last = max(actions, key=lambda action: action.get('start_time'))
+        resp, action = client.get_instance_action(server_id,
+                                                  last['request_id'])
+    except (exceptions.NotFound, exceptions.Unauthorized):
+        return True
+    events = action.get('events') or []
+    if isinstance(events, dict):
+        events = events.get('event') or []
+        if isinstance(events, dict):
+            events = [events]
+    return all(event.get('finish_time') for event in events)
 
-    # NOTE(afazekas): UNKNOWN status possible on ERROR
-    # or in a very early stage.
+
+def _port_open(body, port):
+    """Whether the port of an address of the server accepts connections."""
+    addresses = body.get('addresses') or {}
+    networks = addresses.get(CONF.compute.network_for_ssh)
+    if networks is None:
+        networks = [address for network in addresses.values()
+                    for address in network]
+    for address in networks:
+        try:
+            socket.create_connection((address['addr'], port), 1).close()
+            return True
+        except (socket.error, KeyError):
+            continue
+    return False
+
+
+def _server_ready(client, server_id, status):
+    """
+    Probes the conditions in which a server which reached the status is
+    ready for the next action.
+    """
     resp, body = client.get_server(server_id)
-    old_status = server_status = body['status']
-    old_task_state = task_state = _get_task_state(body)
+    if (body['status'] != status or
+            str(_get_extended_status(client, body, 'task_state')) != "None"):
+        return False
+    power_state = _get_extended_status(client, body, 'power_state')
+    if (status in _READY_POWER_STATES and power_state is not None and
+            int(power_state) != _READY_POWER_STATES[status]):
+        return False
+    if not _last_action_finished(client, server_id):
+        return False
+    port = CONF.compute.ready_probe_port
+    return not port or _port_open(body, port)
+
+
+def _record_ready_wait(server_id, waited, probed):
+    saved = max(CONF.compute.ready_wait - waited, 0)
+    with _ready_probe_lock:
+        _ready_probe_stats['servers'] += 1
+        if probed:
+            _ready_probe_stats['probed'] += 1
+        _ready_probe_stats['saved'] += saved
+    LOG.debug("Server %s ready after %.1f s, %.1f s of ready_wait saved" %
+              (server_id, waited, saved))
+
+
+def ready_probe_summary():
+    """Returns the time saved by the readiness probes, None if unused."""
+    with _ready_probe_lock:
+        if not _ready_probe_stats['probed']:
+            return None
+        return ('%(probed)d of %(servers)d servers found ready by the '
+                'probes, %(saved).1f s of ready_wait saved' %
+                _ready_probe_stats)
+
+
+# NOTE(afazekas): This function needs to know a token and a subject.
+def submit_server_status(client, server_id, status, ready_wait=True,
+                         extra_timeout=0, raise_on_error=True):
+    """Returns the Future of a wait for a server to reach a given status.
+
+    With ready_wait, once the server reached the status with no task in
+    progress, the wait lasts at most CONF.compute.ready_wait more seconds:
+    with CONF.compute.ready_probe, it completes as soon as the server is
+    found ready by _server_ready. The last poll of the wait is due when
+    ready_wait elapses, not one poll interval later.
+    """
     start_time = int(time.time())
     timeout = client.build_timeout + extra_timeout
-    while True:
+    state = {}
+
+    def ready():
+        waited = time.time() - state['ready_since']
+        probed = CONF.compute.ready_probe
+        if probed and _server_ready(client, server_id, status):
+            _record_ready_wait(server_id, waited, probed)
+            return True
+        if waited >= CONF.compute.ready_wait:
+            _record_ready_wait(server_id, waited, probed)
+            return True
+        return False
+
+    def check():
+        if 'ready_since' in state:
+            if ready():
+                return
+            return poller.PendingUntil(state['ready_since'] +
+                                       CONF.compute.ready_wait)
+        resp, body = client.get_server(server_id)
+        server_status = body['status']
+        task_state = _get_extended_status(client, body, 'task_state')
+        if 'status' in state and (server_status != state['status'] or
+                                  task_state != state['task_state']):
+            LOG.info('State transition "%s" ==> "%s" after %d second wait',
+                     '/'.join((state['status'], str(state['task_state']))),
+                     '/'.join((server_status, str(task_state))),
+                     time.time() - start_time)
+        state['status'] = server_status
+        state['task_state'] = task_state
+        timeline.record_status(polling.SERVER, server_id, server_status,
+                               task_state, body)
+        # NOTE(afazekas): UNKNOWN status possible on ERROR
+        # or in a very early stage.
         # NOTE(afazekas): Now the BUILD status only reached
         # between the UNKNOWN->ACTIVE transition.
         # TODO(afazekas): enumerate and validate the stable status set
         if status == 'BUILD' and server_status != 'UNKNOWN':
             return
         if server_status == status:
-            if ready_wait:
-                if status == 'BUILD':
-                    return
-                # NOTE(afazekas): The instance is in "ready for action state"
-                # when no task in progress
-                # NOTE(afazekas): Converted to string bacuse of the XML
-                # responses
-                if str(task_state) == "None":
-                    # without state api extension 3 sec usually enough
-                    time.sleep(CONF.compute.ready_wait)
-                    return
-            else:
+            if not ready_wait or status == 'BUILD':
                 return
-
-        time.sleep(client.build_interval)
-        resp, body = client.get_server(server_id)
-        server_status = body['status']
-        task_state = _get_task_state(body)
-        if (server_status != old_status) or (task_state != old_task_state):
-            LOG.info('State transition "%s" ==> "%s" after %d second wait',
-                     '/'.join((old_status, str(old_task_state))),
-                     '/'.join((server_status, str(task_state))),
-                     time.time() - start_time)
+            # NOTE(afazekas): The instance is in "ready for action state"
+            # when no task in progress
+            # NOTE(afazekas): Converted to string bacuse of the XML
+            # responses
+            if str(task_state) == "None":
+                if not CONF.compute.ready_wait:
+                    return
+                # without state api extension 3 sec usually enough
+                state['ready_since'] = time.time()
+                return check()
         if (server_status == 'ERROR') and raise_on_error:
             raise exceptions.BuildErrorException(server_id=server_id)
+        return poller.PENDING
 
-        timed_out = int(time.time()) - start_time >= timeout
+    def timeout_error():
+        expected_task_state = 'None' if ready_wait else 'n/a'
+        message = ('Server %(server_id)s failed to reach %(status)s '
+                   'status and task state "%(expected_task_state)s" '
+                   'within the required time (%(timeout)s s).' %
+                   {'server_id': server_id,
+                    'status': status,
+                    'expected_task_state': expected_task_state,
+                    'timeout': timeout})
+        message += ' Current status: %s.' % state.get('status')
+        message += ' Current task state: %s.' % state.get('task_state')
+        return exceptions.TimeoutException(message)
 
-        if timed_out:
-            expected_task_state = 'None' if ready_wait else 'n/a'
-            message = ('Server %(server_id)s failed to reach %(status)s '
-                       'status and task state "%(expected_task_state)s" '
-                       'within the required time (%(timeout)s s).' %
-                       {'server_id': server_id,
-                        'status': status,
-                        'expected_task_state': expected_task_state,
-                        'timeout': timeout})
-            message += ' Current status: %s.' % server_status
-            message += ' Current task state: %s.' % task_state
-            raise exceptions.TimeoutException(message)
-        old_status = server_status
-        old_task_state = task_state
+    future = poller.submit(check, timeout, client.build_interval,
+                           resource_type=polling.SERVER,
+                           service=client.service,
+                           timeout_error=timeout_error,
+                           description='server %s' % server_id)
+    return timeline.track_wait(future, polling.SERVER, server_id, status)
 
 
-def wait_for_image_status(client, image_id, status):
-    """Waits for an image to reach a given status.
+def wait_for_server_status(client, server_id, status, ready_wait=True,
+                           extra_timeout=0, raise_on_error=True):
+    """Waits for a server to reach a given status."""
+    return submit_server_status(client, server_id, status,
+                                ready_wait=ready_wait,
+                                extra_timeout=extra_timeout,
+                                raise_on_error=raise_on_error).result()
+
+
+def submit_image_status(client, image_id, status):
+    """Returns the Future of a wait for an image to reach a given status.
 
     The client should have a get_image(image_id) method to get the image.
     The client should also have build_interval and build_timeout attributes.
     """
-    resp, image = client.get_image(image_id)
-    start = int(time.time())
+    state = {}
 
-    while image['status'] != status:
-        time.sleep(client.build_interval)
+    def check():
         resp, image = client.get_image(image_id)
+        state['status'] = image['status']
+        timeline.record_status(polling.IMAGE, image_id, image['status'],
+                               resource=image)
+        if image['status'] == status:
+            return
         if image['status'] == 'ERROR':
             raise exceptions.AddImageException(image_id=image_id)
+        return poller.PENDING
 
-        # check the status again to avoid a false negative where we hit
-        # the timeout at the same time that the image reached the expected
-        # status
-        if image['status'] == status:
+    def timeout_error():
+        message = ('Image %(image_id)s failed to reach %(status)s '
+                   'status within the required time (%(timeout)s s).' %
+                   {'image_id': image_id,
+                    'status': status,
+                    'timeout': client.build_timeout})
+        message += ' Current status: %s.' % state.get('status')
+        return exceptions.TimeoutException(message)
+
+    future = poller.submit(check, client.build_timeout,
+                           client.build_interval,
+                           resource_type=polling.IMAGE,
+                           service=client.service,
+                           timeout_error=timeout_error,
+                           description='image %s' % image_id)
+    return timeline.track_wait(future, polling.IMAGE, image_id, status)
+
+
+def wait_for_image_status(client, image_id, status):
+    """Waits for an image to reach a given status.
+
+    The client should have a get_image(image_id) method to get the image.
+    The client should also have build_interval and build_timeout attributes.
+    """
+    return submit_image_status(client, image_id, status).result()
+
+
+def submit_volume_status(client, volume_id, status):
+    """Returns the Future of a wait for a volume to reach a given status."""
+    state = {}
+
+    def check():
+        resp, body = client.get_volume(volume_id)
+        state['name'] = body.get('display_name') or body.get('name')
+        timeline.record_status(polling.VOLUME, volume_id, body['status'],
+                               resource=body)
+        if body['status'] == status:
             return
+        if body['status'] == 'error':
+            raise exceptions.VolumeBuildErrorException(volume_id=volume_id)
+        return poller.PENDING
+
+    def timeout_error():
+        message = ('Volume %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (state.get('name') or volume_id, status,
+                    client.build_timeout))
+        return exceptions.TimeoutException(message)
+
+    future = poller.submit(check, client.build_timeout,
+                           client.build_interval,
+                           resource_type=polling.VOLUME,
+                           service=client.service,
+                           timeout_error=timeout_error,
+                           description='volume %s' % volume_id)
+    return timeline.track_wait(future, polling.VOLUME, volume_id, status)
+
+
+def wait_for_volume_status(client, volume_id, status):
+    """Waits for a volume to reach a given status."""
+    return submit_volume_status(client, volume_id, status).result()
+
+
+def _server_time(resp, duration):
+    """
+    Returns the time of the server when it started to handle the request
+    answered by resp in duration seconds, None if it is not known.
+    """
+    date = resp.get('date') if resp else None
+    parsed = email.utils.parsedate(date) if date else None
+    if parsed is None:
+        return None
+    # The Date header is rounded down to the second
+    return calendar.timegm(parsed) - duration - 1
+
+
+def _iso8601(seconds):
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(seconds))
+
+
+def wait_for_resources_status(list_resources, resource_ids, status,
+                              resource_type, timeout, interval,
+                              error_statuses=('ERROR',), build_error=None):
+    """Waits for many resources to reach a status with a listing per poll.
+
+    list_resources(changes_since) returns a (server_time, resources)
+    tuple, the resources being dicts with an id and a status. The first
+    call lists all the resources, with changes_since set to None. When
+    server_time is not None, it is the changes_since of the next call,
+    which only has to list the resources changed since, the deleted ones
+    included with the DELETED status. Otherwise every call lists all the
+    resources, and the ones missing from the listing are deleted.
+
+    Returns the last listed representation of the resources by id. A
+    resource in one of error_statuses raises build_error(resource_id), or
+    is not waited for anymore when build_error is None. Raises a
+    TimeoutException naming the resources which did not reach the status
+    in time.
+    """
+    pending = set(resource_ids)
+    statuses = dict.fromkeys(pending)
+    resources = {}
+    error_statuses = [error.lower() for error in error_statuses]
+    start_time = time.time()
+    changes_since = None
+    for _ in polling.poll(resource_type, timeout, interval):
+        server_time, listed = list_resources(changes_since)
+        if changes_since is None:
+            missing = set(pending)
+        else:
+            missing = set()
+        for resource in listed:
+            resource_id = resource['id']
+            if resource_id not in pending:
+                continue
+            missing.discard(resource_id)
+            resources[resource_id] = resource
+            timeline.record_status(resource_type, resource_id,
+                                   resource['status'], resource=resource)
+            if resource['status'] != statuses[resource_id]:
+                LOG.debug('%s %s is in %s status after %d second wait',
+                          resource_type, resource_id, resource['status'],
+                          time.time() - start_time)
+            statuses[resource_id] = resource['status']
+            if resource['status'] == status:
+                pending.discard(resource_id)
+            elif resource['status'].lower() in error_statuses:
+                if build_error is not None:
+                    raise build_error(resource_id)
+                # Not waited for anymore, the caller finds its status in
+                # the returned resources
+                LOG.warning('%s %s is in %s status', resource_type,
+                            resource_id, resource['status'])
+                pending.discard(resource_id)
+        if status == DELETED:
+            for resource_id in missing:
+                statuses[resource_id] = DELETED
+                timeline.record_status(resource_type, resource_id, DELETED)
+            pending -= missing
+        if not pending:
+            return resources
+        changes_since = server_time
+
+    stragglers = ', '.join('%s (%s)' % (resource_id, statuses[resource_id])
+                           for resource_id in sorted(pending))
+    message = ('%(pending)d of %(count)d %(type)ss failed to reach %(status)s '
+               'status within the required time (%(timeout)s s): '
+               '%(stragglers)s' %
+               {'pending': len(pending), 'count': len(statuses),
+                'type': resource_type, 'status': status, 'timeout': timeout,
+                'stragglers': stragglers})
+    raise exceptions.TimeoutException(message)
+
+
+def wait_for_servers_status(client, server_ids, status, raise_on_error=True,
+                            params=None):
+    """Waits for servers to reach a given status.
+
+    Each poll lists the servers changed since the previous one, filtered
+    with params, instead of getting every server. The status can be
+    DELETED to wait for the termination of the servers.
+    """
+    if client.service == CONF.compute.catalog_v3_type:
+        changes_since_param = 'changes_since'
+    else:
+        changes_since_param = 'changes-since'
+
+    def list_servers(changes_since):
+        query = dict(params or {})
+        if changes_since is not None:
+            query[changes_since_param] = _iso8601(changes_since)
+        start = time.time()
+        resp, body = client.list_servers_with_detail(query)
+        return _server_time(resp, time.time() - start), body['servers']
+
+    def build_error(server_id):
+        return exceptions.BuildErrorException(server_id=server_id)
+
+    return wait_for_resources_status(
+        list_servers, server_ids, status, polling.SERVER,
+        client.build_timeout, client.build_interval,
+        build_error=build_error if raise_on_error else None)
+
+
+def wait_for_volumes_status(client, volume_ids, status, raise_on_error=True,
+                            params=None):
+    """Waits for volumes to reach a given status.
+
+    Each poll lists the volumes filtered with params instead of getting
+    every volume. The status can be DELETED to wait for the deletion of
+    the volumes.
+    """
+    def list_volumes(changes_since):
+        resp, volumes = client.list_volumes_with_detail(params)
+        return None, volumes
+
+    def build_error(volume_id):
+        return exceptions.VolumeBuildErrorException(volume_id=volume_id)
 
-        if int(time.time()) - start >= client.build_timeout:
-            message = ('Image %(image_id)s failed to reach %(status)s '
-                       'status within the required time (%(timeout)s s).' %
-                       {'image_id': image_id,
-                        'status': status,
-                        'timeout': client.build_timeout})
-            message += ' Current status: %s.' % image['status']
-            raise exceptions.TimeoutException(message)
+    return wait_for_resources_status(
+        list_volumes, volume_ids, status, polling.VOLUME,
+        client.build_timeout, client.build_interval,
+        error_statuses=('error', 'error_deleting'),
+        build_error=build_error if raise_on_error else None)
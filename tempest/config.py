@@ -96,6 +96,28 @@ IdentityGroup = [
                default='pass',
                help="API key to use when authenticating as admin.",
                secret=True),
+    cfg.BoolOpt('token_cache',
+                default=False,
+                help="Share the tokens between all the auth providers using "
+                     "the same credentials, instead of requesting a new "
+                     "token for each of them."),
+    cfg.StrOpt('token_cache_dir',
+               default=None,
+               help="Directory where the shared tokens are stored, so that "
+                    "they are also shared between the test worker "
+                    "processes. If not set, tokens are only shared within "
+                    "a process."),
+    cfg.IntOpt('token_cache_expiry_margin',
+               default=60,
+               help="Time in seconds before its expiry after which a shared "
+                    "token is not handed out anymore, and a new token is "
+                    "requested instead."),
+    cfg.IntOpt('token_refresh_window',
+               default=0,
+               help="Time in seconds before its expiry after which a token "
+                    "is proactively refreshed, so that long waits do not "
+                    "fail on an expired token. If 0, tokens are refreshed "
+                    "only once expired."),
 ]
 
 identity_feature_group = cfg.OptGroup(name='identity-feature-enabled',
@@ -174,6 +196,17 @@ ComputeGroup = [
                default=0,
                help="Additional wait time for clean state, when there is "
                     "no OS-EXT-STS extension available"),
+    cfg.BoolOpt('ready_probe',
+                default=True,
+                help="Instead of sleeping ready_wait seconds once a server "
+                     "reached the status waited for, probe it until its "
+                     "last instance action finished and its power state "
+                     "matches the status, for at most ready_wait seconds."),
+    cfg.IntOpt('ready_probe_port',
+               default=0,
+               help="TCP port of the servers, e.g. 22, which must also "
+                    "accept connections for the readiness probe to "
+                    "succeed. 0 to not probe any port."),
     cfg.IntOpt('ssh_channel_timeout',
                default=60,
                help="Timeout in seconds to wait for output from ssh "
@@ -763,6 +796,183 @@ BaremetalGroup = [
                help="Catalog type of the baremetal provisioning service."),
 ]
 
+service_clients_group = cfg.OptGroup(name='service-clients',
+                                     title="Service Clients Options")
+
+ServiceClientsGroup = [
+    cfg.BoolOpt('connection_pooling',
+                default=False,
+                help="Keep the HTTP connections of the tempest service "
+                     "clients alive and share them between all the clients "
+                     "instead of closing them after every request."),
+    cfg.IntOpt('pool_maxsize',
+               default=10,
+               help="Maximum number of idle connections kept per "
+                    "(scheme, host, port) when connection_pooling is "
+                    "enabled."),
+    cfg.IntOpt('pool_idle_timeout',
+               default=30,
+               help="Time in seconds after which an idle pooled connection "
+                    "is closed."),
+    cfg.IntOpt('pool_stale_retries',
+               default=1,
+               help="Number of times a request which failed on a reused "
+                    "pooled connection is retried on a new connection."),
+    cfg.IntOpt('stream_chunk_size',
+               default=65536,
+               help="Maximum number of bytes read at a time from the "
+                    "connection when a response body is streamed."),
+    cfg.IntOpt('log_body_limit',
+               default=2048,
+               help="Maximum number of characters of a request or response "
+                    "body written to the debug log, larger bodies are "
+                    "summarized by their length and md5. 0 disables the "
+                    "logging of the bodies."),
+    cfg.BoolOpt('latency_stats',
+                default=False,
+                help="Record the latency of the requests sent by the "
+                     "service clients by service, method, URL template and "
+                     "status, and attach a summary to every test."),
+    cfg.StrOpt('latency_report_dir',
+               default=None,
+               help="Directory where the test workers write their latency "
+                    "histograms and merge them into report.json, with the "
+                    "p50, p90 and p99 latencies, when latency_stats is "
+                    "enabled."),
+    cfg.StrOpt('json_codec',
+               default='json',
+               help="Module encoding and decoding the JSON bodies of the "
+                    "service clients: json, simplejson or ujson. auto uses "
+                    "the first of ujson, simplejson and json which is "
+                    "installed. The faster ujson escapes the slashes and "
+                    "rounds the floats differently from json, so the "
+                    "bodies depend on the codec."),
+    cfg.IntOpt('retry_attempts',
+               default=0,
+               help="Maximum number of times a request failing with a "
+                    "connection error or one of the retry_statuses is "
+                    "retried. 0 disables the retries."),
+    cfg.DictOpt('retry_service_attempts',
+                default={},
+                help="retry_attempts of the services, by catalog type, "
+                     "e.g. compute:3,volume:5. Services not listed use "
+                     "retry_attempts."),
+    cfg.ListOpt('retry_statuses',
+                default=['502', '503', '504'],
+                help="HTTP statuses of the responses whose request is "
+                     "retried."),
+    cfg.ListOpt('retry_methods',
+                default=['GET', 'HEAD', 'DELETE'],
+                help="HTTP methods of the requests which are retried. "
+                     "POST and PUT requests are not idempotent in all the "
+                     "APIs, they are only retried if listed."),
+    cfg.FloatOpt('retry_backoff',
+                 default=1.0,
+                 help="Delay in seconds before the first retry of a "
+                      "request, doubled at every following retry."),
+    cfg.FloatOpt('retry_backoff_max',
+                 default=30.0,
+                 help="Maximum delay in seconds before a retry."),
+    cfg.FloatOpt('retry_jitter',
+                 default=0.5,
+                 help="Randomized fraction of the delays before the "
+                      "retries, so that concurrent requests are not retried "
+                      "all at once."),
+    cfg.IntOpt('retry_budget',
+               default=100,
+               help="Maximum number of retries of the requests to a service "
+                    "by a test worker, after which the failed requests are "
+                    "not retried anymore. 0 means no limit."),
+    cfg.StrOpt('cassette_mode',
+               help="record to write the HTTP requests of the service "
+                    "clients and their responses to a cassette per test in "
+                    "cassette_dir, replay to answer the requests from the "
+                    "cassettes without any network access. The requests are "
+                    "sent normally when unset."),
+    cfg.StrOpt('cassette_dir',
+               help="Directory of the cassettes recorded and replayed in "
+                    "the cassette_mode."),
+    cfg.ListOpt('response_cache_patterns',
+                default=[],
+                help="Regular expressions of the URLs of the GET requests "
+                     "whose responses are cached, e.g. /flavors/[^/]+$ or "
+                     "/schemas/. Only resources which do not change during "
+                     "a run should be cached. Nothing is cached when "
+                     "empty."),
+    cfg.FloatOpt('response_cache_ttl',
+                 default=300.0,
+                 help="Seconds a cached response is served without "
+                      "contacting the service. After that it is revalidated "
+                      "with a conditional request when it has an ETag or a "
+                      "Last-Modified header, or fetched again."),
+    cfg.IntOpt('response_cache_size',
+               default=256,
+               help="Maximum number of cached responses, the least "
+                    "recently used ones are evicted first."),
+    cfg.BoolOpt('adaptive_polling',
+                default=True,
+                help="Whether the waiters poll fast first then back off, "
+                     "rather than sleeping their build_interval between "
+                     "two polls."),
+    cfg.FloatOpt('poll_initial_interval',
+                 default=0.5,
+                 help="Seconds between the first polls of a waiter."),
+    cfg.IntOpt('poll_fast_polls',
+               default=2,
+               help="Number of polls of a waiter after the first one done "
+                    "every poll_initial_interval, before backing off."),
+    cfg.FloatOpt('poll_backoff',
+                 default=1.5,
+                 help="Factor by which the interval between two polls of a "
+                      "waiter grows after the fast polls."),
+    cfg.FloatOpt('poll_max_interval',
+                 help="Maximum seconds between two polls of a waiter. "
+                      "Twice the build_interval of the waiter when unset."),
+    cfg.FloatOpt('poll_jitter',
+                 default=0.1,
+                 help="Fraction of the interval between two polls which is "
+                      "randomized, so that concurrent waiters spread their "
+                      "polls."),
+    cfg.DictOpt('poll_profiles',
+                default={},
+                help="Initial and maximum seconds between two polls by type "
+                     "of resource waited for, e.g. stack:2:30,server:1. The "
+                     "types are server, image, volume, snapshot, backup, "
+                     "stack, interface, deletion and default."),
+    cfg.BoolOpt('central_poller',
+                default=False,
+                help="Poll all the outstanding waits of a process from a "
+                     "single thread, so that a test can overlap its waits. "
+                     "If false, each wait polls in the thread waiting."),
+    cfg.StrOpt('timeline_dir',
+               default=None,
+               help="Directory where the test workers write the timeline "
+                    "of the status transitions of the resources waited "
+                    "for, merged into timeline-report.json with the "
+                    "percentiles of the boot times and wait durations. "
+                    "Nothing is recorded when unset."),
+    cfg.StrOpt('timeline_format',
+               default='jsonl',
+               help="Format of the timeline datasets: jsonl for JSON "
+                    "lines or csv."),
+    cfg.StrOpt('resource_journal',
+               default=None,
+               help="SQLite database where the JSON service clients journal "
+                    "the resources they create and delete, so that "
+                    "tools/sweep_resources.py can delete the resources "
+                    "leaked by the test workers killed or timed out. "
+                    "Nothing is journaled when unset."),
+    cfg.IntOpt('fanout_workers',
+               default=8,
+               help="Maximum number of threads running the calls of a "
+                    "fan-out batch of service client calls."),
+    cfg.DictOpt('max_concurrent_requests',
+                default={},
+                help="Maximum number of requests sent concurrently to a "
+                     "service, by catalog type, e.g. compute:4,network:8. "
+                     "Services not listed are not capped."),
+]
+
 cli_group = cfg.OptGroup(name='cli', title="cli Configuration Options")
 
 CLIGroup = [
@@ -846,6 +1056,8 @@ class TempestConfigPrivate(object):
         register_opt_group(cfg.CONF, baremetal_group, BaremetalGroup)
         register_opt_group(cfg.CONF, input_scenario_group, InputScenarioGroup)
         register_opt_group(cfg.CONF, cli_group, CLIGroup)
+        register_opt_group(cfg.CONF, service_clients_group,
+                           ServiceClientsGroup)
         self.compute = cfg.CONF.compute
         self.compute_feature_enabled = cfg.CONF['compute-feature-enabled']
         self.identity = cfg.CONF.identity
@@ -872,14 +1084,48 @@ class TempestConfigPrivate(object):
         self.baremetal = cfg.CONF.baremetal
         self.input_scenario = cfg.CONF['input-scenario']
         self.cli = cfg.CONF.cli
+        self.service_clients = cfg.CONF['service-clients']
         if not self.compute_admin.username:
             self.compute_admin.username = self.identity.admin_username
             self.compute_admin.password = self.identity.admin_password
             self.compute_admin.tenant_name = self.identity.admin_tenant_name
+        self.service_index = self._build_service_index()
 
         if parse_conf:
             cfg.CONF.log_opt_values(LOG, std_logging.DEBUG)
 
+    def _build_service_index(self):
+        """
+        Maps each service catalog_type to its (region, endpoint_type), so
+        that clients do not need to scan all the option groups on every
+        request.
+        """
+        regions = {}
+        endpoint_types = {}
+        for name in dir(self):
+            if name.startswith('_'):
+                continue
+            # Find all config.FOO.catalog_type and assume FOO is a service.
+            group = getattr(self, name)
+            catalog_type = getattr(group, 'catalog_type', None)
+            if catalog_type is None:
+                continue
+            # The last group defining a region wins, the first group
+            # defining an endpoint type wins
+            regions[catalog_type] = getattr(group, 'region', None)
+            endpoint_types.setdefault(catalog_type,
+                                      getattr(group, 'endpoint_type',
+                                              'publicURL'))
+        # Special case for compute v3 service which hasn't its own
+        # configuration group
+        endpoint_types.setdefault(self.compute.catalog_v3_type,
+                                  self.compute.endpoint_type)
+        index = {}
+        for catalog_type, endpoint_type in endpoint_types.items():
+            region = regions.get(catalog_type) or self.identity.region
+            index[catalog_type] = (region, endpoint_type)
+        return index
+
 
 class TempestConfigProxy(object):
     _config = None
@@ -109,6 +109,10 @@ class StackBuildErrorException(TempestException):
                "due to '%(stack_status_reason)s'")
 
 
+class UnrecordedRequest(TempestException):
+    message = "No recorded response for %(method)s %(url)s in %(cassette)s"
+
+
 class BadRequest(RestClientException):
     message = "Bad request"
 
@@ -13,7 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
+import threading
+
 from tempest import auth
+from tempest.common import fanout
 from tempest import config
 from tempest import exceptions
 
@@ -37,6 +41,10 @@ class Manager(object):
 
         :param credentials: Override of the credentials
         """
+        # Clients are built on first access, see _set_client_factory. The
+        # lock is reentrant since a factory may access other clients.
+        self._client_lock = threading.RLock()
+        self._client_factories = {}
         self.auth_version = CONF.identity.auth_version
         # FIXME(andreaf) Change Manager __init__ to accept a credentials dict
         if username is None or password is None:
@@ -52,6 +60,40 @@ class Manager(object):
         # FIXME(andreaf) unused
         self.client_attr_names = []
 
+    def __getattr__(self, name):
+        # Only invoked when the attribute is not found, i.e. for clients not
+        # built yet. Look into __dict__ directly to avoid recursing before
+        # __init__ has set _client_factories.
+        factories = self.__dict__.get('_client_factories', {})
+        if name not in factories:
+            raise AttributeError("'%s' object has no attribute '%s'" %
+                                 (self.__class__.__name__, name))
+        # Concurrent first accesses, e.g. from fan-out or teardown threads,
+        # build the client once
+        with self._client_lock:
+            if name in self.__dict__:
+                return self.__dict__[name]
+            client = factories[name]()
+            setattr(self, name, client)
+            factories.pop(name, None)
+        return client
+
+    def _set_client_factory(self, name, factory, *args, **kwargs):
+        """
+        Registers a client which is built only when the attribute name is
+        first accessed, by calling factory(*args, **kwargs).
+        """
+        self.__dict__.pop(name, None)
+        self._client_factories[name] = functools.partial(factory, *args,
+                                                         **kwargs)
+
+    def fanout(self, calls, return_exceptions=False):
+        """
+        Runs calls taking no argument, e.g. functools.partial objects of
+        client methods, concurrently. See tempest.common.fanout.run.
+        """
+        return fanout.run(calls, return_exceptions=return_exceptions)
+
     # we do this everywhere, have it be part of the super class
     def _validate_credentials(self, username, password, tenant_name):
         if None in (username, password, tenant_name):
@@ -25,6 +25,8 @@ from novaclient import exceptions as nova_exceptions
 from tempest.api.network import common as net_common
 from tempest import clients
 from tempest.common import isolated_creds
+from tempest.common import poller
+from tempest.common import timeline
 from tempest.common.utils import data_utils
 from tempest.common.utils.linux import remote_client
 from tempest import config
@@ -202,10 +204,31 @@ class OfficialClientTest(tempest.test.BaseTestCase):
                         allow_notfound=False,
                         error_status='ERROR',
                         not_found_exception=nova_exceptions.NotFound):
+        self.submit_status_wait(things, thing_id,
+                                expected_status=expected_status,
+                                allow_notfound=allow_notfound,
+                                error_status=error_status,
+                                not_found_exception=not_found_exception
+                                ).result()
+
+    def submit_status_wait(self,
+                           things,
+                           thing_id,
+                           expected_status=None,
+                           allow_notfound=False,
+                           error_status='ERROR',
+                           not_found_exception=nova_exceptions.NotFound):
+        """
+        Returns the Future of a status_timeout, or of a delete_timeout
+        with allow_notfound, so that a test can wait for several things
+        at once, e.g. with tempest.common.poller.wait_all.
+        """
 
         log_status = expected_status if expected_status else ''
         if allow_notfound:
             log_status += ' or NotFound' if log_status != '' else 'NotFound'
+        # e.g. server for the novaclient ServerManager
+        resource_type = type(things).__name__.lower().replace('manager', '')
 
         def check_status():
             # python-novaclient has resources available to its client
@@ -220,6 +243,8 @@ class OfficialClientTest(tempest.test.BaseTestCase):
                     raise
 
             new_status = thing.status
+            timeline.record_status(resource_type, thing_id, new_status,
+                                   resource=getattr(thing, '_info', None))
 
             # Some components are reporting error status in lower case
             # so case sensitive comparisons can really mess things
@@ -234,13 +259,20 @@ class OfficialClientTest(tempest.test.BaseTestCase):
             LOG.debug("Waiting for %s to get to %s status. "
                       "Currently in %s status",
                       thing, log_status, new_status)
-        if not tempest.test.call_until_true(
-            check_status,
-            CONF.compute.build_timeout,
-            CONF.compute.build_interval):
+            return poller.PENDING
+
+        def timeout_error():
             message = ("Timed out waiting for thing %s "
                        "to become %s") % (thing_id, log_status)
-            raise exceptions.TimeoutException(message)
+            return exceptions.TimeoutException(message)
+
+        future = poller.submit(check_status, CONF.compute.build_timeout,
+                               CONF.compute.build_interval,
+                               service=type(things).__module__.split('.')[0],
+                               timeout_error=timeout_error,
+                               description='thing %s' % thing_id)
+        return timeline.track_wait(future, resource_type, thing_id,
+                                   log_status)
 
     def _create_loginable_secgroup_rule_nova(self, client=None,
                                              secgroup_id=None):
@@ -281,7 +313,11 @@ class OfficialClientTest(tempest.test.BaseTestCase):
         return rules
 
     def create_server(self, client=None, name=None, image=None, flavor=None,
-                      create_kwargs={}):
+                      create_kwargs={}, wait=True):
+        """
+        Creates a server and waits for it to become ACTIVE, unless wait is
+        False, see submit_status_wait.
+        """
         if client is None:
             client = self.compute_client
         if name is None:
@@ -295,6 +331,8 @@ class OfficialClientTest(tempest.test.BaseTestCase):
         server = client.servers.create(name, image, flavor, **create_kwargs)
         self.assertEqual(server.name, name)
         self.set_resource(name, server)
+        if not wait:
+            return server
         self.status_timeout(client.servers, server.id, 'ACTIVE')
         # The instance retrieved on creation is missing network
         # details, necessitating retrieval after it becomes active to
@@ -305,7 +343,11 @@ class OfficialClientTest(tempest.test.BaseTestCase):
         return server
 
     def create_volume(self, client=None, size=1, name=None,
-                      snapshot_id=None, imageRef=None):
+                      snapshot_id=None, imageRef=None, wait=True):
+        """
+        Creates a volume and waits for it to become available, unless wait
+        is False, see submit_status_wait.
+        """
         if client is None:
             client = self.volume_client
         if name is None:
@@ -316,6 +358,8 @@ class OfficialClientTest(tempest.test.BaseTestCase):
                                        imageRef=imageRef)
         self.set_resource(name, volume)
         self.assertEqual(name, volume.display_name)
+        if not wait:
+            return volume
         self.status_timeout(client.volumes, volume.id, 'available')
         LOG.debug("Created volume: %s", volume)
         return volume
@@ -13,8 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from tempest.common import polling
 from tempest.common.utils import data_utils
+from tempest.common import waiters
 from tempest import config
+from tempest import exceptions
 from tempest.openstack.common import log as logging
 from tempest.scenario import manager
 from tempest import test
@@ -42,10 +45,22 @@ class TestLargeOpsScenario(manager.NetworkScenarioTest):
         cls.set_network_resources()
         super(TestLargeOpsScenario, cls).setUpClass()
 
-    def _wait_for_server_status(self, status):
-        for server in self.servers:
-            self.status_timeout(
-                self.compute_client.servers, server.id, status)
+    def _wait_for_server_status(self, status, name):
+        # One listing of the servers named name per poll, instead of a GET
+        # of each of the large_ops_number servers
+        def list_servers(changes_since):
+            servers = self.compute_client.servers.list(
+                search_opts={'name': name})
+            return None, [{'id': server.id, 'status': server.status}
+                          for server in servers]
+
+        def build_error(server_id):
+            return exceptions.BuildErrorException(server_id=server_id)
+
+        waiters.wait_for_resources_status(
+            list_servers, [server.id for server in self.servers], status,
+            polling.SERVER, CONF.compute.build_timeout,
+            CONF.compute.build_interval, build_error=build_error)
 
     def nova_boot(self):
         name = data_utils.rand_name('scenario-server-')
@@ -61,7 +76,7 @@ class TestLargeOpsScenario(manager.NetworkScenarioTest):
         self.servers = [x for x in client.servers.list() if name in x.name]
         for server in self.servers:
             self.set_resource(server.name, server)
-        self._wait_for_server_status('ACTIVE')
+        self._wait_for_server_status('ACTIVE', name)
 
     @test.services('compute', 'image')
     def test_large_ops_scenario(self):
@@ -14,6 +14,7 @@
 #    under the License.
 
 from tempest.common import debug
+from tempest.common import poller
 from tempest import config
 from tempest.openstack.common import log as logging
 from tempest.scenario import manager
@@ -48,7 +49,10 @@ class TestMinimumBasicScenario(manager.OfficialClientTest):
     def nova_boot(self):
         create_kwargs = {'key_name': self.keypair.name}
         self.server = self.create_server(image=self.image,
-                                         create_kwargs=create_kwargs)
+                                         create_kwargs=create_kwargs,
+                                         wait=False)
+        self.server_active = self.submit_status_wait(
+            self.compute_client.servers, self.server.id, 'ACTIVE')
 
     def nova_list(self):
         servers = self.compute_client.servers.list()
@@ -61,7 +65,16 @@ class TestMinimumBasicScenario(manager.OfficialClientTest):
         self.assertEqual(self.server, got_server)
 
     def cinder_create(self):
-        self.volume = self.create_volume()
+        self.volume = self.create_volume(wait=False)
+        self.volume_available = self.submit_status_wait(
+            self.volume_client.volumes, self.volume.id, 'available')
+
+    def wait_for_server_and_volume(self):
+        # The volume is created while the server boots
+        poller.wait_all([self.server_active, self.volume_available])
+        # The server retrieved on creation is missing network details
+        self.server = self.compute_client.servers.get(self.server.id)
+        self.volume = self.volume_client.volumes.get(self.volume.id)
 
     def cinder_list(self):
         volumes = self.volume_client.volumes.list()
@@ -117,9 +130,10 @@ class TestMinimumBasicScenario(manager.OfficialClientTest):
         self.glance_image_create()
         self.nova_keypair_add()
         self.nova_boot()
+        self.cinder_create()
+        self.wait_for_server_and_volume()
         self.nova_list()
         self.nova_show()
-        self.cinder_create()
         self.cinder_list()
         self.cinder_show()
         self.nova_volume_attach()
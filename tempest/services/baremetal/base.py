@@ -11,10 +11,10 @@
 #    under the License.
 
 import functools
-import json
 
 import six
 
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 
@@ -174,7 +174,7 @@ class BaremetalClient(rest_client.RestClient):
 
         """
         uri = self._get_uri(resource, uuid)
-        patch_body = json.dumps(patch_object)
+        patch_body = json_codec.dumps(patch_object)
 
         resp, body = self.patch(uri, body=patch_body)
         return resp, self.deserialize(body)
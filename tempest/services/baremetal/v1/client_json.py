@@ -10,8 +10,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.services.baremetal.v1 import base_v1
 
 
@@ -21,5 +20,5 @@ class BaremetalClientJSON(base_v1.BaremetalClientV1):
     def __init__(self, auth_provider):
         super(BaremetalClientJSON, self).__init__(auth_provider)
 
-        self.serialize = lambda obj_type, obj_body: json.dumps(obj_body)
-        self.deserialize = json.loads
+        self.serialize = lambda obj_type, obj_body: json_codec.dumps(obj_body)
+        self.deserialize = json_codec.loads
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -30,11 +29,11 @@ class FixedIPsClientJSON(RestClient):
     def get_fixed_ip_details(self, fixed_ip):
         url = "os-fixed-ips/%s" % (fixed_ip)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['fixed_ip']
 
     def reserve_fixed_ip(self, ip, body):
         """This reserves and unreserves fixed ips."""
         url = "os-fixed-ips/%s/action" % (ip)
-        resp, body = self.post(url, json.dumps(body))
+        resp, body = self.post(url, json_codec.dumps(body))
         return resp, body
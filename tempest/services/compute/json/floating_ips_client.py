@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -35,14 +35,14 @@ class FloatingIPsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['floating_ips']
 
     def get_floating_ip_details(self, floating_ip_id):
         """Get the details of a floating IP."""
         url = "os-floating-ips/%s" % str(floating_ip_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         if resp.status == 404:
             raise exceptions.NotFound(body)
         return resp, body['floating_ip']
@@ -51,9 +51,9 @@ class FloatingIPsClientJSON(RestClient):
         """Allocate a floating IP to the project."""
         url = 'os-floating-ips'
         post_body = {'pool': pool_name}
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['floating_ip']
 
     def delete_floating_ip(self, floating_ip_id):
@@ -71,7 +71,7 @@ class FloatingIPsClientJSON(RestClient):
             }
         }
 
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post(url, post_body)
         return resp, body
 
@@ -84,7 +84,7 @@ class FloatingIPsClientJSON(RestClient):
             }
         }
 
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post(url, post_body)
         return resp, body
 
@@ -102,5 +102,5 @@ class FloatingIPsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['floating_ip_pools']
@@ -12,9 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -35,14 +35,14 @@ class HostsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['hosts']
 
     def show_host_detail(self, hostname):
         """Show detail information for the host."""
 
         resp, body = self.get("os-hosts/%s" % str(hostname))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['host']
 
     def update_host(self, hostname, **kwargs):
@@ -53,29 +53,29 @@ class HostsClientJSON(RestClient):
             'maintenance_mode': None,
         }
         request_body.update(**kwargs)
-        request_body = json.dumps(request_body)
+        request_body = json_codec.dumps(request_body)
 
         resp, body = self.put("os-hosts/%s" % str(hostname), request_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def startup_host(self, hostname):
         """Startup a host."""
 
         resp, body = self.get("os-hosts/%s/startup" % str(hostname))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['host']
 
     def shutdown_host(self, hostname):
         """Shutdown a host."""
 
         resp, body = self.get("os-hosts/%s/shutdown" % str(hostname))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['host']
 
     def reboot_host(self, hostname):
         """reboot a host."""
 
         resp, body = self.get("os-hosts/%s/reboot" % str(hostname))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['host']
@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest.common import waiters
 from tempest import config
@@ -44,7 +44,7 @@ class ImagesClientJSON(RestClient):
         if meta is not None:
             post_body['createImage']['metadata'] = meta
 
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('servers/%s/action' % str(server_id),
                                post_body)
         return resp, body
@@ -56,7 +56,7 @@ class ImagesClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['images']
 
     def list_images_with_detail(self, params=None):
@@ -66,14 +66,14 @@ class ImagesClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['images']
 
     def get_image(self, image_id):
         """Returns the details of a single image."""
         resp, body = self.get("images/%s" % str(image_id))
         self.expected_success(200, resp)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['image']
 
     def delete_image(self, image_id):
@@ -87,35 +87,35 @@ class ImagesClientJSON(RestClient):
     def list_image_metadata(self, image_id):
         """Lists all metadata items for an image."""
         resp, body = self.get("images/%s/metadata" % str(image_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def set_image_metadata(self, image_id, meta):
         """Sets the metadata for an image."""
-        post_body = json.dumps({'metadata': meta})
+        post_body = json_codec.dumps({'metadata': meta})
         resp, body = self.put('images/%s/metadata' % str(image_id), post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_image_metadata(self, image_id, meta):
         """Updates the metadata for an image."""
-        post_body = json.dumps({'metadata': meta})
+        post_body = json_codec.dumps({'metadata': meta})
         resp, body = self.post('images/%s/metadata' % str(image_id), post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def get_image_metadata_item(self, image_id, key):
         """Returns the value for a specific image metadata key."""
         resp, body = self.get("images/%s/metadata/%s" % (str(image_id), key))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['meta']
 
     def set_image_metadata_item(self, image_id, key, meta):
         """Sets the value for a specific image metadata key."""
-        post_body = json.dumps({'meta': meta})
+        post_body = json_codec.dumps({'meta': meta})
         resp, body = self.put('images/%s/metadata/%s' % (str(image_id), key),
                               post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['meta']
 
     def delete_image_metadata_item(self, image_id, key):
@@ -13,9 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-import time
-
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -31,7 +30,7 @@ class InterfacesClientJSON(RestClient):
 
     def list_interfaces(self, server):
         resp, body = self.get('servers/%s/os-interface' % server)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['interfaceAttachments']
 
     def create_interface(self, server, port_id=None, network_id=None,
@@ -44,15 +43,15 @@ class InterfacesClientJSON(RestClient):
         if fixed_ip:
             fip = dict(ip_address=fixed_ip)
             post_body['interfaceAttachment']['fixed_ips'] = [fip]
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('servers/%s/os-interface' % server,
                                body=post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['interfaceAttachment']
 
     def show_interface(self, server, port_id):
         resp, body = self.get('servers/%s/os-interface/%s' % (server, port_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['interfaceAttachment']
 
     def delete_interface(self, server, port_id):
@@ -62,21 +61,13 @@ class InterfacesClientJSON(RestClient):
 
     def wait_for_interface_status(self, server, port_id, status):
         """Waits for a interface to reach a given status."""
-        resp, body = self.show_interface(server, port_id)
-        interface_status = body['port_state']
-        start = int(time.time())
-
-        while(interface_status != status):
-            time.sleep(self.build_interval)
+        for _ in polling.poll(polling.INTERFACE, self.build_timeout,
+                              self.build_interval):
             resp, body = self.show_interface(server, port_id)
-            interface_status = body['port_state']
-
-            timed_out = int(time.time()) - start >= self.build_timeout
+            if body['port_state'] == status:
+                return resp, body
 
-            if interface_status != status and timed_out:
-                message = ('Interface %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (port_id, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
-
-        return resp, body
+        message = ('Interface %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (port_id, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -29,7 +28,7 @@ class KeyPairsClientJSON(RestClient):
 
     def list_keypairs(self):
         resp, body = self.get("os-keypairs")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         # Each returned keypair is embedded within an unnecessary 'keypair'
         # element which is a deviation from other resources like floating-ips,
         # servers, etc. A bug?
@@ -39,16 +38,16 @@ class KeyPairsClientJSON(RestClient):
 
     def get_keypair(self, key_name):
         resp, body = self.get("os-keypairs/%s" % str(key_name))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['keypair']
 
     def create_keypair(self, name, pub_key=None):
         post_body = {'keypair': {'name': name}}
         if pub_key:
             post_body['keypair']['public_key'] = pub_key
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post("os-keypairs", body=post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['keypair']
 
     def delete_keypair(self, key_name):
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -29,12 +28,12 @@ class LimitsClientJSON(RestClient):
 
     def get_absolute_limits(self):
         resp, body = self.get("limits")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['limits']['absolute']
 
     def get_specific_absolute_limit(self, absolute_limit):
         resp, body = self.get("limits")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         if absolute_limit not in body['limits']['absolute']:
             return None
         else:
@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -37,14 +37,14 @@ class SecurityGroupsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['security_groups']
 
     def get_security_group(self, security_group_id):
         """Get the details of a Security Group."""
         url = "os-security-groups/%s" % str(security_group_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['security_group']
 
     def create_security_group(self, name, description):
@@ -57,9 +57,9 @@ class SecurityGroupsClientJSON(RestClient):
             'name': name,
             'description': description,
         }
-        post_body = json.dumps({'security_group': post_body})
+        post_body = json_codec.dumps({'security_group': post_body})
         resp, body = self.post('os-security-groups', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['security_group']
 
     def update_security_group(self, security_group_id, name=None,
@@ -75,10 +75,10 @@ class SecurityGroupsClientJSON(RestClient):
             post_body['name'] = name
         if description:
             post_body['description'] = description
-        post_body = json.dumps({'security_group': post_body})
+        post_body = json_codec.dumps({'security_group': post_body})
         resp, body = self.put('os-security-groups/%s' % str(security_group_id),
                               post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['security_group']
 
     def delete_security_group(self, security_group_id):
@@ -105,10 +105,10 @@ class SecurityGroupsClientJSON(RestClient):
             'cidr': kwargs.get('cidr'),
             'group_id': kwargs.get('group_id'),
         }
-        post_body = json.dumps({'security_group_rule': post_body})
+        post_body = json_codec.dumps({'security_group_rule': post_body})
         url = 'os-security-group-rules'
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['security_group_rule']
 
     def delete_security_group_rule(self, group_rule_id):
@@ -118,7 +118,7 @@ class SecurityGroupsClientJSON(RestClient):
     def list_security_group_rules(self, security_group_id):
         """List all rules for a security group."""
         resp, body = self.get('os-security-groups')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         for sg in body['security_groups']:
             if sg['id'] == security_group_id:
                 return resp, sg['rules']
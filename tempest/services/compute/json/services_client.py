@@ -14,9 +14,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -35,7 +35,7 @@ class ServicesClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['services']
 
     def enable_service(self, host_name, binary):
@@ -44,9 +44,9 @@ class ServicesClientJSON(RestClient):
         host_name: Name of host
         binary: Service binary
         """
-        post_body = json.dumps({'binary': binary, 'host': host_name})
+        post_body = json_codec.dumps({'binary': binary, 'host': host_name})
         resp, body = self.put('os-services/enable', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
 
     def disable_service(self, host_name, binary):
@@ -55,7 +55,7 @@ class ServicesClientJSON(RestClient):
         host_name: Name of host
         binary: Service binary
         """
-        post_body = json.dumps({'binary': binary, 'host': host_name})
+        post_body = json_codec.dumps({'binary': binary, 'host': host_name})
         resp, body = self.put('os-services/disable', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
@@ -13,10 +13,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-import time
 import urllib
 
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -40,7 +40,7 @@ class VolumesExtensionsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volumes']
 
     def list_volumes_with_detail(self, params=None):
@@ -50,14 +50,14 @@ class VolumesExtensionsClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volumes']
 
     def get_volume(self, volume_id):
         """Returns the details of a single volume."""
         url = "os-volumes/%s" % str(volume_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume']
 
     def create_volume(self, size, **kwargs):
@@ -74,9 +74,9 @@ class VolumesExtensionsClientJSON(RestClient):
             'metadata': kwargs.get('metadata'),
         }
 
-        post_body = json.dumps({'volume': post_body})
+        post_body = json_codec.dumps({'volume': post_body})
         resp, body = self.post('os-volumes', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume']
 
     def delete_volume(self, volume_id):
@@ -85,23 +85,20 @@ class VolumesExtensionsClientJSON(RestClient):
 
     def wait_for_volume_status(self, volume_id, status):
         """Waits for a Volume to reach a given status."""
-        resp, body = self.get_volume(volume_id)
-        volume_name = body['displayName']
-        volume_status = body['status']
-        start = int(time.time())
-
-        while volume_status != status:
-            time.sleep(self.build_interval)
+        for _ in polling.poll(polling.VOLUME, self.build_timeout,
+                              self.build_interval):
             resp, body = self.get_volume(volume_id)
+            volume_name = body['displayName']
             volume_status = body['status']
+            if volume_status == status:
+                return
             if volume_status == 'error':
                 raise exceptions.VolumeBuildErrorException(volume_id=volume_id)
 
-            if int(time.time()) - start >= self.build_timeout:
-                message = ('Volume %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (volume_name, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
+        message = ('Volume %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (volume_name, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
 
     def is_resource_deleted(self, id):
         try:
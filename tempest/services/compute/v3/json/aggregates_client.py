@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -31,21 +30,21 @@ class AggregatesV3ClientJSON(RestClient):
     def list_aggregates(self):
         """Get aggregate list."""
         resp, body = self.get("os-aggregates")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregates']
 
     def get_aggregate(self, aggregate_id):
         """Get details of the given aggregate."""
         resp, body = self.get("os-aggregates/%s" % str(aggregate_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
 
     def create_aggregate(self, **kwargs):
         """Creates a new aggregate."""
-        post_body = json.dumps({'aggregate': kwargs})
+        post_body = json_codec.dumps({'aggregate': kwargs})
         resp, body = self.post('os-aggregates', post_body)
 
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
 
     def update_aggregate(self, aggregate_id, name, availability_zone=None):
@@ -54,10 +53,10 @@ class AggregatesV3ClientJSON(RestClient):
             'name': name,
             'availability_zone': availability_zone
         }
-        put_body = json.dumps({'aggregate': put_body})
+        put_body = json_codec.dumps({'aggregate': put_body})
         resp, body = self.put('os-aggregates/%s' % str(aggregate_id), put_body)
 
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
 
     def delete_aggregate(self, aggregate_id):
@@ -76,10 +75,10 @@ class AggregatesV3ClientJSON(RestClient):
         post_body = {
             'host': host,
         }
-        post_body = json.dumps({'add_host': post_body})
+        post_body = json_codec.dumps({'add_host': post_body})
         resp, body = self.post('os-aggregates/%s/action' % aggregate_id,
                                post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
 
     def remove_host(self, aggregate_id, host):
@@ -87,10 +86,10 @@ class AggregatesV3ClientJSON(RestClient):
         post_body = {
             'host': host,
         }
-        post_body = json.dumps({'remove_host': post_body})
+        post_body = json_codec.dumps({'remove_host': post_body})
         resp, body = self.post('os-aggregates/%s/action' % aggregate_id,
                                post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
 
     def set_metadata(self, aggregate_id, meta):
@@ -98,8 +97,8 @@ class AggregatesV3ClientJSON(RestClient):
         post_body = {
             'metadata': meta,
         }
-        post_body = json.dumps({'set_metadata': post_body})
+        post_body = json_codec.dumps({'set_metadata': post_body})
         resp, body = self.post('os-aggregates/%s/action' % aggregate_id,
                                post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['aggregate']
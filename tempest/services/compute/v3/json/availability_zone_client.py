@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -30,10 +29,10 @@ class AvailabilityZoneV3ClientJSON(RestClient):
 
     def get_availability_zone_list(self):
         resp, body = self.get('os-availability-zone')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['availability_zone_info']
 
     def get_availability_zone_list_detail(self):
         resp, body = self.get('os-availability-zone/detail')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['availability_zone_info']
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -30,12 +29,12 @@ class CertificatesV3ClientJSON(RestClient):
     def get_certificate(self, id):
         url = "os-certificates/%s" % (id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['certificate']
 
     def create_certificate(self):
         """create certificates."""
         url = "os-certificates"
         resp, body = self.post(url, None)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['certificate']
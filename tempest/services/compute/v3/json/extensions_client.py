@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -30,7 +29,7 @@ class ExtensionsV3ClientJSON(RestClient):
     def list_extensions(self):
         url = 'extensions'
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extensions']
 
     def is_enabled(self, extension):
@@ -40,5 +39,5 @@ class ExtensionsV3ClientJSON(RestClient):
 
     def get_extension(self, extension_alias):
         resp, body = self.get('extensions/%s' % extension_alias)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extension']
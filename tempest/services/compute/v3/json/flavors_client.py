@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -34,7 +34,7 @@ class FlavorsV3ClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavors']
 
     def list_flavors_with_detail(self, params=None):
@@ -43,12 +43,12 @@ class FlavorsV3ClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavors']
 
     def get_flavor_details(self, flavor_id):
         resp, body = self.get("flavors/%s" % str(flavor_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavor']
 
     def create_flavor(self, name, ram, vcpus, disk, flavor_id, **kwargs):
@@ -68,10 +68,10 @@ class FlavorsV3ClientJSON(RestClient):
             post_body['os-flavor-rxtx:rxtx_factor'] = kwargs.get('rxtx')
         if kwargs.get('is_public'):
             post_body['flavor-access:is_public'] = kwargs.get('is_public')
-        post_body = json.dumps({'flavor': post_body})
+        post_body = json_codec.dumps({'flavor': post_body})
         resp, body = self.post('flavors', post_body)
 
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavor']
 
     def delete_flavor(self, flavor_id):
@@ -90,30 +90,30 @@ class FlavorsV3ClientJSON(RestClient):
 
     def set_flavor_extra_spec(self, flavor_id, specs):
         """Sets extra Specs to the mentioned flavor."""
-        post_body = json.dumps({'extra_specs': specs})
+        post_body = json_codec.dumps({'extra_specs': specs})
         resp, body = self.post('flavors/%s/flavor-extra-specs' % flavor_id,
                                post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extra_specs']
 
     def get_flavor_extra_spec(self, flavor_id):
         """Gets extra Specs details of the mentioned flavor."""
         resp, body = self.get('flavors/%s/flavor-extra-specs' % flavor_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extra_specs']
 
     def get_flavor_extra_spec_with_key(self, flavor_id, key):
         """Gets extra Specs key-value of the mentioned flavor and key."""
         resp, body = self.get('flavors/%s/flavor-extra-specs/%s' %
                               (str(flavor_id), key))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_flavor_extra_spec(self, flavor_id, key, **kwargs):
         """Update specified extra Specs of the mentioned flavor and key."""
         resp, body = self.put('flavors/%s/flavor-extra-specs/%s' %
-                              (flavor_id, key), json.dumps(kwargs))
-        body = json.loads(body)
+                              (flavor_id, key), json_codec.dumps(kwargs))
+        body = json_codec.loads(body)
         return resp, body
 
     def unset_flavor_extra_spec(self, flavor_id, key):
@@ -124,7 +124,7 @@ class FlavorsV3ClientJSON(RestClient):
     def list_flavor_access(self, flavor_id):
         """Gets flavor access information given the flavor id."""
         resp, body = self.get('flavors/%s/flavor-access' % flavor_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavor_access']
 
     def add_flavor_access(self, flavor_id, tenant_id):
@@ -134,9 +134,9 @@ class FlavorsV3ClientJSON(RestClient):
                 'tenant_id': tenant_id
             }
         }
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('flavors/%s/action' % flavor_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavor_access']
 
     def remove_flavor_access(self, flavor_id, tenant_id):
@@ -146,7 +146,7 @@ class FlavorsV3ClientJSON(RestClient):
                 'tenant_id': tenant_id
             }
         }
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('flavors/%s/action' % flavor_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['flavor_access']
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -32,7 +31,7 @@ class QuotasV3ClientJSON(RestClient):
 
         url = 'os-quota-sets/%s' % str(tenant_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['quota_set']
 
     def get_quota_set_detail(self, tenant_id):
@@ -40,7 +39,7 @@ class QuotasV3ClientJSON(RestClient):
 
         url = 'os-quota-sets/%s/detail' % str(tenant_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['quota_set']
 
     def get_default_quota_set(self, tenant_id):
@@ -48,7 +47,7 @@ class QuotasV3ClientJSON(RestClient):
 
         url = 'os-quota-sets/%s/defaults' % str(tenant_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['quota_set']
 
     def update_quota_set(self, tenant_id, force=None,
@@ -91,8 +90,8 @@ class QuotasV3ClientJSON(RestClient):
         if security_groups is not None:
             post_body['security_groups'] = security_groups
 
-        post_body = json.dumps({'quota_set': post_body})
+        post_body = json_codec.dumps({'quota_set': post_body})
         resp, body = self.put('os-quota-sets/%s' % str(tenant_id), post_body)
 
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['quota_set']
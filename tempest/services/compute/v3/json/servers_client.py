@@ -15,10 +15,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-import time
 import urllib
 
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common.rest_client import RestClient
 from tempest.common import waiters
 from tempest import config
@@ -83,10 +83,10 @@ class ServersV3ClientJSON(RestClient):
             value = kwargs.get(key)
             if value is not None:
                 post_body[post_param] = value
-        post_body = json.dumps({'server': post_body})
+        post_body = json_codec.dumps({'server': post_body})
         resp, body = self.post('servers', post_body)
 
-        body = json.loads(body)
+        body = json_codec.loads(body)
         # NOTE(maurosr): this deals with the case of multiple server create
         # with return reservation id set True
         if 'servers_reservation' in body:
@@ -120,15 +120,15 @@ class ServersV3ClientJSON(RestClient):
         if disk_config is not None:
             post_body['os-disk-config:disk_config'] = disk_config
 
-        post_body = json.dumps({'server': post_body})
+        post_body = json_codec.dumps({'server': post_body})
         resp, body = self.put("servers/%s" % str(server_id), post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['server']
 
     def get_server(self, server_id):
         """Returns the details of an existing server."""
         resp, body = self.get("servers/%s" % str(server_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['server']
 
     def delete_server(self, server_id):
@@ -143,7 +143,7 @@ class ServersV3ClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_servers_with_detail(self, params=None):
@@ -154,7 +154,7 @@ class ServersV3ClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def wait_for_server_status(self, server_id, status, extra_timeout=0,
@@ -166,8 +166,8 @@ class ServersV3ClientJSON(RestClient):
 
     def wait_for_server_termination(self, server_id, ignore_error=False):
         """Waits for server to reach termination."""
-        start_time = int(time.time())
-        while True:
+        for _ in polling.poll(polling.SERVER, self.build_timeout,
+                              self.build_interval):
             try:
                 resp, body = self.get_server(server_id)
             except exceptions.NotFound:
@@ -176,31 +176,27 @@ class ServersV3ClientJSON(RestClient):
             server_status = body['status']
             if server_status == 'ERROR' and not ignore_error:
                 raise exceptions.BuildErrorException(server_id=server_id)
-
-            if int(time.time()) - start_time >= self.build_timeout:
-                raise exceptions.TimeoutException
-
-            time.sleep(self.build_interval)
+        raise exceptions.TimeoutException
 
     def list_addresses(self, server_id):
         """Lists all addresses for a server."""
         resp, body = self.get("servers/%s/ips" % str(server_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['addresses']
 
     def list_addresses_by_network(self, server_id, network_id):
         """Lists all addresses of a specific network type for a server."""
         resp, body = self.get("servers/%s/ips/%s" %
                               (str(server_id), network_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def action(self, server_id, action_name, response_key, **kwargs):
-        post_body = json.dumps({action_name: kwargs})
+        post_body = json_codec.dumps({action_name: kwargs})
         resp, body = self.post('servers/%s/action' % str(server_id),
                                post_body)
         if response_key is not None:
-            body = json.loads(body)[response_key]
+            body = json_codec.loads(body)[response_key]
         return resp, body
 
     def create_backup(self, server_id, backup_type, rotation, name):
@@ -218,7 +214,7 @@ class ServersV3ClientJSON(RestClient):
     def get_password(self, server_id):
         resp, body = self.get("servers/%s/os-server-password" %
                               str(server_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def delete_password(self, server_id):
@@ -270,43 +266,43 @@ class ServersV3ClientJSON(RestClient):
         if meta is not None:
             post_body['create_image']['metadata'] = meta
 
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('servers/%s/action' % str(server_id),
                                post_body)
         return resp, body
 
     def list_server_metadata(self, server_id):
         resp, body = self.get("servers/%s/metadata" % str(server_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def set_server_metadata(self, server_id, meta, no_metadata_field=False):
         if no_metadata_field:
             post_body = ""
         else:
-            post_body = json.dumps({'metadata': meta})
+            post_body = json_codec.dumps({'metadata': meta})
         resp, body = self.put('servers/%s/metadata' % str(server_id),
                               post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_server_metadata(self, server_id, meta):
-        post_body = json.dumps({'metadata': meta})
+        post_body = json_codec.dumps({'metadata': meta})
         resp, body = self.post('servers/%s/metadata' % str(server_id),
                                post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def get_server_metadata_item(self, server_id, key):
         resp, body = self.get("servers/%s/metadata/%s" % (str(server_id), key))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def set_server_metadata_item(self, server_id, key, meta):
-        post_body = json.dumps({'metadata': meta})
+        post_body = json_codec.dumps({'metadata': meta})
         resp, body = self.put('servers/%s/metadata/%s' % (str(server_id), key),
                               post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def delete_server_metadata_item(self, server_id, key):
@@ -338,7 +334,7 @@ class ServersV3ClientJSON(RestClient):
             "host": dest_host
         }
 
-        req_body = json.dumps({'migrate_live': migrate_params})
+        req_body = json_codec.dumps({'migrate_live': migrate_params})
 
         resp, body = self.post("servers/%s/action" % str(server_id),
                                req_body)
@@ -400,20 +396,20 @@ class ServersV3ClientJSON(RestClient):
         """Get the usage data for a server."""
         resp, body = self.get("servers/%s/os-server-diagnostics" %
                               str(server_id))
-        return resp, json.loads(body)
+        return resp, json_codec.loads(body)
 
     def list_instance_actions(self, server_id):
         """List the provided server action."""
         resp, body = self.get("servers/%s/os-instance-actions" %
                               str(server_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['instance_actions']
 
     def get_instance_action(self, server_id, request_id):
         """Returns the action details of the provided server."""
         resp, body = self.get("servers/%s/os-instance-actions/%s" %
                               (str(server_id), str(request_id)))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['instance_action']
 
     def force_delete_server(self, server_id, **kwargs):
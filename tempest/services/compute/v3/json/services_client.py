@@ -14,9 +14,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -35,7 +35,7 @@ class ServicesV3ClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['services']
 
     def enable_service(self, host_name, binary):
@@ -44,14 +44,14 @@ class ServicesV3ClientJSON(RestClient):
         host_name: Name of host
         binary: Service binary
         """
-        post_body = json.dumps({
+        post_body = json_codec.dumps({
             'service': {
                 'binary': binary,
                 'host': host_name
             }
         })
         resp, body = self.put('os-services/enable', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
 
     def disable_service(self, host_name, binary):
@@ -60,12 +60,12 @@ class ServicesV3ClientJSON(RestClient):
         host_name: Name of host
         binary: Service binary
         """
-        post_body = json.dumps({
+        post_body = json_codec.dumps({
             'service': {
                 'binary': binary,
                 'host': host_name
             }
         })
         resp, body = self.put('os-services/disable', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
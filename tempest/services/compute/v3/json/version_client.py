@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 
@@ -29,5 +28,5 @@ class VersionV3ClientJSON(rest_client.RestClient):
 
     def get_version(self):
         resp, body = self.get('')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['version']
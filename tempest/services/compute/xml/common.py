@@ -19,6 +19,17 @@ XMLNS_11 = "http://docs.openstack.org/compute/api/v1.1"
 XMLNS_V3 = "http://docs.openstack.org/compute/api/v1.1"
 
 
+def _quote_attr(value):
+    """Returns the value escaped for a double quoted attribute."""
+    if value is None:
+        return ""
+    value = '%s' % value
+    if '&' in value or '<' in value or '"' in value:
+        value = value.replace('&', '&amp;').replace('<', '&lt;').replace(
+            '"', '&quot;')
+    return value
+
+
 # NOTE(danms): This is just a silly implementation to help make generating
 # XML faster for prototyping. Could be replaced with proper etree gorp
 # if desired
@@ -26,37 +37,52 @@ class Element(object):
     def __init__(self, element_name, *args, **kwargs):
         self.element_name = element_name
         self._attrs = kwargs
-        self._elements = list(args)
+        self._elements = []
+        # First child element by name
+        self._index = {}
+        for element in args:
+            self.append(element)
 
     def add_attr(self, name, value):
         self._attrs[name] = value
 
     def append(self, element):
         self._elements.append(element)
+        name = getattr(element, 'element_name', None)
+        if name is not None and name not in self._index:
+            self._index[name] = element
 
-    def __str__(self):
-        args = " ".join(['%s="%s"' %
-                        (k, v if v is not None else "")
-                        for k, v in self._attrs.items()])
-        string = '<%s %s' % (self.element_name, args)
-        if not self._elements:
-            string += '/>'
-            return string
-
-        string += '>'
+    def _serialize_attrs(self):
+        return " ".join(['%s="%s"' % (k, _quote_attr(v))
+                         for k, v in self._attrs.items()])
 
+    def _serialize_children(self, parts):
         for element in self._elements:
-            string += str(element)
-
-        string += '</%s>' % self.element_name
+            if isinstance(element, Element):
+                element._serialize(parts)
+            else:
+                parts.append(str(element))
+
+    def _serialize(self, parts):
+        """Appends the pieces of the XML document to the parts list."""
+        parts.append('<%s %s' % (self.element_name, self._serialize_attrs()))
+        if not self._elements:
+            parts.append('/>')
+            return
+        parts.append('>')
+        self._serialize_children(parts)
+        parts.append('</%s>' % self.element_name)
 
-        return string
+    def __str__(self):
+        parts = []
+        self._serialize(parts)
+        return ''.join(parts)
 
     def __getitem__(self, name):
-        for element in self._elements:
-            if element.element_name == name:
-                return element
-        raise KeyError("No such element `%s'" % name)
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError("No such element `%s'" % name)
 
     def __getattr__(self, name):
         if name in self._attrs:
@@ -78,14 +104,9 @@ class Document(Element):
             kwargs['encoding'] = 'UTF-8'
         Element.__init__(self, '?xml', *args, **kwargs)
 
-    def __str__(self):
-        args = " ".join(['%s="%s"' %
-                        (k, v if v is not None else "")
-                        for k, v in self._attrs.items()])
-        string = '<?xml %s?>\n' % args
-        for element in self._elements:
-            string += str(element)
-        return string
+    def _serialize(self, parts):
+        parts.append('<?xml %s?>\n' % self._serialize_attrs())
+        self._serialize_children(parts)
 
 
 class Text(Element):
@@ -93,16 +114,62 @@ class Text(Element):
         Element.__init__(self, None)
         self.__content = content
 
-    def __str__(self):
-        return self.__content
+    def _serialize(self, parts):
+        parts.append(self.__content)
+
+
+# Conversions of the text of the leaf elements, by value of one of their
+# attributes, in order of precedence
+LEAF_TYPES = (('bool', lambda text: text == 'True'),
+              ('int', int),
+              ('long', long))
+_LEAF_TYPE_NAMES = frozenset(name for name, _ in LEAF_TYPES)
+
+
+# Tags without their namespace, by qualified tag. The documents of the
+# services share a small set of tags, so they are only split once.
+_local_names = {}
+
+
+def _strip_namespace(tag):
+    local_name = tag
+    if tag.startswith("{"):
+        ns, local_name = tag.split("}", 1)
+    _local_names[tag] = local_name
+    return local_name
+
+
+def _to_json(node, plurals):
+    json = {}
+    types = None
+    for attr, value in node.items():
+        if not attr.startswith("xmlns"):
+            json[attr] = value
+            if value in _LEAF_TYPE_NAMES:
+                if types is None:
+                    types = set()
+                types.add(value)
+    children = node.getchildren()
+    if not children:
+        if types is not None:
+            for name, convert in LEAF_TYPES:
+                if name in types:
+                    return convert(node.text)
+        return node.text or json
+    for child in children:
+        tag = _local_names.get(child.tag)
+        if tag is None:
+            tag = _strip_namespace(child.tag)
+        if plurals is not None and tag in plurals:
+            json[tag] = [_to_json(item, plurals)
+                         for item in child.getchildren()]
+        else:
+            json[tag] = _to_json(child, plurals)
+    return json
 
 
 def parse_array(node, plurals=None):
-    array = []
-    for child in node.getchildren():
-        array.append(xml_to_json(child,
-                     plurals))
-    return array
+    return [_to_json(child, plurals) for child in node.getchildren()]
 
 
 def xml_to_json(node, plurals=None):
@@ -110,38 +177,11 @@ def xml_to_json(node, plurals=None):
     something that looks like a json dump. In cases where the XML
     and json structures are the same, then this "just works". In
     others, it requires a little hand-editing of the result.
+
+    Each element is visited once: its children and attributes are listed
+    once, and the namespace of each distinct tag is only stripped once.
     """
-    json = {}
-    bool_flag = False
-    int_flag = False
-    long_flag = False
-    for attr in node.keys():
-        if not attr.startswith("xmlns"):
-            json[attr] = node.get(attr)
-            if json[attr] == 'bool':
-                bool_flag = True
-            elif json[attr] == 'int':
-                int_flag = True
-            elif json[attr] == 'long':
-                long_flag = True
-    if not node.getchildren():
-        if bool_flag:
-            return node.text == 'True'
-        elif int_flag:
-            return int(node.text)
-        elif long_flag:
-            return long(node.text)
-        else:
-            return node.text or json
-    for child in node.getchildren():
-        tag = child.tag
-        if tag.startswith("{"):
-            ns, tag = tag.split("}", 1)
-        if plurals is not None and tag in plurals:
-                json[tag] = parse_array(child, plurals)
-        else:
-            json[tag] = xml_to_json(child, plurals)
-    return json
+    return _to_json(node, plurals)
 
 
 def deep_dict_to_xml(dest, source):
@@ -13,10 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import time
-
 from lxml import etree
 
+from tempest.common import polling
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -87,20 +86,13 @@ class InterfacesClientXML(rest_client.RestClient):
 
     def wait_for_interface_status(self, server, port_id, status):
         """Waits for a interface to reach a given status."""
-        resp, body = self.show_interface(server, port_id)
-        interface_status = body['port_state']
-        start = int(time.time())
-
-        while(interface_status != status):
-            time.sleep(self.build_interval)
+        for _ in polling.poll(polling.INTERFACE, self.build_timeout,
+                              self.build_interval):
             resp, body = self.show_interface(server, port_id)
-            interface_status = body['port_state']
+            if body['port_state'] == status:
+                return resp, body
 
-            timed_out = int(time.time()) - start >= self.build_timeout
-
-            if interface_status != status and timed_out:
-                message = ('Interface %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (port_id, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
-        return resp, body
+        message = ('Interface %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (port_id, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
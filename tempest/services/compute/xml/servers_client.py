@@ -14,11 +14,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import time
 import urllib
 
 from lxml import etree
 
+from tempest.common import polling
 from tempest.common import rest_client
 from tempest.common import waiters
 from tempest import config
@@ -369,8 +369,8 @@ class ServersClientXML(rest_client.RestClient):
 
     def wait_for_server_termination(self, server_id, ignore_error=False):
         """Waits for server to reach termination."""
-        start_time = int(time.time())
-        while True:
+        for _ in polling.poll(polling.SERVER, self.build_timeout,
+                              self.build_interval):
             try:
                 resp, body = self.get_server(server_id)
             except exceptions.NotFound:
@@ -379,11 +379,7 @@ class ServersClientXML(rest_client.RestClient):
             server_status = body['status']
             if server_status == 'ERROR' and not ignore_error:
                 raise exceptions.BuildErrorException(server_id=server_id)
-
-            if int(time.time()) - start_time >= self.build_timeout:
-                raise exceptions.TimeoutException
-
-            time.sleep(self.build_interval)
+        raise exceptions.TimeoutException
 
     def _parse_network(self, node):
         addrs = []
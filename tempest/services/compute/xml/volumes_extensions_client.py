@@ -13,11 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import time
 import urllib
 
 from lxml import etree
 
+from tempest.common import polling
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -121,23 +121,20 @@ class VolumesExtensionsClientXML(rest_client.RestClient):
 
     def wait_for_volume_status(self, volume_id, status):
         """Waits for a Volume to reach a given status."""
-        resp, body = self.get_volume(volume_id)
-        volume_name = body['displayName']
-        volume_status = body['status']
-        start = int(time.time())
-
-        while volume_status != status:
-            time.sleep(self.build_interval)
+        for _ in polling.poll(polling.VOLUME, self.build_timeout,
+                              self.build_interval):
             resp, body = self.get_volume(volume_id)
+            volume_name = body['displayName']
             volume_status = body['status']
+            if volume_status == status:
+                return
             if volume_status == 'error':
                 raise exceptions.VolumeBuildErrorException(volume_id=volume_id)
 
-            if int(time.time()) - start >= self.build_timeout:
-                message = 'Volume %s failed to reach %s status within '\
-                          'the required time (%s s).' % (volume_name, status,
-                                                         self.build_timeout)
-                raise exceptions.TimeoutException(message)
+        message = ('Volume %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (volume_name, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
 
     def is_resource_deleted(self, id):
         try:
@@ -13,8 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 
@@ -36,7 +35,7 @@ class DataProcessingClient(rest_client.RestClient):
         resp, body = req_fun(uri, headers={
             'Content-Type': 'application/json'
         }, *args, **kwargs)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body[res_name]
 
     def list_node_group_templates(self):
@@ -70,7 +69,7 @@ class DataProcessingClient(rest_client.RestClient):
             'node_configs': node_configs or dict(),
         })
         return self._request_and_parse(self.post, uri, 'node_group_template',
-                                       body=json.dumps(body))
+                                       body=json_codec.dumps(body))
 
     def delete_node_group_template(self, tmpl_id):
         """Deletes the specified node group template by id."""
@@ -10,8 +10,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -45,7 +44,7 @@ class IdentityClientJSON(rest_client.RestClient):
         post_body = {
             'name': name,
         }
-        post_body = json.dumps({'role': post_body})
+        post_body = json_codec.dumps({'role': post_body})
         resp, body = self.post('OS-KSADM/roles', post_body)
         return resp, self._parse_resp(body)
 
@@ -61,7 +60,7 @@ class IdentityClientJSON(rest_client.RestClient):
             'description': kwargs.get('description', ''),
             'enabled': kwargs.get('enabled', True),
         }
-        post_body = json.dumps({'tenant': post_body})
+        post_body = json_codec.dumps({'tenant': post_body})
         resp, body = self.post('tenants', post_body)
         return resp, self._parse_resp(body)
 
@@ -103,7 +102,7 @@ class IdentityClientJSON(rest_client.RestClient):
     def list_tenants(self):
         """Returns tenants."""
         resp, body = self.get('tenants')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['tenants']
 
     def get_tenant_by_name(self, tenant_name):
@@ -125,7 +124,7 @@ class IdentityClientJSON(rest_client.RestClient):
             'description': desc,
             'enabled': en,
         }
-        post_body = json.dumps({'tenant': post_body})
+        post_body = json_codec.dumps({'tenant': post_body})
         resp, body = self.post('tenants/%s' % tenant_id, post_body)
         return resp, self._parse_resp(body)
 
@@ -139,13 +138,13 @@ class IdentityClientJSON(rest_client.RestClient):
         }
         if kwargs.get('enabled') is not None:
             post_body['enabled'] = kwargs.get('enabled')
-        post_body = json.dumps({'user': post_body})
+        post_body = json_codec.dumps({'user': post_body})
         resp, body = self.post('users', post_body)
         return resp, self._parse_resp(body)
 
     def update_user(self, user_id, **kwargs):
         """Updates a user."""
-        put_body = json.dumps({'user': kwargs})
+        put_body = json_codec.dumps({'user': kwargs})
         resp, body = self.put('users/%s' % user_id, put_body)
         return resp, self._parse_resp(body)
 
@@ -168,7 +167,7 @@ class IdentityClientJSON(rest_client.RestClient):
         put_body = {
             'enabled': enabled
         }
-        put_body = json.dumps({'user': put_body})
+        put_body = json_codec.dumps({'user': put_body})
         resp, body = self.put('users/%s/enabled' % user_id, put_body)
         return resp, self._parse_resp(body)
 
@@ -195,7 +194,7 @@ class IdentityClientJSON(rest_client.RestClient):
             'type': type,
             'description': kwargs.get('description')
         }
-        post_body = json.dumps({'OS-KSADM:service': post_body})
+        post_body = json_codec.dumps({'OS-KSADM:service': post_body})
         resp, body = self.post('/OS-KSADM/services', post_body)
         return resp, self._parse_resp(body)
 
@@ -238,7 +237,7 @@ class TokenClientJSON(IdentityClientJSON):
                 'tenantName': tenant,
             }
         }
-        body = json.dumps(creds)
+        body = json_codec.dumps(creds)
         resp, body = self.post(self.auth_url, body=body)
 
         return resp, body['access']
@@ -256,14 +255,14 @@ class TokenClientJSON(IdentityClientJSON):
         self._log_response(resp, resp_body)
 
         if resp.status in [401, 403]:
-            resp_body = json.loads(resp_body)
+            resp_body = json_codec.loads(resp_body)
             raise exceptions.Unauthorized(resp_body['error']['message'])
         elif resp.status not in [200, 201]:
             raise exceptions.IdentityError(
                 'Unexpected status code {0}'.format(resp.status))
 
         if isinstance(resp_body, str):
-            resp_body = json.loads(resp_body)
+            resp_body = json_codec.loads(resp_body)
         return resp, resp_body
 
     def get_token(self, user, password, tenant, auth_data=False):
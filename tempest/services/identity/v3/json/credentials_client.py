@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -39,10 +38,11 @@ class CredentialsClientJSON(RestClient):
             "type": "ec2",
             "user_id": user_id
         }
-        post_body = json.dumps({'credential': post_body})
+        post_body = json_codec.dumps({'credential': post_body})
         resp, body = self.post('credentials', post_body)
-        body = json.loads(body)
-        body['credential']['blob'] = json.loads(body['credential']['blob'])
+        body = json_codec.loads(body)
+        body['credential']['blob'] = json_codec.loads(
+            body['credential']['blob'])
         return resp, body['credential']
 
     def update_credential(self, credential_id, **kwargs):
@@ -61,23 +61,25 @@ class CredentialsClientJSON(RestClient):
             "type": cred_type,
             "user_id": user_id
         }
-        post_body = json.dumps({'credential': post_body})
+        post_body = json_codec.dumps({'credential': post_body})
         resp, body = self.patch('credentials/%s' % credential_id, post_body)
-        body = json.loads(body)
-        body['credential']['blob'] = json.loads(body['credential']['blob'])
+        body = json_codec.loads(body)
+        body['credential']['blob'] = json_codec.loads(
+            body['credential']['blob'])
         return resp, body['credential']
 
     def get_credential(self, credential_id):
         """To GET Details of a credential."""
         resp, body = self.get('credentials/%s' % credential_id)
-        body = json.loads(body)
-        body['credential']['blob'] = json.loads(body['credential']['blob'])
+        body = json_codec.loads(body)
+        body['credential']['blob'] = json_codec.loads(
+            body['credential']['blob'])
         return resp, body['credential']
 
     def list_credentials(self):
         """Lists out all the available credentials."""
         resp, body = self.get('credentials')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['credentials']
 
     def delete_credential(self, credential_id):
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -32,7 +31,7 @@ class EndPointClientJSON(RestClient):
     def list_endpoints(self):
         """GET endpoints."""
         resp, body = self.get('endpoints')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['endpoints']
 
     def create_endpoint(self, service_id, interface, url, **kwargs):
@@ -46,9 +45,9 @@ class EndPointClientJSON(RestClient):
             'region': region,
             'enabled': enabled
         }
-        post_body = json.dumps({'endpoint': post_body})
+        post_body = json_codec.dumps({'endpoint': post_body})
         resp, body = self.post('endpoints', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['endpoint']
 
     def update_endpoint(self, endpoint_id, service_id=None, interface=None,
@@ -65,9 +64,9 @@ class EndPointClientJSON(RestClient):
             post_body['region'] = region
         if enabled is not None:
             post_body['enabled'] = enabled
-        post_body = json.dumps({'endpoint': post_body})
+        post_body = json_codec.dumps({'endpoint': post_body})
         resp, body = self.patch('endpoints/%s' % endpoint_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['endpoint']
 
     def delete_endpoint(self, endpoint_id):
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -47,9 +46,9 @@ class IdentityV3ClientJSON(RestClient):
             'name': user_name,
             'password': password
         }
-        post_body = json.dumps({'user': post_body})
+        post_body = json_codec.dumps({'user': post_body})
         resp, body = self.post('users', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['user']
 
     def update_user(self, user_id, name, **kwargs):
@@ -69,27 +68,27 @@ class IdentityV3ClientJSON(RestClient):
             'domain_id': domain_id,
             'description': description
         }
-        post_body = json.dumps({'user': post_body})
+        post_body = json_codec.dumps({'user': post_body})
         resp, body = self.patch('users/%s' % user_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['user']
 
     def list_user_projects(self, user_id):
         """Lists the projects on which a user has roles assigned."""
         resp, body = self.get('users/%s/projects' % user_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['projects']
 
     def get_users(self):
         """Get the list of users."""
         resp, body = self.get("users")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['users']
 
     def get_user(self, user_id):
         """GET a user."""
         resp, body = self.get("users/%s" % user_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['user']
 
     def delete_user(self, user_id):
@@ -108,14 +107,14 @@ class IdentityV3ClientJSON(RestClient):
             'enabled': en,
             'name': name
         }
-        post_body = json.dumps({'project': post_body})
+        post_body = json_codec.dumps({'project': post_body})
         resp, body = self.post('projects', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['project']
 
     def list_projects(self):
         resp, body = self.get("projects")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['projects']
 
     def update_project(self, project_id, **kwargs):
@@ -131,15 +130,15 @@ class IdentityV3ClientJSON(RestClient):
             'enabled': en,
             'domain_id': domain_id,
         }
-        post_body = json.dumps({'project': post_body})
+        post_body = json_codec.dumps({'project': post_body})
         resp, body = self.patch('projects/%s' % project_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['project']
 
     def get_project(self, project_id):
         """GET a Project."""
         resp, body = self.get("projects/%s" % project_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['project']
 
     def delete_project(self, project_id):
@@ -152,15 +151,15 @@ class IdentityV3ClientJSON(RestClient):
         post_body = {
             'name': name
         }
-        post_body = json.dumps({'role': post_body})
+        post_body = json_codec.dumps({'role': post_body})
         resp, body = self.post('roles', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['role']
 
     def get_role(self, role_id):
         """GET a Role."""
         resp, body = self.get('roles/%s' % str(role_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['role']
 
     def update_role(self, name, role_id):
@@ -168,9 +167,9 @@ class IdentityV3ClientJSON(RestClient):
         post_body = {
             'name': name
         }
-        post_body = json.dumps({'role': post_body})
+        post_body = json_codec.dumps({'role': post_body})
         resp, body = self.patch('roles/%s' % str(role_id), post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['role']
 
     def delete_role(self, role_id):
@@ -193,9 +192,9 @@ class IdentityV3ClientJSON(RestClient):
             'enabled': en,
             'name': name
         }
-        post_body = json.dumps({'domain': post_body})
+        post_body = json_codec.dumps({'domain': post_body})
         resp, body = self.post('domains', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['domain']
 
     def delete_domain(self, domain_id):
@@ -206,7 +205,7 @@ class IdentityV3ClientJSON(RestClient):
     def list_domains(self):
         """List Domains."""
         resp, body = self.get('domains')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['domains']
 
     def update_domain(self, domain_id, **kwargs):
@@ -220,22 +219,22 @@ class IdentityV3ClientJSON(RestClient):
             'enabled': en,
             'name': name
         }
-        post_body = json.dumps({'domain': post_body})
+        post_body = json_codec.dumps({'domain': post_body})
         resp, body = self.patch('domains/%s' % domain_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['domain']
 
     def get_domain(self, domain_id):
         """Get Domain details."""
         resp, body = self.get('domains/%s' % domain_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['domain']
 
     def get_token(self, resp_token):
         """Get token details."""
         headers = {'X-Subject-Token': resp_token}
         resp, body = self.get("auth/tokens", headers=headers)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['token']
 
     def delete_token(self, resp_token):
@@ -255,15 +254,15 @@ class IdentityV3ClientJSON(RestClient):
             'project_id': project_id,
             'name': name
         }
-        post_body = json.dumps({'group': post_body})
+        post_body = json_codec.dumps({'group': post_body})
         resp, body = self.post('groups', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['group']
 
     def get_group(self, group_id):
         """Get group details."""
         resp, body = self.get('groups/%s' % group_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['group']
 
     def update_group(self, group_id, **kwargs):
@@ -275,9 +274,9 @@ class IdentityV3ClientJSON(RestClient):
             'name': name,
             'description': description
         }
-        post_body = json.dumps({'group': post_body})
+        post_body = json_codec.dumps({'group': post_body})
         resp, body = self.patch('groups/%s' % group_id, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['group']
 
     def delete_group(self, group_id):
@@ -294,7 +293,7 @@ class IdentityV3ClientJSON(RestClient):
     def list_group_users(self, group_id):
         """List users in group."""
         resp, body = self.get('groups/%s/users' % group_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['users']
 
     def delete_group_user(self, group_id, user_id):
@@ -318,14 +317,14 @@ class IdentityV3ClientJSON(RestClient):
         """list roles of a user on a project."""
         resp, body = self.get('projects/%s/users/%s/roles' %
                               (project_id, user_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['roles']
 
     def list_user_roles_on_domain(self, domain_id, user_id):
         """list roles of a user on a domain."""
         resp, body = self.get('domains/%s/users/%s/roles' %
                               (domain_id, user_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['roles']
 
     def revoke_role_from_user_on_project(self, project_id, user_id, role_id):
@@ -356,14 +355,14 @@ class IdentityV3ClientJSON(RestClient):
         """list roles of a user on a project."""
         resp, body = self.get('projects/%s/groups/%s/roles' %
                               (project_id, group_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['roles']
 
     def list_group_roles_on_domain(self, domain_id, group_id):
         """list roles of a user on a domain."""
         resp, body = self.get('domains/%s/groups/%s/roles' %
                               (domain_id, group_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['roles']
 
     def revoke_role_from_group_on_project(self, project_id, group_id, role_id):
@@ -390,9 +389,9 @@ class IdentityV3ClientJSON(RestClient):
             'roles': roles,
             'expires_at': expires_at
         }
-        post_body = json.dumps({'trust': post_body})
+        post_body = json_codec.dumps({'trust': post_body})
         resp, body = self.post('OS-TRUST/trusts', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['trust']
 
     def delete_trust(self, trust_id):
@@ -410,26 +409,26 @@ class IdentityV3ClientJSON(RestClient):
                                   % trustee_user_id)
         else:
             resp, body = self.get("OS-TRUST/trusts")
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['trusts']
 
     def get_trust(self, trust_id):
         """GET trust."""
         resp, body = self.get("OS-TRUST/trusts/%s" % trust_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['trust']
 
     def get_trust_roles(self, trust_id):
         """GET roles delegated by a trust."""
         resp, body = self.get("OS-TRUST/trusts/%s/roles" % trust_id)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['roles']
 
     def get_trust_role(self, trust_id, role_id):
         """GET role delegated by a trust."""
         resp, body = self.get("OS-TRUST/trusts/%s/roles/%s"
                               % (trust_id, role_id))
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['role']
 
     def check_trust_role(self, trust_id, role_id):
@@ -492,7 +491,7 @@ class V3TokenClientJSON(RestClient):
             scope = dict(project=project)
             creds['auth']['scope'] = scope
 
-        body = json.dumps(creds)
+        body = json_codec.dumps(creds)
         resp, body = self.post(self.auth_url, body=body)
         return resp, body
 
@@ -509,13 +508,13 @@ class V3TokenClientJSON(RestClient):
         self._log_response(resp, resp_body)
 
         if resp.status in [401, 403]:
-            resp_body = json.loads(resp_body)
+            resp_body = json_codec.loads(resp_body)
             raise exceptions.Unauthorized(resp_body['error']['message'])
         elif resp.status not in [200, 201, 204]:
             raise exceptions.IdentityError(
                 'Unexpected status code {0}'.format(resp.status))
 
-        return resp, json.loads(resp_body)
+        return resp, json_codec.loads(resp_body)
 
     def get_token(self, user, password, tenant, domain='Default',
                   auth_data=False):
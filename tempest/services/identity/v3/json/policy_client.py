@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -35,22 +34,22 @@ class PolicyClientJSON(RestClient):
             "blob": blob,
             "type": type
         }
-        post_body = json.dumps({'policy': post_body})
+        post_body = json_codec.dumps({'policy': post_body})
         resp, body = self.post('policies', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['policy']
 
     def list_policies(self):
         """Lists the policies."""
         resp, body = self.get('policies')
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['policies']
 
     def get_policy(self, policy_id):
         """Lists out the given policy."""
         url = 'policies/%s' % policy_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['policy']
 
     def update_policy(self, policy_id, **kwargs):
@@ -60,10 +59,10 @@ class PolicyClientJSON(RestClient):
         post_body = {
             'type': type
         }
-        post_body = json.dumps({'policy': post_body})
+        post_body = json_codec.dumps({'policy': post_body})
         url = 'policies/%s' % policy_id
         resp, body = self.patch(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['policy']
 
     def delete_policy(self, policy_id):
@@ -13,8 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -40,16 +39,16 @@ class ServiceClientJSON(RestClient):
             'type': type,
             'name': name
         }
-        patch_body = json.dumps({'service': patch_body})
+        patch_body = json_codec.dumps({'service': patch_body})
         resp, body = self.patch('services/%s' % service_id, patch_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
 
     def get_service(self, service_id):
         """Get Service."""
         url = 'services/%s' % service_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['service']
 
     def create_service(self, serv_type, name=None, description=None,
@@ -60,9 +59,9 @@ class ServiceClientJSON(RestClient):
             'enabled': enabled,
             "description": description,
         }
-        body = json.dumps({'service': body_dict})
+        body = json_codec.dumps({'service': body_dict})
         resp, body = self.post("services", body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body["service"]
 
     def delete_service(self, serv_id):
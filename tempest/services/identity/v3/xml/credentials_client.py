@@ -13,10 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
 from lxml import etree
 
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 from tempest.services.compute.xml.common import Document
@@ -64,7 +63,7 @@ class CredentialsClientXML(rest_client.RestClient):
         credential.append(blob)
         resp, body = self.post('credentials', str(Document(credential)))
         body = self._parse_body(etree.fromstring(body))
-        body['blob'] = json.loads(body['blob'])
+        body['blob'] = json_codec.loads(body['blob'])
         return resp, body
 
     def update_credential(self, credential_id, **kwargs):
@@ -87,14 +86,14 @@ class CredentialsClientXML(rest_client.RestClient):
         resp, body = self.patch('credentials/%s' % credential_id,
                                 str(Document(credential)))
         body = self._parse_body(etree.fromstring(body))
-        body['blob'] = json.loads(body['blob'])
+        body['blob'] = json_codec.loads(body['blob'])
         return resp, body
 
     def get_credential(self, credential_id):
         """To GET Details of a credential."""
         resp, body = self.get('credentials/%s' % credential_id)
         body = self._parse_body(etree.fromstring(body))
-        body['blob'] = json.loads(body['blob'])
+        body['blob'] = json_codec.loads(body['blob'])
         return resp, body
 
     def list_credentials(self):
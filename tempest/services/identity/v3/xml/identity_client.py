@@ -13,10 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
 from lxml import etree
 
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -500,13 +499,13 @@ class V3TokenClientXML(rest_client.RestClient):
         self._log_response(resp, resp_body)
 
         if resp.status in [401, 403]:
-            resp_body = json.loads(resp_body)
+            resp_body = json_codec.loads(resp_body)
             raise exceptions.Unauthorized(resp_body['error']['message'])
         elif resp.status not in [200, 201, 204]:
             raise exceptions.IdentityError(
                 'Unexpected status code {0}'.format(resp.status))
 
-        return resp, json.loads(resp_body)
+        return resp, json_codec.loads(resp_body)
 
     def get_token(self, user, password, tenant, domain='Default',
                   auth_data=False):
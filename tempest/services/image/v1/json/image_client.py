@@ -15,13 +15,15 @@
 
 import copy
 import errno
-import json
 import os
 import time
 import urllib
 
 from tempest.common import glance_http
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common.rest_client import RestClient
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -114,7 +116,7 @@ class ImageClientJSON(RestClient):
                                                 headers=headers, body=data)
         self._error_checker('POST', '/v1/images', headers, data, resp,
                             body_iter)
-        body = json.loads(''.join([c for c in body_iter]))
+        body = json_codec.loads(''.join([c for c in body_iter]))
         return resp, body['image']
 
     def _update_with_data(self, image_id, headers, data):
@@ -123,7 +125,7 @@ class ImageClientJSON(RestClient):
                                                 body=data)
         self._error_checker('PUT', url, headers, data,
                             resp, body_iter)
-        body = json.loads(''.join([c for c in body_iter]))
+        body = json_codec.loads(''.join([c for c in body_iter]))
         return resp, body['image']
 
     @property
@@ -153,7 +155,7 @@ class ImageClientJSON(RestClient):
             return self._create_with_data(headers, kwargs.get('data'))
 
         resp, body = self.post('v1/images', None, headers)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['image']
 
     def update_image(self, image_id, name=None, container_format=None,
@@ -176,7 +178,7 @@ class ImageClientJSON(RestClient):
 
         url = 'v1/images/%s' % image_id
         resp, body = self.put(url, data, headers)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['image']
 
     def delete_image(self, image_id):
@@ -190,7 +192,7 @@ class ImageClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(kwargs)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['images']
 
     def image_list_detail(self, properties=dict(), changes_since=None,
@@ -210,7 +212,7 @@ class ImageClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(kwargs)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['images']
 
     def get_image_meta(self, image_id):
@@ -234,20 +236,20 @@ class ImageClientJSON(RestClient):
     def get_image_membership(self, image_id):
         url = 'v1/images/%s/members' % image_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def get_shared_images(self, member_id):
         url = 'v1/shared-images/%s' % member_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def add_member(self, member_id, image_id, can_share=False):
         url = 'v1/images/%s/members/%s' % (image_id, member_id)
         body = None
         if can_share:
-            body = json.dumps({'member': {'can_share': True}})
+            body = json_codec.dumps({'member': {'can_share': True}})
         resp, __ = self.put(url, body)
         return resp
 
@@ -258,41 +260,40 @@ class ImageClientJSON(RestClient):
 
     def replace_membership_list(self, image_id, member_list):
         url = 'v1/images/%s/members' % image_id
-        body = json.dumps({'membership': member_list})
+        body = json_codec.dumps({'membership': member_list})
         resp, data = self.put(url, body)
-        data = json.loads(data)
+        data = json_codec.loads(data)
         return resp, data
 
     # NOTE(afazekas): just for the wait function
     def _get_image_status(self, image_id):
         resp, meta = self.get_image_meta(image_id)
         status = meta['status']
+        timeline.record_status(polling.IMAGE, image_id, status,
+                               resource=meta)
         return status
 
     # NOTE(afazkas): Wait reinvented again. It is not in the correct layer
     def wait_for_image_status(self, image_id, status):
         """Waits for a Image to reach a given status."""
         start_time = time.time()
-        old_value = value = self._get_image_status(image_id)
-        while True:
-            dtime = time.time() - start_time
-            time.sleep(self.build_interval)
-            if value != old_value:
+        old_value = value = None
+        for _ in polling.poll(polling.IMAGE, self.build_timeout,
+                              self.build_interval):
+            old_value, value = value, self._get_image_status(image_id)
+            if old_value is not None and value != old_value:
                 LOG.info('Value transition from "%s" to "%s"'
                          'in %d second(s).', old_value,
-                         value, dtime)
+                         value, time.time() - start_time)
             if value == status:
                 return value
 
             if value == 'killed':
                 raise exceptions.ImageKilledException(image_id=image_id,
                                                       status=status)
-            if dtime > self.build_timeout:
-                message = ('Time Limit Exceeded! (%ds)'
-                           'while waiting for %s, '
-                           'but we got %s.' %
-                           (self.build_timeout, status, value))
-                raise exceptions.TimeoutException(message)
-            time.sleep(self.build_interval)
-            old_value = value
-            value = self._get_image_status(image_id)
+
+        message = ('Time Limit Exceeded! (%ds)'
+                   'while waiting for %s, '
+                   'but we got %s.' %
+                   (self.build_timeout, status, value))
+        raise exceptions.TimeoutException(message)
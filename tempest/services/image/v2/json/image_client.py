@@ -13,12 +13,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
 import jsonschema
 
 from tempest.common import glance_http
+from tempest.common import json_codec
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -42,13 +42,13 @@ class ImageClientV2JSON(rest_client.RestClient):
     def get_images_schema(self):
         url = 'v2/schemas/images'
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def get_image_schema(self):
         url = 'v2/schemas/image'
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def _validate_schema(self, body, type='image'):
@@ -83,11 +83,11 @@ class ImageClientV2JSON(rest_client.RestClient):
                 else:
                     params[option] = value
 
-        data = json.dumps(params)
+        data = json_codec.dumps(params)
         self._validate_schema(data)
 
         resp, body = self.post('v2/images', data)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def delete_image(self, image_id):
@@ -101,14 +101,14 @@ class ImageClientV2JSON(rest_client.RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         self._validate_schema(body, type='images')
         return resp, body['images']
 
     def get_image(self, image_id):
         url = 'v2/images/%s' % image_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def is_resource_deleted(self, id):
@@ -125,9 +125,9 @@ class ImageClientV2JSON(rest_client.RestClient):
                                            body=data)
         return resp, body
 
-    def get_image_file(self, image_id):
+    def get_image_file(self, image_id, stream=False):
         url = 'v2/images/%s/file' % image_id
-        resp, body = self.get(url)
+        resp, body = self.get(url, stream=stream)
         return resp, body
 
     def add_image_tag(self, image_id, tag):
@@ -143,23 +143,23 @@ class ImageClientV2JSON(rest_client.RestClient):
     def get_image_membership(self, image_id):
         url = 'v2/images/%s/members' % image_id
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         self.expected_success(200, resp)
         return resp, body
 
     def add_member(self, image_id, member_id):
         url = 'v2/images/%s/members' % image_id
-        data = json.dumps({'member': member_id})
+        data = json_codec.dumps({'member': member_id})
         resp, body = self.post(url, data)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         self.expected_success(200, resp)
         return resp, body
 
     def update_member_status(self, image_id, member_id, status):
         """Valid status are: ``pending``, ``accepted``,  ``rejected``."""
         url = 'v2/images/%s/members/%s' % (image_id, member_id)
-        data = json.dumps({'status': status})
+        data = json_codec.dumps({'status': status})
         resp, body = self.put(url, data)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         self.expected_success(200, resp)
         return resp, body
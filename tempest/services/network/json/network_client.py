@@ -10,8 +10,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest.services.network import network_client_base
 
@@ -35,26 +34,26 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         return RestClient(auth_provider)
 
     def deserialize_single(self, body):
-        return json.loads(body)
+        return json_codec.loads(body)
 
     def deserialize_list(self, body):
-        res = json.loads(body)
+        res = json_codec.loads(body)
         # expecting response in form
         # {'resources': [ res1, res2] }
         return res[res.keys()[0]]
 
     def serialize(self, data):
-        return json.dumps(data)
+        return json_codec.dumps(data)
 
     def serialize_list(self, data, root=None, item=None):
         return self.serialize(data)
 
     def update_quotas(self, tenant_id, **kwargs):
         put_body = {'quota': kwargs}
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         uri = '%s/quotas/%s' % (self.uri_prefix, tenant_id)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['quota']
 
     def reset_quotas(self, tenant_id):
@@ -66,16 +65,16 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         post_body = {'router': kwargs}
         post_body['router']['name'] = name
         post_body['router']['admin_state_up'] = admin_state_up
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/routers' % (self.uri_prefix)
         resp, body = self.post(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def _update_router(self, router_id, set_enable_snat, **kwargs):
         uri = '%s/routers/%s' % (self.uri_prefix, router_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         update_body = {}
         update_body['name'] = kwargs.get('name', body['router']['name'])
         update_body['admin_state_up'] = kwargs.get(
@@ -86,9 +85,9 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         update_body['external_gateway_info'] = kwargs.get(
             'external_gateway_info', body['router']['external_gateway_info'])
         update_body = dict(router=update_body)
-        update_body = json.dumps(update_body)
+        update_body = json_codec.dumps(update_body)
         resp, body = self.put(uri, update_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_router(self, router_id, **kwargs):
@@ -112,55 +111,55 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         uri = '%s/routers/%s/add_router_interface' % (self.uri_prefix,
               router_id)
         update_body = {"subnet_id": subnet_id}
-        update_body = json.dumps(update_body)
+        update_body = json_codec.dumps(update_body)
         resp, body = self.put(uri, update_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def add_router_interface_with_port_id(self, router_id, port_id):
         uri = '%s/routers/%s/add_router_interface' % (self.uri_prefix,
               router_id)
         update_body = {"port_id": port_id}
-        update_body = json.dumps(update_body)
+        update_body = json_codec.dumps(update_body)
         resp, body = self.put(uri, update_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def remove_router_interface_with_subnet_id(self, router_id, subnet_id):
         uri = '%s/routers/%s/remove_router_interface' % (self.uri_prefix,
               router_id)
         update_body = {"subnet_id": subnet_id}
-        update_body = json.dumps(update_body)
+        update_body = json_codec.dumps(update_body)
         resp, body = self.put(uri, update_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def remove_router_interface_with_port_id(self, router_id, port_id):
         uri = '%s/routers/%s/remove_router_interface' % (self.uri_prefix,
               router_id)
         update_body = {"port_id": port_id}
-        update_body = json.dumps(update_body)
+        update_body = json_codec.dumps(update_body)
         resp, body = self.put(uri, update_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def create_floating_ip(self, ext_network_id, **kwargs):
         post_body = {
             'floatingip': kwargs}
         post_body['floatingip']['floating_network_id'] = ext_network_id
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/floatingips' % (self.uri_prefix)
         resp, body = self.post(uri, body=body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_floating_ip(self, floating_ip_id, **kwargs):
         post_body = {
             'floatingip': kwargs}
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/floatingips/%s' % (self.uri_prefix, floating_ip_id)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def create_member(self, address, protocol_port, pool_id):
@@ -171,10 +170,10 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                 "address": address
             }
         }
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/lb/members' % (self.uri_prefix)
         resp, body = self.post(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_member(self, admin_state_up, member_id):
@@ -183,10 +182,10 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                 "admin_state_up": admin_state_up
             }
         }
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         uri = '%s/lb/members/%s' % (self.uri_prefix, member_id)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def associate_health_monitor_with_pool(self, health_monitor_id,
@@ -196,11 +195,11 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                 "id": health_monitor_id,
             }
         }
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/lb/pools/%s/health_monitors' % (self.uri_prefix,
                                                   pool_id)
         resp, body = self.post(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def disassociate_health_monitor_with_pool(self, health_monitor_id,
@@ -219,10 +218,10 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         }
         for key, val in kwargs.items():
             post_body['vpnservice'][key] = val
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/vpn/vpnservices' % (self.uri_prefix)
         resp, body = self.post(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_vpnservice(self, uuid, description):
@@ -231,16 +230,16 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                 "description": description
             }
         }
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         uri = '%s/vpn/vpnservices/%s' % (self.uri_prefix, uuid)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_router_interfaces(self, uuid):
         uri = '%s/ports?device_id=%s' % (self.uri_prefix, uuid)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_agent(self, agent_id, agent_info):
@@ -250,46 +249,46 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         """
         uri = '%s/agents/%s' % (self.uri_prefix, agent_id)
         agent = {"agent": agent_info}
-        body = json.dumps(agent)
+        body = json_codec.dumps(agent)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_pools_hosted_by_one_lbaas_agent(self, agent_id):
         uri = '%s/agents/%s/loadbalancer-pools' % (self.uri_prefix, agent_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def show_lbaas_agent_hosting_pool(self, pool_id):
         uri = ('%s/lb/pools/%s/loadbalancer-agent' %
                (self.uri_prefix, pool_id))
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_routers_on_l3_agent(self, agent_id):
         uri = '%s/agents/%s/l3-routers' % (self.uri_prefix, agent_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_l3_agents_hosting_router(self, router_id):
         uri = '%s/routers/%s/l3-agents' % (self.uri_prefix, router_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_dhcp_agent_hosting_network(self, network_id):
         uri = '%s/networks/%s/dhcp-agents' % (self.uri_prefix, network_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_networks_hosted_by_one_dhcp_agent(self, agent_id):
         uri = '%s/agents/%s/dhcp-networks' % (self.uri_prefix, agent_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def remove_network_from_dhcp_agent(self, agent_id, network_id):
@@ -306,18 +305,18 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
         }
         for key, val in kwargs.items():
             post_body['ikepolicy'][key] = val
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
         uri = '%s/vpn/ikepolicies' % (self.uri_prefix)
         resp, body = self.post(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_ikepolicy(self, uuid, **kwargs):
         put_body = {'ikepolicy': kwargs}
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         uri = '%s/vpn/ikepolicies/%s' % (self.uri_prefix, uuid)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def update_extra_routes(self, router_id, nexthop, destination):
@@ -328,9 +327,9 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                             "destination": destination}]
             }
         }
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def delete_extra_routes(self, router_id):
@@ -341,13 +340,13 @@ class NetworkClientJSON(network_client_base.NetworkClientBase):
                 'routes': null_routes
             }
         }
-        body = json.dumps(put_body)
+        body = json_codec.dumps(put_body)
         resp, body = self.put(uri, body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def list_lb_pool_stats(self, pool_id):
         uri = '%s/lb/pools/%s/stats' % (self.uri_prefix, pool_id)
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
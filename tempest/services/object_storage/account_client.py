@@ -13,10 +13,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
 from tempest.common import http
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from tempest import exceptions
@@ -123,14 +123,14 @@ class AccountClient(RestClient):
         resp, body = self.get(url)
 
         if params and params.get('format') == 'json':
-            body = json.loads(body)
+            body = json_codec.loads(body)
         return resp, body
 
     def list_extensions(self):
         self.skip_path()
         resp, body = self.get('info')
         self.reset_path()
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
 
@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 from xml.etree import ElementTree as etree
@@ -183,7 +183,7 @@ class ContainerClient(RestClient):
 
         resp, body = self.get(url, headers={})
         if params and params.get('format') == 'json':
-            body = json.loads(body)
+            body = json_codec.loads(body)
         elif params and params.get('format') == 'xml':
             body = etree.fromstring(body)
         return resp, body
@@ -73,11 +73,14 @@ class ObjectClient(RestClient):
         resp, body = self.head(url)
         return resp, body
 
-    def get_object(self, container, object_name):
-        """Retrieve object's data."""
+    def get_object(self, container, object_name, stream=False):
+        """
+        Retrieve object's data. With stream=True the body is a file-like
+        http.ResponseBodyStream which is read from the connection on demand.
+        """
 
         url = "{0}/{1}".format(container, object_name)
-        resp, body = self.get(url)
+        resp, body = self.get(url, stream=stream)
         return resp, body
 
     def copy_object_in_same_container(self, container, src_object_name,
@@ -13,12 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import re
-import time
 import urllib
 
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common import rest_client
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 
@@ -41,7 +42,7 @@ class OrchestrationClient(rest_client.RestClient):
             uri += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(uri)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['stacks']
 
     def create_stack(self, name, disable_rollback=True, parameters={},
@@ -86,7 +87,7 @@ class OrchestrationClient(rest_client.RestClient):
             post_body['template'] = template
         if template_url:
             post_body['template_url'] = template_url
-        body = json.dumps(post_body)
+        body = json_codec.dumps(post_body)
 
         # Password must be provided on stack create so that heat
         # can perform future operations on behalf of the user
@@ -99,35 +100,35 @@ class OrchestrationClient(rest_client.RestClient):
         """Returns the details of a single stack."""
         url = "stacks/%s" % stack_identifier
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['stack']
 
     def suspend_stack(self, stack_identifier):
         """Suspend a stack."""
         url = 'stacks/%s/actions' % stack_identifier
         body = {'suspend': None}
-        resp, body = self.post(url, json.dumps(body))
+        resp, body = self.post(url, json_codec.dumps(body))
         return resp, body
 
     def resume_stack(self, stack_identifier):
         """Resume a stack."""
         url = 'stacks/%s/actions' % stack_identifier
         body = {'resume': None}
-        resp, body = self.post(url, json.dumps(body))
+        resp, body = self.post(url, json_codec.dumps(body))
         return resp, body
 
     def list_resources(self, stack_identifier):
         """Returns the details of a single resource."""
         url = "stacks/%s/resources" % stack_identifier
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['resources']
 
     def get_resource(self, stack_identifier, resource_name):
         """Returns the details of a single resource."""
         url = "stacks/%s/resources/%s" % (stack_identifier, resource_name)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['resource']
 
     def delete_stack(self, stack_identifier):
@@ -137,10 +138,10 @@ class OrchestrationClient(rest_client.RestClient):
     def wait_for_resource_status(self, stack_identifier, resource_name,
                                  status, failure_pattern='^.*_FAILED$'):
         """Waits for a Resource to reach a given status."""
-        start = int(time.time())
         fail_regexp = re.compile(failure_pattern)
 
-        while True:
+        for _ in polling.poll(polling.STACK, self.build_timeout,
+                              self.build_interval):
             try:
                 resp, body = self.get_resource(
                     stack_identifier, resource_name)
@@ -159,23 +160,23 @@ class OrchestrationClient(rest_client.RestClient):
                         resource_status=resource_status,
                         resource_status_reason=body['resource_status_reason'])
 
-            if int(time.time()) - start >= self.build_timeout:
-                message = ('Resource %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (resource_name, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
-            time.sleep(self.build_interval)
+        message = ('Resource %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (resource_name, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
 
     def wait_for_stack_status(self, stack_identifier, status,
                               failure_pattern='^.*_FAILED$'):
         """Waits for a Stack to reach a given status."""
-        start = int(time.time())
         fail_regexp = re.compile(failure_pattern)
 
-        while True:
+        for _ in polling.poll(polling.STACK, self.build_timeout,
+                              self.build_interval):
             resp, body = self.get_stack(stack_identifier)
             stack_name = body['stack_name']
             stack_status = body['stack_status']
+            timeline.record_status(polling.STACK, stack_identifier,
+                                   stack_status, resource=body)
             if stack_status == status:
                 return body
             if fail_regexp.search(stack_status):
@@ -184,26 +185,24 @@ class OrchestrationClient(rest_client.RestClient):
                     stack_status=stack_status,
                     stack_status_reason=body['stack_status_reason'])
 
-            if int(time.time()) - start >= self.build_timeout:
-                message = ('Stack %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (stack_name, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
-            time.sleep(self.build_interval)
+        message = ('Stack %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (stack_name, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
 
     def show_resource_metadata(self, stack_identifier, resource_name):
         """Returns the resource's metadata."""
         url = ('stacks/{stack_identifier}/resources/{resource_name}'
                '/metadata'.format(**locals()))
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def list_events(self, stack_identifier):
         """Returns list of all events for a stack."""
         url = 'stacks/{stack_identifier}/events'.format(**locals())
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['events']
 
     def list_resource_events(self, stack_identifier, resource_name):
@@ -211,7 +210,7 @@ class OrchestrationClient(rest_client.RestClient):
         url = ('stacks/{stack_identifier}/resources/{resource_name}'
                '/events'.format(**locals()))
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['events']
 
     def show_event(self, stack_identifier, resource_name, event_id):
@@ -219,21 +218,21 @@ class OrchestrationClient(rest_client.RestClient):
         url = ('stacks/{stack_identifier}/resources/{resource_name}/events'
                '/{event_id}'.format(**locals()))
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['event']
 
     def show_template(self, stack_identifier):
         """Returns the template for the stack."""
         url = ('stacks/{stack_identifier}/template'.format(**locals()))
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def _validate_template(self, post_body):
         """Returns the validation request result."""
-        post_body = json.dumps(post_body)
+        post_body = json_codec.dumps(post_body)
         resp, body = self.post('validate', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def validate_template(self, template, parameters={}):
@@ -13,9 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
 from tempest import config
 
@@ -41,14 +41,14 @@ class VolumeTypesClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume_types']
 
     def get_volume_type(self, volume_id):
         """Returns the details of a single volume_type."""
         url = "types/%s" % str(volume_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume_type']
 
     def create_volume_type(self, name, **kwargs):
@@ -63,9 +63,9 @@ class VolumeTypesClientJSON(RestClient):
             'extra_specs': kwargs.get('extra_specs'),
         }
 
-        post_body = json.dumps({'volume_type': post_body})
+        post_body = json_codec.dumps({'volume_type': post_body})
         resp, body = self.post('types', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume_type']
 
     def delete_volume_type(self, volume_id):
@@ -79,7 +79,7 @@ class VolumeTypesClientJSON(RestClient):
             url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extra_specs']
 
     def get_volume_type_extra_specs(self, vol_type_id, extra_spec_name):
@@ -87,7 +87,7 @@ class VolumeTypesClientJSON(RestClient):
         url = "types/%s/extra_specs/%s" % (str(vol_type_id),
                                            str(extra_spec_name))
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
 
     def create_volume_type_extra_specs(self, vol_type_id, extra_spec):
@@ -97,9 +97,9 @@ class VolumeTypesClientJSON(RestClient):
         extra_specs: A dictionary of values to be used as extra_specs.
         """
         url = "types/%s/extra_specs" % str(vol_type_id)
-        post_body = json.dumps({'extra_specs': extra_spec})
+        post_body = json_codec.dumps({'extra_specs': extra_spec})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['extra_specs']
 
     def delete_volume_type_extra_specs(self, vol_id, extra_spec_name):
@@ -118,7 +118,7 @@ class VolumeTypesClientJSON(RestClient):
         """
         url = "types/%s/extra_specs/%s" % (str(vol_type_id),
                                            str(extra_spec_name))
-        put_body = json.dumps(extra_spec)
+        put_body = json_codec.dumps(extra_spec)
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body
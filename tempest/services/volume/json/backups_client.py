@@ -13,9 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-import time
-
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common import rest_client
 from tempest import config
 from tempest import exceptions
@@ -44,17 +43,17 @@ class BackupsClientJSON(rest_client.RestClient):
             post_body['name'] = name
         if description:
             post_body['description'] = description
-        post_body = json.dumps({'backup': post_body})
+        post_body = json_codec.dumps({'backup': post_body})
         resp, body = self.post('backups', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['backup']
 
     def restore_backup(self, backup_id, volume_id=None):
         """Restore volume from backup."""
         post_body = {'volume_id': volume_id}
-        post_body = json.dumps({'restore': post_body})
+        post_body = json_codec.dumps({'restore': post_body})
         resp, body = self.post('backups/%s/restore' % (backup_id), post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['restore']
 
     def delete_backup(self, backup_id):
@@ -66,24 +65,21 @@ class BackupsClientJSON(rest_client.RestClient):
         """Returns the details of a single backup."""
         url = "backups/%s" % str(backup_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['backup']
 
     def wait_for_backup_status(self, backup_id, status):
         """Waits for a Backup to reach a given status."""
-        resp, body = self.get_backup(backup_id)
-        backup_status = body['status']
-        start = int(time.time())
-
-        while backup_status != status:
-            time.sleep(self.build_interval)
+        for _ in polling.poll(polling.BACKUP, self.build_timeout,
+                              self.build_interval):
             resp, body = self.get_backup(backup_id)
             backup_status = body['status']
+            if backup_status == status:
+                return
             if backup_status == 'error':
                 raise exceptions.VolumeBackupException(backup_id=backup_id)
 
-            if int(time.time()) - start >= self.build_timeout:
-                message = ('Volume backup %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (backup_id, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
+        message = ('Volume backup %s failed to reach %s status within '
+                   'the required time (%s s).' %
+                   (backup_id, status, self.build_timeout))
+        raise exceptions.TimeoutException(message)
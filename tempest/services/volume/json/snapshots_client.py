@@ -10,11 +10,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
 import time
 import urllib
 
+from tempest.common import json_codec
+from tempest.common import polling
 from tempest.common.rest_client import RestClient
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -41,7 +43,7 @@ class SnapshotsClientJSON(RestClient):
                 url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['snapshots']
 
     def list_snapshots_with_detail(self, params=None):
@@ -51,14 +53,14 @@ class SnapshotsClientJSON(RestClient):
                 url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['snapshots']
 
     def get_snapshot(self, snapshot_id):
         """Returns the details of a single snapshot."""
         url = "snapshots/%s" % str(snapshot_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['snapshot']
 
     def create_snapshot(self, volume_id, **kwargs):
@@ -71,22 +73,24 @@ class SnapshotsClientJSON(RestClient):
         """
         post_body = {'volume_id': volume_id}
         post_body.update(kwargs)
-        post_body = json.dumps({'snapshot': post_body})
+        post_body = json_codec.dumps({'snapshot': post_body})
         resp, body = self.post('snapshots', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['snapshot']
 
     def update_snapshot(self, snapshot_id, **kwargs):
         """Updates a snapshot."""
-        put_body = json.dumps({'snapshot': kwargs})
+        put_body = json_codec.dumps({'snapshot': kwargs})
         resp, body = self.put('snapshots/%s' % snapshot_id, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['snapshot']
 
     # NOTE(afazekas): just for the wait function
     def _get_snapshot_status(self, snapshot_id):
         resp, body = self.get_snapshot(snapshot_id)
         status = body['status']
+        timeline.record_status(polling.SNAPSHOT, snapshot_id, status,
+                               resource=body)
         # NOTE(afazekas): snapshot can reach an "error"
         # state in a "normal" lifecycle
         if (status == 'error'):
@@ -99,26 +103,22 @@ class SnapshotsClientJSON(RestClient):
     def wait_for_snapshot_status(self, snapshot_id, status):
         """Waits for a Snapshot to reach a given status."""
         start_time = time.time()
-        old_value = value = self._get_snapshot_status(snapshot_id)
-        while True:
-            dtime = time.time() - start_time
-            time.sleep(self.build_interval)
-            if value != old_value:
+        old_value = value = None
+        for _ in polling.poll(polling.SNAPSHOT, self.build_timeout,
+                              self.build_interval):
+            old_value, value = value, self._get_snapshot_status(snapshot_id)
+            if old_value is not None and value != old_value:
                 LOG.info('Value transition from "%s" to "%s"'
                          'in %d second(s).', old_value,
-                         value, dtime)
+                         value, time.time() - start_time)
             if (value == status):
                 return value
 
-            if dtime > self.build_timeout:
-                message = ('Time Limit Exceeded! (%ds)'
-                           'while waiting for %s, '
-                           'but we got %s.' %
-                           (self.build_timeout, status, value))
-                raise exceptions.TimeoutException(message)
-            time.sleep(self.build_interval)
-            old_value = value
-            value = self._get_snapshot_status(snapshot_id)
+        message = ('Time Limit Exceeded! (%ds)'
+                   'while waiting for %s, '
+                   'but we got %s.' %
+                   (self.build_timeout, status, value))
+        raise exceptions.TimeoutException(message)
 
     def delete_snapshot(self, snapshot_id):
         """Delete Snapshot."""
@@ -133,7 +133,7 @@ class SnapshotsClientJSON(RestClient):
 
     def reset_snapshot_status(self, snapshot_id, status):
         """Reset the specified snapshot's status."""
-        post_body = json.dumps({'os-reset_status': {"status": status}})
+        post_body = json_codec.dumps({'os-reset_status': {"status": status}})
         resp, body = self.post('snapshots/%s/action' % snapshot_id, post_body)
         return resp, body
 
@@ -143,40 +143,40 @@ class SnapshotsClientJSON(RestClient):
             'status': status,
             'progress': progress
         }
-        post_body = json.dumps({'os-update_snapshot_status': post_body})
+        post_body = json_codec.dumps({'os-update_snapshot_status': post_body})
         url = 'snapshots/%s/action' % str(snapshot_id)
         resp, body = self.post(url, post_body)
         return resp, body
 
     def create_snapshot_metadata(self, snapshot_id, metadata):
         """Create metadata for the snapshot."""
-        put_body = json.dumps({'metadata': metadata})
+        put_body = json_codec.dumps({'metadata': metadata})
         url = "snapshots/%s/metadata" % str(snapshot_id)
         resp, body = self.post(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def get_snapshot_metadata(self, snapshot_id):
         """Get metadata of the snapshot."""
         url = "snapshots/%s/metadata" % str(snapshot_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_snapshot_metadata(self, snapshot_id, metadata):
         """Update metadata for the snapshot."""
-        put_body = json.dumps({'metadata': metadata})
+        put_body = json_codec.dumps({'metadata': metadata})
         url = "snapshots/%s/metadata" % str(snapshot_id)
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_snapshot_metadata_item(self, snapshot_id, id, meta_item):
         """Update metadata item for the snapshot."""
-        put_body = json.dumps({'meta': meta_item})
+        put_body = json_codec.dumps({'meta': meta_item})
         url = "snapshots/%s/metadata/%s" % (str(snapshot_id), str(id))
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['meta']
 
     def delete_snapshot_metadata_item(self, snapshot_id, id):
@@ -187,6 +187,6 @@ class SnapshotsClientJSON(RestClient):
 
     def force_delete_snapshot(self, snapshot_id):
         """Force Delete Snapshot."""
-        post_body = json.dumps({'os-force_delete': {}})
+        post_body = json_codec.dumps({'os-force_delete': {}})
         resp, body = self.post('snapshots/%s/action' % snapshot_id, post_body)
         return resp, body
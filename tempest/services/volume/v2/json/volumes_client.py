@@ -13,11 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-import time
 import urllib
 
+from tempest.common import json_codec
 from tempest.common.rest_client import RestClient
+from tempest.common import waiters
 from tempest import config
 from tempest import exceptions
 
@@ -48,7 +48,7 @@ class VolumesV2ClientJSON(RestClient):
                 url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volumes']
 
     def list_volumes_with_detail(self, params=None):
@@ -58,14 +58,14 @@ class VolumesV2ClientJSON(RestClient):
                 url += '?%s' % urllib.urlencode(params)
 
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volumes']
 
     def get_volume(self, volume_id):
         """Returns the details of a single volume."""
         url = "volumes/%s" % str(volume_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume']
 
     def create_volume(self, size, **kwargs):
@@ -81,16 +81,16 @@ class VolumesV2ClientJSON(RestClient):
         """
         post_body = {'size': size}
         post_body.update(kwargs)
-        post_body = json.dumps({'volume': post_body})
+        post_body = json_codec.dumps({'volume': post_body})
         resp, body = self.post('volumes', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume']
 
     def update_volume(self, volume_id, **kwargs):
         """Updates the Specified Volume."""
-        put_body = json.dumps({'volume': kwargs})
+        put_body = json_codec.dumps({'volume': kwargs})
         resp, body = self.put('volumes/%s' % volume_id, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['volume']
 
     def delete_volume(self, volume_id):
@@ -103,10 +103,10 @@ class VolumesV2ClientJSON(RestClient):
             'image_name': image_name,
             'disk_format': disk_format
         }
-        post_body = json.dumps({'os-volume_upload_image': post_body})
+        post_body = json_codec.dumps({'os-volume_upload_image': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['os-volume_upload_image']
 
     def attach_volume(self, volume_id, instance_uuid, mountpoint):
@@ -115,7 +115,7 @@ class VolumesV2ClientJSON(RestClient):
             'instance_uuid': instance_uuid,
             'mountpoint': mountpoint,
         }
-        post_body = json.dumps({'os-attach': post_body})
+        post_body = json_codec.dumps({'os-attach': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
@@ -123,7 +123,7 @@ class VolumesV2ClientJSON(RestClient):
     def detach_volume(self, volume_id):
         """Detaches a volume from an instance."""
         post_body = {}
-        post_body = json.dumps({'os-detach': post_body})
+        post_body = json_codec.dumps({'os-detach': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
@@ -131,7 +131,7 @@ class VolumesV2ClientJSON(RestClient):
     def reserve_volume(self, volume_id):
         """Reserves a volume."""
         post_body = {}
-        post_body = json.dumps({'os-reserve': post_body})
+        post_body = json_codec.dumps({'os-reserve': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
@@ -139,30 +139,14 @@ class VolumesV2ClientJSON(RestClient):
     def unreserve_volume(self, volume_id):
         """Restore a reserved volume ."""
         post_body = {}
-        post_body = json.dumps({'os-unreserve': post_body})
+        post_body = json_codec.dumps({'os-unreserve': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
 
     def wait_for_volume_status(self, volume_id, status):
         """Waits for a Volume to reach a given status."""
-        resp, body = self.get_volume(volume_id)
-        volume_name = body['name']
-        volume_status = body['status']
-        start = int(time.time())
-
-        while volume_status != status:
-            time.sleep(self.build_interval)
-            resp, body = self.get_volume(volume_id)
-            volume_status = body['status']
-            if volume_status == 'error':
-                raise exceptions.VolumeBuildErrorException(volume_id=volume_id)
-
-            if int(time.time()) - start >= self.build_timeout:
-                message = ('Volume %s failed to reach %s status within '
-                           'the required time (%s s).' %
-                           (volume_name, status, self.build_timeout))
-                raise exceptions.TimeoutException(message)
+        return waiters.wait_for_volume_status(self, volume_id, status)
 
     def is_resource_deleted(self, id):
         try:
@@ -176,26 +160,26 @@ class VolumesV2ClientJSON(RestClient):
         post_body = {
             'new_size': extend_size
         }
-        post_body = json.dumps({'os-extend': post_body})
+        post_body = json_codec.dumps({'os-extend': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
 
     def reset_volume_status(self, volume_id, status):
         """Reset the Specified Volume's Status."""
-        post_body = json.dumps({'os-reset_status': {"status": status}})
+        post_body = json_codec.dumps({'os-reset_status': {"status": status}})
         resp, body = self.post('volumes/%s/action' % volume_id, post_body)
         return resp, body
 
     def volume_begin_detaching(self, volume_id):
         """Volume Begin Detaching."""
-        post_body = json.dumps({'os-begin_detaching': {}})
+        post_body = json_codec.dumps({'os-begin_detaching': {}})
         resp, body = self.post('volumes/%s/action' % volume_id, post_body)
         return resp, body
 
     def volume_roll_detaching(self, volume_id):
         """Volume Roll Detaching."""
-        post_body = json.dumps({'os-roll_detaching': {}})
+        post_body = json_codec.dumps({'os-roll_detaching': {}})
         resp, body = self.post('volumes/%s/action' % volume_id, post_body)
         return resp, body
 
@@ -206,16 +190,16 @@ class VolumesV2ClientJSON(RestClient):
         }
         if name:
             post_body['name'] = name
-        post_body = json.dumps({'transfer': post_body})
+        post_body = json_codec.dumps({'transfer': post_body})
         resp, body = self.post('os-volume-transfer', post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['transfer']
 
     def get_volume_transfer(self, transfer_id):
         """Returns the details of a volume transfer."""
         url = "os-volume-transfer/%s" % str(transfer_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['transfer']
 
     def list_volume_transfers(self, params=None):
@@ -224,7 +208,7 @@ class VolumesV2ClientJSON(RestClient):
         if params:
             url += '?%s' % urllib.urlencode(params)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['transfers']
 
     def delete_volume_transfer(self, transfer_id):
@@ -237,9 +221,9 @@ class VolumesV2ClientJSON(RestClient):
             'auth_key': transfer_auth_key,
         }
         url = 'os-volume-transfer/%s/accept' % transfer_id
-        post_body = json.dumps({'accept': post_body})
+        post_body = json_codec.dumps({'accept': post_body})
         resp, body = self.post(url, post_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['transfer']
 
     def update_volume_readonly(self, volume_id, readonly):
@@ -247,46 +231,46 @@ class VolumesV2ClientJSON(RestClient):
         post_body = {
             'readonly': readonly
         }
-        post_body = json.dumps({'os-update_readonly_flag': post_body})
+        post_body = json_codec.dumps({'os-update_readonly_flag': post_body})
         url = 'volumes/%s/action' % (volume_id)
         resp, body = self.post(url, post_body)
         return resp, body
 
     def force_delete_volume(self, volume_id):
         """Force Delete Volume."""
-        post_body = json.dumps({'os-force_delete': {}})
+        post_body = json_codec.dumps({'os-force_delete': {}})
         resp, body = self.post('volumes/%s/action' % volume_id, post_body)
         return resp, body
 
     def create_volume_metadata(self, volume_id, metadata):
         """Create metadata for the volume."""
-        put_body = json.dumps({'metadata': metadata})
+        put_body = json_codec.dumps({'metadata': metadata})
         url = "volumes/%s/metadata" % str(volume_id)
         resp, body = self.post(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def get_volume_metadata(self, volume_id):
         """Get metadata of the volume."""
         url = "volumes/%s/metadata" % str(volume_id)
         resp, body = self.get(url)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_volume_metadata(self, volume_id, metadata):
         """Update metadata for the volume."""
-        put_body = json.dumps({'metadata': metadata})
+        put_body = json_codec.dumps({'metadata': metadata})
         url = "volumes/%s/metadata" % str(volume_id)
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['metadata']
 
     def update_volume_metadata_item(self, volume_id, id, meta_item):
         """Update metadata item for the volume."""
-        put_body = json.dumps({'meta': meta_item})
+        put_body = json_codec.dumps({'meta': meta_item})
         url = "volumes/%s/metadata/%s" % (str(volume_id), str(id))
         resp, body = self.put(url, put_body)
-        body = json.loads(body)
+        body = json_codec.loads(body)
         return resp, body['meta']
 
     def delete_volume_metadata_item(self, volume_id, id):
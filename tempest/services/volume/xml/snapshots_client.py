@@ -15,7 +15,9 @@ import urllib
 
 from lxml import etree
 
+from tempest.common import polling
 from tempest.common import rest_client
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -104,6 +106,8 @@ class SnapshotsClientXML(rest_client.RestClient):
     def _get_snapshot_status(self, snapshot_id):
         resp, body = self.get_snapshot(snapshot_id)
         status = body['status']
+        timeline.record_status(polling.SNAPSHOT, snapshot_id, status,
+                               resource=body)
         # NOTE(afazekas): snapshot can reach an "error"
         # state in a "normal" lifecycle
         if (status == 'error'):
@@ -116,26 +120,22 @@ class SnapshotsClientXML(rest_client.RestClient):
     def wait_for_snapshot_status(self, snapshot_id, status):
         """Waits for a Snapshot to reach a given status."""
         start_time = time.time()
-        old_value = value = self._get_snapshot_status(snapshot_id)
-        while True:
-            dtime = time.time() - start_time
-            time.sleep(self.build_interval)
-            if value != old_value:
+        old_value = value = None
+        for _ in polling.poll(polling.SNAPSHOT, self.build_timeout,
+                              self.build_interval):
+            old_value, value = value, self._get_snapshot_status(snapshot_id)
+            if old_value is not None and value != old_value:
                 LOG.info('Value transition from "%s" to "%s"'
                          'in %d second(s).', old_value,
-                         value, dtime)
+                         value, time.time() - start_time)
             if (value == status):
                 return value
 
-            if dtime > self.build_timeout:
-                message = ('Time Limit Exceeded! (%ds)'
-                           'while waiting for %s, '
-                           'but we got %s.' %
-                           (self.build_timeout, status, value))
-                raise exceptions.TimeoutException(message)
-            time.sleep(self.build_interval)
-            old_value = value
-            value = self._get_snapshot_status(snapshot_id)
+        message = ('Time Limit Exceeded! (%ds)'
+                   'while waiting for %s, '
+                   'but we got %s.' %
+                   (self.build_timeout, status, value))
+        raise exceptions.TimeoutException(message)
 
     def delete_snapshot(self, snapshot_id):
         """Delete Snapshot."""
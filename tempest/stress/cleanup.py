@@ -15,6 +15,7 @@
 #    limitations under the License.
 
 from tempest import clients
+from tempest.common import waiters
 from tempest.openstack.common import log as logging
 
 LOG = logging.getLogger(__name__)
@@ -31,11 +32,13 @@ def cleanup():
         except Exception:
             pass
 
-    for s in body['servers']:
-        try:
-            admin_manager.servers_client.wait_for_server_termination(s['id'])
-        except Exception:
-            pass
+    try:
+        waiters.wait_for_servers_status(
+            admin_manager.servers_client,
+            [s['id'] for s in body['servers']], waiters.DELETED,
+            raise_on_error=False, params={"all_tenants": True})
+    except Exception as exc:
+        LOG.warning("Cleanup::servers not deleted: %s" % exc)
 
     _, keypairs = admin_manager.keypairs_client.list_keypairs()
     LOG.info("Cleanup::remove %s keypairs" % len(keypairs))
@@ -87,16 +90,22 @@ def cleanup():
 
     _, vols = admin_manager.volumes_client.list_volumes({"all_tenants": True})
     LOG.info("Cleanup::remove %s volumes" % len(vols))
-    for v in vols:
+    volume_ids = [v['id'] for v in vols]
+    try:
+        waiters.wait_for_volumes_status(
+            admin_manager.volumes_client, volume_ids, 'available',
+            raise_on_error=False, params={"all_tenants": True})
+    except Exception as exc:
+        LOG.warning("Cleanup::volumes not available: %s" % exc)
+    for volume_id in volume_ids:
         try:
-            admin_manager.volumes_client.\
-                wait_for_volume_status(v['id'], 'available')
-            admin_manager.volumes_client.delete_volume(v['id'])
+            admin_manager.volumes_client.delete_volume(volume_id)
         except Exception:
             pass
 
-    for v in vols:
-        try:
-            admin_manager.volumes_client.wait_for_resource_deletion(v['id'])
-        except Exception:
-            pass
+    try:
+        waiters.wait_for_volumes_status(
+            admin_manager.volumes_client, volume_ids, waiters.DELETED,
+            raise_on_error=False, params={"all_tenants": True})
+    except Exception as exc:
+        LOG.warning("Cleanup::volumes not deleted: %s" % exc)
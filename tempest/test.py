@@ -18,7 +18,6 @@ import functools
 import json
 import os
 import sys
-import time
 import urllib
 import uuid
 
@@ -26,10 +25,16 @@ import fixtures
 import nose.plugins.attrib
 import testresources
 import testtools
+import testtools.content
 
 from tempest import clients
+from tempest.common import cassette
 from tempest.common import generate_json
 from tempest.common import isolated_creds
+from tempest.common import journal
+from tempest.common import latency
+from tempest.common import retry
+from tempest.common import timeline
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common import log as logging
@@ -244,6 +249,63 @@ def validate_tearDownClass():
 
 atexit.register(validate_tearDownClass)
 
+
+def write_latency_report():
+    # Nothing is recorded when latency_stats is disabled, and the
+    # configuration may not even be loaded
+    if not latency.recorded():
+        return
+    report_dir = CONF.service_clients.latency_report_dir
+    if report_dir:
+        latency.write_report(report_dir)
+
+
+def log_retry_stats():
+    summary = retry.stats().summary()
+    if summary:
+        LOG.info("Requests retried by service:\n%s" % summary)
+
+
+def log_response_cache_stats():
+    from tempest.common import response_cache
+    if response_cache.used():
+        LOG.info("Response cache: %s" % response_cache.get_cache().summary())
+
+
+def log_ready_probe_stats():
+    from tempest.common import waiters
+    summary = waiters.ready_probe_summary()
+    if summary:
+        LOG.info("Server readiness probes: %s" % summary)
+
+
+def write_timeline_report():
+    # The configuration may not be loaded when nothing was recorded
+    if timeline.recorded():
+        timeline.write_report(CONF.service_clients.timeline_dir)
+
+
+def save_cassette():
+    # The configuration may not be loaded when nothing was recorded
+    if cassette.current_name() is not None:
+        cassette.save()
+
+
+def report_at_exit():
+    """
+    Writes the reports and logs the stats of the service clients of the
+    process. A failing report does not prevent the others.
+    """
+    for report in (write_latency_report, log_retry_stats,
+                   log_response_cache_stats, log_ready_probe_stats,
+                   write_timeline_report, save_cassette):
+        try:
+            report()
+        except Exception:
+            LOG.exception("%s failed at exit" % report.__name__)
+
+atexit.register(report_at_exit)
+
 if sys.version_info >= (2, 7):
     class BaseDeps(testtools.TestCase,
                    testtools.testcase.WithAttributes,
@@ -272,6 +334,15 @@ class BaseTestCase(BaseDeps):
         if hasattr(super(BaseTestCase, cls), 'setUpClass'):
             super(BaseTestCase, cls).setUpClass()
         cls.setUpClassCalled = True
+        # The requests of the class fixtures go to the cassette of the class
+        cassette.use(cls._test_id())
+        timeline.start_test(cls._test_id())
+        journal.start_test(cls._test_id())
+
+    @classmethod
+    def _test_id(cls):
+        """Id of the test class, owning the work of its fixtures."""
+        return '%s.%s' % (cls.__module__, cls.__name__)
 
     @classmethod
     def tearDownClass(cls):
@@ -286,6 +357,13 @@ class BaseTestCase(BaseDeps):
                                "setUpClass in the "
                                + self.__class__.__name__)
         at_exit_set.add(self.__class__)
+        cassette.use(self.id())
+        # Added first to run last, after the cleanups of the test
+        self.addCleanup(cassette.use, self._test_id())
+        timeline.start_test(self.id())
+        self.addCleanup(timeline.start_test, self._test_id())
+        journal.start_test(self.id())
+        self.addCleanup(journal.start_test, self._test_id())
         test_timeout = os.environ.get('OS_TEST_TIMEOUT', 0)
         try:
             test_timeout = int(test_timeout)
@@ -308,6 +386,22 @@ class BaseTestCase(BaseDeps):
             self.useFixture(fixtures.LoggerFixture(nuke_handlers=False,
                                                    format=log_format,
                                                    level=None))
+        # Only the clients check latency_stats, when they record a request:
+        # reading it here would load the configuration of the unit tests
+        latency.start_test()
+        self.addCleanup(self._attach_latency)
+        retry.start_test()
+        self.addCleanup(self._attach_retries)
+
+    def _attach_latency(self):
+        summary = latency.stop_test()
+        if summary:
+            self.addDetail('latency', testtools.content.text_content(summary))
+
+    def _attach_retries(self):
+        summary = retry.stop_test()
+        if summary:
+            self.addDetail('retries', testtools.content.text_content(summary))
 
     @classmethod
     def get_client_manager(cls, interface=None):
@@ -567,14 +661,11 @@ def call_until_true(func, duration, sleep_for):
     :param duration: The number of seconds for which to attempt a
         successful call of the function.
     :param sleep_for: The number of seconds to sleep after an unsuccessful
-                      invocation of the function.
+                      invocation of the function, which the adaptive polling
+                      shortens at first.
     """
-    now = time.time()
-    timeout = now + duration
-    while now < timeout:
+    from tempest.common import polling
+    for _ in polling.poll(polling.DEFAULT, duration, sleep_for):
         if func():
             return True
-        LOG.debug("Sleeping for %d seconds", sleep_for)
-        time.sleep(sleep_for)
-        now = time.time()
     return False
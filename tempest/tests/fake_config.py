@@ -18,12 +18,58 @@ class FakeConfig(object):
     class fake_compute(object):
         build_interval = 10
         build_timeout = 10
+        catalog_v3_type = 'computev3'
+        network_for_ssh = 'public'
+        ready_wait = 0
+        ready_probe = True
+        ready_probe_port = 0
 
     class fake_identity(object):
         disable_ssl_certificate_validation = True
         catalog_type = 'identity'
         uri = 'http://fake_uri.com/auth'
         uri_v3 = 'http://fake_uri_v3.com/auth'
+        auth_version = 'v2'
+        region = 'RegionOne'
+        token_cache = False
+        token_refresh_window = 0
+
+    class fake_service_clients(object):
+        connection_pooling = False
+        pool_maxsize = 10
+        pool_idle_timeout = 30
+        pool_stale_retries = 1
+        stream_chunk_size = 65536
+        log_body_limit = 2048
+        latency_stats = False
+        latency_report_dir = None
+        json_codec = 'json'
+        retry_attempts = 0
+        retry_service_attempts = {}
+        retry_statuses = ['502', '503', '504']
+        retry_methods = ['GET', 'HEAD', 'DELETE']
+        retry_backoff = 1.0
+        retry_backoff_max = 30.0
+        retry_jitter = 0.5
+        retry_budget = 100
+        cassette_mode = None
+        cassette_dir = None
+        response_cache_patterns = []
+        response_cache_ttl = 300.0
+        response_cache_size = 256
+        adaptive_polling = True
+        poll_initial_interval = 0.5
+        poll_fast_polls = 2
+        poll_backoff = 1.5
+        poll_max_interval = None
+        poll_jitter = 0.1
+        poll_profiles = {}
+        central_poller = False
+        timeline_dir = None
+        timeline_format = 'jsonl'
+        resource_journal = None
+        fanout_workers = 8
+        max_concurrent_requests = {}
 
     class fake_default_feature_enabled(object):
         api_extensions = ['all']
@@ -42,6 +88,7 @@ class FakeConfig(object):
         neutron = True
         swift = True
         horizon = True
+        ceilometer = True
 
     compute_feature_enabled = fake_compute_feature_enabled()
     volume_feature_enabled = fake_default_feature_enabled()
@@ -52,3 +99,6 @@ class FakeConfig(object):
 
     compute = fake_compute()
     identity = fake_identity()
+    service_clients = fake_service_clients()
+
+    service_index = {'identity': ('RegionOne', 'publicURL')}
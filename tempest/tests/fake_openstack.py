@@ -0,0 +1,263 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Local stand-in for the OpenStack APIs, used by the client benchmarks.
+
+Every service listens on its own port of 127.0.0.1. The identity service
+issues Keystone v2 and v3 tokens with a catalog of the compute, network,
+volume, image and object-store endpoints. Those answer the REST calls
+with canned resources: a GET on a collection lists items_per_list items,
+a GET on a resource returns it, a POST creates it and the other methods
+succeed with an empty body. Each response is delayed by latency seconds.
+No state is kept, so that the cost of a request never grows.
+"""
+
+import json
+import re
+import socket
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urlparse
+
+TENANT_ID = 'fake_tenant_id'
+USER_ID = 'fake_user_id'
+TOKEN = 'fake_token'
+REGION = 'RegionOne'
+EXPIRES = '2099-01-01T00:00:00Z'
+EXPIRES_V3 = '2099-01-01T00:00:00.000000Z'
+
+ID_RE = re.compile('^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+                   '[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{32})$')
+
+# Catalog type and path of the endpoint of the services behind identity
+SERVICES = (
+    ('compute', '/v2/%s' % TENANT_ID),
+    ('network', ''),
+    ('volume', '/v1/%s' % TENANT_ID),
+    ('image', ''),
+    ('object-store', '/v1/AUTH_%s' % TENANT_ID),
+)
+
+
+def resource(collection, index=0):
+    return {'id': '%08x-0000-4000-8000-%012x' % (index, index),
+            'name': '%s-%d' % (collection, index),
+            'status': 'ACTIVE',
+            'tenant_id': TENANT_ID,
+            'links': []}
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Canned answers to the REST calls of a service."""
+
+    protocol_version = 'HTTP/1.1'
+    latency = 0
+    items_per_list = 10
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        # Headers and body are written separately, avoid the delayed ACK
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def reply(self, status, body=None, headers=None):
+        if self.latency:
+            time.sleep(self.latency)
+        if body is None:
+            data = b''
+        elif isinstance(body, bytes):
+            data = body
+        else:
+            data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if data:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data and self.command != 'HEAD':
+            self.wfile.write(data)
+
+    def segments(self):
+        path = urlparse.urlsplit(self.path).path
+        return [segment for segment in path.split('/') if segment]
+
+    def handle_rest(self):
+        self.read_body()
+        segments = self.segments()
+        if segments and segments[-1] == 'detail':
+            segments = segments[:-1]
+        if len(segments) >= 2 and ID_RE.match(segments[-1]):
+            collection, item = segments[-2], segments[-1]
+        else:
+            collection, item = segments[-1] if segments else '', None
+        singular = collection[:-1] if collection.endswith('s') else collection
+        if self.command == 'GET' and item is None:
+            items = [resource(collection, index)
+                     for index in range(self.items_per_list)]
+            self.reply(200, {collection: items})
+        elif self.command == 'GET':
+            self.reply(200, {singular: dict(resource(collection), id=item)})
+        elif self.command == 'POST':
+            self.reply(202, {singular: resource(collection)})
+        elif self.command == 'PUT':
+            self.reply(200, {singular: resource(collection)})
+        else:
+            self.reply(204)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = do_PATCH = handle_rest
+
+
+class IdentityHandler(Handler):
+    """Keystone v2 and v3 tokens with the catalog of the services."""
+
+    # Type and endpoint URL of the services, set by FakeCloud
+    endpoints = ()
+
+    def catalog_v2(self):
+        return [{'type': service, 'name': service,
+                 'endpoints': [{'region': REGION, 'publicURL': url,
+                                'internalURL': url, 'adminURL': url}]}
+                for service, url in self.endpoints]
+
+    def catalog_v3(self):
+        return [{'type': service, 'id': service,
+                 'endpoints': [{'id': '%s-%s' % (service, interface),
+                                'interface': interface, 'region': REGION,
+                                'url': url}
+                               for interface in ('public', 'internal',
+                                                 'admin')]}
+                for service, url in self.endpoints]
+
+    def do_POST(self):
+        path = urlparse.urlsplit(self.path).path.rstrip('/')
+        if path.endswith('/tokens') and not path.endswith('/auth/tokens'):
+            self.read_body()
+            self.reply(200, {'access': {
+                'token': {'id': TOKEN, 'expires': EXPIRES,
+                          'tenant': {'id': TENANT_ID, 'name': 'fake_tenant'}},
+                'user': {'id': USER_ID, 'name': 'fake_user'},
+                'serviceCatalog': self.catalog_v2()}})
+        elif path.endswith('/auth/tokens'):
+            self.read_body()
+            domain = {'id': 'default', 'name': 'Default'}
+            self.reply(201, {'token': {
+                'methods': ['password'],
+                'expires_at': EXPIRES_V3,
+                'issued_at': '2014-01-01T00:00:00.000000Z',
+                'project': {'id': TENANT_ID, 'name': 'fake_tenant',
+                            'domain': domain},
+                'user': {'id': USER_ID, 'name': 'fake_user',
+                         'domain': domain},
+                'catalog': self.catalog_v3()}},
+                headers={'X-Subject-Token': TOKEN})
+        else:
+            self.handle_rest()
+
+
+class ObjectStoreHandler(Handler):
+    """Swift accounts, containers and objects."""
+
+    object_data = b'x' * 1024
+
+    def handle_rest(self):
+        self.read_body()
+        # v1, account, container, object
+        depth = len(self.segments())
+        if self.command in ('GET', 'HEAD') and depth == 2:
+            self.reply(200, [{'name': 'container-%d' % index, 'count': 0,
+                              'bytes': 0}
+                             for index in range(self.items_per_list)],
+                       headers={'X-Account-Container-Count':
+                                str(self.items_per_list),
+                                'X-Account-Object-Count': '0',
+                                'X-Account-Bytes-Used': '0'})
+        elif self.command in ('GET', 'HEAD') and depth == 3:
+            self.reply(200, [{'name': 'object-%d' % index,
+                              'bytes': len(self.object_data),
+                              'hash': 'fake_hash',
+                              'content_type': 'application/octet-stream'}
+                             for index in range(self.items_per_list)],
+                       headers={'X-Container-Object-Count':
+                                str(self.items_per_list)})
+        elif self.command == 'GET':
+            self.reply(200, self.object_data)
+        elif self.command in ('PUT', 'POST'):
+            self.reply(201)
+        else:
+            self.reply(204)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = handle_rest
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def _serve(handler):
+    server = Server(('127.0.0.1', 0), handler)
+    # A short poll interval so that stop() does not wait for long
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def _handler(base, latency, items_per_list):
+    # A subclass per server, BaseHTTPRequestHandler is a classic class on
+    # Python 2 so type() can not build it
+    class ServerHandler(base):
+        pass
+
+    ServerHandler.latency = latency
+    ServerHandler.items_per_list = items_per_list
+    return ServerHandler
+
+
+class FakeCloud(object):
+    """The servers of the services, started in threads of this process."""
+
+    def __init__(self, latency=0, items_per_list=10):
+        self.servers = []
+        endpoints = []
+        for service, path in SERVICES:
+            base = ObjectStoreHandler if service == 'object-store' else Handler
+            server = _serve(_handler(base, latency, items_per_list))
+            self.servers.append(server)
+            endpoints.append((service, 'http://127.0.0.1:%d%s' % (
+                server.server_address[1], path)))
+        identity = _serve(_handler(IdentityHandler, latency, items_per_list))
+        self.servers.append(identity)
+        url = 'http://127.0.0.1:%d' % identity.server_address[1]
+        endpoints.append(('identity', url + '/v2.0'))
+        identity.RequestHandlerClass.endpoints = tuple(endpoints)
+        self.uri = url + '/v2.0'
+        self.uri_v3 = url + '/v3'
+
+    def stop(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
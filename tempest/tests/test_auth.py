@@ -14,6 +14,11 @@
 #    under the License.
 
 import copy
+import datetime
+import time
+
+import fixtures
+import mock
 
 from tempest import auth
 from tempest.common import http
@@ -117,6 +122,19 @@ class TestKeystoneV2AuthProvider(BaseAuthTestsSetUp):
     def _get_token_from_fake_identity(self):
         return fake_identity.TOKEN
 
+    def _get_auth_data_with_urls(self):
+        access = copy.deepcopy(fake_identity.IDENTITY_V2_RESPONSE['access'])
+        for i, ep in enumerate(access['serviceCatalog'][0]['endpoints']):
+            ep['publicURL'] = 'http://fake_url/%d' % i
+        return fake_identity.TOKEN, access
+
+    def _get_tenant_id_from_fake_identity(self):
+        return 'fake_tenant_id'
+
+    def test_get_tenant_id(self):
+        self.assertEqual(self._get_tenant_id_from_fake_identity(),
+                         self.auth_provider.get_tenant_id())
+
     def _test_request_helper(self):
         filters = {
             'service': 'compute',
@@ -166,6 +184,66 @@ class TestKeystoneV2AuthProvider(BaseAuthTestsSetUp):
                           self.auth_provider.auth_request, 'GET',
                           'http://fakeurl.com/fake_api', filters=filters)
 
+    def test_base_url_is_memoized(self):
+        filters = {
+            'service': 'compute',
+            'endpoint_type': 'publicURL',
+            'region': 'FakeRegion'
+        }
+        self.useFixture(mockpatch.PatchObject(self.auth_provider,
+                                              'is_expired',
+                                              return_value=False))
+        base_url = self.auth_provider.base_url(filters)
+        self.assertEqual(self._get_result_url_from_fake_identity(), base_url)
+        index_catalog = self.useFixture(mockpatch.PatchObject(
+            self.auth_provider, '_index_catalog')).mock
+        self.assertEqual(base_url, self.auth_provider.base_url(filters))
+        self.assertFalse(index_catalog.called)
+
+    def test_base_url_of_region(self):
+        auth_data = self._get_auth_data_with_urls()
+        filters = {
+            'service': 'compute',
+            'endpoint_type': 'publicURL',
+        }
+        for region, url in (('FakeRegion', 'http://fake_url/1'),
+                            ('BadRegion', 'http://fake_url/0'),
+                            (None, 'http://fake_url/0')):
+            filters['region'] = region
+            self.assertEqual(url,
+                             self.auth_provider.base_url(filters, auth_data))
+
+    def test_base_url_memo_is_cleared_with_auth(self):
+        filters = {
+            'service': 'compute',
+            'endpoint_type': 'publicURL',
+            'region': 'FakeRegion'
+        }
+        self.auth_provider.base_url(filters)
+        self.assertNotEqual({}, self.auth_provider._base_urls)
+        self.auth_provider.clear_auth()
+        self.assertEqual({}, self.auth_provider._base_urls)
+        self.assertIsNone(self.auth_provider._catalog)
+
+    def test_expiry_is_parsed_once(self):
+        get_expiry = self.useFixture(mockpatch.PatchObject(
+            self.auth_provider, 'get_expiry',
+            return_value=datetime.datetime.now() + datetime.timedelta(1)))
+        self.auth_provider.get_token()
+        self.auth_provider.get_token()
+        self.assertEqual(1, get_expiry.mock.call_count)
+        self.assertEqual(0, self.auth_provider.refresh_count)
+
+    def test_token_is_refreshed_within_refresh_window(self):
+        self.auth_provider.refresh_window = 3600
+        self.useFixture(mockpatch.PatchObject(
+            self.auth_provider, 'get_expiry',
+            return_value=datetime.datetime.now() +
+            datetime.timedelta(minutes=30)))
+        self.auth_provider.get_token()
+        self.auth_provider.get_token()
+        self.assertEqual(1, self.auth_provider.refresh_count)
+
     def test_check_credentials_missing_attribute(self):
         for attr in ['username', 'password']:
             cred = copy.copy(self.credentials)
@@ -204,7 +282,77 @@ class TestKeystoneV3AuthProvider(TestKeystoneV2AuthProvider):
     def _get_result_url_from_fake_identity(self):
         return fake_identity.COMPUTE_ENDPOINTS_V3['endpoints'][1]['url']
 
+    def _get_auth_data_with_urls(self):
+        access = copy.deepcopy(fake_identity.IDENTITY_V3_RESPONSE['token'])
+        for i, ep in enumerate(access['catalog'][0]['endpoints']):
+            ep['url'] = 'http://fake_url/%d' % i
+        return fake_identity.TOKEN, access
+
+    def _get_tenant_id_from_fake_identity(self):
+        return 'project_id'
+
     def test_check_credentials_missing_tenant_name(self):
         cred = copy.copy(self.credentials)
         del cred['domain_name']
         self.assertFalse(self.auth_provider.check_credentials(cred))
+
+
+class TestTokenCache(BaseAuthTestsSetUp):
+    _auth_provider_class = auth.KeystoneV2AuthProvider
+
+    def setUp(self):
+        super(TestTokenCache, self).setUp()
+        self.stubs.Set(http.ClosingHttp, 'request',
+                       fake_identity._fake_v2_response)
+        self.expiry = time.time() + 3600
+        self.get_expiry = lambda auth_data: self.expiry
+        self.get_auth = mock.Mock(side_effect=self._fake_auth)
+
+    def _fake_auth(self):
+        return (fake_identity.TOKEN,
+                fake_identity.IDENTITY_V2_RESPONSE['access'])
+
+    def test_auth_data_are_cached(self):
+        cache = auth.TokenCache()
+        auth_data = cache.get_auth('key', self.get_auth, self.get_expiry)
+        self.assertEqual(auth_data,
+                         cache.get_auth('key', self.get_auth, self.get_expiry))
+        self.assertEqual(1, self.get_auth.call_count)
+
+    def test_auth_data_within_expiry_margin_are_refreshed(self):
+        cache = auth.TokenCache(expiry_margin=3600)
+        cache.get_auth('key', self.get_auth, self.get_expiry)
+        cache.get_auth('key', self.get_auth, self.get_expiry)
+        self.assertEqual(2, self.get_auth.call_count)
+
+    def test_invalidate(self):
+        cache = auth.TokenCache()
+        auth_data = cache.get_auth('key', self.get_auth, self.get_expiry)
+        cache.invalidate('key', auth_data)
+        cache.get_auth('key', self.get_auth, self.get_expiry)
+        self.assertEqual(2, self.get_auth.call_count)
+
+    def test_file_backed_cache_is_shared(self):
+        lock_path = self.useFixture(fixtures.TempDir()).path
+        auth.TokenCache(lock_path=lock_path).get_auth(
+            'key', self.get_auth, self.get_expiry)
+        auth_data = auth.TokenCache(lock_path=lock_path).get_auth(
+            'key', self.get_auth, self.get_expiry)
+        self.assertEqual(fake_identity.TOKEN, auth_data[0])
+        self.assertEqual(1, self.get_auth.call_count)
+
+    def test_providers_share_tokens(self):
+        self.stubs.Set(auth, '_token_cache', auth.TokenCache())
+        self.useFixture(mockpatch.PatchObject(
+            auth.KeystoneV2AuthProvider, 'get_expiry',
+            return_value=datetime.datetime.now() + datetime.timedelta(1)))
+        providers = []
+        for _ in range(2):
+            provider = self._auth(self.credentials)
+            provider.token_cache = auth.get_token_cache()
+            providers.append(provider)
+        fetch_auth = self.useFixture(mockpatch.PatchObject(
+            auth.KeystoneV2AuthProvider, '_fetch_auth',
+            side_effect=self._fake_auth)).mock
+        self.assertEqual(providers[0].get_token(), providers[1].get_token())
+        self.assertEqual(1, fetch_auth.call_count)
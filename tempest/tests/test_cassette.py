@@ -0,0 +1,194 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+
+import httplib2
+
+from tempest import auth
+from tempest.common import cassette
+from tempest.common import http
+from tempest import config
+from tempest import exceptions
+from tempest.tests import base
+from tempest.tests import fake_config
+from tempest.tests import fake_identity
+
+
+class TestCassette(base.TestCase):
+
+    url = 'http://fake_host:8774/v2/servers'
+    server_url = url + '/0123456789abcdef0123456789abcdef'
+
+    def setUp(self):
+        super(TestCassette, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.cassette_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cassette_dir)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        self.stubs.Set(self.conf, 'cassette_dir', self.cassette_dir)
+        self.stubs.Set(cassette, '_cassettes', {})
+        self.stubs.Set(cassette, '_current', None)
+        self.stubs.Set(cassette, '_name', cassette.DEFAULT_CASSETTE)
+        self.http_request = self.patch('httplib2.Http.request')
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200',
+                               'content-type': 'application/json'}),
+            '{"servers": []}')
+        self.http = http.ClosingHttp()
+
+    def _record(self, name='test_one'):
+        self.stubs.Set(self.conf, 'cassette_mode', 'record')
+        cassette.use(name)
+        resp, body = self.http.request(self.url, 'GET')
+        self.http_request.return_value = (
+            httplib2.Response({'status': '404'}), '')
+        self.http.request(self.server_url, 'DELETE')
+        cassette.use('other_test')
+        self.assertEqual(2, self.http_request.call_count)
+        self.stubs.Set(cassette, '_cassettes', {})
+        self.stubs.Set(cassette, '_current', None)
+        self.stubs.Set(self.conf, 'cassette_mode', 'replay')
+        cassette.use(name)
+        return resp, body
+
+    def test_record_replay(self):
+        recorded_resp, recorded_body = self._record()
+        self.assertTrue(os.path.exists(
+            os.path.join(self.cassette_dir, 'test_one.json')))
+        resp, body = self.http.request(self.url, 'GET')
+        self.assertEqual(recorded_body, body)
+        self.assertEqual(200, resp.status)
+        self.assertEqual('application/json', resp['content-type'])
+        resp, body = self.http.request(self.server_url, 'DELETE')
+        self.assertEqual(404, resp.status)
+        self.assertEqual('', body)
+        self.assertEqual(2, self.http_request.call_count)
+
+    def test_replay_url_template(self):
+        self._record()
+        resp, _ = self.http.request(
+            self.url + '/fedcba9876543210fedcba9876543210', 'DELETE')
+        self.assertEqual(404, resp.status)
+
+    def test_replayed_once(self):
+        self._record()
+        self.http.request(self.url, 'GET')
+        self.assertRaises(exceptions.UnrecordedRequest,
+                          self.http.request, self.url, 'GET')
+
+    def test_unrecorded(self):
+        self._record()
+        self.assertRaises(exceptions.UnrecordedRequest,
+                          self.http.request, self.url, 'POST')
+
+    def test_binary_body(self):
+        self.stubs.Set(self.conf, 'cassette_mode', 'record')
+        cassette.use('test_binary')
+        cassette.record('GET', self.url, 200, {}, b'\xff\x00')
+        cassette.save()
+        replayed = cassette.Cassette.load(
+            'test_binary', os.path.join(self.cassette_dir, 'test_binary.json'))
+        self.assertEqual((200, {}, b'\xff\x00'),
+                         replayed.play('GET', self.url))
+
+    def test_disabled(self):
+        self.http.request(self.url, 'GET')
+        self.assertIsNone(cassette.current_name())
+
+    def test_use_does_not_load_config(self):
+        self.stubs.Set(config, 'TempestConfigPrivate', None)
+        cassette.use('test_one')
+        cassette.use('other_test')
+        self.assertIsNone(cassette.current_name())
+
+    def test_replayed_token_not_expired(self):
+        token = copy.deepcopy(fake_identity.IDENTITY_V2_RESPONSE)
+        token['access']['token']['expires'] = '2000-01-01T00:00:00Z'
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200'}), json.dumps(token))
+        credentials = {'username': 'fake_user', 'password': 'fake_pwd',
+                       'tenant_name': 'fake_tenant'}
+        self.stubs.Set(self.conf, 'cassette_mode', 'record')
+        cassette.use('test_token')
+        auth.KeystoneV2AuthProvider(credentials).get_token()
+        cassette.use('other_test')
+        self.stubs.Set(cassette, '_cassettes', {})
+        self.stubs.Set(cassette, '_current', None)
+        self.stubs.Set(self.conf, 'cassette_mode', 'replay')
+        cassette.use('test_token')
+        provider = auth.KeystoneV2AuthProvider(credentials)
+        # The token recorded once is replayed once, requesting it again
+        # would fail with UnrecordedRequest
+        for _ in range(3):
+            self.assertEqual(cassette.REDACTED_TOKEN, provider.get_token())
+        self.assertFalse(provider.is_expired(provider.auth_data))
+        self.assertEqual(1, self.http_request.call_count)
+
+    def test_recorded_token_redacted(self):
+        self.stubs.Set(self.conf, 'cassette_mode', 'record')
+        cassette.use('test_token')
+        token_url = 'http://fake_host:5000/v3/auth/tokens'
+        cassette.record('POST', token_url, 201,
+                        {'x-subject-token': fake_identity.TOKEN},
+                        json.dumps(fake_identity.IDENTITY_V3_RESPONSE))
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200'}),
+            json.dumps(fake_identity.IDENTITY_V2_RESPONSE))
+        resp, body = self.http.request(
+            'http://fake_host:5000/v2.0/tokens', 'POST')
+        # The response of the client keeps its token
+        self.assertEqual(fake_identity.TOKEN,
+                         json.loads(body)['access']['token']['id'])
+        cassette.save()
+        with open(os.path.join(self.cassette_dir, 'test_token.json')) as f:
+            recorded = f.read()
+        self.assertNotIn(fake_identity.TOKEN, recorded)
+        v3, v2 = json.loads(recorded)
+        self.assertEqual(cassette.REDACTED_TOKEN,
+                         v3['headers']['x-subject-token'])
+        self.assertEqual(cassette.REDACTED_TOKEN,
+                         json.loads(v2['body'])['access']['token']['id'])
+
+    def test_cassettes_dropped(self):
+        self.stubs.Set(self.conf, 'cassette_mode', 'record')
+        cassette.use('tests.Class')
+        self.http.request(self.url, 'GET')
+        cassette.use('tests.Class.test_one')
+        self.http.request(self.url, 'GET')
+        self.assertEqual(['tests.Class', 'tests.Class.test_one'],
+                         sorted(cassette._cassettes))
+        cassette.use('tests.Class')
+        self.http.request(self.url, 'GET')
+        self.assertEqual(['tests.Class'], list(cassette._cassettes))
+        self.assertEqual(2, len(cassette.current().interactions))
+        cassette.use('tests.OtherClass')
+        self.assertEqual({}, cassette._cassettes)
+
+
+class TestReplayedResponse(base.TestCase):
+
+    def test_read(self):
+        resp = cassette.ReplayedResponse(
+            200, {'content-type': 'text/plain'}, b'abcde')
+        self.assertEqual('text/plain', resp.getheader('Content-Type'))
+        self.assertIsNone(resp.getheader('etag'))
+        self.assertEqual(b'ab', resp.read(2))
+        self.assertEqual(b'cde', resp.read())
+        self.assertEqual(b'', resp.read(2))
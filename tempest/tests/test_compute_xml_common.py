@@ -65,3 +65,158 @@ class TestXMLParser(base.TestCase):
           </health_monitor>''')
         body = common.xml_to_json(node, 'elements')
         self.assertEqual(body['elements'], ['first_element', 'second_element'])
+
+
+def legacy_xml_to_json(node, plurals=None):
+    """The recursive conversion xml_to_json is checked against."""
+    json = {}
+    bool_flag = False
+    int_flag = False
+    long_flag = False
+    for attr in node.keys():
+        if not attr.startswith("xmlns"):
+            json[attr] = node.get(attr)
+            if json[attr] == 'bool':
+                bool_flag = True
+            elif json[attr] == 'int':
+                int_flag = True
+            elif json[attr] == 'long':
+                long_flag = True
+    if not node.getchildren():
+        if bool_flag:
+            return node.text == 'True'
+        elif int_flag:
+            return int(node.text)
+        elif long_flag:
+            return long(node.text)
+        else:
+            return node.text or json
+    for child in node.getchildren():
+        tag = child.tag
+        if tag.startswith("{"):
+            ns, tag = tag.split("}", 1)
+        if plurals is not None and tag in plurals:
+            json[tag] = [legacy_xml_to_json(item, plurals)
+                         for item in child.getchildren()]
+        else:
+            json[tag] = legacy_xml_to_json(child, plurals)
+    return json
+
+
+class TestXMLParserParity(base.TestCase):
+
+    fixtures = [
+        ('''<health_monitor
+        xmlns="http://openstack.org/quantum/api/v2.0"
+         xmlns:quantum="http://openstack.org/quantum/api/v2.0"
+          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+           <admin_state_up quantum:type="bool">False</admin_state_up>
+          <fake_state_up quantum:type="bool">True</fake_state_up>
+          </health_monitor>''', None),
+        ('''<health_monitor
+        xmlns="http://openstack.org/quantum/api/v2.0"
+         xmlns:quantum="http://openstack.org/quantum/api/v2.0"
+          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+          <delay quantum:type="long">4</delay>
+          <max_retries quantum:type="int">3</max_retries>
+          </health_monitor>''', None),
+        ('''<health_monitor
+        xmlns="http://openstack.org/quantum/api/v2.0"
+         xmlns:quantum="http://openstack.org/quantum/api/v2.0"
+          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+          <status>ACTIVE</status>
+          </health_monitor>''', None),
+        ('''<health_monitor
+        xmlns="http://openstack.org/quantum/api/v2.0"
+         xmlns:quantum="http://openstack.org/quantum/api/v2.0"
+          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+          <elements>
+          <element>first_element</element>
+          <element>second_element</element>
+          </elements>
+          </health_monitor>''', 'elements'),
+        ('''<servers xmlns="http://docs.openstack.org/compute/api/v1.1"
+          xmlns:atom="http://www.w3.org/2005/Atom">
+          <server id="1" name="first">
+            <image id="2"><atom:link href="http://x/2" rel="bookmark"/>
+            </image>
+            <metadata><meta key="a">b</meta><meta key="c"/></metadata>
+            <addresses>
+              <network id="private"><ip version="4" addr="10.0.0.2"/></network>
+            </addresses>
+            <progress type="int">0</progress>
+            <locked type="bool" other="int">True</locked>
+            <empty/>
+          </server>
+          <server id="2" name="second" status="ACTIVE"/>
+          </servers>''', ['addresses', 'metadata']),
+    ]
+
+    def test_xml_to_json_parity(self):
+        for document, plurals in self.fixtures:
+            node = etree.fromstring(document)
+            self.assertEqual(legacy_xml_to_json(node, plurals),
+                             common.xml_to_json(node, plurals))
+            self.assertEqual(legacy_xml_to_json(node),
+                             common.xml_to_json(node))
+
+    def test_parse_array_parity(self):
+        for document, plurals in self.fixtures:
+            node = etree.fromstring(document)
+            self.assertEqual([legacy_xml_to_json(child, plurals)
+                              for child in node.getchildren()],
+                             common.parse_array(node, plurals))
+
+    def test_xml_to_json_plurals_string(self):
+        # A string is matched by substring, as it always was
+        node = etree.fromstring(self.fixtures[4][0])
+        body = common.xml_to_json(node, 'servers addresses')
+        self.assertEqual(legacy_xml_to_json(node, 'servers addresses'), body)
+        self.assertIsInstance(body['server'], list)
+
+
+class TestXMLSerializer(base.TestCase):
+
+    def test_element_str(self):
+        server = common.Element('server', name='fake', imageRef=None)
+        server.add_attr('flavorRef', 1)
+        metadata = common.Element('metadata')
+        metadata.append(common.Element('meta', common.Text('value'),
+                                       key='key'))
+        server.append(metadata)
+        server.append(common.Element('empty'))
+        attrs = ' '.join('%s="%s"' % (k, v if v is not None else '')
+                         for k, v in server.attributes())
+        self.assertEqual('<server %s><metadata ><meta key="key">value</meta>'
+                         '</metadata><empty /></server>' % attrs, str(server))
+
+    def test_document_str(self):
+        document = common.Document(common.Element('volume', size=1))
+        self.assertEqual('<?xml version="1.0" encoding="UTF-8"?>\n'
+                         '<volume size="1"/>', str(document))
+
+    def test_attribute_escaped(self):
+        element = common.Element('meta', key='a&b<"c">')
+        self.assertEqual('<meta key="a&amp;b&lt;&quot;c&quot;>"/>',
+                         str(element))
+        node = etree.fromstring(str(element))
+        self.assertEqual('a&b<"c">', node.get('key'))
+
+    def test_text_not_escaped(self):
+        element = common.Element('meta', common.Text('a &amp; b'), key='k')
+        self.assertEqual('<meta key="k">a &amp; b</meta>', str(element))
+
+    def test_getitem_first_match(self):
+        first = common.Element('meta', key='first')
+        element = common.Element('metadata', first,
+                                 common.Element('meta', key='second'))
+        element.append(common.Element('link'))
+        self.assertIs(first, element['meta'])
+        self.assertEqual('link', element['link'].element_name)
+        self.assertRaises(KeyError, element.__getitem__, 'missing')
+
+    def test_deep_dict_to_xml(self):
+        element = common.Element('metadata')
+        common.deep_dict_to_xml(element, {'a': {'b': 'c'}})
+        self.assertEqual('<metadata ><a ><b >c</b></a></metadata>',
+                         str(element))
@@ -0,0 +1,70 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+from tempest import auth
+from tempest.common import rest_client
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+from tempest.tests import fake_openstack
+
+
+class TestFakeOpenStack(base.TestCase):
+
+    credentials = {'username': 'fake_user', 'password': 'fake_password',
+                   'tenant_name': 'fake_tenant'}
+
+    def setUp(self):
+        super(TestFakeOpenStack, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.cloud = fake_openstack.FakeCloud(items_per_list=3)
+        self.addCleanup(self.cloud.stop)
+        identity = fake_config.FakeConfig.fake_identity
+        self.stubs.Set(identity, 'uri', self.cloud.uri)
+        self.stubs.Set(identity, 'uri_v3', self.cloud.uri_v3)
+        self.stubs.Set(fake_config.FakeConfig, 'service_index', dict(
+            (service, ('RegionOne', 'publicURL'))
+            for service, _ in fake_openstack.SERVICES + (('identity', ''),)))
+
+    def _get(self, auth_provider, service, url):
+        client = rest_client.RestClient(auth_provider)
+        client.service = service
+        resp, body = client.get(url)
+        return resp, json.loads(body)
+
+    def test_v2(self):
+        auth_provider = auth.KeystoneV2AuthProvider(self.credentials)
+        self.assertEqual(self.cloud.uri, auth_provider.base_url(
+            {'service': 'identity', 'endpoint_type': 'publicURL'}))
+        resp, body = self._get(auth_provider, 'compute', 'servers/detail')
+        self.assertEqual(200, resp.status)
+        self.assertEqual(3, len(body['servers']))
+
+    def test_v3(self):
+        auth_provider = auth.KeystoneV3AuthProvider(
+            dict(self.credentials, domain_name='Default'))
+        server_id = fake_openstack.resource('servers')['id']
+        resp, body = self._get(auth_provider, 'compute',
+                               'servers/%s' % server_id)
+        self.assertEqual(server_id, body['server']['id'])
+
+    def test_object_store(self):
+        auth_provider = auth.KeystoneV2AuthProvider(self.credentials)
+        resp, body = self._get(auth_provider, 'object-store', '?format=json')
+        self.assertEqual('3', resp['x-account-container-count'])
+        self.assertEqual(['container-0', 'container-1', 'container-2'],
+                         [container['name'] for container in body])
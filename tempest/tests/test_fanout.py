@@ -0,0 +1,79 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import functools
+import threading
+import time
+
+from tempest.common import fanout
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestFanout(base.TestCase):
+
+    def setUp(self):
+        super(TestFanout, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(fanout, '_service_semaphores', {})
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _call(self, value, service=None):
+        with fanout.service_slot(service):
+            with self.lock:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+            time.sleep(0.01)
+            with self.lock:
+                self.running -= 1
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def _calls(self, values, service=None):
+        return [functools.partial(self._call, value, service)
+                for value in values]
+
+    def test_results_are_ordered(self):
+        self.assertEqual(list(range(10)),
+                         fanout.run(self._calls(range(10)), max_workers=4))
+        self.assertTrue(1 < self.max_running <= 4)
+
+    def test_first_error_is_raised(self):
+        calls = self._calls([1, ValueError('first'), KeyError('second')])
+        e = self.assertRaises(ValueError, fanout.run, calls)
+        self.assertEqual('first', str(e))
+
+    def test_return_exceptions(self):
+        error = ValueError()
+        self.assertEqual([1, error, 3],
+                         fanout.run(self._calls([1, error, 3]),
+                                    return_exceptions=True))
+
+    def test_serial(self):
+        self.assertEqual([1, 2], fanout.run(self._calls([1, 2]),
+                                            max_workers=1))
+        self.assertEqual(1, self.max_running)
+
+    def test_service_cap(self):
+        fake_config.FakeConfig.service_clients.max_concurrent_requests = {
+            'compute': '2'}
+        self.addCleanup(setattr, fake_config.FakeConfig.service_clients,
+                        'max_concurrent_requests', {})
+        fanout.run(self._calls(range(8), 'compute'), max_workers=8)
+        self.assertEqual(2, self.max_running)
@@ -0,0 +1,201 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import io
+import socket
+
+import httplib2
+import mock
+from six.moves import http_client
+
+from tempest.common import http
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestPooledHttp(base.TestCase):
+
+    url = 'http://fake_host:8774/v2/servers'
+
+    def setUp(self):
+        super(TestPooledHttp, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.http_request = self.patch('httplib2.Http.request')
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200'}), 'fake_body')
+        self.pool = http.PooledHttp(maxsize=2, idle_timeout=30)
+
+    def test_pool_key(self):
+        self.assertEqual(('http', 'fake_host', 8774),
+                         self.pool.pool_key(self.url))
+        self.assertEqual(('https', 'fake_host', 443),
+                         self.pool.pool_key('https://fake_host/v2'))
+
+    def test_connection_is_reused(self):
+        self.pool.request(self.url, 'GET')
+        self.assertEqual(1, self.pool.size(self.url))
+        _, reused = self.pool._acquire(self.pool.pool_key(self.url))
+        self.assertTrue(reused)
+        self.assertEqual(0, self.pool.size())
+
+    def test_max_size_per_host(self):
+        key = self.pool.pool_key(self.url)
+        for _ in range(3):
+            self.pool._release(key, httplib2.Http())
+        self.assertEqual(2, self.pool.size(self.url))
+
+    def test_idle_connections_are_evicted(self):
+        self.pool.request(self.url, 'GET')
+        with mock.patch('time.time', return_value=10 ** 10):
+            _, reused = self.pool._acquire(self.pool.pool_key(self.url))
+        self.assertFalse(reused)
+
+    def test_connection_close_is_not_pooled(self):
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200', 'connection': 'close'}), '')
+        self.pool.request(self.url, 'GET')
+        self.assertEqual(0, self.pool.size())
+
+    def test_stale_connection_is_retried(self):
+        self.pool.request(self.url, 'GET')
+        ok = self.http_request.return_value
+        self.http_request.side_effect = [socket.error('reset'), ok]
+        resp, body = self.pool.request(self.url, 'GET')
+        self.assertEqual('fake_body', body)
+        self.assertEqual(3, self.http_request.call_count)
+
+    def test_stale_post_is_not_retried(self):
+        self.pool.request(self.url, 'GET')
+        self.http_request.side_effect = socket.error('reset')
+        self.assertRaises(socket.error, self.pool.request, self.url, 'POST',
+                          body='{}')
+        self.assertEqual(2, self.http_request.call_count)
+        self.assertEqual(0, self.pool.size())
+
+    def test_unanswered_post_is_retried(self):
+        self.pool.request(self.url, 'GET')
+        ok = self.http_request.return_value
+        self.http_request.side_effect = [http_client.BadStatusLine(''), ok]
+        resp, body = self.pool.request(self.url, 'POST', body='{}')
+        self.assertEqual('fake_body', body)
+        self.assertEqual(3, self.http_request.call_count)
+
+    def test_connection_closed_on_error(self):
+        self.pool.request(self.url, 'GET')
+        self.http_request.side_effect = httplib2.ServerNotFoundError()
+        close = self.patch('tempest.common.http.PooledHttp._close')
+        self.assertRaises(httplib2.ServerNotFoundError, self.pool.request,
+                          self.url, 'GET')
+        self.assertEqual(1, close.call_count)
+        self.assertEqual(0, self.pool.size())
+
+    def test_new_connection_error_is_not_retried(self):
+        self.http_request.side_effect = socket.error('refused')
+        self.assertRaises(socket.error, self.pool.request, self.url, 'GET')
+        self.assertEqual(1, self.http_request.call_count)
+
+    def test_shared_pool(self):
+        self.assertIs(http.get_pooled_http(maxsize=3),
+                      http.get_pooled_http(maxsize=3))
+        self.assertIsNot(http.get_pooled_http(maxsize=3),
+                         http.get_pooled_http(maxsize=4))
+
+
+class TestResponseBodyStream(base.TestCase):
+
+    data = b'x' * 1000 + b'y' * 500
+
+    def setUp(self):
+        super(TestResponseBodyStream, self).setUp()
+        self.response = io.BytesIO(self.data)
+        self.connection = mock.Mock()
+        self.stream = http.ResponseBodyStream(self.response, self.connection,
+                                              chunk_size=300)
+        self.closed = mock.Mock()
+        self.stream.on_close.append(self.closed)
+
+    def test_iter_chunks(self):
+        chunks = list(self.stream)
+        self.assertEqual(5, len(chunks))
+        self.assertTrue(all(len(chunk) <= 300 for chunk in chunks))
+        self.assertEqual(self.data, b''.join(chunks))
+        self.assertEqual(len(self.data), self.stream.length)
+        self.assertEqual(hashlib.md5(self.data).hexdigest(), self.stream.md5)
+        self.assertTrue(self.stream.closed)
+        self.connection.close.assert_called_once_with()
+        self.closed.assert_called_once_with(self.stream)
+
+    def test_read(self):
+        self.assertEqual(self.data[:10], self.stream.read(10))
+        self.assertEqual(self.data[10:], self.stream.read())
+        self.assertEqual(b'', self.stream.read())
+        self.assertEqual(hashlib.md5(self.data).hexdigest(), self.stream.md5)
+        self.assertEqual(1, self.closed.call_count)
+
+    def test_close(self):
+        with self.stream as stream:
+            stream.read(10)
+        self.assertEqual(10, self.stream.length)
+        self.assertEqual(b'', self.stream.read(10))
+        self.closed.assert_called_once_with(self.stream)
+
+
+class TestLogBody(base.TestCase):
+
+    def setUp(self):
+        super(TestLogBody, self).setUp()
+        self.log = mock.Mock()
+        self.log.isEnabledFor.return_value = True
+
+    def test_debug_disabled(self):
+        self.log.isEnabledFor.return_value = False
+        body = mock.MagicMock()
+        http.log_body(self.log, 'Body', body, 10)
+        self.assertFalse(self.log.debug.called)
+        self.assertFalse(body.__str__.called)
+
+    def test_small_body(self):
+        http.log_body(self.log, 'Body', 'fake_body', 10)
+        self.log.debug.assert_called_once_with('%s: %s', 'Body', 'fake_body')
+
+    def test_large_body(self):
+        body = 'x' * 20
+        http.log_body(self.log, 'Body', body, 10)
+        self.log.debug.assert_any_call('%s: %s', 'Body', 'x' * 10)
+        self.log.debug.assert_any_call(
+            "Large body (%d) md5 summary: %s", 20,
+            hashlib.md5(body.encode('utf-8')).hexdigest())
+
+    def test_large_text_body(self):
+        body = u'\xe9' * (http.CHUNK_SIZE + 1)
+        http.log_body(self.log, 'Body', body, 10)
+        self.log.debug.assert_any_call(
+            "Large body (%d) md5 summary: %s", len(body),
+            hashlib.md5(body.encode('utf-8')).hexdigest())
+
+    def test_limit_disabled(self):
+        http.log_body(self.log, 'Body', 'fake_body', 0)
+        self.assertFalse(self.log.debug.called)
+
+    def test_safe_headers(self):
+        token = 'a' * 65
+        headers = {'X-Auth-Token': token}
+        self.assertEqual({'X-Auth-Token': '<Token omitted>'},
+                         http.safe_headers(headers))
+        self.assertEqual(token, headers['X-Auth-Token'])
+        self.assertEqual({'X-Auth-Token': 'short'},
+                         http.safe_headers({'X-Auth-Token': 'short'}))
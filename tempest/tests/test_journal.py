@@ -0,0 +1,199 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+
+import fixtures
+import httplib2
+import mock
+
+from tempest.common import journal
+from tempest.common import rest_client
+from tempest.common import sweeper
+from tempest import config
+from tempest import exceptions
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestJournal(base.TestCase):
+
+    def setUp(self):
+        super(TestJournal, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path,
+                            'journal.db')
+        self.stubs.Set(self.conf, 'resource_journal', path)
+        self.stubs.Set(journal, '_connection', None)
+        self.stubs.Set(journal, '_test', 'test_boot')
+        auth_provider = mock.Mock()
+        auth_provider.get_tenant_id.return_value = 'demo-id'
+        self.client = rest_client.RestClient(auth_provider)
+        self.client.service = 'compute'
+
+    def _respond(self, method, url, status, body=None):
+        resp = httplib2.Response({'status': str(status)})
+        journal.journal_response(self.client, method, url, resp,
+                                 json.dumps(body) if body else '')
+        return resp
+
+    def _entries(self):
+        return journal.open_entries(journal._get_connection())
+
+    def test_create(self):
+        resp = self._respond('POST', 'servers', 202,
+                             {'server': {'id': '42', 'tenant_id': 't1'}})
+        self._respond('POST', 'os-keypairs', 200,
+                      {'keypair': {'name': 'key'}})
+        self._respond('POST', 'servers/42/action', 202)
+        entries = self._entries()
+        self.assertEqual(1, len(entries))
+        self.assertEqual(('servers', '42', 'servers/42', 't1', 'test_boot',
+                          self.client.filters),
+                         tuple(entries[0][key] for key in
+                               ('resource_type', 'resource_id', 'path',
+                                'tenant', 'test', 'filters')))
+        # The client finds the body decoded
+        self.assertEqual({'id': '42', 'tenant_id': 't1'},
+                         resp.decoded_body[1])
+
+    def test_unwrapped_body(self):
+        self._respond('POST', 'v2/images', 201, {'id': 'i1', 'name': 'x'})
+        self.assertEqual([('images', 'v2/images/i1', 'demo-id')],
+                         [(entry['resource_type'], entry['path'],
+                           entry['tenant']) for entry in self._entries()])
+
+    def test_delete(self):
+        for server_id in ('1', '2', '3'):
+            self._respond('POST', 'servers', 202,
+                          {'server': {'id': server_id}})
+        self._respond('DELETE', 'servers/1', 204)
+        self._respond('DELETE', 'servers/2', 404)
+        self._respond('DELETE', 'servers/3', 409)
+        self.assertEqual(['3'], [entry['resource_id']
+                                 for entry in self._entries()])
+
+    def test_disabled(self):
+        self.stubs.Set(self.conf, 'resource_journal', None)
+        self._respond('POST', 'servers', 202, {'server': {'id': '42'}})
+        self.assertIsNone(journal._connection)
+
+
+class FakeSweepClient(object):
+    """Records the requests of the sweeper in order."""
+
+    build_timeout = 10
+    build_interval = 1
+
+    def __init__(self, requests, existing):
+        self.requests = requests
+        self.existing = existing
+
+    def delete(self, path):
+        self.requests.append(('DELETE', path))
+        if path not in self.existing:
+            raise exceptions.NotFound()
+        if not path.startswith('servers'):
+            self.existing.discard(path)
+
+    def get(self, path):
+        self.requests.append(('GET', path))
+        if path.startswith('v2.0/ports'):
+            return {}, [{'id': 'p1',
+                         'device_owner': 'network:router_interface'}]
+        if path not in self.existing:
+            raise exceptions.NotFound()
+        # The servers are gone once polled
+        self.existing.discard(path)
+        return {}, {}
+
+    def put(self, path, body):
+        self.requests.append(('PUT', path))
+
+    def _parse_resp(self, body):
+        return body
+
+
+class TestSweeper(base.TestCase):
+
+    def setUp(self):
+        super(TestSweeper, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.patch('time.sleep')
+        self.connection = journal.connect(os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'journal.db'))
+        self.stubs.Set(journal, '_get_connection', lambda: self.connection)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        self.stubs.Set(self.conf, 'resource_journal', 'journal.db')
+        self.requests = []
+        self.existing = set()
+        self.client = FakeSweepClient(self.requests, self.existing)
+        self.stubs.Set(sweeper, '_SweepClient', lambda *args: self.client)
+
+    def _record(self, resource_type, path, service='network'):
+        journal.record(service, resource_type, path.rsplit('/', 1)[-1], path,
+                       filters=dict(service=service))
+        self.existing.add(path)
+
+    def _position(self, method, path):
+        return self.requests.index((method, path))
+
+    def test_sweep(self):
+        self._record('tenants', 'tenants/t1', service='identity')
+        self._record('networks', 'v2.0/networks/n1')
+        self._record('subnets', 'v2.0/subnets/s1')
+        self._record('routers', 'v2.0/routers/r1')
+        self._record('servers', 'servers/v1', service='compute')
+        self._record('ports', 'v2.0/ports/p2')
+        journal.record('network', 'networks', 'gone', 'v2.0/networks/gone',
+                       filters=dict(service='network'))
+        deleted, failed = sweeper.Sweeper(self.connection, None,
+                                          max_workers=4).sweep()
+        self.assertEqual([], failed)
+        self.assertEqual(7, len(deleted))
+        self.assertEqual([], journal.open_entries(self.connection))
+        # The servers are gone before the ports and networks are deleted
+        self.assertTrue(self._position('GET', 'servers/v1') <
+                        self._position('DELETE', 'v2.0/ports/p2') <
+                        self._position('DELETE', 'v2.0/subnets/s1') <
+                        self._position('DELETE', 'v2.0/networks/n1') <
+                        self._position('DELETE', 'tenants/t1'))
+        self.assertTrue(
+            self._position('PUT', 'v2.0/routers/r1/remove_router_interface') <
+            self._position('DELETE', 'v2.0/routers/r1') <
+            self._position('DELETE', 'v2.0/subnets/s1'))
+        self.assertFalse([path for method, path in self.requests
+                          if 'all_tenants' in path])
+
+    def test_failure(self):
+        self._record('routers', 'v2.0/routers/r1')
+        self._record('networks', 'v2.0/networks/n1')
+        self.client.put = mock.Mock(side_effect=exceptions.Conflict())
+        deleted, failed = sweeper.Sweeper(self.connection, None).sweep()
+        self.assertEqual(['r1'], [entry['resource_id'] for entry in failed])
+        self.assertEqual(['n1'], [entry['resource_id'] for entry in deleted])
+        self.assertEqual(['r1'], [entry['resource_id'] for entry in
+                                  journal.open_entries(self.connection)])
+
+    def test_running_workers_skipped(self):
+        self._record('networks', 'v2.0/networks/n1')
+        self.patch('os.getpid', return_value=1)
+        deleted, failed = sweeper.Sweeper(self.connection, None).sweep()
+        self.assertEqual(([], []), (deleted, failed))
+        deleted, failed = sweeper.Sweeper(self.connection, None).sweep(
+            include_running=True)
+        self.assertEqual(1, len(deleted))
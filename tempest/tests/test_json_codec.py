@@ -0,0 +1,64 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import mock
+
+from tempest.common import json_codec
+from tempest import config
+from tempest import exceptions
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestJsonCodec(base.TestCase):
+
+    def setUp(self):
+        super(TestJsonCodec, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(json_codec, '_codec', None)
+        self.addCleanup(setattr, fake_config.FakeConfig.service_clients,
+                        'json_codec', 'json')
+
+    def _set_codec(self, name):
+        fake_config.FakeConfig.service_clients.json_codec = name
+
+    def test_json(self):
+        self.assertIs(json, json_codec.get_codec())
+        self.assertEqual({'a': [1]}, json_codec.loads('{"a": [1]}'))
+        self.assertEqual('{"a": [1]}', json_codec.dumps({'a': [1]}))
+
+    def test_auto(self):
+        self._set_codec('auto')
+        fast_codec = mock.Mock(__name__='fast_codec')
+        self.patch('tempest.openstack.common.importutils.try_import',
+                   side_effect=[None, fast_codec])
+        self.assertIs(fast_codec, json_codec.get_codec())
+        self.assertIs(fast_codec, json_codec.get_codec())
+
+    def test_unknown(self):
+        self._set_codec('fake_codec')
+        self.assertRaises(exceptions.InvalidConfiguration,
+                          json_codec.get_codec)
+
+    def test_dumps_fallback(self):
+        fast_codec = mock.Mock()
+        fast_codec.dumps.side_effect = OverflowError
+        self.stubs.Set(json_codec, '_codec', fast_codec)
+        self.assertEqual('[1]', json_codec.dumps([1]))
+
+    def test_invalid_document(self):
+        self.assertRaises(ValueError, json_codec.loads, '{')
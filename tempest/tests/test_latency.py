@@ -0,0 +1,92 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+
+import fixtures
+
+from tempest.common import latency
+from tempest.tests import base
+
+
+class TestLatency(base.TestCase):
+
+    def setUp(self):
+        super(TestLatency, self).setUp()
+        self.stubs.Set(latency, '_run_recorder', latency.LatencyRecorder())
+        self.stubs.Set(latency, '_test_recorder', latency.LatencyRecorder())
+
+    def test_url_template(self):
+        self.assertEqual(
+            '/v2/{id}/servers/{id}/action',
+            latency.url_template('http://fake_host:8774/v2/'
+                                 '8d1cd2a6a1ba4fb7a63d0b9d2c25b9b2/servers/'
+                                 'ecb5dc9d-7d3f-4d9c-8b0a-3d39d56d0fc2/'
+                                 'action'))
+        self.assertEqual('/v2/images?limit&name',
+                         latency.url_template('/v2/images?name=a&limit=1'
+                                              '&name=b'))
+
+    def test_percentiles(self):
+        histogram = latency.Histogram()
+        for value in range(1, 101):
+            histogram.record(float(value))
+        summary = histogram.summary()
+        self.assertEqual(100, summary['count'])
+        self.assertEqual(50.5, summary['mean'])
+        for percent in (50, 90, 99):
+            self.assertTrue(percent <= summary['p%d' % percent] <=
+                            percent * latency.BUCKET_GROWTH)
+        self.assertEqual(100, summary['max'])
+
+    def test_merge(self):
+        first = latency.Histogram()
+        first.record(10.0)
+        second = latency.Histogram.from_dict(first.to_dict())
+        second.record(1000.0)
+        first.merge(second)
+        self.assertEqual(3, first.count)
+        self.assertEqual(1000.0, first.max)
+        self.assertTrue(first.percentile(50) < 11)
+
+    def test_test_summary(self):
+        latency.record('compute', 'get', '/v2/servers', 200, 0.5)
+        latency.start_test()
+        latency.record('compute', 'get', '/v2/servers', 200, 0.25)
+        latency.record('compute', 'get', '/v2/servers', 200, 0.5)
+        self.assertEqual('compute GET /v2/servers 200 count=2 total=750.0ms '
+                         'max=500.0ms', latency.stop_test())
+        self.assertEqual('', latency.stop_test())
+
+    def test_write_report(self):
+        report_dir = self.useFixture(fixtures.TempDir()).path
+        self.patch('os.getpgrp', return_value=42)
+        other_worker = latency.Histogram()
+        other_worker.record(100.0)
+        # Only the workers of the same run are merged
+        for run in (41, 42):
+            with open(os.path.join(report_dir,
+                                   latency.WORKER_FILE % (run, 1)), 'w') as f:
+                json.dump({'compute GET /v2/servers 200':
+                           other_worker.to_dict()}, f)
+        latency.record('compute', 'get', '/v2/servers', 200, 0.3)
+        latency.record('image', 'get', '/v2/images', 200, 0.3)
+        latency.write_report(report_dir)
+        with open(os.path.join(report_dir, latency.REPORT_FILE)) as f:
+            requests = json.load(f)['requests']
+        self.assertEqual(2, requests['compute GET /v2/servers 200']['count'])
+        self.assertEqual(300, requests['compute GET /v2/servers 200']['max'])
+        self.assertEqual(1, requests['image GET /v2/images 200']['count'])
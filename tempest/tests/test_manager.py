@@ -0,0 +1,108 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+import mock
+
+from tempest import clients
+from tempest import config
+from tempest import manager
+from tempest.openstack.common import importutils
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestLazyClients(base.TestCase):
+
+    def setUp(self):
+        super(TestLazyClients, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.patch('tempest.manager.Manager.get_auth_provider')
+        self.manager = manager.Manager('fake_user', 'fake_pwd',
+                                       'fake_tenant')
+        self.factory = mock.Mock()
+        self.manager._set_client_factory('fake_client', self.factory,
+                                         'fake_arg', fake_kwarg=1)
+
+    def test_client_built_on_first_access(self):
+        self.assertFalse(self.factory.called)
+        client = self.manager.fake_client
+        self.factory.assert_called_once_with('fake_arg', fake_kwarg=1)
+        self.assertIs(client, self.manager.fake_client)
+        self.assertEqual(1, self.factory.call_count)
+
+    def test_unknown_attribute(self):
+        self.assertRaises(AttributeError, getattr, self.manager, 'fake_attr')
+        self.assertFalse(hasattr(self.manager, 'fake_attr'))
+
+    def test_failed_client_is_retried(self):
+        self.factory.side_effect = [ValueError, mock.sentinel.client]
+        self.assertRaises(ValueError, getattr, self.manager, 'fake_client')
+        self.assertIs(mock.sentinel.client, self.manager.fake_client)
+
+    def test_concurrent_first_access(self):
+        started = threading.Event()
+        build = threading.Event()
+
+        def factory(*args, **kwargs):
+            started.set()
+            self.assertTrue(build.wait(5))
+            return mock.sentinel.client
+
+        self.manager._set_client_factory('fake_client', factory)
+        built = []
+        threads = [threading.Thread(
+            target=lambda: built.append(self.manager.fake_client))
+            for _ in range(2)]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        threads[1].start()
+        build.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([mock.sentinel.client] * 2, built)
+
+    def test_set_client_overrides_factory(self):
+        self.manager.fake_client = mock.sentinel.client
+        self.assertIs(mock.sentinel.client, self.manager.fake_client)
+        self.assertFalse(self.factory.called)
+
+
+class TestClientsManager(base.TestCase):
+
+    def setUp(self):
+        super(TestClientsManager, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.patch('tempest.manager.Manager.get_auth_provider')
+        self.import_object = self.patch(
+            'tempest.openstack.common.importutils.import_object')
+
+    def test_no_client_built(self):
+        clients.Manager('fake_user', 'fake_pwd', 'fake_tenant')
+        self.assertFalse(self.import_object.called)
+
+    def test_client_imported_on_access(self):
+        os = clients.Manager('fake_user', 'fake_pwd', 'fake_tenant')
+        self.assertIs(self.import_object.return_value, os.servers_client)
+        self.import_object.assert_called_once_with(
+            'tempest.services.compute.json.servers_client.ServersClientJSON',
+            os.auth_provider)
+
+    def test_client_paths(self):
+        for table in (clients.XML_CLIENTS, clients.JSON_CLIENTS,
+                      clients.COMMON_CLIENTS):
+            for path in table.values():
+                importutils.import_class(clients.SERVICES_PACKAGE + path)
@@ -0,0 +1,168 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from tempest.common import poller
+from tempest import config
+from tempest import exceptions
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class Countdown(object):
+    """Check complete after a number of polls."""
+
+    def __init__(self, polls, result='done', error=None):
+        self.polls = polls
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.threads = set()
+
+    def __call__(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        if self.calls < self.polls:
+            return poller.PENDING
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestPoller(base.TestCase):
+
+    def setUp(self):
+        super(TestPoller, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        self.stubs.Set(self.conf, 'poll_initial_interval', 0.01)
+        self.stubs.Set(self.conf, 'poll_jitter', 0)
+        self.stubs.Set(self.conf, 'central_poller', True)
+        self.stubs.Set(poller, '_poller', None)
+
+    def test_result(self):
+        check = Countdown(3)
+        future = poller.submit(check, 5, 0.01)
+        self.assertEqual('done', future.result(5))
+        self.assertTrue(future.done())
+        self.assertEqual(3, check.calls)
+        self.assertEqual(set(['tempest-poller']), check.threads)
+
+    def test_error(self):
+        future = poller.submit(Countdown(2, error=ValueError('failed')), 5,
+                               0.01)
+        e = self.assertRaises(ValueError, future.result, 5)
+        self.assertEqual('failed', str(e))
+        self.assertIsInstance(future.exception(), ValueError)
+
+    def test_timeout(self):
+        future = poller.submit(Countdown(1000), 0.05, 0.01,
+                               description='server 42')
+        e = self.assertRaises(exceptions.TimeoutException, future.result, 5)
+        self.assertIn('server 42 did not complete', str(e))
+
+    def test_timeout_error(self):
+        future = poller.submit(Countdown(1000), 0.05, 0.01,
+                               timeout_error=lambda: KeyError('late'))
+        self.assertRaises(KeyError, future.result, 5)
+
+    def test_waits_overlap(self):
+        polls = {'server': 0, 'volume': 0}
+
+        def check(resource, other):
+            # Complete once the other wait was polled too, which never
+            # happens if the waits run one after the other
+            def _check():
+                polls[resource] += 1
+                if polls[other] < 2:
+                    return poller.PENDING
+                return resource
+            return _check
+
+        futures = [poller.submit(check('server', 'volume'), 5, 0.01,
+                                 service='compute'),
+                   poller.submit(check('volume', 'server'), 5, 0.01,
+                                 service='volume')]
+        self.assertEqual(['server', 'volume'], poller.wait_all(futures, 5))
+        self.assertEqual(0, poller.get_poller().outstanding())
+
+    def _test_pending_until(self):
+        self.stubs.Set(self.conf, 'poll_initial_interval', 10)
+        start = time.time()
+        check = Countdown(2)
+
+        def _check():
+            result = check()
+            if result is poller.PENDING:
+                return poller.PendingUntil(start + 0.05)
+            return result
+
+        self.assertEqual('done', poller.submit(_check, 5, 10).result(5))
+        self.assertTrue(0.05 <= time.time() - start < 1)
+
+    def test_pending_until(self):
+        self._test_pending_until()
+
+    def test_pending_until_without_central_poller(self):
+        self.stubs.Set(self.conf, 'central_poller', False)
+        self._test_pending_until()
+
+    def test_wait_all_raises_first_error(self):
+        futures = [poller.submit(Countdown(1), 5, 0.01),
+                   poller.submit(Countdown(1, error=KeyError()), 5, 0.01),
+                   poller.submit(Countdown(2), 5, 0.01)]
+        self.assertRaises(KeyError, poller.wait_all, futures, 5)
+        self.assertTrue(all(future.done() for future in futures))
+
+    def test_done_callback(self):
+        results = []
+        future = poller.submit(Countdown(2), 5, 0.01)
+        future.add_done_callback(lambda f: results.append(f.result()))
+        future.result(5)
+        future.add_done_callback(lambda f: results.append(f.result()))
+        self.assertEqual(['done', 'done'], results)
+
+    def test_result_wakes_up(self):
+        # Never blocks without a timeout, which signals cannot interrupt
+        self.stubs.Set(poller, 'WAKEUP_INTERVAL', 0.01)
+        future = poller.Future()
+        timeouts = []
+        event_wait = future._event.wait
+
+        def wait(timeout=None):
+            timeouts.append(timeout)
+            return event_wait(timeout)
+
+        self.stubs.Set(future._event, 'wait', wait)
+        timer = threading.Timer(0.05, future.set_result, ['done'])
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual('done', future.result())
+        self.assertTrue(len(timeouts) > 1)
+        self.assertTrue(all(timeout is not None and timeout <= 0.01
+                            for timeout in timeouts))
+        pending = poller.Future('server 42')
+        self.assertRaises(exceptions.TimeoutException, pending.result, 0.03)
+
+    def test_without_central_poller(self):
+        self.stubs.Set(self.conf, 'central_poller', False)
+        check = Countdown(3)
+        future = poller.submit(check, 5, 0.01)
+        self.assertTrue(future.done())
+        self.assertEqual('done', future.result())
+        self.assertEqual(set([threading.current_thread().name]),
+                         check.threads)
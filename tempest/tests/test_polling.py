@@ -0,0 +1,99 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import itertools
+
+from tempest.common import polling
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestPollProfile(base.TestCase):
+
+    def test_intervals(self):
+        profile = polling.PollProfile(0.5, 3.0, fast_polls=2, backoff=2.0)
+        self.assertEqual([0.5, 0.5, 1.0, 2.0, 3.0, 3.0],
+                         list(itertools.islice(profile.intervals(), 6)))
+
+    def test_fixed_intervals(self):
+        profile = polling.PollProfile(1.0, 1.0)
+        self.assertEqual([1.0, 1.0, 1.0],
+                         list(itertools.islice(profile.intervals(), 3)))
+
+    def test_jitter(self):
+        profile = polling.PollProfile(1.0, 1.0, jitter=0.5)
+        self.patch('random.random', return_value=0)
+        self.assertEqual(0.5, next(profile.intervals()))
+        self.patch('random.random', return_value=1)
+        self.assertEqual(1.5, next(profile.intervals()))
+
+
+class TestGetProfile(base.TestCase):
+
+    def setUp(self):
+        super(TestGetProfile, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+
+    def test_adaptive(self):
+        profile = polling.get_profile(polling.VOLUME, 3)
+        self.assertEqual(0.5, profile.initial_interval)
+        self.assertEqual(6, profile.max_interval)
+        self.assertEqual(1.5, profile.backoff)
+
+    def test_not_adaptive(self):
+        self.stubs.Set(self.conf, 'adaptive_polling', False)
+        profile = polling.get_profile(polling.VOLUME, 3)
+        self.assertEqual([3, 3],
+                         list(itertools.islice(profile.intervals(), 2)))
+
+    def test_resource_profile(self):
+        self.stubs.Set(self.conf, 'poll_profiles',
+                       {'stack': '2:30', 'image': '1'})
+        stack = polling.get_profile(polling.STACK, 1)
+        self.assertEqual((2.0, 30.0),
+                         (stack.initial_interval, stack.max_interval))
+        image = polling.get_profile(polling.IMAGE, 1)
+        self.assertEqual((1.0, 2), (image.initial_interval,
+                                    image.max_interval))
+
+
+class TestPoll(base.TestCase):
+
+    def setUp(self):
+        super(TestPoll, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(fake_config.FakeConfig.fake_service_clients,
+                       'poll_jitter', 0)
+        self.now = 1000.0
+        self.sleeps = []
+        self.patch('time.time', side_effect=lambda: self.now)
+        self.patch('time.sleep', side_effect=self._sleep)
+
+    def _sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def test_poll_until_timeout(self):
+        polls = list(polling.poll(polling.SERVER, 4, 1))
+        self.assertEqual([1, 2, 3, 4, 5, 6], polls)
+        self.assertEqual([0.5, 0.5, 0.75, 1.125, 1.125], self.sleeps)
+        self.assertEqual(1004.0, self.now)
+
+    def test_first_poll_immediate(self):
+        for _ in polling.poll(polling.SERVER, 4, 1):
+            break
+        self.assertEqual([], self.sleeps)
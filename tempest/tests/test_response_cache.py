@@ -0,0 +1,137 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import httplib2
+import mock
+
+from tempest.common import response_cache
+from tempest.common import rest_client
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_auth_provider
+from tempest.tests import fake_config
+
+
+class TestResponseCache(base.TestCase):
+
+    url = 'http://fake_host/v2/fake_tenant/flavors/1'
+    headers = {'Accept': 'application/json', 'X-Auth-Token': 'fake_token'}
+
+    def setUp(self):
+        super(TestResponseCache, self).setUp()
+        self.cache = response_cache.ResponseCache(['/flavors/[^/]+$'],
+                                                  ttl=10, maxsize=2)
+        self.send = mock.Mock(return_value=(
+            httplib2.Response({'status': '200', 'etag': '"v1"'}),
+            '{"flavor": {}}'))
+        self.now = self.patch('time.time', return_value=1000.0)
+
+    def _get(self, url=None, headers=None):
+        return self.cache.request(self.send, url or self.url, 'GET',
+                                  headers=headers or self.headers)
+
+    def test_hit(self):
+        resp, body = self._get()
+        self.assertFalse(resp.fromcache)
+        resp, cached_body = self._get()
+        self.assertTrue(resp.fromcache)
+        self.assertEqual(200, resp.status)
+        self.assertEqual(body, cached_body)
+        self.assertEqual(1, self.send.call_count)
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    def test_not_cacheable(self):
+        self._get(self.url + '/os-extra_specs')
+        self._get(self.url + '/os-extra_specs')
+        self.assertEqual(2, self.send.call_count)
+        self.assertEqual(0, self.cache.hits)
+
+    def test_key_includes_token(self):
+        self._get()
+        self._get(headers=dict(self.headers, **{'X-Auth-Token': 'other'}))
+        self.assertEqual(2, self.send.call_count)
+
+    def test_revalidate(self):
+        self._get()
+        self.now.return_value = 1011.0
+        self.send.return_value = (httplib2.Response({'status': '304'}), '')
+        resp, body = self._get()
+        self.assertEqual(200, resp.status)
+        self.assertFalse(resp.fromcache)
+        self.assertEqual('{"flavor": {}}', body)
+        self.assertEqual('"v1"', self.send.call_args[1]['headers'][
+            'If-None-Match'])
+        self.assertEqual(1, self.cache.revalidations)
+        # Fresh again after the revalidation
+        resp, _ = self._get()
+        self.assertTrue(resp.fromcache)
+
+    def test_expired_without_validator(self):
+        self.send.return_value = (httplib2.Response({'status': '200'}), '{}')
+        self._get()
+        self.now.return_value = 1011.0
+        self._get()
+        self.assertNotIn('If-None-Match',
+                         self.send.call_args[1]['headers'])
+        self.assertEqual(2, self.cache.misses)
+
+    def test_errors_not_cached(self):
+        self.send.return_value = (httplib2.Response({'status': '404'}), '')
+        self._get()
+        self._get()
+        self.assertEqual(2, self.send.call_count)
+
+    def test_lru_eviction(self):
+        for flavor in ('1', '2', '1', '3'):
+            self._get('http://fake_host/v2/fake_tenant/flavors/' + flavor)
+        self.assertEqual(1, self.cache.evictions)
+        self._get('http://fake_host/v2/fake_tenant/flavors/1')
+        self.assertEqual(2, self.cache.hits)
+        self._get('http://fake_host/v2/fake_tenant/flavors/2')
+        self.assertEqual(4, self.cache.misses)
+
+    def test_invalidate(self):
+        self._get()
+        self.cache.request(self.send, self.url + '/os-extra_specs', 'POST')
+        self._get()
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(2, self.cache.misses)
+
+    def test_disabled(self):
+        self.assertFalse(response_cache.ResponseCache().enabled())
+        self.assertTrue(self.cache.enabled())
+
+
+class TestRestClientResponseCache(base.TestCase):
+
+    def setUp(self):
+        super(TestRestClientResponseCache, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(response_cache, '_cache',
+                       response_cache.ResponseCache(['flavors/[^/]+$']))
+        self.http_request = self.patch('httplib2.Http.request')
+        self.http_request.return_value = (
+            httplib2.Response({'status': '200'}), '{"flavor": {}}')
+        self.client = rest_client.RestClient(
+            fake_auth_provider.FakeAuthProvider())
+
+    def test_get_cached(self):
+        self.client.get('flavors/1')
+        resp, body = self.client.get('flavors/1')
+        self.assertTrue(resp.fromcache)
+        self.assertEqual('{"flavor": {}}', body)
+        self.assertEqual(1, self.http_request.call_count)
+        self.assertEqual(1, response_cache.get_cache().hits)
+        self.assertTrue(response_cache.used())
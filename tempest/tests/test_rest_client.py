@@ -13,9 +13,15 @@
 #    under the License.
 
 import httplib2
+import io
 import json
+import socket
 
+import mock
+
+from tempest.common import http
 from tempest.common import rest_client
+from tempest.common import retry
 from tempest import config
 from tempest import exceptions
 from tempest.openstack.common.fixture import mockpatch
@@ -93,6 +99,166 @@ class TestRestClientNotFoundHandling(BaseRestClientTestClass):
                           self.url, {}, {})
 
 
+class TestRestClientFanout(BaseRestClientTestClass):
+    def setUp(self):
+        self.fake_http = fake_http.fake_httplib2(404)
+        super(TestRestClientFanout, self).setUp()
+
+    def test_fanout_errors_are_mapped(self):
+        results = self.rest_client.fanout(self.rest_client.get,
+                                          ['url1', 'url2'],
+                                          return_exceptions=True)
+        self.assertEqual(2, len(results))
+        for result in results:
+            self.assertIsInstance(result, exceptions.NotFound)
+
+    def test_fanout_raises(self):
+        self.assertRaises(exceptions.NotFound, self.rest_client.fanout,
+                          self.rest_client.get, ['url1', 'url2'])
+
+
+class TestRestClientStream(BaseRestClientTestClass):
+    def setUp(self):
+        self.fake_http = fake_http.fake_httplib2()
+        super(TestRestClientStream, self).setUp()
+        self.open_stream = self.patch('tempest.common.http.open_stream')
+
+    def _set_response(self, status, body):
+        resp = httplib2.Response({'status': str(status),
+                                  'content-type': 'application/json'})
+        self.open_stream.return_value = (
+            resp, http.ResponseBodyStream(io.BytesIO(body)))
+
+    def test_stream(self):
+        self._set_response(200, b'fake_body')
+        resp, body = self.rest_client.get(self.url, stream=True)
+        self.assertIsInstance(body, http.ResponseBodyStream)
+        self.assertEqual(b'fake_body', body.read())
+
+    def test_stream_error(self):
+        self._set_response(404, b'{"itemNotFound": {}}')
+        self.assertRaises(exceptions.NotFound, self.rest_client.get,
+                          self.url, stream=True)
+
+    def test_no_stream(self):
+        self.rest_client.get(self.url)
+        self.assertFalse(self.open_stream.called)
+
+
+class TestRestClientDecodeOnce(BaseRestClientTestClass):
+    def setUp(self):
+        self.fake_http = fake_http.fake_httplib2()
+        super(TestRestClientDecodeOnce, self).setUp()
+        resp = httplib2.Response({'status': '413', 'retry-after': '0',
+                                  'content-type': 'application/json'})
+        body = '{"overLimit": {"message": "Quota exceeded"}}'
+        self.useFixture(mockpatch.PatchObject(
+            self.rest_client.http_obj, 'request', return_value=(resp, body)))
+        self.parse_resp = self.useFixture(mockpatch.PatchObject(
+            self.rest_client, '_parse_resp',
+            wraps=self.rest_client._parse_resp)).mock
+
+    def test_error_body_decoded_once(self):
+        self.assertRaises(exceptions.OverLimit, self.rest_client.get,
+                          self.url)
+        self.assertEqual(1, self.parse_resp.call_count)
+
+
+class TestRestClientRetry(BaseRestClientTestClass):
+    def setUp(self):
+        self.fake_http = fake_http.fake_httplib2()
+        super(TestRestClientRetry, self).setUp()
+        self.policy = retry.RetryPolicy('compute', attempts=2,
+                                        statuses=['503'],
+                                        methods=['GET', 'HEAD', 'DELETE'],
+                                        backoff=1.0, jitter=0)
+        self.useFixture(mockpatch.PatchObject(retry, 'get_policy',
+                                              return_value=self.policy))
+        self.sleep = self.useFixture(mockpatch.Patch('time.sleep')).mock
+        self.request = self.useFixture(mockpatch.PatchObject(
+            self.rest_client.http_obj, 'request')).mock
+
+    def _response(self, status):
+        return (httplib2.Response({'status': str(status),
+                                   'content-type': 'application/json'}),
+                '{}')
+
+    def test_retry_status(self):
+        self.request.side_effect = [self._response(503),
+                                    self._response(200)]
+        resp, _ = self.rest_client.get(self.url)
+        self.assertEqual(200, resp.status)
+        self.assertEqual(2, self.request.call_count)
+        self.sleep.assert_called_once_with(1.0)
+
+    def test_retry_connection_error(self):
+        self.request.side_effect = [socket.error('Connection reset'),
+                                    self._response(200)]
+        resp, _ = self.rest_client.delete(self.url)
+        self.assertEqual(200, resp.status)
+
+    def test_retries_exhausted(self):
+        self.request.return_value = self._response(503)
+        self.assertRaises(exceptions.RestClientException, self.rest_client.get,
+                          self.url)
+        self.assertEqual(3, self.request.call_count)
+        self.assertEqual([mock.call(1.0), mock.call(2.0)],
+                         self.sleep.call_args_list)
+
+    def test_post_not_retried(self):
+        self.request.side_effect = socket.error('Connection reset')
+        self.assertRaises(socket.error, self.rest_client.post, self.url,
+                          '{}', {})
+        self.assertEqual(1, self.request.call_count)
+
+    def test_post_opt_in(self):
+        self.policy.methods = frozenset(['POST'])
+        self.request.side_effect = [self._response(503),
+                                    self._response(201)]
+        resp, _ = self.rest_client.post(self.url, '{}', {})
+        self.assertEqual(201, resp.status)
+
+    def test_status_not_retried(self):
+        self.request.return_value = self._response(500)
+        self.assertRaises(exceptions.ServerFault, self.rest_client.get,
+                          self.url)
+        self.assertEqual(1, self.request.call_count)
+
+    def test_budget_spent(self):
+        self.policy.budget = 1
+        self.request.return_value = self._response(503)
+        self.assertRaises(exceptions.RestClientException, self.rest_client.get,
+                          self.url)
+        self.assertEqual(2, self.request.call_count)
+
+
+class TestRestClientFilters(BaseRestClientTestClass):
+    def setUp(self):
+        self.fake_http = fake_http.fake_httplib2()
+        super(TestRestClientFilters, self).setUp()
+        self.rest_client.service = 'identity'
+
+    def test_filters_from_service_index(self):
+        self.assertEqual('publicURL',
+                         self.rest_client.filters['endpoint_type'])
+
+    def test_filters_are_cached(self):
+        self.assertIs(self.rest_client.filters, self.rest_client.filters)
+
+    def test_filters_are_reset(self):
+        filters = self.rest_client.filters
+        self.rest_client.api_version = 'v3'
+        self.assertIsNot(filters, self.rest_client.filters)
+        self.assertEqual('v3', self.rest_client.filters['api_version'])
+        self.rest_client.skip_path()
+        self.assertTrue(self.rest_client.filters['skip_path'])
+        self.rest_client.reset_path()
+        self.assertNotIn('skip_path', self.rest_client.filters)
+        self.rest_client.endpoint_url = 'adminURL'
+        self.assertEqual('adminURL',
+                         self.rest_client.filters['endpoint_type'])
+
+
 class TestRestClientHeadersJSON(TestRestClientHTTPMethods):
     TYPE = "json"
 
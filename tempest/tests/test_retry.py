@@ -0,0 +1,98 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+
+from tempest.common import retry
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestRetryPolicy(base.TestCase):
+
+    def setUp(self):
+        super(TestRetryPolicy, self).setUp()
+        self.policy = retry.RetryPolicy(
+            'compute', attempts=3, statuses=['503'], methods=['get'],
+            backoff=1.0, backoff_max=3.0, jitter=0.5, budget=2)
+
+    def test_retriable(self):
+        self.assertTrue(self.policy.retriable('GET'))
+        self.assertTrue(self.policy.retriable('GET', status=503))
+        self.assertFalse(self.policy.retriable('GET', status=500))
+        self.assertFalse(self.policy.retriable('POST'))
+        self.assertFalse(self.policy.retriable('GET', body=io.BytesIO()))
+
+    def test_disabled(self):
+        self.policy.attempts = 0
+        self.assertFalse(self.policy.retriable('GET'))
+
+    def test_delay(self):
+        self.patch('random.random', return_value=0)
+        self.assertEqual([1.0, 2.0, 3.0],
+                         [self.policy.delay(attempt) for attempt in range(3)])
+        self.patch('random.random', return_value=1)
+        self.assertEqual(0.5, self.policy.delay(0))
+
+    def test_budget(self):
+        self.assertTrue(self.policy.spend_budget())
+        self.assertTrue(self.policy.spend_budget())
+        self.assertFalse(self.policy.spend_budget())
+
+    def test_unlimited_budget(self):
+        policy = retry.RetryPolicy('compute', budget=0)
+        for _ in range(10):
+            self.assertTrue(policy.spend_budget())
+
+
+class TestGetPolicy(base.TestCase):
+
+    def setUp(self):
+        super(TestGetPolicy, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(retry, '_policies', {})
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        self.stubs.Set(self.conf, 'retry_attempts', 1)
+        self.stubs.Set(self.conf, 'retry_service_attempts', {'volume': '4'})
+
+    def test_service_attempts(self):
+        self.assertEqual(1, retry.get_policy('compute').attempts)
+        self.assertEqual(4, retry.get_policy('volume').attempts)
+        self.assertEqual(frozenset([502, 503, 504]),
+                         retry.get_policy('volume').statuses)
+
+    def test_policy_is_shared(self):
+        self.assertIs(retry.get_policy('compute'),
+                      retry.get_policy('compute'))
+
+
+class TestRetryStats(base.TestCase):
+
+    def setUp(self):
+        super(TestRetryStats, self).setUp()
+        self.stubs.Set(retry, '_run_stats', retry.RetryStats())
+        self.stubs.Set(retry, '_test_stats', retry.RetryStats())
+
+    def test_stats(self):
+        retry.start_test()
+        retry.record('compute', 1.5)
+        retry.record('compute', 2.5)
+        retry.record_exhausted('volume')
+        self.assertEqual('compute retries=2 backoff=4.0s exhausted=0\n'
+                         'volume retries=0 backoff=0.0s exhausted=1',
+                         retry.stop_test())
+        self.assertEqual('', retry.stop_test())
+        self.assertEqual(2, retry.stats().retries['compute'])
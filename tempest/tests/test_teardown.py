@@ -0,0 +1,118 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+
+from tempest.common import teardown
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestTeardown(base.TestCase):
+
+    def setUp(self):
+        super(TestTeardown, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.lock = threading.Lock()
+        self.events = []
+
+    def _delete(self, kind, error=None):
+        def delete(resource):
+            with self.lock:
+                self.events.append((kind, resource))
+            if error is not None and resource == error:
+                raise ValueError(resource)
+        return delete
+
+    def _position(self, event):
+        return self.events.index(event)
+
+    def test_dependencies(self):
+        cleanup = teardown.Teardown(max_workers=4)
+        cleanup.add('floating_ips', ['f1', 'f2'],
+                    self._delete('floating_ips'))
+        cleanup.add('routers', ['r1'], self._delete('routers'),
+                    depends_on=('floating_ips',))
+        cleanup.add('ports', ['p1', 'p2'], self._delete('ports'),
+                    depends_on=('routers',))
+        cleanup.add('members', ['m1'], self._delete('members'))
+        cleanup.add('networks', ['n1'], self._delete('networks'),
+                    depends_on=('ports',))
+        cleanup.run()
+        self.assertEqual(7, len(self.events))
+        for floating_ip in ('f1', 'f2'):
+            self.assertTrue(self._position(('floating_ips', floating_ip)) <
+                            self._position(('routers', 'r1')))
+        for port in ('p1', 'p2'):
+            self.assertTrue(self._position(('routers', 'r1')) <
+                            self._position(('ports', port)) <
+                            self._position(('networks', 'n1')))
+
+    def test_empty_kinds(self):
+        cleanup = teardown.Teardown()
+        cleanup.add('routers', [], self._delete('routers'))
+        cleanup.add('ports', [], self._delete('ports'),
+                    depends_on=('routers',))
+        cleanup.add('networks', ['n1'], self._delete('networks'),
+                    depends_on=('ports',))
+        cleanup.run()
+        self.assertEqual([('networks', 'n1')], self.events)
+
+    def test_batch_wait(self):
+        def wait(servers):
+            with self.lock:
+                self.events.append(('wait', tuple(servers)))
+
+        cleanup = teardown.Teardown(max_workers=3)
+        cleanup.add('servers', ['s1', 's2', 's3'], self._delete('servers'),
+                    wait=wait)
+        cleanup.add('security_groups', ['g1'],
+                    self._delete('security_groups'),
+                    depends_on=('servers',))
+        cleanup.run()
+        self.assertEqual([('wait', ('s1', 's2', 's3')),
+                          ('security_groups', 'g1')], self.events[-2:])
+
+    def test_concurrent(self):
+        barrier = threading.Event()
+        started = []
+
+        def delete(resource):
+            # Both deletions have to run at once for either to complete
+            started.append(resource)
+            if len(started) == 2:
+                barrier.set()
+            self.assertTrue(barrier.wait(5))
+
+        cleanup = teardown.Teardown(max_workers=2)
+        cleanup.add('images', ['i1'], delete)
+        cleanup.add('servers', ['s1'], delete)
+        cleanup.run()
+        self.assertEqual(set(['i1', 's1']), set(started))
+
+    def test_error_stops_teardown(self):
+        cleanup = teardown.Teardown(max_workers=1)
+        cleanup.add('routers', ['r1', 'r2'], self._delete('routers', 'r1'))
+        cleanup.add('networks', ['n1'], self._delete('networks'),
+                    depends_on=('routers',))
+        e = self.assertRaises(ValueError, cleanup.run)
+        self.assertEqual('r1', str(e))
+        self.assertEqual([('routers', 'r1')], self.events)
+
+    def test_unknown_dependency(self):
+        cleanup = teardown.Teardown()
+        self.assertRaises(ValueError, cleanup.add, 'ports', [],
+                          self._delete('ports'), depends_on=('routers',))
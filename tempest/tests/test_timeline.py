@@ -0,0 +1,156 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import glob
+import json
+import os
+import sys
+
+import fixtures
+
+from tempest.common import poller
+from tempest.common import timeline
+from tempest import config
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestTimeline(base.TestCase):
+
+    def setUp(self):
+        super(TestTimeline, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.conf = fake_config.FakeConfig.fake_service_clients
+        self.dir = self.useFixture(fixtures.TempDir()).path
+        self.stubs.Set(self.conf, 'timeline_dir', self.dir)
+        self.stubs.Set(timeline, '_file', None)
+        self.stubs.Set(timeline, '_writer', None)
+        self.stubs.Set(timeline, '_states', {})
+        self.stubs.Set(timeline, '_test', None)
+        self.now = 1000.0
+        self.patch('time.time', side_effect=lambda: self.now)
+        self.patch('os.getpgrp', return_value=42)
+        self.addCleanup(self._close)
+
+    def _close(self):
+        if timeline._file is not None:
+            timeline._file.close()
+
+    def _boot(self, server_id, boot_time, flavor='1'):
+        server = {'created': '1970-01-01T00:16:40Z', 'flavor': {'id': flavor},
+                  'image': {'id': 'cirros'}}
+        self.now = 1000.0
+        timeline.record_status('server', server_id, 'BUILD', 'spawning',
+                               server)
+        timeline.record_status('server', server_id, 'BUILD', 'spawning',
+                               server)
+        self.now += boot_time
+        timeline.record_status('server', server_id, 'ACTIVE', None, server)
+
+    def _rows(self):
+        return timeline.load(glob.glob(os.path.join(self.dir,
+                                                    'timeline-*')))
+
+    def test_transitions(self):
+        timeline.start_test('test_boot')
+        self._boot('42', 12.5)
+        rows = self._rows()
+        self.assertEqual(2, len(rows))
+        self.assertEqual(['BUILD', 'ACTIVE'], [row['status'] for row in rows])
+        self.assertEqual('spawning', rows[0]['task_state'])
+        self.assertEqual(('test_boot', 1000.0, '1', 'cirros'),
+                         (rows[1]['test'], rows[1]['created'],
+                          rows[1]['flavor'], rows[1]['image']))
+
+    def test_disabled(self):
+        self.stubs.Set(self.conf, 'timeline_dir', None)
+        self._boot('42', 12.5)
+        self.assertFalse(timeline.recorded())
+        self.assertEqual([], os.listdir(self.dir))
+
+    def test_track_wait(self):
+        future = timeline.track_wait(poller.Future(), 'volume', 'v1',
+                                     'in-use')
+        self.now += 3
+        future.set_result(None)
+        failed = timeline.track_wait(poller.Future(), 'volume', 'v2',
+                                     'in-use')
+        try:
+            raise ValueError()
+        except ValueError:
+            failed.set_exception(sys.exc_info())
+        rows = self._rows()
+        self.assertEqual([('v1', 'in-use', 3.0, 'ok'),
+                          ('v2', 'in-use', 0.0, 'ValueError')],
+                         [(row['resource_id'], row['target'],
+                           row['duration'], row['outcome']) for row in rows])
+
+    def _test_report(self):
+        for index in range(10):
+            self._boot(str(index), index + 1.0, flavor=str(index % 2))
+        timeline.track_wait(poller.Future(), 'volume', 'v1',
+                            'in-use').set_result(None)
+        timeline.write_report(self.dir)
+        with open(os.path.join(self.dir, timeline.REPORT_FILE)) as f:
+            report = json.load(f)
+        self.assertEqual({'count': 10, 'p50': 5.0, 'p90': 9.0, 'p99': 10.0,
+                          'max': 10.0},
+                         report['boot_time']['image']['cirros'])
+        self.assertEqual(5, report['boot_time']['flavor']['1']['count'])
+        self.assertEqual(10.0, report['boot_time']['flavor']['1']['max'])
+        self.assertEqual(0.0,
+                         report['time_to_status']['server']['BUILD']['max'])
+        self.assertEqual(1, report['volume_attach']['count'])
+
+    def test_report_json_lines(self):
+        self._test_report()
+
+    def test_report_csv(self):
+        self.stubs.Set(self.conf, 'timeline_format', timeline.CSV)
+        self._test_report()
+
+    def _previous_run(self):
+        # A boot of 100 seconds of a run whose worker had the same pid
+        path = os.path.join(self.dir, timeline.WORKER_FILE % (
+            41, os.getpid(), timeline.JSON_LINES))
+        with open(path, 'w') as f:
+            f.write(json.dumps({'time': 1100.0, 'kind': timeline.TRANSITION,
+                                'resource_type': 'server',
+                                'resource_id': 'old', 'status': 'ACTIVE',
+                                'created': 1000.0, 'image': 'cirros'}))
+        os.utime(path, (0, 0))
+
+    def test_previous_runs_not_merged(self):
+        self._previous_run()
+        self._boot('42', 12.5)
+        timeline.write_report(self.dir)
+        with open(os.path.join(self.dir, timeline.REPORT_FILE)) as f:
+            report = json.load(f)
+        self.assertEqual({'count': 1, 'p50': 12.5, 'p90': 12.5, 'p99': 12.5,
+                          'max': 12.5},
+                         report['boot_time']['image']['cirros'])
+        self.assertEqual(1, len(timeline.dataset_paths(self.dir)))
+        self.assertEqual(1, len(timeline.dataset_paths(self.dir, run=41)))
+
+    def test_csv_header_written_once(self):
+        self.stubs.Set(self.conf, 'timeline_format', timeline.CSV)
+        self._boot('1', 1.0)
+        # Another worker of the run with the same pid
+        self._close()
+        self.stubs.Set(timeline, '_file', None)
+        self.stubs.Set(timeline, '_writer', None)
+        self._boot('2', 2.0)
+        self.assertEqual(['1', '1', '2', '2'],
+                         [row['resource_id'] for row in self._rows()])
@@ -0,0 +1,210 @@
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+import mock
+
+from tempest.common import poller
+from tempest.common import waiters
+from tempest import config
+from tempest import exceptions
+from tempest.tests import base
+from tempest.tests import fake_config
+
+
+class TestBatchWaiters(base.TestCase):
+
+    def setUp(self):
+        super(TestBatchWaiters, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.patch('time.sleep')
+        self.patch('time.time', return_value=1000.0)
+        self.client = mock.Mock(service='compute', build_timeout=10,
+                                build_interval=1)
+
+    def _servers(self, *statuses):
+        return {'servers': [{'id': str(index), 'status': status}
+                            for index, status in enumerate(statuses)
+                            if status is not None]}
+
+    def test_wait_for_servers_status(self):
+        self.client.list_servers_with_detail.side_effect = [
+            ({'date': 'Thu, 01 Jan 2015 00:00:10 GMT'},
+             self._servers('BUILD', 'ACTIVE', 'BUILD')),
+            ({'date': 'Thu, 01 Jan 2015 00:00:12 GMT'},
+             self._servers('ACTIVE')),
+            ({}, self._servers(None, None, 'ACTIVE')),
+        ]
+        servers = waiters.wait_for_servers_status(
+            self.client, ['0', '1', '2'], 'ACTIVE', params={'name': 'x'})
+        self.assertEqual(['0', '1', '2'], sorted(servers))
+        calls = self.client.list_servers_with_detail.call_args_list
+        self.assertEqual(3, len(calls))
+        self.assertEqual({'name': 'x'}, calls[0][0][0])
+        # The servers changed since the previous listing started
+        self.assertEqual('2015-01-01T00:00:09Z',
+                         calls[1][0][0]['changes-since'])
+        self.assertEqual('2015-01-01T00:00:11Z',
+                         calls[2][0][0]['changes-since'])
+
+    def test_wait_for_servers_deletion(self):
+        self.client.list_servers_with_detail.side_effect = [
+            ({}, self._servers(None, 'ACTIVE')),
+            ({}, self._servers(None, None)),
+        ]
+        waiters.wait_for_servers_status(self.client, ['0', '1'],
+                                        waiters.DELETED)
+        self.assertEqual(2, self.client.list_servers_with_detail.call_count)
+
+    def test_build_error(self):
+        self.client.list_servers_with_detail.return_value = (
+            {}, self._servers('BUILD', 'ERROR'))
+        e = self.assertRaises(exceptions.BuildErrorException,
+                              waiters.wait_for_servers_status,
+                              self.client, ['0', '1'], 'ACTIVE')
+        self.assertIn('1', str(e))
+
+    def test_errors_not_raised(self):
+        self.client.list_servers_with_detail.return_value = (
+            {}, self._servers('ACTIVE', 'ERROR'))
+        servers = waiters.wait_for_servers_status(
+            self.client, ['0', '1'], 'ACTIVE', raise_on_error=False)
+        self.assertEqual('ERROR', servers['1']['status'])
+
+    def test_stragglers(self):
+        self.client.build_timeout = 0
+        self.client.list_servers_with_detail.return_value = (
+            {}, self._servers('ACTIVE', 'BUILD', 'BUILD'))
+        e = self.assertRaises(exceptions.TimeoutException,
+                              waiters.wait_for_servers_status,
+                              self.client, ['0', '1', '2'], 'ACTIVE')
+        self.assertIn('2 of 3 servers failed to reach ACTIVE', str(e))
+        self.assertIn('1 (BUILD), 2 (BUILD)', str(e))
+
+    def test_wait_for_volumes_status(self):
+        self.client.list_volumes_with_detail.side_effect = [
+            ({}, [{'id': '0', 'status': 'creating'}]),
+            ({}, [{'id': '0', 'status': 'available'}]),
+        ]
+        waiters.wait_for_volumes_status(self.client, ['0'], 'available')
+        self.assertEqual(2, self.client.list_volumes_with_detail.call_count)
+
+
+class TestServerWaiter(base.TestCase):
+
+    def setUp(self):
+        super(TestServerWaiter, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(fake_config.FakeConfig.fake_service_clients,
+                       'poll_initial_interval', 0.01)
+        self.client = mock.Mock(service='compute', build_timeout=5,
+                                build_interval=0.01)
+
+    def test_wait_for_server_status(self):
+        self.client.get_server.side_effect = [
+            ({}, {'status': 'BUILD'}), ({}, {'status': 'ACTIVE'})]
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE',
+                                       ready_wait=False)
+        self.assertEqual(2, self.client.get_server.call_count)
+
+    def test_build_error(self):
+        self.client.get_server.return_value = ({}, {'status': 'ERROR'})
+        self.assertRaises(exceptions.BuildErrorException,
+                          waiters.wait_for_server_status,
+                          self.client, '42', 'ACTIVE')
+
+    def test_overlapping_waits(self):
+        self.client.get_server.return_value = ({}, {'status': 'ACTIVE'})
+        futures = [waiters.submit_server_status(self.client, server_id,
+                                                'ACTIVE', ready_wait=False)
+                   for server_id in ('1', '2')]
+        self.assertEqual([None, None], poller.wait_all(futures, 5))
+
+
+class TestServerReadyProbe(base.TestCase):
+
+    def setUp(self):
+        super(TestServerReadyProbe, self).setUp()
+        self.stubs.Set(config, 'TempestConfigPrivate', fake_config.FakeConfig)
+        self.stubs.Set(fake_config.FakeConfig.fake_service_clients,
+                       'poll_initial_interval', 0.01)
+        self.stubs.Set(fake_config.FakeConfig.fake_compute, 'ready_wait', 30)
+        self.stubs.Set(waiters, '_ready_probe_stats',
+                       {'servers': 0, 'probed': 0, 'saved': 0.0})
+        self.client = mock.Mock(service='compute', build_timeout=5,
+                                build_interval=0.01)
+        self.client.get_server.return_value = (
+            {}, {'status': 'ACTIVE', 'OS-EXT-STS:task_state': None,
+                 'OS-EXT-STS:power_state': 1})
+        self.client.list_instance_actions.return_value = (
+            {}, [{'request_id': 'req-1', 'start_time': '2014-01-01'},
+                 {'request_id': 'req-2', 'start_time': '2014-01-02'}])
+
+    def test_ready(self):
+        self.client.get_instance_action.return_value = (
+            {}, {'events': [{'finish_time': '2014-01-02'}]})
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE')
+        self.client.get_instance_action.assert_called_once_with('42',
+                                                                'req-2')
+        self.assertIn('1 of 1 servers found ready by the probes',
+                      waiters.ready_probe_summary())
+        self.assertTrue(waiters._ready_probe_stats['saved'] > 29)
+
+    def test_pending_action(self):
+        self.client.get_instance_action.side_effect = [
+            ({}, {'events': [{'finish_time': None}]}),
+            ({}, {'events': [{'finish_time': '2014-01-02'}]})]
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE')
+        self.assertEqual(2, self.client.get_instance_action.call_count)
+
+    def test_power_state(self):
+        self.client.get_server.side_effect = [
+            ({}, {'status': 'SHUTOFF', 'OS-EXT-STS:task_state': None,
+                  'OS-EXT-STS:power_state': 1}),
+            ({}, {'status': 'SHUTOFF', 'OS-EXT-STS:task_state': None,
+                  'OS-EXT-STS:power_state': 1}),
+            ({}, {'status': 'SHUTOFF', 'OS-EXT-STS:task_state': None,
+                  'OS-EXT-STS:power_state': 4})]
+        self.client.list_instance_actions.return_value = ({}, [])
+        waiters.wait_for_server_status(self.client, '42', 'SHUTOFF')
+        self.assertEqual(3, self.client.get_server.call_count)
+
+    def test_without_instance_actions(self):
+        self.client.list_instance_actions.side_effect = exceptions.NotFound
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE')
+        self.assertEqual(1, waiters._ready_probe_stats['probed'])
+
+    def test_probe_disabled(self):
+        self.stubs.Set(fake_config.FakeConfig.fake_compute, 'ready_probe',
+                       False)
+        self.stubs.Set(fake_config.FakeConfig.fake_compute, 'ready_wait',
+                       0.05)
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE')
+        self.assertFalse(self.client.list_instance_actions.called)
+        self.assertIsNone(waiters.ready_probe_summary())
+        self.assertEqual(1, waiters._ready_probe_stats['servers'])
+
+    def test_probe_disabled_waits_no_longer(self):
+        self.stubs.Set(fake_config.FakeConfig.fake_compute, 'ready_probe',
+                       False)
+        self.stubs.Set(fake_config.FakeConfig.fake_compute, 'ready_wait',
+                       0.05)
+        self.stubs.Set(fake_config.FakeConfig.fake_service_clients,
+                       'poll_initial_interval', 10)
+        start = time.time()
+        waiters.wait_for_server_status(self.client, '42', 'ACTIVE')
+        self.assertTrue(time.time() - start < 1)
+        self.assertEqual(1, self.client.get_server.call_count)
@@ -19,6 +19,7 @@ import time
 import boto.exception
 from testtools import TestCase
 
+from tempest.common import poller
 from tempest import config
 from tempest.openstack.common import log as logging
 
@@ -26,31 +27,43 @@ CONF = config.CONF
 LOG = logging.getLogger(__name__)
 
 
-def state_wait(lfunction, final_set=set(), valid_set=None):
+def submit_state_wait(lfunction, final_set=set(), valid_set=None):
+    """Returns the Future of a state_wait."""
     # TODO(afazekas): evaluate using ABC here
     if not isinstance(final_set, set):
         final_set = set((final_set,))
     if not isinstance(valid_set, set) and valid_set is not None:
         valid_set = set((valid_set,))
     start_time = time.time()
-    old_status = status = lfunction()
-    while True:
-        if status != old_status:
-            LOG.info('State transition "%s" ==> "%s" %d second', old_status,
-                     status, time.time() - start_time)
+    state = {}
+
+    def check():
+        status = lfunction()
+        if 'status' in state and status != state['status']:
+            LOG.info('State transition "%s" ==> "%s" %d second',
+                     state['status'], status, time.time() - start_time)
+        state['status'] = status
         if status in final_set:
             return status
         if valid_set is not None and status not in valid_set:
             return status
-        dtime = time.time() - start_time
-        if dtime > CONF.boto.build_timeout:
-            raise TestCase.failureException("State change timeout exceeded!"
-                                            '(%ds) While waiting'
-                                            'for %s at "%s"' %
-                                            (dtime, final_set, status))
-        time.sleep(CONF.boto.build_interval)
-        old_status = status
-        status = lfunction()
+        return poller.PENDING
+
+    def timeout_error():
+        return TestCase.failureException("State change timeout exceeded!"
+                                         '(%ds) While waiting'
+                                         'for %s at "%s"' %
+                                         (time.time() - start_time,
+                                          final_set, state.get('status')))
+
+    return poller.submit(check, CONF.boto.build_timeout,
+                         CONF.boto.build_interval, service='boto',
+                         timeout_error=timeout_error,
+                         description='state in %s' % list(final_set))
+
+
+def state_wait(lfunction, final_set=set(), valid_set=None):
+    return submit_state_wait(lfunction, final_set, valid_set).result()
 
 
 def re_search_wait(lfunction, regexp):
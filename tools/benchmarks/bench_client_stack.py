@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the throughput of the tempest client stack, that is the service
+clients of a tempest.clients.Manager, their auth provider and RestClient,
+against the local stand-in of the OpenStack APIs of
+tempest.tests.fake_openstack.
+
+The stand-in runs in a child process, so the CPU time reported per request
+is only the one of the client side. The memory allocated per request is
+measured with tracemalloc, when it is available. No network access and no
+tempest configuration are needed: a configuration pointing to the stand-in
+is written to a temporary directory.
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from tempest.tests import fake_openstack
+
+CONFIG = """
+[identity]
+uri = %(uri)s
+uri_v3 = %(uri_v3)s
+auth_version = %(auth_version)s
+region = %(region)s
+username = fake_user
+password = fake_password
+tenant_name = fake_tenant
+
+[compute]
+image_ref = %(image_id)s
+image_ref_alt = %(image_id)s
+
+[identity-feature-enabled]
+api_v3 = true
+
+[service_available]
+cinder = true
+neutron = true
+glance = true
+swift = true
+
+[service-clients]
+connection_pooling = %(connection_pooling)s
+"""
+
+SERVER_ID = fake_openstack.resource('servers')['id']
+
+# Name and call of the requests measured, sent with a clients.Manager
+WORKLOADS = (
+    ('token', lambda manager: token_request(manager)),
+    ('compute-list-servers',
+     lambda manager: manager.servers_client.list_servers()),
+    ('compute-get-server',
+     lambda manager: manager.servers_client.get_server(SERVER_ID)),
+    ('compute-list-flavors-detail',
+     lambda manager: manager.flavors_client.list_flavors_with_detail()),
+    ('network-list-networks',
+     lambda manager: manager.network_client.list_networks()),
+    ('volume-list-volumes',
+     lambda manager: manager.volumes_client.list_volumes()),
+    ('image-list-images', lambda manager: manager.image_client.image_list()),
+    ('object-list-containers',
+     lambda manager: manager.account_client.list_account_containers()),
+)
+
+
+def token_request(manager):
+    credentials = manager.credentials
+    if manager.auth_version == 'v3':
+        return manager.token_v3_client.auth(
+            credentials['username'], credentials['password'],
+            credentials['tenant_name'], user_type='name',
+            domain=credentials['domain_name'])
+    return manager.token_client.auth(credentials['username'],
+                                     credentials['password'],
+                                     credentials['tenant_name'])
+
+
+def serve(latency, items, conn):
+    cloud = fake_openstack.FakeCloud(latency, items)
+    conn.send((cloud.uri, cloud.uri_v3))
+    # Serve until the benchmark closes its end of the pipe
+    try:
+        conn.recv()
+    except EOFError:
+        pass
+    cloud.stop()
+
+
+def cpu_time():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def measure(call, requests):
+    """Returns the seconds and the CPU seconds per request."""
+    start, start_cpu = time.time(), cpu_time()
+    for _ in range(requests):
+        call()
+    return ((time.time() - start) / requests,
+            (cpu_time() - start_cpu) / requests)
+
+
+def measure_memory(call, requests):
+    """Returns the peak KB allocated and the blocks kept per request."""
+    if tracemalloc is None:
+        return None, None
+    peak = kept = 0
+    for _ in range(requests):
+        tracemalloc.start()
+        call()
+        kept += len(tracemalloc.take_snapshot().traces)
+        peak += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak / 1024.0 / requests, float(kept) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--requests', type=int, default=500,
+                        help='number of requests per workload')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='delay of each response of the stand-in in '
+                             'seconds')
+    parser.add_argument('--items', type=int, default=10,
+                        help='number of items of the listed collections')
+    parser.add_argument('--auth-version', default='v2', choices=('v2', 'v3'))
+    parser.add_argument('--no-pooling', action='store_true',
+                        help='close the connection after each request')
+    parser.add_argument('--workloads',
+                        help='comma separated workloads to run, all by '
+                             'default: %s' % ','.join(
+                                 name for name, _ in WORKLOADS))
+    args = parser.parse_args()
+
+    conn, child_conn = multiprocessing.Pipe()
+    server = multiprocessing.Process(
+        target=serve, args=(args.latency, args.items, child_conn))
+    server.daemon = True
+    server.start()
+    if not conn.poll(30):
+        raise RuntimeError("The stand-in servers did not start")
+    uri, uri_v3 = conn.recv()
+
+    config_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(config_dir, 'tempest.conf'), 'w') as f:
+            f.write(CONFIG % {'uri': uri, 'uri_v3': uri_v3,
+                              'auth_version': args.auth_version,
+                              'region': fake_openstack.REGION,
+                              'image_id': fake_openstack.resource(
+                                  'images')['id'],
+                              'connection_pooling': not args.no_pooling})
+        os.environ['TEMPEST_CONFIG_DIR'] = config_dir
+        os.environ['TEMPEST_CONFIG'] = 'tempest.conf'
+        # Imported once the configuration is in place
+        from tempest import clients
+
+        manager = clients.Manager()
+        selected = args.workloads.split(',') if args.workloads else None
+        print("%-28s %10s %12s %12s %12s" % (
+            'workload', 'req/s', 'CPU us/req', 'peak KB/req',
+            'blocks/req'))
+        for name, workload in WORKLOADS:
+            if selected is not None and name not in selected:
+                continue
+
+            def call():
+                return workload(manager)
+
+            # The first call authenticates and builds the client
+            call()
+            elapsed, cpu = measure(call, args.requests)
+            peak, kept = measure_memory(call, min(args.requests, 50))
+            if peak is None:
+                memory = "%12s %12s" % ('n/a', 'n/a')
+            else:
+                memory = "%12.1f %12.1f" % (peak, kept)
+            print("%-28s %10.1f %12.1f %s" % (
+                name, 1 / elapsed, cpu * 10 ** 6, memory))
+    finally:
+        shutil.rmtree(config_dir)
+        conn.close()
+        server.join(5)
+
+
+if __name__ == "__main__":
+    main()
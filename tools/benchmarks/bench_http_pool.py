@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare the per-request latency of the closing and the pooled keep-alive
+transports of the tempest REST clients against a local HTTP server.
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from tempest.common import http
+
+
+class KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    body = b'{"servers": []}'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        # Headers and body are written separately, avoid the delayed ACK
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def run(http_obj, url, requests):
+    start = time.time()
+    for _ in range(requests):
+        resp, _ = http_obj.request(url, 'GET')
+        assert resp.status == 200
+    return (time.time() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--requests', type=int, default=2000,
+                        help='number of requests per transport')
+    args = parser.parse_args()
+
+    server = Server(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://127.0.0.1:%d/v2/servers' % server.server_address[1]
+
+    closing = run(http.ClosingHttp(), url, args.requests)
+    pooled = run(http.PooledHttp(), url, args.requests)
+    print("closing: %.1f us/request" % (closing * 10 ** 6))
+    print("pooled:  %.1f us/request" % (pooled * 10 ** 6))
+    print("speedup: %.2fx" % (closing / pooled))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the time needed to import a module in a fresh interpreter, which
+every testr worker and every test listing pays, and report the modules it
+loads. By default tempest.test is imported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Libraries which should only be loaded when a test actually uses them
+DEFERRED_PACKAGES = ('boto', 'cinderclient', 'glanceclient', 'heatclient',
+                     'keystoneclient', 'neutronclient', 'novaclient',
+                     'swiftclient')
+
+PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.time()
+import %s
+elapsed = time.time() - start
+print(json.dumps({'elapsed': elapsed,
+                  'modules': sorted(set(sys.modules) - before)}))
+"""
+
+
+def measure(module):
+    output = subprocess.check_output([sys.executable, '-c', PROBE % module])
+    return json.loads(output.decode('utf-8').splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                        help='number of fresh interpreters')
+    parser.add_argument('module', nargs='?', default='tempest.test')
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    times = sorted(run['elapsed'] for run in runs)
+    modules = runs[-1]['modules']
+    packages = set(name.split('.')[0] for name in modules)
+    print("import %s: min %.1f ms, median %.1f ms" % (
+        args.module, times[0] * 1000, times[len(times) // 2] * 1000))
+    print("modules loaded: %d (%d tempest)" % (
+        len(modules), len([m for m in modules if m.startswith('tempest')])))
+    loaded = sorted(packages.intersection(DEFERRED_PACKAGES))
+    print("deferred packages loaded: %s" % (', '.join(loaded) or 'none'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the decoding and encoding time of a large list_servers_with_detail
+response body with each of the JSON codecs supported by
+tempest.common.json_codec which is installed.
+"""
+
+import argparse
+import time
+import uuid
+
+from tempest.common import json_codec
+from tempest.openstack.common import importutils
+
+
+def fake_server(index):
+    server_id = str(uuid.uuid4())
+    return {
+        'id': server_id,
+        'name': 'server-%d' % index,
+        'status': 'ACTIVE',
+        'tenant_id': uuid.uuid4().hex,
+        'user_id': uuid.uuid4().hex,
+        'created': '2014-01-01T00:00:00Z',
+        'updated': '2014-01-01T00:01:00Z',
+        'hostId': uuid.uuid4().hex,
+        'accessIPv4': '',
+        'accessIPv6': '',
+        'progress': 0,
+        'metadata': {'index': str(index)},
+        'image': {'id': str(uuid.uuid4()), 'links': []},
+        'flavor': {'id': '1', 'links': []},
+        'addresses': {'private': [{'addr': '10.0.%d.%d' % divmod(index % 65536,
+                                                                 256),
+                                   'version': 4}]},
+        'links': [{'href': 'http://fake_host/v2/servers/%s' % server_id,
+                   'rel': 'self'}],
+        'OS-EXT-STS:task_state': None,
+        'OS-EXT-STS:vm_state': 'active',
+        'OS-EXT-STS:power_state': 1,
+    }
+
+
+def measure(func, arg, repeat):
+    start = time.time()
+    for _ in range(repeat):
+        func(arg)
+    return (time.time() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--servers', type=int, default=5000,
+                        help='number of servers in the response')
+    parser.add_argument('-n', '--repeat', type=int, default=10,
+                        help='number of decodings per codec')
+    args = parser.parse_args()
+
+    servers = {'servers': [fake_server(i) for i in range(args.servers)]}
+    body = json_codec.dumps(servers)
+    print("body: %d servers, %.1f MB" % (args.servers,
+                                         len(body) / 1024.0 / 1024.0))
+    for name in json_codec.CODECS:
+        codec = importutils.try_import(name)
+        if codec is None:
+            print("%-10s not installed" % name)
+            continue
+        loads = measure(codec.loads, body, args.repeat)
+        dumps = measure(codec.dumps, servers, args.repeat)
+        print("%-10s loads %8.1f ms  dumps %8.1f ms" % (
+            name, loads * 1000, dumps * 1000))
+
+
+if __name__ == "__main__":
+    main()
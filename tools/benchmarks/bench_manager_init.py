@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the construction time and the memory of tempest.clients.Manager
+objects, building only the clients a test typically uses (lazy) and
+building all of them, like the Manager did before the clients were lazy
+(eager). No request is sent, so no cloud is needed.
+"""
+
+import argparse
+import resource
+import time
+
+from tempest import clients
+
+
+def build(count, interface, touch):
+    managers = []
+    start = time.time()
+    for _ in range(count):
+        manager = clients.Manager('fake_user', 'fake_password',
+                                  'fake_tenant', interface=interface)
+        for name in touch(manager):
+            getattr(manager, name)
+        managers.append(manager)
+    return managers, (time.time() - start) / count
+
+
+def max_rss():
+    # Kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--managers', type=int, default=200,
+                        help='number of managers built for each mode')
+    parser.add_argument('--interface', default='json',
+                        choices=('json', 'xml'))
+    parser.add_argument('--clients', default='servers_client',
+                        help='comma separated clients accessed in lazy mode')
+    args = parser.parse_args()
+    used = [name for name in args.clients.split(',') if name]
+
+    # maxrss only grows: measure the lazy mode first, and keep the managers
+    # of each mode alive until its measure is taken.
+    modes = (('lazy', lambda manager: used),
+             ('eager', lambda manager: list(manager._client_factories)))
+    for mode, touch in modes:
+        rss = max_rss()
+        managers, elapsed = build(args.managers, args.interface, touch)
+        print("%-6s %8.1f us/manager %8.1f KB/manager" % (
+            mode, elapsed * 10 ** 6,
+            float(max_rss() - rss) / args.managers))
+        del managers
+
+
+if __name__ == "__main__":
+    main()
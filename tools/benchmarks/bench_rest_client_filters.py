@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the client side CPU spent in RestClient.filters, which is
+evaluated on every request, comparing the former scan of all the config
+option groups with the service index lookup and the cached filters.
+"""
+
+import argparse
+import time
+
+from tempest.common import rest_client
+from tempest import config
+
+CONF = config.CONF
+
+
+def scan_filters(client):
+    """The filters computation done before the service index."""
+    region = endpoint_type = None
+    for cfgname in dir(CONF._config):
+        cfg = getattr(CONF, cfgname)
+        if getattr(cfg, 'catalog_type', None) == client.service:
+            region = getattr(cfg, 'region', None)
+            if endpoint_type is None:
+                endpoint_type = getattr(cfg, 'endpoint_type', 'publicURL')
+    return dict(service=client.service, endpoint_type=endpoint_type,
+                region=region or CONF.identity.region)
+
+
+def index_filters(client):
+    client._filters = None
+    return client.filters
+
+
+def cached_filters(client):
+    return client.filters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--requests', type=int, default=10000,
+                        help='number of filters evaluations')
+    args = parser.parse_args()
+
+    client = rest_client.RestClient(None)
+    client.service = CONF.compute.catalog_type
+    for func in (scan_filters, index_filters, cached_filters):
+        start = time.time()
+        for _ in range(args.requests):
+            func(client)
+        elapsed = (time.time() - start) / args.requests
+        print("%-15s %8.2f us/request" % (func.__name__, elapsed * 10 ** 6))
+
+
+if __name__ == "__main__":
+    main()
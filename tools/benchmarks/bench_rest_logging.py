@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the client side CPU spent logging a request and its response with
+a large body, comparing the former eager formatting with the level guarded
+logging of RestClient, at INFO level (the default) and at DEBUG level.
+"""
+
+import argparse
+import hashlib
+import logging
+import time
+
+import httplib2
+
+from tempest.common import rest_client
+
+
+def eager_log(log, method, req_url, headers, body, resp, resp_body):
+    """The request and response logging done before the level guards."""
+    log.info('Request: ' + method + ' ' + req_url)
+    log.debug('Request Headers: ' + str(headers))
+    for title, data in (('Request Body', body), ('Response Body', resp_body)):
+        str_body = str(data)
+        length = len(str_body)
+        log.debug(title + ': ' + str_body[:2048])
+        if length >= 2048:
+            log.debug("Large body (%d) md5 summary: %s", length,
+                      hashlib.md5(str_body.encode('utf-8')).hexdigest())
+    log.info("Response Status: " + resp['status'])
+    headers = resp.copy()
+    del headers['status']
+    log.debug('Response Headers: ' + str(headers))
+
+
+def guarded_log(client, method, req_url, headers, body, resp, resp_body):
+    client._log_request(method, req_url, headers, body)
+    client._log_response(resp, resp_body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--requests', type=int, default=200,
+                        help='number of logged requests')
+    parser.add_argument('-s', '--size', type=int, default=1024,
+                        help='body size in KB')
+    args = parser.parse_args()
+
+    client = rest_client.RestClient(None)
+    logger = logging.getLogger(rest_client.__name__)
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    body = '{"servers": [%s]}' % ('"x",' * (args.size * 256))[:-1]
+    resp = httplib2.Response({'status': '200',
+                              'content-type': 'application/json',
+                              'x-compute-request-id': 'req-fake'})
+    call_args = ('POST', 'http://fake_host/v2/servers',
+                 {'X-Auth-Token': 'fake_token'}, body, resp, body)
+    for level in (logging.INFO, logging.DEBUG):
+        logger.setLevel(level)
+        for name, func, target in (('eager', eager_log, client.LOG),
+                                   ('guarded', guarded_log, client)):
+            start = time.time()
+            for _ in range(args.requests):
+                func(target, *call_args)
+            elapsed = (time.time() - start) / args.requests
+            print("%-5s %-8s %10.2f us/request" % (
+                logging.getLevelName(level), name, elapsed * 10 ** 6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare the peak memory of downloading a large body from a local HTTP
+server with the buffered transport of the REST clients and with a
+streamed body, hashing the data like the response logging does. Each
+mode runs in its own process so that their peak RSS are independent.
+"""
+
+import argparse
+import hashlib
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+
+from tempest.common import http
+
+CHUNK = b'x' * 1024 * 1024
+
+
+class BlobHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        size = int(self.path.strip('/'))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(size * len(CHUNK)))
+        self.end_headers()
+        for _ in range(size):
+            self.wfile.write(CHUNK)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def download(mode, url):
+    if mode == 'buffered':
+        resp, body = http.ClosingHttp().request(url, 'GET')
+        return len(body), hashlib.md5(body).hexdigest()
+    resp, stream = http.open_stream(url)
+    for _ in stream:
+        pass
+    return stream.length, stream.md5
+
+
+def child(mode, url):
+    start = time.time()
+    length, md5 = download(mode, url)
+    elapsed = time.time() - start
+    # Kilobytes on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print("%-9s %6d MB in %6.2f s, md5 %s, max RSS %8.1f MB" % (
+        mode, length // len(CHUNK), elapsed, md5, rss / 1024.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--size', type=int, default=256,
+                        help='body size in MB')
+    parser.add_argument('--mode', choices=('buffered', 'streamed'),
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        return child(args.mode, args.url)
+
+    server = Server(('127.0.0.1', 0), BlobHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://127.0.0.1:%d/%d' % (server.server_address[1], args.size)
+    for mode in ('streamed', 'buffered'):
+        subprocess.check_call([sys.executable, __file__, '--mode', mode,
+                               '--url', url])
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
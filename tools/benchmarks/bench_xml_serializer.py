@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the serialization of large XML request bodies built with the
+Element and Document classes of the XML clients, comparing the former
+string concatenation with the current serializer.
+"""
+
+import argparse
+import timeit
+
+from tempest.services.compute.xml import common
+
+
+def legacy_str(element):
+    """The serialization done before the parts list."""
+    if isinstance(element, common.Text):
+        return str(element)
+    args = " ".join(['%s="%s"' % (k, v if v is not None else "")
+                     for k, v in element.attributes()])
+    if isinstance(element, common.Document):
+        string = '<?xml %s?>\n' % args
+        for child in element.children():
+            string += legacy_str(child)
+        return string
+    string = '<%s %s' % (element.element_name, args)
+    if not element.children():
+        string += '/>'
+        return string
+    string += '>'
+    for child in element.children():
+        if isinstance(child, common.Element):
+            string += legacy_str(child)
+        else:
+            string += str(child)
+    string += '</%s>' % element.element_name
+    return string
+
+
+def metadata_body(items):
+    metadata = common.Element('metadata', xmlns=common.XMLNS_11)
+    for index in range(items):
+        metadata.append(common.Element('meta', common.Text('value-%d' % index),
+                                       key='key-%d' % index))
+    return common.Document(metadata)
+
+
+def batch_body(items):
+    servers = common.Element('servers', xmlns=common.XMLNS_11)
+    for index in range(items // 10):
+        server = common.Element('server', name='server-%d' % index,
+                                imageRef='fake-image', flavorRef='1')
+        metadata = common.Element('metadata')
+        for key in range(4):
+            metadata.append(common.Element('meta', common.Text('value'),
+                                           key='key-%d' % key))
+        server.append(metadata)
+        networks = common.Element('networks')
+        networks.append(common.Element('network', uuid='fake-network'))
+        server.append(networks)
+        servers.append(server)
+    return common.Document(servers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-e', '--elements', type=int, default=10000,
+                        help='number of elements of the bodies')
+    parser.add_argument('-n', '--repeat', type=int, default=30,
+                        help='number of serializations per body, the best '
+                             'time is reported')
+    args = parser.parse_args()
+
+    for name, build in (('metadata', metadata_body), ('batch', batch_body)):
+        document = build(args.elements)
+        body = str(document)
+        assert body == legacy_str(document)
+        print("%s: %.1f KB" % (name, len(body) / 1024.0))
+        best = {}
+        for _ in range(args.repeat):
+            for label, func in (('legacy', legacy_str), ('current', str)):
+                # timeit disables the garbage collector while timing
+                elapsed = timeit.timeit(lambda: func(document), number=1)
+                best[label] = min(best.get(label, elapsed), elapsed)
+        for label in ('legacy', 'current'):
+            print("  %-8s %8.1f ms" % (label, best[label] * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the conversion of large XML listings by xml_to_json, comparing
+the former recursive conversion with the current one. The parsing time of
+the documents is given for reference.
+"""
+
+import argparse
+import timeit
+
+from lxml import etree
+
+from tempest.services.compute.xml import common
+
+SERVER = ('<server id="%(index)d" name="server-%(index)d" status="ACTIVE">'
+          '<image id="1"><atom:link href="http://fake/images/1" '
+          'rel="bookmark"/></image><flavor id="1"/>'
+          '<metadata><meta key="index">%(index)d</meta></metadata>'
+          '<addresses><network id="private">'
+          '<ip version="4" addr="10.0.0.1"/></network></addresses>'
+          '<progress type="int">0</progress>'
+          '<locked type="bool">False</locked></server>')
+USER = ('<user id="%(index)d" name="user-%(index)d" enabled="true">'
+        '<email>user-%(index)d@example.com</email>'
+        '<description>User %(index)d</description></user>')
+
+DOCUMENTS = (
+    ('servers', '<servers xmlns="%s" xmlns:atom="http://www.w3.org/2005/Atom">'
+     % common.XMLNS_11, SERVER, '</servers>'),
+    ('users', '<users xmlns="http://docs.openstack.org/identity/api/v3">',
+     USER, '</users>'),
+)
+
+
+def legacy_xml_to_json(node, plurals=None):
+    """The conversion done before the single visit of each element."""
+    json = {}
+    bool_flag = False
+    int_flag = False
+    long_flag = False
+    for attr in node.keys():
+        if not attr.startswith("xmlns"):
+            json[attr] = node.get(attr)
+            if json[attr] == 'bool':
+                bool_flag = True
+            elif json[attr] == 'int':
+                int_flag = True
+            elif json[attr] == 'long':
+                long_flag = True
+    if not node.getchildren():
+        if bool_flag:
+            return node.text == 'True'
+        elif int_flag:
+            return int(node.text)
+        elif long_flag:
+            return long(node.text)
+        else:
+            return node.text or json
+    for child in node.getchildren():
+        tag = child.tag
+        if tag.startswith("{"):
+            ns, tag = tag.split("}", 1)
+        if plurals is not None and tag in plurals:
+            json[tag] = [legacy_xml_to_json(item, plurals)
+                         for item in child.getchildren()]
+        else:
+            json[tag] = legacy_xml_to_json(child, plurals)
+    return json
+
+
+def measure(funcs, repeat):
+    """Returns the best time of each function, run in turn."""
+    best = [None] * len(funcs)
+    for _ in range(repeat):
+        for index, func in enumerate(funcs):
+            # timeit disables the garbage collector while timing
+            elapsed = timeit.timeit(func, number=1)
+            if best[index] is None or elapsed < best[index]:
+                best[index] = elapsed
+    return best
+
+
+def parse_array(convert, node):
+    """The conversion of a listing by the service clients."""
+    return [convert(child) for child in node.getchildren()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-e', '--elements', type=int, default=10000,
+                        help='number of elements of the documents')
+    parser.add_argument('-n', '--repeat', type=int, default=30,
+                        help='number of conversions per document, the '
+                             'best time is reported')
+    args = parser.parse_args()
+
+    for name, head, item, tail in DOCUMENTS:
+        per_item = len(etree.fromstring(
+            head + item % {'index': 0} + tail).xpath('//*')) - 1
+        body = head + ''.join(item % {'index': index} for index in
+                              range(args.elements // per_item)) + tail
+        node = etree.fromstring(body)
+        elements = len(node.xpath('//*'))
+        print("%s: %d elements, %.1f KB" % (name, elements,
+                                            len(body) / 1024.0))
+        labels = ('parse', 'legacy', 'current')
+        timings = measure(
+            (lambda: etree.fromstring(body),
+             lambda: parse_array(legacy_xml_to_json, node),
+             lambda: parse_array(common.xml_to_json, node)), args.repeat)
+        for label, elapsed in zip(labels, timings):
+            print("  %-8s %8.1f ms" % (label, elapsed * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Delete the resources leaked by the tests, e.g. by the test workers killed
+by a timeout, from the [service-clients] resource_journal of the run, see
+tempest.common.sweeper. Unlike stress/cleanup.py, nothing is listed across
+the tenants: only the resources recorded as created and not deleted are.
+"""
+
+import argparse
+import sys
+
+from tempest import clients
+from tempest.common import journal
+from tempest.common import sweeper
+from tempest import config
+
+CONF = config.CONF
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--journal',
+                        default=CONF.service_clients.resource_journal,
+                        help='resource journal, [service-clients] '
+                             'resource_journal by default')
+    parser.add_argument('--include-running', action='store_true',
+                        help='also delete the resources of the test '
+                             'workers still running on this host')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='concurrent deletions, [service-clients] '
+                             'fanout_workers by default')
+    args = parser.parse_args()
+    if not args.journal:
+        raise SystemExit("No resource journal")
+
+    connection = journal.connect(args.journal)
+    sweep = sweeper.Sweeper(connection, clients.AdminManager().auth_provider,
+                            max_workers=args.workers)
+    deleted, failed = sweep.sweep(include_running=args.include_running)
+    print("%d resources deleted, %d failed" % (len(deleted), len(failed)))
+    for entry in failed:
+        print("%(resource_type)s %(resource_id)s of tenant %(tenant)s, "
+              "created by %(test)s" % entry)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+# Copyright 2014 OpenStack Foundation
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Print the aggregates of the resource timeline datasets of the last run
+recorded in a [service-clients] timeline_dir, see tempest.common.timeline.
+
+With --baseline, the timeline_dir of a previous run, e.g. of the previous
+release of the cloud, the change of each p50 and p90 is printed too.
+"""
+
+import argparse
+
+from tempest.common import timeline
+
+
+def load_report(timeline_dir):
+    paths = timeline.dataset_paths(timeline_dir)
+    if not paths:
+        raise SystemExit("No timeline dataset in %s" % timeline_dir)
+    return timeline.report(timeline.load(paths))
+
+
+def flatten(report):
+    """Returns the summaries of the report by printable name."""
+    summaries = {}
+    for reference, values in report['boot_time'].items():
+        for key, summary in values.items():
+            summaries['boot time, %s %s' % (reference, key)] = summary
+    for resource_type, values in report['time_to_status'].items():
+        for status, summary in values.items():
+            summaries['%s created to %s' % (resource_type, status)] = summary
+    for key, summary in report['waits'].items():
+        summaries['wait for %s' % key] = summary
+    return summaries
+
+
+def change(value, baseline):
+    if not baseline:
+        return '%8s' % 'n/a'
+    return '%+7.0f%%' % ((value - baseline) * 100.0 / baseline)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('timeline_dir')
+    parser.add_argument('--baseline', help='timeline_dir of a previous run')
+    args = parser.parse_args()
+
+    summaries = flatten(load_report(args.timeline_dir))
+    baselines = {}
+    if args.baseline:
+        baselines = flatten(load_report(args.baseline))
+    header = "%-50s %6s %9s %9s %9s" % ('', 'count', 'p50 s', 'p90 s',
+                                        'max s')
+    if baselines:
+        header += " %8s %8s" % ('p50', 'p90')
+    print(header)
+    for name in sorted(summaries):
+        summary = summaries[name]
+        line = "%-50s %6d %9.1f %9.1f %9.1f" % (
+            name, summary['count'], summary['p50'], summary['p90'],
+            summary['max'])
+        if baselines:
+            baseline = baselines.get(name, {})
+            line += " %s %s" % (change(summary['p50'], baseline.get('p50')),
+                                change(summary['p90'], baseline.get('p90')))
+        print(line)
+
+
+if __name__ == "__main__":
+    main()